@@ -0,0 +1,2 @@
+def load():
+    import pyomo.contrib.portfolio.portfolio
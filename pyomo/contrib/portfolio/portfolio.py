@@ -0,0 +1,336 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+from __future__ import division
+
+import logging
+import multiprocessing
+import os
+import signal
+import time
+import traceback
+
+from six import iteritems, string_types
+from six.moves import queue
+
+from pyomo.common.config import (
+    ConfigBlock, ConfigValue, NonNegativeFloat, PositiveInt,
+    add_docstring_list
+)
+from pyomo.core import Objective, Var, minimize, value
+from pyomo.opt import SolverFactory, SolverResults, SolverStatus
+from pyomo.opt import TerminationCondition as tc
+
+logger = logging.getLogger('pyomo.contrib.portfolio')
+
+# Termination conditions that end the race: no other configuration
+# can do better than a solver that proved one of these.
+_conclusive = set([tc.optimal, tc.locallyOptimal, tc.globallyOptimal,
+                   tc.infeasible, tc.unbounded, tc.infeasibleOrUnbounded])
+
+# Seconds between checks for workers that died without reporting
+_poll_interval = 0.5
+
+
+def _normalize_entry(entry):
+    """Return a solver configuration as a dict with the keys solver,
+    solver_io, options and solver_args."""
+    if isinstance(entry, string_types):
+        entry = {'solver': entry}
+    elif not hasattr(entry, 'items'):
+        raise ValueError(
+            "Portfolio solver configurations must be solver names or "
+            "dicts, but received %s" % (entry,))
+    ans = {'solver': None, 'solver_io': None,
+           'options': {}, 'solver_args': {}}
+    for key, val in iteritems(entry):
+        if key not in ans:
+            raise ValueError(
+                "Unknown key '%s' in portfolio solver configuration %s. "
+                "Valid keys are: %s" % (key, entry, ", ".join(sorted(ans))))
+        ans[key] = val
+    if ans['solver'] is None:
+        raise ValueError(
+            "Portfolio solver configuration %s does not specify a "
+            "solver" % (entry,))
+    return ans
+
+
+def _entry_label(entry):
+    label = entry['solver']
+    if entry['solver_io'] is not None:
+        label += ' (%s)' % (entry['solver_io'],)
+    if entry['options']:
+        label += ' ' + ' '.join('%s=%s' % (key, entry['options'][key])
+                                for key in sorted(entry['options']))
+    return label
+
+
+def _objective_value(model):
+    for obj in model.component_data_objects(Objective, active=True):
+        return value(obj, exception=False)
+    return None
+
+
+def _portfolio_worker(results_queue, index, model, entry, solver_args):
+    """Solve the model with one configuration and report the results,
+    the objective value and the variable values (in
+    component_data_objects order) through the queue."""
+    if hasattr(os, 'setpgrp'):
+        # Start a new process group so that the solver executables
+        # launched by this worker are killed along with it.
+        os.setpgrp()
+    try:
+        kwds = dict(solver_args)
+        kwds.update(entry['solver_args'])
+        kwds['load_solutions'] = False
+        if entry['options']:
+            kwds['options'] = entry['options']
+        factory_kwds = {}
+        if entry['solver_io'] is not None:
+            factory_kwds['solver_io'] = entry['solver_io']
+        with SolverFactory(entry['solver'], **factory_kwds) as opt:
+            results = opt.solve(model, **kwds)
+        values = objective = None
+        if len(results.solution) > 0:
+            model.solutions.load_from(results)
+            values = [var.value for var in
+                      model.component_data_objects(Var, descend_into=True)]
+            objective = _objective_value(model)
+        # The symbol map refers to this process' copy of the model
+        results._smap = None
+        results.solution.clear()
+        results_queue.put((index, True, (results, objective, values)))
+    except:
+        results_queue.put((index, False, traceback.format_exc()))
+
+
+def _kill(process):
+    if process.is_alive():
+        if hasattr(os, 'killpg'):
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except OSError:
+                # the worker has not created its process group yet
+                pass
+        if process.is_alive():
+            process.terminate()
+    process.join()
+
+
+def _get_context():
+    # Workers are forked where possible so that the model does not
+    # need to be pickled.
+    if not hasattr(multiprocessing, 'get_context'):
+        return multiprocessing
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+
+@SolverFactory.register('portfolio',
+                        doc='Portfolio solver that races several solver '
+                        'configurations in parallel')
+class PortfolioSolver(object):
+    """Solver wrapper that runs several solver configurations in parallel.
+
+    Each configuration solves the model in a separate process.  The
+    first configuration that proves optimality (or infeasibility or
+    unboundedness) wins, and the other processes, including the
+    solver executables they launched, are killed.  If no configuration
+    is conclusive, the best solution found by the configurations that
+    finished before the time limit is used.  The variable values of
+    the winning configuration are loaded into the model and its
+    results are returned; suffix values (e.g., duals) are not loaded.
+
+    Solver configurations are solver names or dicts with the keys
+    ``solver`` (the solver name), ``solver_io``, ``options`` (the
+    solver options) and ``solver_args`` (keyword arguments for
+    ``solve``)::
+
+        SolverFactory('portfolio').solve(model, solvers=[
+            'gurobi',
+            {'solver': 'cbc', 'options': {'threads': 1}},
+            {'solver': 'cbc', 'options': {'cuts': 'off'}}])
+
+    The index of the winning configuration is stored in the ``winner``
+    attribute.  On platforms without ``fork``, the model must be
+    picklable.
+
+    Keyword arguments below are specified for the ``solve`` function.
+
+    """
+
+    CONFIG = ConfigBlock("Portfolio")
+    CONFIG.declare("solvers", ConfigValue(
+        default=[],
+        description="List of solver configurations to race.",
+        doc="""List of solver configurations to race. Each configuration is
+        a solver name or a dict with the keys 'solver', 'solver_io',
+        'options' and 'solver_args'."""
+    ))
+    CONFIG.declare("solver_args", ConfigValue(
+        default={},
+        description="Dictionary of keyword arguments to pass to every "
+        "solver."
+    ))
+    CONFIG.declare("timelimit", ConfigValue(
+        default=None, domain=NonNegativeFloat,
+        description="Seconds after which the remaining solvers are "
+        "stopped and the best result so far is used."
+    ))
+    CONFIG.declare("max_workers", ConfigValue(
+        default=None, domain=PositiveInt,
+        description="Maximum number of configurations solved at the "
+        "same time. Defaults to all configurations."
+    ))
+
+    __doc__ = add_docstring_list(__doc__, CONFIG)
+
+    def __init__(self, **kwds):
+        self.winner = None
+
+    def available(self, exception_flag=True):
+        """Check if solver is available.
+
+        The sub-solvers are checked when they are run.
+
+        """
+        return True
+
+    def solve(self, model, **kwds):
+        config = self.CONFIG(kwds.pop('options', {}))
+        config.set_value(kwds)
+        entries = [_normalize_entry(entry) for entry in config.solvers]
+        if not entries:
+            raise ValueError(
+                "Portfolio solver requires at least one solver "
+                "configuration.")
+
+        objectives = list(model.component_data_objects(Objective,
+                                                        active=True))
+        if len(objectives) > 1:
+            raise RuntimeError(
+                "Portfolio solver is unable to handle model with multiple "
+                "active objectives.")
+        obj_sign = 1
+        if objectives and objectives[0].sense != minimize:
+            obj_sign = -1
+
+        context = _get_context()
+        results_queue = context.Queue()
+        pending = list(range(len(entries)))
+        running = {}
+        finished = []
+        max_workers = config.max_workers or len(entries)
+        deadline = None
+        if config.timelimit is not None:
+            deadline = time.time() + config.timelimit
+        timed_out = False
+        self.winner = None
+
+        try:
+            while pending or running:
+                while pending and (len(running) < max_workers):
+                    index = pending.pop(0)
+                    process = context.Process(
+                        target=_portfolio_worker,
+                        args=(results_queue, index, model, entries[index],
+                              config.solver_args))
+                    process.daemon = True
+                    process.start()
+                    running[index] = process
+
+                timeout = _poll_interval
+                if deadline is not None:
+                    timeout = min(timeout, deadline - time.time())
+                    if timeout <= 0:
+                        timed_out = True
+                        break
+                try:
+                    index, ok, payload = results_queue.get(timeout=timeout)
+                except queue.Empty:
+                    # Workers that report always exit cleanly, so a
+                    # nonzero exit code means the worker died
+                    for index, process in list(iteritems(running)):
+                        if (not process.is_alive()) and process.exitcode:
+                            del running[index]
+                            logger.warning(
+                                "Portfolio solver configuration %s (%s) "
+                                "exited with code %s"
+                                % (index, _entry_label(entries[index]),
+                                   process.exitcode))
+                    continue
+
+                running.pop(index).join()
+                if not ok:
+                    logger.warning(
+                        "Portfolio solver configuration %s (%s) failed:\n%s"
+                        % (index, _entry_label(entries[index]), payload))
+                    continue
+                finished.append((index,) + payload)
+                results = payload[0]
+                if results.solver.termination_condition in _conclusive:
+                    self.winner = index
+                    break
+        finally:
+            for process in running.values():
+                _kill(process)
+            results_queue.close()
+
+        if self.winner is None:
+            # Use the best solution, or the first result when no
+            # configuration returned a solution
+            best = None
+            for index, results, objective, values in finished:
+                if values is None:
+                    continue
+                if (best is None) or \
+                   ((objective is not None) and
+                    ((best[1] is None) or
+                     (obj_sign*objective < obj_sign*best[1]))):
+                    best = (index, objective)
+            if best is not None:
+                self.winner = best[0]
+            elif finished:
+                self.winner = finished[0][0]
+
+        if self.winner is None:
+            results = SolverResults()
+            results.solver.status = SolverStatus.aborted
+            if timed_out:
+                results.solver.termination_condition = tc.maxTimeLimit
+                results.solver.message = \
+                    "No portfolio solver configuration finished within " \
+                    "the time limit"
+            else:
+                results.solver.termination_condition = tc.error
+                results.solver.message = \
+                    "All portfolio solver configurations failed"
+            return results
+
+        for index, results, objective, values in finished:
+            if index == self.winner:
+                break
+        logger.info("Portfolio solver: using the results of configuration "
+                    "%s (%s)" % (index, _entry_label(entries[index])))
+        if values is not None:
+            for var, val in zip(
+                    model.component_data_objects(Var, descend_into=True),
+                    values):
+                if not var.fixed:
+                    var.value = val
+        return results
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, t, v, traceback):
+        pass
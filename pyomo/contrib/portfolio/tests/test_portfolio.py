@@ -0,0 +1,145 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import time
+
+import pyutilib.th as unittest
+from pyomo.opt import TerminationCondition as tc
+from pyomo.environ import (
+    ConcreteModel, Constraint, NonNegativeReals, Objective, SolverFactory,
+    SolverStatus, Var, maximize, value
+)
+
+try:
+    import swiglpk
+    glpkpy_available = True
+except ImportError:
+    glpkpy_available = False
+
+
+@SolverFactory.register('_portfolio_test_solver',
+                        doc='GLPK with an artificial delay, for testing')
+class _DelayedSolver(object):
+
+    def __init__(self, **kwds):
+        pass
+
+    def available(self, exception_flag=True):
+        return True
+
+    def solve(self, model, **kwds):
+        options = kwds.pop('options', {})
+        time.sleep(options.get('delay', 0))
+        if options.get('fail', False):
+            raise RuntimeError("Solver failed")
+        results = SolverFactory('glpk', solver_io='python').solve(
+            model, **kwds)
+        if options.get('feasible', False):
+            results.solver.termination_condition = tc.feasible
+        return results
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, t, v, traceback):
+        pass
+
+
+def build_model():
+    m = ConcreteModel()
+    m.x = Var(within=NonNegativeReals)
+    m.y = Var(within=NonNegativeReals)
+    m.c1 = Constraint(expr=m.x + 2*m.y <= 4)
+    m.c2 = Constraint(expr=3*m.x + m.y <= 6)
+    m.obj = Objective(expr=m.x + m.y, sense=maximize)
+    return m
+
+
+@unittest.skipIf(not glpkpy_available,
+                 "The 'swiglpk' python bindings are not available")
+class PortfolioTests(unittest.TestCase):
+
+    def test_first_optimal(self):
+        m = build_model()
+        opt = SolverFactory('portfolio')
+        start = time.time()
+        results = opt.solve(m, solvers=[
+            {'solver': '_portfolio_test_solver', 'options': {'delay': 60}},
+            {'solver': 'glpk', 'solver_io': 'python'}])
+        # the slow configuration was killed
+        self.assertLess(time.time() - start, 30)
+        self.assertEqual(opt.winner, 1)
+        self.assertEqual(results.solver.termination_condition, tc.optimal)
+        self.assertAlmostEqual(value(m.obj), 2.8)
+        self.assertAlmostEqual(m.x.value, 1.6)
+        self.assertAlmostEqual(m.y.value, 1.2)
+
+    def test_failed_configurations(self):
+        m = build_model()
+        opt = SolverFactory('portfolio')
+        results = opt.solve(m, solvers=[
+            {'solver': '_portfolio_test_solver', 'options': {'fail': True}},
+            '_portfolio_test_solver'])
+        self.assertEqual(opt.winner, 1)
+        self.assertAlmostEqual(value(m.obj), 2.8)
+
+        m = build_model()
+        results = opt.solve(m, solvers=[
+            {'solver': '_portfolio_test_solver', 'options': {'fail': True}}])
+        self.assertIsNone(opt.winner)
+        self.assertEqual(results.solver.status, SolverStatus.aborted)
+        self.assertEqual(results.solver.termination_condition, tc.error)
+        self.assertIsNone(m.x.value)
+
+    def test_timelimit(self):
+        m = build_model()
+        opt = SolverFactory('portfolio')
+        start = time.time()
+        results = opt.solve(m, timelimit=2, solvers=[
+            {'solver': '_portfolio_test_solver', 'options': {'delay': 60}},
+            {'solver': '_portfolio_test_solver',
+             'options': {'feasible': True}}])
+        self.assertLess(time.time() - start, 30)
+        # the best solution found within the time limit is used
+        self.assertEqual(opt.winner, 1)
+        self.assertEqual(results.solver.termination_condition, tc.feasible)
+        self.assertAlmostEqual(value(m.obj), 2.8)
+
+        m = build_model()
+        results = opt.solve(m, timelimit=1, solvers=[
+            {'solver': '_portfolio_test_solver', 'options': {'delay': 60}}])
+        self.assertIsNone(opt.winner)
+        self.assertEqual(results.solver.termination_condition,
+                         tc.maxTimeLimit)
+
+    def test_max_workers(self):
+        m = build_model()
+        opt = SolverFactory('portfolio')
+        results = opt.solve(m, max_workers=1, solvers=[
+            {'solver': '_portfolio_test_solver',
+             'options': {'feasible': True}},
+            '_portfolio_test_solver'])
+        # configurations are run one at a time, until one is conclusive
+        self.assertEqual(opt.winner, 1)
+        self.assertEqual(results.solver.termination_condition, tc.optimal)
+
+    def test_bad_configuration(self):
+        opt = SolverFactory('portfolio')
+        with self.assertRaisesRegexp(ValueError, "at least one solver"):
+            opt.solve(build_model())
+        with self.assertRaisesRegexp(ValueError, "Unknown key 'threads'"):
+            opt.solve(build_model(), solvers=[{'solver': 'cbc',
+                                               'threads': 2}])
+        with self.assertRaisesRegexp(ValueError, "does not specify"):
+            opt.solve(build_model(), solvers=[{'options': {}}])
+
+
+if __name__ == '__main__':
+    unittest.main()
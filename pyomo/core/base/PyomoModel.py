@@ -633,7 +633,7 @@ use the AbstractModel or ConcreteModel class instead.""")
     def create_instance( self, filename=None, data=None, name=None,
                          namespace=None, namespaces=None,
                          profile_memory=0, report_timing=False,
-                         **kwds ):
+                         cache=None, **kwds ):
         """
         Create a concrete instance of an abstract model, possibly using data
         read in from a file.
@@ -648,6 +648,9 @@ use the AbstractModel or ConcreteModel class instead.""")
             namespaces:         A list of namespaces used to select data.
             profile_memory:     A number that indicates the profiling level.
             report_timing:      Report timing statistics during construction.
+            cache:              An InstanceCache used to restore a previously
+                                    constructed instance of this model
+                                    for the same data.
         """
         #
         # Generate a warning if this is a concrete model but the
@@ -699,6 +702,25 @@ arguments (which have been ignored):"""
         if data is None:
             data = {}
 
+        if namespaces:
+            _namespaces = list(namespaces)
+        else:
+            _namespaces = []
+        if namespace is not None:
+            _namespaces.append(namespace)
+        if None not in _namespaces:
+            _namespaces.append(None)
+
+        #
+        # Restore a previously constructed instance if the model
+        # declaration and the data are unchanged
+        #
+        if cache is not None:
+            cache_key = cache.fingerprint(self, data, name, _namespaces)
+            instance = cache.get(cache_key)
+            if instance is not None:
+                return instance
+
         #
         # Clone the model and load the data
         #
@@ -712,15 +734,6 @@ arguments (which have been ignored):"""
         if instance._rule is not None:
             instance._rule(instance)
 
-        if namespaces:
-            _namespaces = list(namespaces)
-        else:
-            _namespaces = []
-        if namespace is not None:
-            _namespaces.append(namespace)
-        if None not in _namespaces:
-            _namespaces.append(None)
-
         instance.load( data,
                        namespaces=_namespaces,
                        profile_memory=profile_memory )
@@ -763,6 +776,9 @@ arguments (which have been ignored):"""
         # ConcreteModel
         #
         instance.__class__ = ConcreteModel
+
+        if cache is not None:
+            cache.put(cache_key, instance)
         return instance
 
 
@@ -10,7 +10,7 @@
 
 __all__ = ['Block', 'TraversalStrategy', 'SortComponents',
            'active_components', 'components', 'active_components_data',
-           'components_data']
+           'components_data', 'ComponentUIDIndex']
 
 import copy
 import sys
@@ -38,6 +38,13 @@ from pyomo.opt import WriterFactory
 
 logger = logging.getLogger('pyomo.core')
 
+#
+# Objects that cache information derived from the structure of a model
+# (e.g., ComponentUIDIndex) register themselves here to be notified when
+# components are added to or deleted from a block.
+#
+_block_structure_observers = weakref.WeakSet()
+
 
 # Monkey-patch for deepcopying weakrefs
 # Only required on Python <= 2.6
@@ -932,6 +939,12 @@ component, use the block del_component() and add_component() methods.
         else:
             self._ctypes[_type] = [_new_idx, _new_idx, 1]
         #
+        # Notify any structure observers
+        #
+        if _block_structure_observers:
+            for observer in list(_block_structure_observers):
+                observer._component_added(self, name, val)
+        #
         # Propagate properties to sub-blocks:
         #   suppressed ctypes
         #
@@ -1037,6 +1050,12 @@ Components must now specify their rules explicitly using 'rule=' keywords.""" %
 
         name = obj.local_name
 
+        # Notify any structure observers (before the component is
+        # removed, so they can still walk its data)
+        if _block_structure_observers:
+            for observer in list(_block_structure_observers):
+                observer._component_removed(self, obj)
+
         # Replace the component in the master list with a None placeholder
         idx = self._decl[name]
         del self._decl[name]
@@ -1925,6 +1944,58 @@ class IndexedBlock(Block):
         Block.__init__(self, *args, **kwds)
 
 
+def _cuid_ctypes(ctype, descend_into):
+    """
+    Return the tuple of ctypes to generate CUID strings for and the
+    tuple of ctypes of the subblocks to descend into (or False).
+    """
+    if descend_into is True:
+        descend_ctype = (Block,)
+    elif descend_into is False:
+        descend_ctype = False
+    elif type(descend_into) == type:
+        descend_ctype = (descend_into,)
+    elif isinstance(descend_into, collections.Iterable):
+        for i in descend_into:
+            assert type(i) == type
+        descend_ctype = tuple(descend_into)
+    else:
+        raise ValueError('Unrecognized value passed to descend_into: %s. '
+                         'We support True, False, types, or '
+                         'iterables of types.'
+                         % descend_into)
+
+    if type(ctype) in (tuple, list, set):
+        ctypes = tuple(ctype)
+    elif ctype is None:
+        ctypes = None
+    else:
+        ctypes = (ctype,)
+
+    if descend_into and ctype is not None:
+        ctypes = tuple(set(descend_ctype) | set(ctypes))
+    return ctypes, descend_ctype
+
+
+def _generate_component_cuid_names(obj_cuid, obj, cuid_names_):
+    """
+    Store the CUID strings for a component (and its component data
+    objects) with the CUID string obj_cuid.
+    """
+    if obj.is_indexed():
+        tDict_get = ComponentUID.tDict.get
+        prefix = obj_cuid + ":"
+        for data_key, obj_data in obj.items():
+            if data_key.__class__ is tuple:
+                key_cuid = ','.join([tDict_get(type(x), '?') + str(x)
+                                     for x in data_key])
+            else:
+                key_cuid = tDict_get(type(data_key), '?') + str(data_key)
+            cuid_names_[obj_data] = prefix + key_cuid
+        obj_cuid += ":**"
+    cuid_names_[obj] = obj_cuid
+
+
 def generate_cuid_names(block,
                         ctype=None,
                         descend_into=True,
@@ -1963,46 +2034,10 @@ def generate_cuid_names(block,
 
     # determine if we need to generate labels on
     # subblocks
-    if descend_into is True:
-        descend_ctype = (Block,)
-    elif descend_into is False:
-        descend_ctype = False
-    elif type(descend_into) == type:
-        descend_ctype = (descend_into,)
-    elif isinstance(descend_into, collections.Iterable):
-        for i in descend_into:
-            assert type(i) == type
-        descend_ctype = tuple(descend_into)
-    else:
-        raise ValueError('Unrecognized value passed to descend_into: %s. '
-                         'We support True, False, types, or '
-                         'iterables of types.'
-                         % descend_into)
-
-    if type(ctype) in (tuple, list, set):
-        ctypes = tuple(ctype)
-    elif ctype is None:
-        ctypes = None
-    else:
-        ctypes = (ctype,)
-
-    if descend_into and ctype is not None:
-        ctypes = tuple(set(descend_ctype) | set(ctypes))
+    ctypes, descend_ctype = _cuid_ctypes(ctype, descend_into)
 
     for key, obj in block.component_map(ctype=ctypes).items():
-        obj_cuid = block_prefix + key
-        if obj.is_indexed():
-            for data_key, obj_data in obj.items():
-                if data_key.__class__ is tuple:
-                    key_cuid = ','.join(
-                        ComponentUID.tDict.get(type(x), '?') + str(x)
-                        for x in data_key)
-                else:
-                    key_cuid = ComponentUID.tDict.get(type(data_key), '?') + \
-                        str(data_key)
-                cuid_names_[obj_data] = obj_cuid + ":" + key_cuid
-            obj_cuid += ":**"
-        cuid_names_[obj] = obj_cuid
+        _generate_component_cuid_names(block_prefix + key, obj, cuid_names_)
 
     # Now recurse into subblocks
     if descend_into:
@@ -2017,6 +2052,144 @@ def generate_cuid_names(block,
     return cuid_names_
 
 
+class ComponentUIDIndex(object):
+    """
+    A bidirectional index between the components on a block and their
+    CUID strings.
+
+    The index is generated in a single pass (using
+    :func:`generate_cuid_names`), and it is updated incrementally when
+    components are added to or deleted from the indexed blocks.  CUID
+    strings use the same format as ``repr(ComponentUID(obj))``.
+
+    Args:
+        block: The block to index.
+        ctype: The ctype(s) to index (see :func:`generate_cuid_names`).
+        descend_into: Indicates whether or not to index subblocks
+            (see :func:`generate_cuid_names`).
+    """
+
+    def __init__(self, block, ctype=None, descend_into=True):
+        self._block = block
+        self._ctypes, self._descend_ctype = _cuid_ctypes(ctype, descend_into)
+        self._cuids = generate_cuid_names(block,
+                                          ctype=ctype,
+                                          descend_into=descend_into)
+        self._components = dict((cuid, obj) for obj, cuid
+                                in self._cuids.items())
+        # (block, name) tuples for components that were added after
+        # the index was generated
+        self._pending = []
+        _block_structure_observers.add(self)
+
+    def __len__(self):
+        if self._pending:
+            self._update()
+        return len(self._cuids)
+
+    def cuid(self, component):
+        """Return the CUID string for a component."""
+        if self._pending:
+            self._update()
+        ans = self._cuids.get(component)
+        if ans is None:
+            ans = repr(ComponentUID(component, context=self._block))
+            self._cuids[component] = ans
+            self._components[ans] = component
+        return ans
+
+    def cuids(self, components):
+        """Return a list of the CUID strings for a list of components."""
+        return [self.cuid(obj) for obj in components]
+
+    def find_component(self, cuid):
+        """
+        Return the component for a CUID (either a ComponentUID or its
+        string representation), or None if the component does not exist.
+        """
+        if self._pending:
+            self._update()
+        if cuid.__class__ is ComponentUID:
+            key = repr(cuid)
+        else:
+            key = cuid
+        ans = self._components.get(key)
+        if ans is not None and ans.parent_component() is not None:
+            return ans
+        # Not indexed (e.g., the string representation, component data
+        # that was added to an existing component, or component data
+        # that was deleted)
+        if cuid.__class__ is not ComponentUID:
+            cuid = ComponentUID(cuid)
+        ans = cuid.find_component(self._block)
+        if ans is None:
+            self._components.pop(key, None)
+        else:
+            self._components[key] = ans
+        return ans
+
+    def find_components(self, cuids):
+        """Return a list of the components for a list of CUIDs."""
+        return [self.find_component(cuid) for cuid in cuids]
+
+    def _is_indexed_block(self, block):
+        if block is self._block:
+            return True
+        return self._descend_ctype is not False and block in self._cuids
+
+    def _component_added(self, block, name, obj):
+        if self._ctypes is not None and obj.type() not in self._ctypes:
+            return
+        if self._is_indexed_block(block):
+            # The CUIDs are generated when the index is next used, as the
+            # component may not be constructed yet.
+            self._pending.append((block, name))
+
+    def _component_removed(self, block, obj):
+        if not self._is_indexed_block(block) or obj not in self._cuids:
+            return
+        objs = [obj]
+        if obj.is_indexed():
+            objs.extend(obj.values())
+        for obj in objs:
+            self._remove(obj)
+            if self._descend_ctype is not False and \
+               isinstance(obj, _BlockData):
+                for comp in obj.component_objects(descend_into=True):
+                    self._remove(comp)
+                    if comp.is_indexed():
+                        for data in comp.values():
+                            self._remove(data)
+
+    def _remove(self, obj):
+        cuid = self._cuids.pop(obj, None)
+        if cuid is not None and self._components.get(cuid) is obj:
+            del self._components[cuid]
+
+    def _update(self):
+        pending, self._pending = self._pending, []
+        names = ComponentMap()
+        for block, name in pending:
+            obj = block.component(name)
+            if obj is None or obj in self._cuids:
+                continue
+            if block is self._block:
+                obj_cuid = name
+            else:
+                obj_cuid = self._cuids[block] + '.' + name
+            _generate_component_cuid_names(obj_cuid, obj, names)
+            if self._descend_ctype is not False and \
+               obj.type() in self._descend_ctype:
+                for block_ in obj.values():
+                    generate_cuid_names(block_,
+                                        ctype=self._ctypes,
+                                        descend_into=self._descend_ctype,
+                                        cuid_names_=names)
+        for obj, cuid in names.items():
+            self._cuids[obj] = cuid
+            self._components[cuid] = obj
+
+
 #
 # Deprecated functions.
 #
@@ -15,6 +15,7 @@ import pyutilib.misc
 from pyomo.core.expr.expr_errors import TemplateExpressionError
 from pyomo.core.base.indexed_component_slice import _IndexedComponent_slice
 from pyomo.core.base.component import Component, ActiveComponent
+from pyomo.core.base.label import _name_caches, _component_data_removed
 from pyomo.core.base.config import PyomoOptions
 from pyomo.common import DeveloperError
 
@@ -428,8 +429,11 @@ You can silence this warning by one of three ways:
         else:
             # Handle the normal deletion operation
             if self.is_indexed():
+                obj = self._data[index]
+                if _name_caches:
+                    _component_data_removed(self, obj)
                 # Remove reference to this object
-                self._data[index]._component = None
+                obj._component = None
             del self._data[index]
 
     def _not_constructed_error(self, idx):
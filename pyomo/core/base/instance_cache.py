@@ -0,0 +1,328 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+__all__ = ['InstanceCache']
+
+import functools
+import hashlib
+import logging
+import os
+import sys
+import types
+
+from six import iteritems, string_types, PY3
+from six.moves import cPickle as pickle, xrange
+
+from pyutilib.enum import EnumValue
+
+from pyomo.core.kernel.set_types import _VirtualSet, _validate_interval
+
+logger = logging.getLogger('pyomo.core')
+
+_simple_types = (int, float, bool, type(None)) + string_types
+if not PY3:
+    _simple_types += (long,)
+
+
+class _UnfingerprintableError(Exception):
+    """Raised for values whose fingerprint would not reflect their
+    behavior (e.g., arbitrary callable objects or containers of an
+    unknown type)"""
+
+
+def _fingerprint_value(val, _hash, _seen):
+    """Feed a stable representation of val into the hash object.
+
+    Only "value-like" objects (numbers, strings, ranges, NumPy arrays,
+    containers of them, functions, enums, virtual sets and components)
+    contribute their contents.  Any other object raises
+    _UnfingerprintableError, as neither its type name nor its repr()
+    identifies the values it would produce during construction.
+    """
+    if isinstance(val, _simple_types):
+        _hash.update(repr(val).encode())
+        return
+    if isinstance(val, xrange):
+        _hash.update(repr(val).encode())
+        return
+    numpy = sys.modules.get('numpy')
+    if (numpy is not None) and \
+       isinstance(val, (numpy.ndarray, numpy.generic)):
+        _hash.update(type(val).__name__.encode())
+        _hash.update(val.dtype.str.encode())
+        _hash.update(repr(val.shape).encode())
+        if val.dtype.hasobject:
+            _fingerprint_value(val.tolist(), _hash, set())
+        else:
+            _hash.update(numpy.ascontiguousarray(val).tobytes())
+        return
+    if id(val) in _seen:
+        _hash.update(b'<cycle>')
+        return
+    _seen.add(id(val))
+    if isinstance(val, (list, tuple)):
+        _hash.update(type(val).__name__.encode())
+        for v in val:
+            _fingerprint_value(v, _hash, _seen)
+    elif isinstance(val, (set, frozenset)):
+        _hash.update(b'set')
+        for v in sorted(repr(v) for v in val):
+            _hash.update(v.encode())
+    elif isinstance(val, dict):
+        _hash.update(b'dict')
+        for k, v in sorted(iteritems(val), key=lambda x: repr(x[0])):
+            _fingerprint_value(k, _hash, _seen)
+            _fingerprint_value(v, _hash, _seen)
+    elif isinstance(val, types.CodeType):
+        _hash.update(val.co_code)
+        _fingerprint_value(val.co_names, _hash, _seen)
+        _fingerprint_value(val.co_consts, _hash, _seen)
+    elif isinstance(val, (types.FunctionType, types.MethodType)):
+        func = getattr(val, '__func__', val)
+        _hash.update(getattr(func, '__module__', '').encode())
+        _hash.update(func.__name__.encode())
+        _fingerprint_value(func.__code__, _hash, _seen)
+        _fingerprint_value(func.__defaults__, _hash, _seen)
+        _fingerprint_value(getattr(func, '__kwdefaults__', None),
+                           _hash, _seen)
+        # Values captured by closures change the rule behavior
+        # without changing its bytecode
+        for cell in (func.__closure__ or ()):
+            try:
+                contents = cell.cell_contents
+            except ValueError:
+                _hash.update(b'<empty cell>')
+                continue
+            _fingerprint_value(contents, _hash, _seen)
+        if getattr(val, '__self__', None) is not None:
+            _fingerprint_value(val.__self__, _hash, _seen)
+    elif isinstance(val, functools.partial):
+        _hash.update(b'partial')
+        _fingerprint_value(val.func, _hash, _seen)
+        _fingerprint_value(val.args, _hash, _seen)
+        _fingerprint_value(val.keywords, _hash, _seen)
+    elif isinstance(val, types.BuiltinFunctionType):
+        _hash.update(str(getattr(val, '__module__', '')).encode())
+        _hash.update(val.__name__.encode())
+    elif isinstance(val, type):
+        _hash.update(getattr(val, '__module__', '').encode())
+        _hash.update(val.__name__.encode())
+    elif hasattr(val, 'is_component_type') and val.is_component_type():
+        _hash.update(val.__class__.__name__.encode())
+        _hash.update(val.name.encode())
+    elif isinstance(val, EnumValue):
+        _hash.update(b'enum')
+        _fingerprint_value(val.key, _hash, _seen)
+        _fingerprint_value(val.index, _hash, _seen)
+    elif isinstance(val, _VirtualSet):
+        _hash.update(val.__class__.__name__.encode())
+        _fingerprint_value(val.name, _hash, _seen)
+        _fingerprint_value(val._bounds, _hash, _seen)
+        # Interval validators only check the bounds recorded above
+        if not isinstance(val.validate, _validate_interval):
+            _fingerprint_value(val.validate, _hash, _seen)
+    elif callable(val):
+        raise _UnfingerprintableError(
+            "Can not fingerprint callable object of type %s"
+            % (type(val).__name__,))
+    else:
+        raise _UnfingerprintableError(
+            "Can not fingerprint object of type %s"
+            % (type(val).__name__,))
+
+
+def _fingerprint_file(fname, _hash):
+    _hash.update(os.path.abspath(fname).encode())
+    with open(fname, 'rb') as INPUT:
+        while True:
+            block = INPUT.read(1 << 20)
+            if not block:
+                break
+            _hash.update(block)
+
+
+if hasattr(os, 'replace'):
+    _replace = os.replace
+else:                                             #pragma:nocover
+    def _replace(src, dst):
+        # os.rename does not overwrite existing files on Windows
+        # (and os.replace is not available in Python 2)
+        if os.name == 'nt' and os.path.exists(dst):
+            os.remove(dst)
+        os.rename(src, dst)
+
+
+class InstanceCache(object):
+    """
+    An on-disk cache of constructed model instances.
+
+    Instances created by :meth:`Model.create_instance` are stored as
+    pickled snapshots keyed on a fingerprint of the abstract model
+    declaration (component names, types, rules and initializers) and of
+    the data used to construct it (the contents of the data file, or the
+    contents of the data dictionary / DataPortal).  When the same model
+    is created from the same data, the snapshot is restored instead of
+    re-running the component rules.
+
+    Note that rules are fingerprinted by their bytecode, defaults and
+    closure values: changes to global values referenced by a rule are
+    not detected.  Models that use callable objects other than
+    functions, methods and :class:`functools.partial` objects as
+    rules or initializers, or initializers other than numbers,
+    strings, ranges, NumPy arrays and the builtin containers of
+    them, can not be fingerprinted and are never cached.  Additional
+    files that affect construction (for example, files loaded by
+    ``load`` or ``include`` commands in a .dat file) may be listed in
+    ``dependencies``.
+
+    Args:
+        directory (str): the directory used to store the snapshots.
+            It is created if it does not exist.
+        max_size (int): the maximum total size (in bytes) of all
+            snapshots in the cache.  The least recently used snapshots
+            are removed when the limit is exceeded.  None means
+            unbounded.
+        dependencies (list): additional file names whose contents are
+            included in every fingerprint.
+    """
+
+    suffix = '.pyomo_instance'
+
+    def __init__(self, directory, max_size=None, dependencies=()):
+        self.directory = os.path.abspath(directory)
+        self.max_size = max_size
+        self.dependencies = list(dependencies)
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+
+    def fingerprint(self, model, data=None, name=None, namespaces=None):
+        """Return the cache key for constructing model from data.
+
+        Returns None if the model declaration or the data can not be
+        fingerprinted, in which case the instance must not be cached.
+        """
+        try:
+            return self._fingerprint(model, data, name, namespaces)
+        except _UnfingerprintableError:
+            err = sys.exc_info()[1]
+            logger.debug("Model '%s' will not use the instance cache: %s"
+                         % (model.name, err))
+            return None
+
+    def _fingerprint(self, model, data, name, namespaces):
+        _hash = hashlib.sha1()
+        _seen = set()
+        _hash.update(model.__class__.__name__.encode())
+        _fingerprint_value(name, _hash, _seen)
+        _fingerprint_value(namespaces, _hash, _seen)
+        _fingerprint_value(model._rule, _hash, _seen)
+        for cname, comp in iteritems(model.component_map()):
+            _hash.update(cname.encode())
+            _hash.update(comp.__class__.__name__.encode())
+            for attr, val in sorted(iteritems(comp.__dict__)):
+                if attr in ('_parent', '_component', '_name'):
+                    continue
+                _hash.update(attr.encode())
+                _fingerprint_value(val, _hash, _seen)
+        if isinstance(data, string_types):
+            _fingerprint_file(data, _hash)
+        elif hasattr(data, '_data') and hasattr(data, '_default'):
+            # A DataPortal that has already loaded its data
+            _fingerprint_value(data._data, _hash, _seen)
+            _fingerprint_value(data._default, _hash, _seen)
+        else:
+            _fingerprint_value(data, _hash, _seen)
+        for fname in self.dependencies:
+            _fingerprint_file(fname, _hash)
+        return _hash.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + self.suffix)
+
+    def get(self, key):
+        """Return the cached instance for key, or None on a cache miss."""
+        if key is None:
+            return None
+        fname = self._path(key)
+        if not os.path.exists(fname):
+            return None
+        try:
+            with open(fname, 'rb') as INPUT:
+                instance = pickle.load(INPUT)
+        except Exception:
+            logger.warning(
+                "Discarding unreadable model instance cache entry '%s'"
+                % (fname,))
+            self._remove(fname)
+            return None
+        # Touch the file so that eviction is least-recently-used
+        os.utime(fname, None)
+        return instance
+
+    def put(self, key, instance):
+        """Store the instance under key.
+
+        Returns True if the instance was stored.  Instances that cannot
+        be pickled (e.g., because they reference lambda rules) or that
+        have no fingerprint (key is None) are not cached.
+        """
+        if key is None:
+            return False
+        fname = self._path(key)
+        tmpname = fname + '.%d.tmp' % (os.getpid(),)
+        try:
+            with open(tmpname, 'wb') as OUTPUT:
+                pickle.dump(instance, OUTPUT, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            err = sys.exc_info()[1]
+            logger.warning(
+                "Model instance '%s' could not be stored in the instance "
+                "cache:\n    %s: %s" % (instance.name, type(err).__name__, err))
+            self._remove(tmpname)
+            return False
+        _replace(tmpname, fname)
+        self._evict()
+        return True
+
+    def clear(self):
+        """Remove all snapshots from the cache."""
+        for fname, _, _ in self._entries():
+            self._remove(fname)
+
+    def _entries(self):
+        ans = []
+        for fname in os.listdir(self.directory):
+            if not fname.endswith(self.suffix):
+                continue
+            fname = os.path.join(self.directory, fname)
+            try:
+                stat = os.stat(fname)
+            except OSError:
+                continue
+            ans.append((fname, stat.st_mtime, stat.st_size))
+        return ans
+
+    def _evict(self):
+        if self.max_size is None:
+            return
+        entries = sorted(self._entries(), key=lambda x: x[1])
+        total = sum(x[2] for x in entries)
+        # Always keep the most recent entry, even if it alone exceeds
+        # the size limit
+        while total > self.max_size and len(entries) > 1:
+            fname, _, size = entries.pop(0)
+            self._remove(fname)
+            total -= size
+
+    def _remove(self, fname):
+        try:
+            os.remove(fname)
+        except OSError:
+            pass
@@ -10,16 +10,20 @@
 
 __all__ = ['CounterLabeler', 'NumericLabeler', 'CNameLabeler', 'TextLabeler',
            'AlphaNumericTextLabeler','NameLabeler', 'CuidLabeler',
-           'ShortNameLabeler']
+           'ShortNameLabeler', 'ComponentNameCache']
+
+import weakref
 
 import six
+from six import iteritems
 if six.PY3:
     _translate = str.translate
 else:
     import string
     _translate = string.translate
 
-from pyomo.core.base.component import ComponentUID
+from pyomo.core.base.component import (ComponentUID, Component,
+                                       ComponentData, _name_index_generator)
 
 # This module provides some basic functionality for generating labels
 # from pyomo names, which often contain characters such as "[" and "]"
@@ -112,45 +116,247 @@ class NumericLabeler(object):
         pass
 
 #
-# TODO: [JDS] I would like to rename TextLabeler to LPLabeler - as it
-# generated LP-file-compliant labels - and make the CNameLabeler the
-# TextLabeler.  This makes sense as the name() is the closest thing we
-# have to a human-readable canonical text naming convention (the
-# ComponentUID strings are actually unique, but not meant to be human
-# readable).  Unfortunately, the TextLabeler is used all over the place
-# (particularly PySP), and I don't know how much depends on the labels
-# actually being LP-compliant.
+# Model-level cache of fully qualified component names
 #
-class CNameLabeler(object):
+
+# model -> ComponentNameCache
+_name_caches = weakref.WeakKeyDictionary()
+
+class _NameCacheObserver(object):
+    """Invalidates the name caches when the model structure changes"""
+
+    # Set when the first cache is created (importing Block here would
+    # create a circular import)
+    block_type = None
+
+    def _component_added(self, block, name, obj):
+        # Only a model (a block without a parent) owns a name cache.
+        # Adding a model to another block changes the names of all of
+        # its components; adding anything else cannot change a name
+        # that is already cached.
+        if obj._type is not self.block_type:
+            return
+        cache = _name_caches.pop(obj, None)
+        if cache is not None:
+            cache.clear()
+
+    def _component_removed(self, block, obj):
+        if not _name_caches:
+            return
+        model = block.model()
+        if model is None:
+            return
+        cache = _name_caches.get(model)
+        if cache is not None:
+            cache._component_removed(obj)
+
+_name_cache_observer = _NameCacheObserver()
+
+def _component_data_removed(component, obj):
+    """Discard the cached name of a deleted index of a component"""
+    model = component.model()
+    if model is None:
+        return
+    cache = _name_caches.get(model)
+    if cache is not None:
+        cache._discard(obj)
+
+class ComponentNameCache(object):
+    """
+    A cache of the fully qualified names (and labels generated from
+    them) of the components in a model.
+
+    The cache is shared by all labelers that generate labels from
+    component names, so that repeated writes of the same model do not
+    regenerate the names.  Entries only hold weak references to the
+    components, and are discarded when components (or indices of
+    indexed components) are deleted from the model, which is the only
+    way a component can be renamed or moved.  The whole cache is
+    discarded when the model is added to another block.  Use
+    :meth:`get` to retrieve the cache for a model.
+    """
+
     def __init__(self):
-        self.name_buffer = {}
+        # id -> (weakref, name)
+        self._names = {}
+        # translation function -> {id -> (weakref, label)}
+        self._tables = {None: self._names}
 
-    def __call__(self, obj):
-        return obj.getname(True, self.name_buffer)
+        def remove(wr, selfref=weakref.ref(self)):
+            self = selfref()
+            if self is not None:
+                ent = self._names.get(wr.key)
+                if ent is not None and ent[0] is wr:
+                    self._discard_id(wr.key)
+        self._remove = remove
+
+    @staticmethod
+    def get(obj, create=True):
+        """
+        Return the name cache for the model that owns obj, or None if
+        the object is not a component attached to a model.
+        """
+        if not isinstance(obj, (Component, ComponentData)):
+            return None
+        model = obj.model()
+        if model is None:
+            return None
+        cache = _name_caches.get(model)
+        if cache is None and create:
+            from pyomo.core.base.block import (Block,
+                                               _block_structure_observers)
+            _name_cache_observer.block_type = Block
+            _block_structure_observers.add(_name_cache_observer)
+            cache = _name_caches[model] = ComponentNameCache()
+        return cache
+
+    def __len__(self):
+        return len(self._names)
+
+    def clear(self):
+        """Discard all cached names and labels"""
+        for table in self._tables.values():
+            table.clear()
+
+    def table(self, translate=None):
+        """Return the {id: (weakref, label)} dictionary for a translation"""
+        table = self._tables.get(translate)
+        if table is None:
+            table = self._tables[translate] = {}
+        return table
+
+    def name(self, obj):
+        """Return the fully qualified name of a component"""
+        names = self._names
+        ent = names.get(id(obj))
+        if ent is not None and ent[0]() is obj:
+            return ent[1]
+        c = obj.parent_component()
+        if c is obj:
+            pb = obj.parent_block()
+            if pb is None:
+                # The model itself is not cached
+                return obj._name
+            if pb.parent_block() is None:
+                ans = obj._name
+            else:
+                ans = self.name(pb) + "." + obj._name
+            names[id(obj)] = (weakref.KeyedRef(obj, self._remove, id(obj)),
+                              ans)
+            return ans
+        #
+        # Generate the names of all the data in the owning component
+        #
+        base = self.name(c)
+        remove = self._remove
+        for idx, data in iteritems(c):
+            ent = names.get(id(data))
+            if ent is None or ent[0]() is not data:
+                names[id(data)] = (
+                    weakref.KeyedRef(data, remove, id(data)),
+                    base + _name_index_generator(idx))
+        ent = names.get(id(obj))
+        if ent is None or ent[0]() is not obj:
+            raise RuntimeError("Fatal error: cannot find the component data "
+                               "in the owning component's _data dictionary.")
+        return ent[1]
+
+    def label(self, obj, translate=None):
+        """Return the (translated) fully qualified name of a component"""
+        if translate is None:
+            return self.name(obj)
+        table = self.table(translate)
+        ent = table.get(id(obj))
+        if ent is not None and ent[0]() is obj:
+            return ent[1]
+        ans = translate(self.name(obj))
+        ent = self._names.get(id(obj))
+        if ent is not None:
+            table[id(obj)] = (ent[0], ans)
+        return ans
+
+    def _discard_id(self, _id):
+        for table in self._tables.values():
+            table.pop(_id, None)
+
+    def _discard(self, obj):
+        ent = self._names.get(id(obj))
+        if ent is not None and ent[0]() is obj:
+            self._discard_id(id(obj))
+
+    def _component_removed(self, obj):
+        if id(obj) not in self._names:
+            # Names are generated top-down, so nothing below this
+            # component has been cached
+            return
+        objs = [obj]
+        if obj.is_indexed():
+            objs.extend(obj.values())
+        for obj in objs:
+            self._discard(obj)
+            if hasattr(obj, 'component_objects'):
+                for comp in obj.component_objects(descend_into=True):
+                    self._discard(comp)
+                    if comp.is_indexed():
+                        for data in comp.values():
+                            self._discard(data)
+
+class _CachedNameLabeler(object):
+    """
+    Base class for labelers that generate labels from the fully
+    qualified component names, using the model name cache (see
+    ComponentNameCache).
+    """
+    _translate = None
 
-class TextLabeler(object):
     def __init__(self):
+        # Used for objects that are not attached to a model (and
+        # kernel objects)
         self.name_buffer = {}
+        self._table = None
 
     def __call__(self, obj):
-        return cpxlp_label_from_name(obj.getname(True, self.name_buffer))
+        table = self._table
+        if table is not None:
+            ent = table.get(id(obj))
+            if ent is not None and ent[0]() is obj:
+                return ent[1]
+        cache = ComponentNameCache.get(obj)
+        if cache is None:
+            ans = obj.getname(True, self.name_buffer)
+            if self._translate is not None:
+                ans = self._translate(ans)
+            return ans
+        self._table = cache.table(self._translate)
+        return cache.label(obj, self._translate)
 
     def remove_obj(self, obj):
-        self.name_buffer.pop(id(obj))
+        self.name_buffer.pop(id(obj), None)
+        cache = ComponentNameCache.get(obj, create=False)
+        if cache is not None:
+            cache._discard(obj)
 
-class AlphaNumericTextLabeler(object):
-    def __init__(self):
-        self.name_buffer = {}
+#
+# TODO: [JDS] I would like to rename TextLabeler to LPLabeler - as it
+# generated LP-file-compliant labels - and make the CNameLabeler the
+# TextLabeler.  This makes sense as the name() is the closest thing we
+# have to a human-readable canonical text naming convention (the
+# ComponentUID strings are actually unique, but not meant to be human
+# readable).  Unfortunately, the TextLabeler is used all over the place
+# (particularly PySP), and I don't know how much depends on the labels
+# actually being LP-compliant.
+#
+class CNameLabeler(_CachedNameLabeler):
+    pass
 
-    def __call__(self, obj):
-        return alphanum_label_from_name(obj.getname(True, self.name_buffer))
+class TextLabeler(_CachedNameLabeler):
+    _translate = staticmethod(cpxlp_label_from_name)
 
-class NameLabeler(object):
-    def __init__(self):
-        self.name_buffer = {}
+class AlphaNumericTextLabeler(_CachedNameLabeler):
+    _translate = staticmethod(alphanum_label_from_name)
 
-    def __call__(self, obj):
-        return obj.getname(True, self.name_buffer)
+class NameLabeler(_CachedNameLabeler):
+    pass
 
 class ShortNameLabeler(object):
     def __init__(self, limit, prefix, start=0, labeler=None):
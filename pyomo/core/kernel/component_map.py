@@ -171,4 +171,29 @@ class ComponentMap(_MutableMapping):
             self[key] = default
         return default
 
+    def update(*args, **kwds):
+        'D.update([E, ]**F) -> None.  Update D from mapping/iterable E and F.'
+        # The default implementation calls __setitem__ for each
+        # entry, which is slow when loading large amounts of
+        # solver data (e.g., into Suffix objects).
+        if not args:
+            raise TypeError("descriptor 'update' of 'ComponentMap' "
+                            "object needs an argument")
+        self = args[0]
+        if len(args) > 2:
+            raise TypeError("update expected at most 1 arguments, "
+                            "got %d" % (len(args) - 1))
+        if len(args) == 2:
+            other = args[1]
+            if isinstance(other, ComponentMap):
+                self._dict.update(other._dict)
+            elif isinstance(other, _Mapping) or hasattr(other, "keys"):
+                self._dict.update((id(key), (key, other[key]))
+                                  for key in other.keys())
+            else:
+                self._dict.update((id(key), (key, val))
+                                  for key, val in other)
+        for key, val in six.iteritems(kwds):
+            self[key] = val
+
 
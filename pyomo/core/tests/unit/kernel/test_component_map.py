@@ -179,6 +179,22 @@ class TestComponentMap(unittest.TestCase):
         for c, val in self._components:
             self.assertEqual(cmap[c], val)
 
+    def test_update_mapping(self):
+        cmap = ComponentMap(self._components)
+        other = ComponentMap()
+        other.update(cmap)
+        self.assertEqual(other, cmap)
+        other = ComponentMap()
+        other.update(dict((id(c), (c, val)) for c, val in self._components)
+                     .values())
+        self.assertEqual(other, cmap)
+        c, _ = self._components[0]
+        other.update(ComponentMap([(c, "new")]))
+        self.assertEqual(other[c], "new")
+        self.assertEqual(len(other), len(self._components))
+        with self.assertRaises(TypeError):
+            other.update(cmap, cmap)
+
     def test_clear(self):
         cmap = ComponentMap()
         self.assertEqual(len(cmap), 0)
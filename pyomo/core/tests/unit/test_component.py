@@ -15,7 +15,7 @@ import pyutilib.th as unittest
 
 from pyomo.common import DeveloperError
 import pyomo.core.base._pyomo
-from pyomo.core.base.block import generate_cuid_names
+from pyomo.core.base.block import generate_cuid_names, ComponentUIDIndex
 from pyomo.environ import *
 
 
@@ -466,6 +466,67 @@ class TestComponentUID(unittest.TestCase):
             del cuids[obj]
         self.assertEqual(len(cuids), 0)
 
+    def _cuid_index_model(self):
+        model = Block(concrete=True)
+        model.x = Var()
+        model.y = Var([1,2])
+        model.V = Var([('a','b'),(1,'2'),(3,4)])
+        model.b = Block(concrete=True)
+        model.b.z = Var([1,'2'])
+        model.B = Block(['a',2], concrete=True)
+        model.B[2].b = Block()
+        model.B[2].b.x = Var()
+        return model
+
+    def test_cuid_index(self):
+        model = self._cuid_index_model()
+        index = ComponentUIDIndex(model)
+        cuids = generate_cuid_names(model)
+        self.assertEqual(len(index), len(cuids))
+        for obj, cuid in cuids.items():
+            self.assertEqual(index.cuid(obj), cuid)
+            self.assertIs(index.find_component(cuid), obj)
+            self.assertIs(index.find_component(ComponentUID(obj)), obj)
+        self.assertIs(index.find_component('V[1,2]'), model.V[1,'2'])
+        self.assertIs(index.find_component('foo'), None)
+        objs = [model.y[2], model.B[2].b.x, model.x]
+        self.assertEqual(index.find_components(index.cuids(objs)), objs)
+
+    def test_cuid_index_add_del(self):
+        model = self._cuid_index_model()
+        index = ComponentUIDIndex(model, ctype=Var)
+        n = len(index)
+        model.w = Var([1,2])
+        model.B[2].b.c = Block()
+        model.B[2].b.c.v = Var()
+        model.B['a'].e = Expression()
+        self.assertEqual(len(index), n + 5)
+        for obj in [model.w, model.w[1], model.B[2].b.c, model.B[2].b.c.v]:
+            self.assertEqual(index.cuid(obj), repr(ComponentUID(obj)))
+            self.assertIs(index.find_component(repr(ComponentUID(obj))), obj)
+        self.assertEqual(index.find_component('B[a].e'), model.B['a'].e)
+
+        # deleted component data is not returned from the index
+        y1 = model.y[1]
+        del model.y[1]
+        y1_new = index.find_component('y:#1')
+        self.assertIsNot(y1_new, y1)
+        self.assertIs(y1_new, model.y[1])
+
+        model.del_component(model.B)
+        self.assertIs(index.find_component('B:#2.b.c.v'), None)
+        self.assertIs(index.find_component('B:$a'), None)
+        model.del_component(model.x)
+        self.assertIs(index.find_component('x'), None)
+        model.x = Var()
+        self.assertIs(index.find_component('x'), model.x)
+
+        # blocks that are not indexed are ignored
+        other = ConcreteModel()
+        other.x = Var()
+        self.assertIs(index.find_component('x'), model.x)
+
+
 class TestEnviron(unittest.TestCase):
 
     def test_components(self):
@@ -0,0 +1,235 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for the model instance cache
+#
+
+import functools
+import os
+import shutil
+import tempfile
+
+import pyutilib.th as unittest
+
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
+from pyomo.environ import AbstractModel, ConcreteModel, Set, Param, Var, \
+    Constraint, Objective, InstanceCache, value
+
+_rule_calls = []
+
+def _c_rule(m, i):
+    _rule_calls.append(i)
+    return m.x[i] >= m.p[i]
+
+def _c_rule_alt(m, i):
+    _rule_calls.append(i)
+    return m.x[i] >= 2*m.p[i]
+
+def _c_rule_scaled(m, i, scale):
+    _rule_calls.append(i)
+    return m.x[i] >= scale*m.p[i]
+
+def _make_closure_rule(scale):
+    def _rule(m, i):
+        return m.x[i] >= scale*m.p[i]
+    return _rule
+
+class _Domain(object):
+    def __init__(self, values):
+        self.values = values
+    def __contains__(self, val):
+        return val in self.values
+
+class _CallableRule(object):
+    def __init__(self, scale):
+        self.scale = scale
+    def __call__(self, m, i):
+        return m.x[i] >= self.scale*m.p[i]
+
+def _o_rule(m):
+    return sum(m.x[i] for i in m.A)
+
+def _make_model(c_rule=_c_rule):
+    model = AbstractModel()
+    model.A = Set()
+    model.p = Param(model.A, mutable=True)
+    model.x = Var(model.A)
+    model.c = Constraint(model.A, rule=c_rule)
+    model.o = Objective(rule=_o_rule)
+    return model
+
+
+class TestInstanceCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.cache = InstanceCache(os.path.join(self.tmpdir, 'cache'))
+        del _rule_calls[:]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _data(self, p):
+        return {None: {'A': {None: [1, 2]}, 'p': p}}
+
+    def _initialized_model(self, initialize):
+        model = AbstractModel()
+        model.A = Set(initialize=initialize)
+        return model
+
+    def test_hit(self):
+        model = _make_model()
+        data = self._data({1: 10, 2: 20})
+        inst1 = model.create_instance(data=data, cache=self.cache)
+        self.assertEqual(_rule_calls, [1, 2])
+        inst2 = model.create_instance(data=data, cache=self.cache)
+        self.assertEqual(_rule_calls, [1, 2])
+        self.assertIsNot(inst1, inst2)
+        self.assertIs(type(inst2), ConcreteModel)
+        self.assertEqual(value(inst2.p[2]), 20)
+        self.assertEqual(value(inst2.c[2].lower), 20)
+        # the restored instance is independent and fully functional
+        inst2.p[2] = 5
+        self.assertEqual(value(inst2.c[2].lower), 5)
+        self.assertEqual(value(inst1.c[2].lower), 20)
+
+    def test_miss_on_data_change(self):
+        model = _make_model()
+        model.create_instance(data=self._data({1: 10, 2: 20}),
+                              cache=self.cache)
+        inst = model.create_instance(data=self._data({1: 10, 2: 30}),
+                                     cache=self.cache)
+        self.assertEqual(_rule_calls, [1, 2, 1, 2])
+        self.assertEqual(value(inst.p[2]), 30)
+
+    def test_miss_on_model_change(self):
+        data = self._data({1: 10, 2: 20})
+        _make_model().create_instance(data=data, cache=self.cache)
+        inst = _make_model(_c_rule_alt).create_instance(
+            data=data, cache=self.cache)
+        self.assertEqual(_rule_calls, [1, 2, 1, 2])
+        self.assertEqual(value(inst.c[2].lower), 40)
+
+    def test_miss_on_file_change(self):
+        fname = os.path.join(self.tmpdir, 'data.dat')
+        with open(fname, 'w') as OUTPUT:
+            OUTPUT.write("set A := 1 2 ;\nparam p := 1 10 2 20 ;\n")
+        model = _make_model()
+        model.create_instance(fname, cache=self.cache)
+        model.create_instance(fname, cache=self.cache)
+        self.assertEqual(_rule_calls, [1, 2])
+        with open(fname, 'w') as OUTPUT:
+            OUTPUT.write("set A := 1 2 ;\nparam p := 1 10 2 25 ;\n")
+        inst = model.create_instance(fname, cache=self.cache)
+        self.assertEqual(_rule_calls, [1, 2, 1, 2])
+        self.assertEqual(value(inst.p[2]), 25)
+
+    def test_closure_fingerprint(self):
+        data = self._data({1: 10, 2: 20})
+        key1 = self.cache.fingerprint(_make_model(_make_closure_rule(1)),
+                                      data)
+        key2 = self.cache.fingerprint(_make_model(_make_closure_rule(2)),
+                                      data)
+        self.assertIsNotNone(key1)
+        self.assertNotEqual(key1, key2)
+        self.assertEqual(
+            key1,
+            self.cache.fingerprint(_make_model(_make_closure_rule(1)),
+                                   data))
+
+    def test_miss_on_partial_change(self):
+        data = self._data({1: 10, 2: 20})
+        _make_model(functools.partial(_c_rule_scaled, scale=1)).\
+            create_instance(data=data, cache=self.cache)
+        inst = _make_model(functools.partial(_c_rule_scaled, scale=3)).\
+            create_instance(data=data, cache=self.cache)
+        self.assertEqual(_rule_calls, [1, 2, 1, 2])
+        self.assertEqual(value(inst.c[2].lower), 60)
+        _make_model(functools.partial(_c_rule_scaled, scale=3)).\
+            create_instance(data=data, cache=self.cache)
+        self.assertEqual(_rule_calls, [1, 2, 1, 2])
+
+    def test_callable_object_not_cached(self):
+        data = self._data({1: 10, 2: 20})
+        model = _make_model(_CallableRule(2))
+        self.assertIsNone(self.cache.fingerprint(model, data))
+        inst = model.create_instance(data=data, cache=self.cache)
+        self.assertEqual(value(inst.c[2].lower), 40)
+        self.assertEqual(self.cache._entries(), [])
+
+    def test_miss_on_range_change(self):
+        self._initialized_model(range(3)).create_instance(cache=self.cache)
+        inst = self._initialized_model(range(5)).create_instance(
+            cache=self.cache)
+        self.assertEqual(list(inst.A), [0, 1, 2, 3, 4])
+        self.assertEqual(len(self.cache._entries()), 2)
+
+    @unittest.skipIf(not numpy_available, "NumPy is not available")
+    def test_miss_on_array_change(self):
+        self._initialized_model(numpy.array([1, 2, 3])).\
+            create_instance(cache=self.cache)
+        inst = self._initialized_model(numpy.array([1, 2, 4])).\
+            create_instance(cache=self.cache)
+        self.assertEqual(sorted(inst.A), [1, 2, 4])
+        self.assertEqual(len(self.cache._entries()), 2)
+        inst = self._initialized_model(numpy.array([1, 2, 4])).\
+            create_instance(cache=self.cache)
+        self.assertEqual(sorted(inst.A), [1, 2, 4])
+        self.assertEqual(len(self.cache._entries()), 2)
+
+    def test_unknown_domain_not_cached(self):
+        model = AbstractModel()
+        model.p = Param(within=_Domain([1, 2, 3]), initialize=2)
+        self.assertIsNone(self.cache.fingerprint(model))
+        inst = model.create_instance(cache=self.cache)
+        self.assertEqual(value(inst.p), 2)
+        self.assertEqual(self.cache._entries(), [])
+
+    def test_overwrite_entry(self):
+        model = _make_model()
+        data = self._data({1: 10, 2: 20})
+        inst = model.create_instance(data=data)
+        key = self.cache.fingerprint(model, data)
+        self.assertTrue(self.cache.put(key, inst))
+        self.assertTrue(self.cache.put(key, inst))
+        self.assertEqual(len(self.cache._entries()), 1)
+        self.assertEqual(value(self.cache.get(key).p[2]), 20)
+
+    def test_lru_eviction(self):
+        model = _make_model()
+        model.create_instance(data=self._data({1: 1, 2: 1}),
+                              cache=self.cache)
+        entries = self.cache._entries()
+        self.assertEqual(len(entries), 1)
+        self.cache.max_size = int(1.5*entries[0][2])
+        model.create_instance(data=self._data({1: 2, 2: 2}),
+                              cache=self.cache)
+        self.assertEqual(len(self.cache._entries()), 1)
+        # The most recent instance is the one retained
+        del _rule_calls[:]
+        model.create_instance(data=self._data({1: 2, 2: 2}),
+                              cache=self.cache)
+        self.assertEqual(_rule_calls, [])
+
+    def test_clear(self):
+        model = _make_model()
+        model.create_instance(data=self._data({1: 1, 2: 1}),
+                              cache=self.cache)
+        self.cache.clear()
+        self.assertEqual(self.cache._entries(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
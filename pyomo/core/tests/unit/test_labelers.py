@@ -9,8 +9,12 @@
 #  ___________________________________________________________________________
 
 
+import gc
+import weakref
+
 import pyutilib.th as unittest
 from pyomo.environ import *
+from pyomo.core.base.label import cpxlp_label_from_name
 
 
 class LabelerTests(unittest.TestCase):
@@ -151,6 +155,91 @@ class LabelerTests(unittest.TestCase):
         self.assertEqual(lbl(m.ind[10]), 'ind_10_')
         self.assertEqual(lbl(m.ind[1]), 'ind_1_')
 
+    def test_name_cache(self):
+        m = self.m
+        cache = ComponentNameCache.get(m.ind[3])
+        self.assertIs(ComponentNameCache.get(m.myblock.mystreet), cache)
+        self.assertEqual(TextLabeler()(m.ind[3]), 'ind(3)')
+        # the names of all the data in m.ind are cached
+        n = len(cache)
+        self.assertEqual(n, 11)
+        self.assertEqual(NameLabeler()(m.ind[5]), 'ind[5]')
+        self.assertEqual(len(cache), n)
+        self.assertEqual(TextLabeler()(m.myblock.mystreet), 'myblock_mystreet')
+        self.assertEqual(len(cache), n + 2)
+        # objects that are not attached to a model are not cached
+        self.assertIs(ComponentNameCache.get(Var()), None)
+        self.assertEqual(NameLabeler()(m), 'unknown')
+        self.assertEqual(len(cache), n + 2)
+
+    def test_name_cache_invalidation(self):
+        m = self.m
+        lbl = TextLabeler()
+        street = m.myblock.mystreet
+        self.assertEqual(lbl(street), 'myblock_mystreet')
+        m.myblock.del_component(street)
+        m.newblock = Block()
+        m.newblock.add_component('mystreet', street)
+        self.assertEqual(lbl(street), 'newblock_mystreet')
+
+        # a model that is added to another model
+        cache = ComponentNameCache.get(m.mycomp)
+        self.assertEqual(lbl(m.mycomp), 'mycomp')
+        self.assertEqual(lbl(m.ind[1]), 'ind(1)')
+        outer = ConcreteModel()
+        outer.inner = m
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(lbl(m.mycomp), 'inner_mycomp')
+        self.assertEqual(lbl(m.ind[1]), 'inner_ind(1)')
+
+    def test_name_cache_index_deletion(self):
+        m = self.m
+        lbl = TextLabeler()
+        cache = ComponentNameCache.get(m.ind[1])
+        v = m.ind[2]
+        self.assertEqual(lbl(v), 'ind(2)')
+        n = len(cache)
+        del m.ind[2]
+        self.assertEqual(len(cache), n - 1)
+        self.assertIs(ComponentNameCache.get(v), None)
+        self.assertEqual(lbl(m.ind[3]), 'ind(3)')
+        self.assertEqual(len(cache), n - 1)
+
+    def test_name_cache_weak_references(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2])
+        m.b = Block()
+        m.b.y = Var()
+        lbl = TextLabeler()
+        cache = ComponentNameCache.get(m.x)
+        self.assertEqual(lbl(m.x[1]), 'x(1)')
+        self.assertEqual(lbl(m.b.y), 'b_y')
+        self.assertEqual(len(cache), 5)
+        # the cache does not keep deleted components alive
+        y = weakref.ref(m.b.y)
+        m.b.del_component('y')
+        gc.collect()
+        self.assertIs(y(), None)
+        self.assertEqual(len(cache), 4)
+        b = weakref.ref(m.b)
+        x2 = weakref.ref(m.x[2])
+        del m.x[2]
+        m.del_component('b')
+        gc.collect()
+        self.assertIs(b(), None)
+        self.assertIs(x2(), None)
+        self.assertEqual(len(cache), 2)
+
+    def test_name_cache_remove_obj(self):
+        m = self.m
+        lbl = TextLabeler()
+        cache = ComponentNameCache.get(m.mycomp)
+        self.assertEqual(lbl(m.mycomp), 'mycomp')
+        self.assertIn(id(m.mycomp), cache.table(cpxlp_label_from_name))
+        lbl.remove_obj(m.mycomp)
+        self.assertNotIn(id(m.mycomp), cache.table(cpxlp_label_from_name))
+        self.assertEqual(lbl(m.mycomp), 'mycomp')
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -10,10 +10,31 @@
 
 __all__ = ['TableData']
 
+from itertools import islice
+
+from six import string_types
 from six.moves import xrange
 
 from pyutilib.misc import Options
-from pyomo.dataportal.process_data import _process_data
+from pyomo.dataportal.process_data import _process_data, _process_token
+
+#
+# The default number of rows that are read from a table at a time
+# when the table is streamed.
+#
+DEFAULT_CHUNKSIZE = 10000
+
+
+def _convert_column(values):
+    """
+    Convert a column of string tokens using the same rules as
+    _process_token().  Columns that only contain integers are converted
+    in bulk.
+    """
+    try:
+        return [int(v) for v in values]
+    except (ValueError, TypeError):
+        return [_process_token(v) for v in values]
 
 
 class TableData(object):
@@ -27,6 +48,7 @@ class TableData(object):
         Constructor
         """
         self._info=None
+        self._streamed=None
         self._data=None
         self.options = Options()
         self.options.ncolumns = 1
@@ -88,6 +110,14 @@ class TableData(object):
             model = self.options.model
         if not self.options.namespace in data:
             data[self.options.namespace] = {}
+        if self._streamed is not None:
+            _data = data[self.options.namespace]
+            for dtype, name, values in self._streamed:
+                if dtype == 'set':
+                    _data[name] = {None: values}
+                else:
+                    _data.setdefault(name, {}).update(values)
+            return True
         return _process_data(
           self._info,
           model,
@@ -104,8 +134,87 @@ class TableData(object):
         Clear the data that was extracted from this table
         """
         self._info = None
+        self._streamed = None
 
-    def _set_data(self, headers, rows):
+    def _chunks(self, rows):
+        """
+        Group an iterator of table rows into lists of at most
+        'chunksize' rows.
+        """
+        chunksize = self.options.chunksize or DEFAULT_CHUNKSIZE
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, chunksize))
+            if not chunk:
+                return
+            yield chunk
+
+    def _stream_data(self, headers, chunks, convert=True):
+        """
+        Process table data that is provided as an iterable of row
+        chunks (lists of rows).
+
+        Tables in the 'table' format are converted column-by-column as
+        each chunk is read, and the set and parameter dictionaries are
+        populated directly.  This avoids storing the full table and the
+        intermediate token list that is generated by _set_data().
+        Other formats fall back to _set_data().
+
+        If convert is False, then the table values are assumed to be
+        typed by the data source, and they are only processed with
+        _process_token() if they are strings.
+        """
+        header_index = self._set_options(headers)
+        nparams = 0 if self.options.param is None else len(self.options.param)
+        dimen = len(header_index) - nparams
+        if self.options.format != 'table' or dimen < 1 or \
+           type(self.options.index) in (tuple, list):
+            rows = []
+            for chunk in chunks:
+                rows.extend(chunk)
+            self._set_data(headers, rows)
+            return
+
+        if self.options.index is None:
+            index_data = None
+        else:
+            index_data = []
+        param_data = [{} for i in xrange(nparams)]
+        for chunk in chunks:
+            if convert:
+                columns = [_convert_column([row[i] for row in chunk])
+                           for i in header_index]
+            else:
+                columns = [[_process_token(row[i])
+                            if isinstance(row[i], string_types)
+                            else row[i] for row in chunk]
+                           for i in header_index]
+            if dimen == 1:
+                keys = columns[0]
+            else:
+                keys = list(zip(*columns[:dimen]))
+            if index_data is not None:
+                index_data.extend(keys)
+            for j in xrange(nparams):
+                _pdata = param_data[j]
+                for key, val in zip(keys, columns[dimen+j]):
+                    if val != '.':
+                        _pdata[key] = val
+
+        self.options.ncolumns = len(header_index)
+        self._info = None
+        self._streamed = []
+        if index_data is not None:
+            self._streamed.append(('set', self.options.index, index_data))
+        for j in xrange(nparams):
+            self._streamed.append(
+                ('param', self.options.param[j], param_data[j]))
+
+    def _set_options(self, headers):
+        """
+        Normalize the table options, and return the indices of the
+        selected table columns.
+        """
         from pyomo.core.base.sets import Set
         from pyomo.core.base.param import Param
 
@@ -162,6 +271,10 @@ class TableData(object):
         elif self.options.set is None and self.options.param is None:
             msg = "Must specify the set or parameter option for data"
             raise IOError(msg)
+        return header_index
+
+    def _set_data(self, headers, rows):
+        header_index = self._set_options(headers)
 
         if self.options.format == 'set':
             if not self.options.index is None:
@@ -8,8 +8,9 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
-__all__ = ['parse_data_commands']
+__all__ = ['parse_data_commands', 'split_data_commands']
 
+import re
 import sys
 import os
 import os.path
@@ -509,5 +510,117 @@ def parse_data_commands(data=None, filename=None, debug=0, outputdir=None):
     #print(_parse_info)
     return _parse_info
 
+
+## -----------------------------------------------------------
+##
+## Fast statement scanner
+##
+## -----------------------------------------------------------
+
+#
+# Quoted strings and comments, using the same patterns as the lexer
+#
+_special_re = re.compile(r'("(?:[^"]|"")*"|\'(?:[^\']|\'\')*\'|\#[^\n]*|/\*.*?\*/)')
+#
+# Statements that only contain these characters can be tokenized by
+# splitting on whitespace and colons.
+#
+_unsafe_re = re.compile(r'[^\sA-Za-z0-9_.+\-:=]')
+_token_re = re.compile(r':=|[:=]|[^\s:=]+')
+_namespace_re = re.compile(r'\bnamespace\b')
+_fast_commands = set(['set', 'param'])
+_unsafe_words = set(['data', 'end', 'store', 'load', 'include', 'namespace', '='])
+
+_not_newline_re = re.compile(r'[^\n]')
+
+def _simple_data(tokens):
+    # The grammar does not allow colons in the data section
+    return ':' not in tokens and ':=' not in tokens
+
+def _padding(data, start):
+    # Whitespace that places the character data[start] on the same line
+    # and column
+    column = start - (data.rfind('\n', 0, start) + 1)
+    return '\n'*data.count('\n', 0, start) + ' '*column
+
+def split_data_commands(data):
+    """
+    Split the text of a data command file into statements.
+
+    Simple 'set' and 'param' statements (statements that do not contain
+    quoted strings, tuples, brackets or templates) are tokenized
+    directly, which is much faster than the PLY parser.  This function
+    returns a list of (tokens, text) tuples.  For simple statements,
+    tokens is the list of (unconverted) string tokens and text is None.
+    For all other statements, tokens is None and text contains the
+    statements, which must be parsed with parse_data_commands().
+    Consecutive statements that need to be parsed are combined, and the
+    text is padded so that parse errors report the line and column of
+    the statements in data.
+
+    Returns None if the data contains namespace declarations, which
+    cannot be split into independent statements.
+    """
+    if _namespace_re.search(data) is not None:
+        return None
+    pieces = _special_re.split(data)
+    statements = []
+    current = []
+    simple = True
+    for i, piece in enumerate(pieces):
+        if i % 2:
+            if piece[0] in '#/':
+                # Comments are discarded (keeping the positions of
+                # the following text)
+                current.append(_not_newline_re.sub(' ', piece))
+            else:
+                current.append(piece)
+                simple = False
+            continue
+        parts = piece.split(';')
+        for part in parts[:-1]:
+            current.append(part)
+            statements.append((simple, ''.join(current)))
+            current = []
+            simple = True
+        current.append(parts[-1])
+    tail = ''.join(current)
+
+    ans = []
+    text = []
+    # The statements and the separating semicolons span data, so this
+    # is the offset of the next statement in data
+    offset = 0
+    for simple, stmt in statements:
+        start = offset
+        offset += len(stmt) + 1
+        if simple and _unsafe_re.search(stmt) is None:
+            tokens = _token_re.findall(stmt)
+            if tokens and tokens[0] in _fast_commands and ':=' in tokens \
+               and _unsafe_words.isdisjoint(tokens) \
+               and _simple_data(tokens[tokens.index(':=')+1:]):
+                if text:
+                    ans.append((None, ''.join(text)))
+                    text = []
+                ans.append((tokens, None))
+                continue
+        if not text:
+            stripped = stmt.lstrip()
+            text.append(_padding(data, start + len(stmt) - len(stripped)))
+            stmt = stripped
+        text.append(stmt)
+        text.append(';')
+    if tail.strip():
+        # Let the parser report the incomplete statement
+        if not text:
+            stripped = tail.lstrip()
+            text.append(_padding(data, len(data) - len(stripped)))
+            tail = stripped
+        text.append(tail)
+    if text:
+        ans.append((None, ''.join(text)))
+    return ans
+
+
 if __name__ == '__main__':
     parse_data_commands(filename=sys.argv[1], debug=100)
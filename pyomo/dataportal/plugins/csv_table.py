@@ -10,6 +10,7 @@
 
 import os.path
 import csv
+from itertools import chain
 
 from pyomo.dataportal import TableData
 from pyomo.dataportal.factory import DataManagerFactory
@@ -29,18 +30,23 @@ class CSVTable(TableData):
         self.FILE.close()
 
     def read(self):
-        from pyomo.core.base.param import Param
         if not os.path.exists(self.filename):           #pragma:nocover
             raise IOError("Cannot find file '%s'" % self.filename)
         self.FILE = open(self.filename, 'r')
-        tmp=[]
-        for tokens in csv.reader(self.FILE):
-            if tokens != ['']:
-                tmp.append(tokens)
-        self.FILE.close()
-        if len(tmp) == 0:
+        try:
+            self._read_rows(tokens for tokens in csv.reader(self.FILE)
+                            if tokens != [''])
+        finally:
+            self.FILE.close()
+
+    def _read_rows(self, rows):
+        from pyomo.core.base.param import Param
+        headers = next(rows, None)
+        if headers is None:
             raise IOError("Empty *.csv file")
-        elif len(tmp) == 1:
+        chunks = self._chunks(rows)
+        first = next(chunks, None)
+        if first is None:
             if not self.options.param is None:
                 if type(self.options.param) in (list, tuple):
                     p = self.options.param[0]
@@ -49,13 +55,13 @@ class CSVTable(TableData):
                 if isinstance(p, Param):
                     self.options.model = p.model()
                     p = p.local_name
-                self._info = ["param",p,":=",tmp[0][0]]
+                self._info = ["param",p,":=",headers[0]]
             elif len(self.options.symbol_map) == 1:
-                self._info = ["param",self.options.symbol_map[self.options.symbol_map.keys()[0]],":=",tmp[0][0]]
+                self._info = ["param",self.options.symbol_map[self.options.symbol_map.keys()[0]],":=",headers[0]]
             else:
                 raise IOError("Data looks like a parameter, but multiple parameter names have been specified: %s" % str(self.options.symbol_map))
         else:
-            self._set_data(tmp[0], tmp[1:])
+            self._stream_data(headers, chain([first], chunks))
 
     def write(self, data):
         if self.options.set is None and self.options.param is None:
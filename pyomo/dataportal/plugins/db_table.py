@@ -46,6 +46,7 @@ except ImportError:
     pymysql_available=False
 
 from pyomo.dataportal import TableData
+from pyomo.dataportal.TableData import DEFAULT_CHUNKSIZE
 from pyomo.dataportal.factory import DataManagerFactory
 
 
@@ -88,7 +89,6 @@ class db_Table(TableData):
         if self.db is None:
             return
         cursor = self.db.cursor()
-        tmp = []
         if self.options.query is None:
             if self.options.table is None:
                 raise IOError("Must specify 'query' or 'table' option!")
@@ -98,10 +98,7 @@ class db_Table(TableData):
 
         try:
             cursor.execute(self.options.query)
-            rows = cursor.fetchall()
-            for col in cursor.description:
-                tmp.append(col[0])
-            tmp = [tmp]
+            headers = [col[0] for col in (cursor.description or ())]
         except sqlite3.OperationalError:
             import logging
             logging.getLogger('pyomo.core').error(
@@ -121,40 +118,38 @@ the ODBC connector for this data source is not correctly installed,
 or that there is a bug in the ODBC connector.
 """ % (self.filename, self.options.query) )
             raise
-        for row in rows:
-            #print("DATA %s" % str(list(row))) # XXX
-            ttmp=[]
-            for data in list(row):
-                if isinstance(data,Decimal):
-                    ttmp.append(float(data))
-                elif data is None:
-                    ttmp.append('.')
-                elif isinstance(data, str) or isinstance(data, basestring):
-                    nulidx = data.find('\x00')
-                    if nulidx > -1:
-                        data = data[:nulidx]
-                    ttmp.append(data)
-                else:
-                    ttmp.append(data)
-            tmp.append(ttmp)
-        #print('FINAL %s' % str(tmp)) # XXX
+        if len(headers) == 0:
+            raise IOError("Empty range '%s'" % self.options.range)
         #
-        # Process data from the table
+        # Process data from the table.  Rows are fetched from the
+        # cursor in chunks, so the full query result is never held
+        # in memory.
         #
-        if type(tmp) in (int,long,float):
-            if not self.options.param is None:
-                self._info = ["param", self.options.param.local_name, ":=", tmp]
-            elif len(self.options.symbol_map) == 1:
-                self._info = ["param", self.options.symbol_map[self.options.symbol_map.keys()[0]], ":=", tmp]
+        self._stream_data(headers, self._fetch_chunks(cursor), convert=False)
+
+    def _fetch_chunks(self, cursor):
+        chunksize = self.options.chunksize or DEFAULT_CHUNKSIZE
+        while True:
+            rows = cursor.fetchmany(chunksize)
+            if not rows:
+                return
+            yield [self._convert_row(row) for row in rows]
+
+    def _convert_row(self, row):
+        ttmp=[]
+        for data in row:
+            if isinstance(data,Decimal):
+                ttmp.append(float(data))
+            elif data is None:
+                ttmp.append('.')
+            elif isinstance(data, str) or isinstance(data, basestring):
+                nulidx = data.find('\x00')
+                if nulidx > -1:
+                    data = data[:nulidx]
+                ttmp.append(data)
             else:
-                raise IOError("Data looks like a scalar parameter, but multiple parameter names have been specified: %s" % str(self.options.symbol_map))
-        elif len(tmp) == 0:
-            raise IOError("Empty range '%s'" % self.options.range)
-        else:
-            #print("_info %s" % str(self._info))
-            #print("SETTING DATA %s %s" % (str(tmp[0]), str(tmp[1:]))) # XXX
-            #print("OPTIONS %s" % str(self.options))
-            self._set_data(tmp[0], tmp[1:])
+                ttmp.append(data)
+        return ttmp
 
     def close(self):
         if self._data is None and not self.db is None:
@@ -18,7 +18,7 @@ from pyutilib.misc import quote_split, Options
 import pyutilib.common
 from pyutilib.misc import flatten
 
-from pyomo.dataportal.parse_datacmds import parse_data_commands
+from pyomo.dataportal.parse_datacmds import parse_data_commands, split_data_commands
 from pyomo.dataportal.factory import DataManagerFactory, UnknownDataManager
 
 try:
@@ -573,25 +573,72 @@ def _process_data_list(param_name, dim, cmd):
     return ans
 
 
-def _process_include(cmd, _model, _data, _default, options=None):
-    if len(cmd) == 1:
-        raise IOError("Cannot execute 'include' command without a filename")
-    if len(cmd) > 2:
-        raise IOError("The 'include' command only accepts a single filename")
+def _convert_tokens(tokens):
+    """
+    Convert a list of string tokens using the same rules as
+    _process_token().  Lists of integers are converted in bulk, and
+    otherwise repeated tokens (e.g., index values) are only converted
+    once.
+    """
+    try:
+        return [int(token) for token in tokens]
+    except ValueError:
+        pass
+    cache = {}
+    ans = []
+    for token in tokens:
+        val = cache.get(token, cache)
+        if val is cache:
+            try:
+                val = int(token)
+            except ValueError:
+                try:
+                    val = float(token)
+                except ValueError:
+                    val = _process_token(token)
+            cache[token] = val
+        ans.append(val)
+    return ans
 
-    global Filename
-    Filename = cmd[1]
-    global Lineno
-    Lineno = 0
 
-    try:
-        scenarios = parse_data_commands(filename=cmd[1])
-    except IOError:
-        raise
-        err = sys.exc_info()[1]
-        raise IOError("Error parsing file '%s': %s" % (Filename, str(err)))
-    if scenarios is None:
-        return False
+def _process_simple_data(tokens, _model, _data, _default):
+    """
+    Called by _process_include() to process a simple 'set' or 'param'
+    statement that was tokenized by split_data_commands().  The tokens
+    do not contain tuples, so the _preprocess_data() step is not needed.
+    """
+    i = tokens.index(':=')
+    cmd = [_process_token(token) for token in tokens[:i+1]]
+    values = _convert_tokens(tokens[i+1:])
+
+    if cmd[0] == 'set':
+        if len(cmd) == 3:
+            _data[cmd[1]] = {None: values}
+        else:
+            _process_set(cmd + values, _model, _data)
+        return
+
+    if values and len(cmd) in (3, 5) and cmd[1] != ':' and \
+       (len(cmd) == 3 or cmd[2] == 'default'):
+        pname = cmd[1]
+        if len(cmd) == 5 and cmd[3] != None:
+            _default[pname] = cmd[3]
+        if pname not in _data:
+            _data[pname] = {}
+        if not _model is None:
+            dim = getattr(_model, pname).dim()
+        else:
+            dim = 1
+        _data[pname].update(_process_data_list(pname, dim, values))
+    else:
+        _process_param(cmd + values, _model, _data, _default)
+
+
+def _process_scenarios(scenarios, _model, _data, _default):
+    """
+    Called by _process_include() to process the commands generated by
+    parse_data_commands().
+    """
     for scenario in scenarios:
         for cmd in scenarios[scenario]:
             if scenario not in _data:
@@ -613,6 +660,38 @@ def _process_include(cmd, _model, _data, _default, options=None):
                             raise IOError("Cannot define a scenario within another scenario")
             else:
                 _process_data(cmd, _model, _data[scenario], _default, Filename, Lineno)
+
+
+def _process_include(cmd, _model, _data, _default, options=None):
+    if len(cmd) == 1:
+        raise IOError("Cannot execute 'include' command without a filename")
+    if len(cmd) > 2:
+        raise IOError("The 'include' command only accepts a single filename")
+
+    global Filename
+    Filename = cmd[1]
+    global Lineno
+    Lineno = 0
+
+    with open(cmd[1], 'r') as INPUT:
+        text = INPUT.read()
+    #
+    # Simple set and param statements are processed directly.  All
+    # other statements are parsed with the PLY parser.
+    #
+    statements = split_data_commands(text)
+    if statements is None:
+        statements = [(None, text)]
+    for tokens, data in statements:
+        if tokens is not None:
+            if None not in _data:
+                _data[None] = {}
+            _process_simple_data(tokens, _model, _data[None], _default)
+            continue
+        scenarios = parse_data_commands(data=data)
+        if scenarios is None:
+            return False
+        _process_scenarios(scenarios, _model, _data, _default)
     return True
 
 
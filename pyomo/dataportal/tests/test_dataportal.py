@@ -1632,5 +1632,198 @@ class TestTableCmd(unittest.TestCase):
         os.remove(currdir+'loadComplex.dat')
 
 
+class TestStreamingTable(unittest.TestCase):
+
+    def setUp(self):
+        self.csvfile = currdir+'stream.csv'
+        with open(self.csvfile, 'w') as OUTPUT:
+            OUTPUT.write("A,B,P,Q\n")
+            for i in range(7):
+                OUTPUT.write("A%d,%d,%s,%s\n"
+                             % (i, i, i+0.5, '.' if i == 3 else i))
+
+    def tearDown(self):
+        if os.path.exists(self.csvfile):
+            os.remove(self.csvfile)
+
+    def _model(self):
+        model = AbstractModel()
+        model.I = Set(dimen=2)
+        model.P = Param(model.I)
+        model.Q = Param(model.I, default=-1)
+        return model
+
+    def _check(self, instance):
+        self.assertEqual(instance.I.data(),
+                         set(('A%d' % i, i) for i in range(7)))
+        self.assertEqual(instance.P.extract_values(),
+                         dict((('A%d' % i, i), i+0.5) for i in range(7)))
+        self.assertEqual(instance.Q[('A3', 3)], -1)
+        self.assertEqual(instance.Q[('A4', 4)], 4)
+        self.assertIs(type(instance.Q[('A4', 4)]), int)
+
+    def test_csv_chunks(self):
+        model = self._model()
+        data = DataPortal()
+        data.load(filename=self.csvfile, index=model.I,
+                  param=(model.P, model.Q), chunksize=2)
+        self._check(model.create_instance(data))
+
+    def test_csv_chunks_select(self):
+        model = self._model()
+        model.R = Param(model.I)
+        data = DataPortal()
+        data.load(filename=self.csvfile, select=('A', 'B', 'Q'),
+                  index=model.I, param=model.R, chunksize=3)
+        instance = model.create_instance(data)
+        self.assertEqual(len(instance.I), 7)
+        self.assertEqual(len(instance.R), 6)
+        self.assertEqual(instance.R[('A5', 5)], 5)
+
+    @unittest.skipIf(DataManagerFactory('sqlite3') is None
+                     or not DataManagerFactory('sqlite3').available(),
+                     "sqlite3 is not available")
+    def test_sqlite3_chunks(self):
+        import sqlite3
+        dbfile = currdir+'stream.db'
+        if os.path.exists(dbfile):
+            os.remove(dbfile)
+        con = sqlite3.connect(dbfile)
+        con.execute("CREATE TABLE T (A text, B integer, P real, Q integer)")
+        con.executemany("INSERT INTO T VALUES (?,?,?,?)",
+                        [('A%d' % i, i, i+0.5, None if i == 3 else i)
+                         for i in range(7)])
+        con.commit()
+        con.close()
+        try:
+            model = self._model()
+            data = DataPortal()
+            data.load(filename=dbfile, using='sqlite3', table='T',
+                      index=model.I, param=(model.P, model.Q), chunksize=2)
+            self._check(model.create_instance(data))
+        finally:
+            os.remove(dbfile)
+
+    @unittest.skipIf(DataManagerFactory('sqlite3') is None
+                     or not DataManagerFactory('sqlite3').available(),
+                     "sqlite3 is not available")
+    def test_sqlite3_empty_range(self):
+        import sqlite3
+        dbfile = currdir+'stream.db'
+        if os.path.exists(dbfile):
+            os.remove(dbfile)
+        con = sqlite3.connect(dbfile)
+        con.execute("CREATE TABLE T (A text, B integer)")
+        con.commit()
+        con.close()
+        try:
+            model = self._model()
+            data = DataPortal()
+            # a statement that does not return any columns
+            with self.assertRaisesRegexp(IOError, "Empty range"):
+                data.load(filename=dbfile, using='sqlite3',
+                          query="DELETE FROM T",
+                          index=model.I, param=model.P)
+        finally:
+            os.remove(dbfile)
+
+
+class TestSplitDataCommands(unittest.TestCase):
+
+    def test_split(self):
+        from pyomo.dataportal.parse_datacmds import split_data_commands
+        data = """
+# comment ; with a semicolon
+set A := a b c;
+param p default 0 := a 1 b 2.5 /* c */ ;
+param q := 'x y' 3;
+set B := (1,2) (3,4);
+param : A : r s := a 1 2 b 3 4;
+"""
+        ans = split_data_commands(data)
+        self.assertEqual(len(ans), 4)
+        self.assertEqual(ans[:2] + ans[3:], [
+            (['set', 'A', ':=', 'a', 'b', 'c'], None),
+            (['param', 'p', 'default', '0', ':=', 'a', '1', 'b', '2.5'], None),
+            (['param', ':', 'A', ':', 'r', 's', ':=',
+              'a', '1', '2', 'b', '3', '4'], None),
+            ])
+        # The parsed statements keep their line in the data
+        self.assertEqual(ans[2][1],
+                         "\n"*data.count("\n", 0, data.index("param q")) +
+                         "param q := 'x y' 3;\nset B := (1,2) (3,4);")
+        self.assertIsNone(split_data_commands("namespace n { set A := 1; }"))
+
+    def test_error_line(self):
+        from pyomo.dataportal.parse_datacmds import parse_data_commands
+        fname = currdir+'split.dat'
+        model = AbstractModel()
+        model.A = Set()
+        model.B = Set(dimen=2)
+        model.p = Param(model.A)
+        model.q = Param(model.A)
+        for data, error in [
+                ("set A := a b c;\n"
+                 "param p := a 1 b 2;\n"
+                 "param q := 'a' 3;\n"
+                 "set B := (1,2) (3,4);\n"
+                 "param p := a 1 @ b 2;\n",
+                 "Line 4 Column"),
+                ("set A := a b c;\n"
+                 "set B := (1,2);\n"
+                 "param p := a 1 b 2;\n"
+                 "param q := 'a' 3 /* c */ ;\n"
+                 "param q := 'a' 1 2 := 3;\n",
+                 "in line 4 at column 21"),
+                ]:
+            # The errors report the same line as parsing the whole
+            # file
+            with self.assertRaisesRegexp(IOError, error):
+                parse_data_commands(data=data)
+            with open(fname, 'w') as OUTPUT:
+                OUTPUT.write(data)
+            try:
+                with self.assertRaisesRegexp(IOError, error):
+                    model.create_instance(fname)
+            finally:
+                os.remove(fname)
+
+    def test_load(self):
+        fname = currdir+'split.dat'
+        with open(fname, 'w') as OUTPUT:
+            OUTPUT.write("""
+set A := a b c;
+set B := (1,a) (2,b);
+param p default 0 := a 1 b 2.5 ;
+param q : 1 2 := a 1 2 b . 4 ;
+param : C : r s := 1 x 2 2 y True ;
+param t := 1 a 3 2 b 4 ;
+""")
+        try:
+            model = AbstractModel()
+            model.A = Set()
+            model.B = Set(dimen=2)
+            model.C = Set()
+            model.p = Param(model.A)
+            model.q = Param(model.A, [1,2])
+            model.r = Param(model.C)
+            model.s = Param(model.C)
+            model.t = Param(model.B)
+            instance = model.create_instance(fname)
+        finally:
+            os.remove(fname)
+        self.assertEqual(set(instance.A), set(['a', 'b', 'c']))
+        self.assertEqual(set(instance.B), set([(1,'a'), (2,'b')]))
+        self.assertEqual(instance.p.extract_values(),
+                         {'a': 1, 'b': 2.5, 'c': 0})
+        self.assertEqual(instance.q.extract_values(),
+                         {('a',1): 1, ('a',2): 2, ('b',2): 4})
+        self.assertEqual(set(instance.C), set([1, 2]))
+        self.assertEqual(instance.r.extract_values(), {1: 'x', 2: 'y'})
+        self.assertEqual(instance.s.extract_values(), {1: 2, 2: True})
+        self.assertEqual(instance.t.extract_values(),
+                         {(1,'a'): 3, (2,'b'): 4})
+
+
 if __name__ == "__main__":
     unittest.main()
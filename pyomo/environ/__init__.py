@@ -51,6 +51,7 @@ _optional_packages = set([
     'pyomo.contrib.gdp_bounds',
     'pyomo.contrib.trustregion',
     'pyomo.contrib.multistart',
+    'pyomo.contrib.portfolio',
 ])
 
 
@@ -9,4 +9,5 @@
 #  ___________________________________________________________________________
 
 from pyomo.opt.solver.shellcmd import *
+from pyomo.opt.solver.cache import *
 from pyomo.opt.solver.ilmcmd import *
@@ -0,0 +1,168 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+__all__ = ['SolverResultsCache']
+
+import errno
+import hashlib
+import logging
+import os
+import tempfile
+
+from six.moves import cPickle as pickle
+
+logger = logging.getLogger('pyomo.opt')
+
+
+class SolverResultsCache(object):
+    """
+    A cache of solver results that is stored in a directory.
+
+    Entries are keyed by a hash of the problem files passed to the
+    solver, together with the solver type, executable, options and
+    requested suffixes, so that a cached entry is only replayed when
+    the solver would be given exactly the same problem.  When the
+    cache holds more than max_entries entries, or more than max_size
+    bytes, the least recently used entries are removed.
+
+    Arguments:
+        directory: The directory that holds the cache entries.  It
+            is created if it does not exist.
+        max_entries: The maximum number of entries (None for no
+            limit).
+        max_size: The maximum total size of the entries, in bytes
+            (None for no limit).
+    """
+
+    entry_suffix = '.pyomo.results'
+
+    def __init__(self, directory, max_entries=None, max_size=None):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.max_entries = max_entries
+        self.max_size = max_size
+        try:
+            os.makedirs(self.directory)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+
+    def key(self, problem_files, *args):
+        """
+        Returns the key of a solve with the given problem files.
+        The remaining arguments (e.g., the solver name and options)
+        must have a repr() that is identical between Python sessions.
+        """
+        h = hashlib.sha256()
+        for arg in args:
+            h.update(repr(arg).encode('utf-8'))
+            h.update(b'\0')
+        for filename in problem_files:
+            with open(filename, 'rb') as INPUT:
+                for chunk in iter(lambda: INPUT.read(1 << 20), b''):
+                    h.update(chunk)
+            h.update(b'\0')
+        return h.hexdigest()
+
+    def _entry_filename(self, key):
+        return os.path.join(self.directory, key + self.entry_suffix)
+
+    def _entries(self):
+        """
+        Returns a list of (access time, size, filename) tuples for
+        the cache entries, sorted from the least to the most recently
+        used entry.
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(self.entry_suffix):
+                continue
+            filename = os.path.join(self.directory, name)
+            try:
+                st = os.stat(filename)
+            except OSError:
+                # removed by another process
+                continue
+            entries.append((st.st_mtime, st.st_size, filename))
+        entries.sort()
+        return entries
+
+    def get(self, key):
+        """
+        Returns the SolverResults stored for the key, or None.
+        """
+        filename = self._entry_filename(key)
+        try:
+            with open(filename, 'rb') as INPUT:
+                results = pickle.load(INPUT)
+        except (IOError, OSError):
+            return None
+        except Exception as e:
+            logger.warning("Removing unreadable solver results cache "
+                           "entry '%s': %s" % (filename, e))
+            self._remove(filename)
+            return None
+        # Entries are evicted based on their modification time
+        try:
+            os.utime(filename, None)
+        except OSError:
+            pass
+        return results
+
+    def put(self, key, results):
+        """
+        Store the SolverResults for the key and remove the least
+        recently used entries if the cache is too large.
+        """
+        fd, tmpname = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as OUTPUT:
+                pickle.dump(results, OUTPUT, pickle.HIGHEST_PROTOCOL)
+            filename = self._entry_filename(key)
+            if os.name == 'nt':
+                self._remove(filename)
+            os.rename(tmpname, filename)
+        except:
+            self._remove(tmpname)
+            raise
+        self.evict()
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the cache
+        satisfies its max_entries and max_size limits.
+        """
+        if (self.max_entries is None) and (self.max_size is None):
+            return
+        entries = self._entries()
+        count = len(entries)
+        size = sum(entry[1] for entry in entries)
+        for _, entry_size, filename in entries:
+            if ((self.max_entries is None) or (count <= self.max_entries)) and \
+               ((self.max_size is None) or (size <= self.max_size)):
+                break
+            self._remove(filename)
+            count -= 1
+            size -= entry_size
+
+    def clear(self):
+        """
+        Remove all entries from the cache.
+        """
+        for _, _, filename in self._entries():
+            self._remove(filename)
+
+    def __len__(self):
+        return len(self._entries())
+
+    def _remove(self, filename):
+        try:
+            os.remove(filename)
+        except OSError:
+            pass
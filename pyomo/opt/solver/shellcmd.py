@@ -8,12 +8,19 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
-__all__ = ['SystemCallSolver']
+__all__ = ['SystemCallSolver', 'SolverProgress', 'LogProgressParser',
+           'memory_tempdir']
 
+import errno
 import os
+import signal
+import subprocess
 import sys
 import time
 import logging
+import threading
+
+import six
 
 import pyutilib.misc
 from pyutilib.common import ApplicationError, WindowsError
@@ -23,10 +30,176 @@ from pyutilib.subprocess import run
 
 from pyomo.opt.base import *
 from pyomo.opt.base.solvers import *
-from pyomo.opt.results import SolverStatus, SolverResults
+from pyomo.opt.base.formats import ProblemFormat
+from pyomo.opt.results import SolverStatus, SolverResults, \
+    TerminationCondition
+from pyomo.opt.solver.cache import SolverResultsCache
 
 logger = logging.getLogger('pyomo.opt')
 
+# Candidate memory-backed directories for the tempdir='memory' option
+_memory_tempdirs = ['/dev/shm']
+
+
+def memory_tempdir():
+    """
+    Returns a writable memory-backed directory (e.g., /dev/shm) that
+    can be used for the temporary files of a solve, or None if no such
+    directory is available on this platform.
+    """
+    for dirname in _memory_tempdirs:
+        if os.path.isdir(dirname) and os.access(dirname, os.W_OK | os.X_OK):
+            return dirname
+    return None
+
+
+# File suffixes of the problem files (and the FIFOs of pipelined
+# writers) written by the solver interface
+_problem_suffixes = {ProblemFormat.cpxlp: '.pyomo.lp',
+                     ProblemFormat.mps: '.pyomo.mps',
+                     ProblemFormat.nl: '.pyomo.nl',
+                     ProblemFormat.bar: '.pyomo.bar'}
+
+
+def _release_fifo(filename, done):
+    """
+    Open and close the write end of a FIFO, so that a reader blocked
+    on it sees the end of the file.  Gives up once the done event is
+    set (e.g., because the reader exited without opening the FIFO).
+    """
+    while not done.is_set():
+        try:
+            fd = os.open(filename, os.O_WRONLY | os.O_NONBLOCK)
+        except OSError:
+            if sys.exc_info()[1].errno != errno.ENXIO:
+                return
+            # No reader yet
+            done.wait(0.01)
+            continue
+        os.close(fd)
+        return
+
+
+def _drain_fifo(filename, thread):
+    """
+    Read (and discard) the data written to a FIFO until the writer
+    thread exits.  This releases a writer whose reader exited without
+    opening the FIFO.
+    """
+    fd = os.open(filename, os.O_RDONLY | os.O_NONBLOCK)
+    try:
+        while thread.is_alive():
+            try:
+                if os.read(fd, 1 << 16):
+                    continue
+            except OSError:
+                if sys.exc_info()[1].errno != errno.EAGAIN:
+                    raise
+            thread.join(0.01)
+    finally:
+        os.close(fd)
+
+
+class _PipelinedWriter(threading.Thread):
+    """
+    Writes a model to a FIFO in a separate thread, so that the solver
+    parses the problem while it is still being generated.
+    """
+
+    def __init__(self, model, filename, format, capabilities, io_options):
+        threading.Thread.__init__(self, name="pipelined writer")
+        self.daemon = True
+        self.model = model
+        self.filename = filename
+        self.format = format
+        self.capabilities = capabilities
+        self.io_options = io_options
+        self.symbol_map_id = None
+        self.error = None
+        self._solver_done = threading.Event()
+
+    def run(self):
+        try:
+            (_, self.symbol_map_id) = self.model.write(
+                filename=self.filename,
+                format=self.format,
+                solver_capability=self.capabilities,
+                io_options=self.io_options)
+        except:
+            self.error = sys.exc_info()
+            # The solver may be waiting for the problem
+            _release_fifo(self.filename, self._solver_done)
+
+    def stop(self):
+        """Wait for the writer once the solver has exited"""
+        self._solver_done.set()
+        if self.is_alive():
+            _drain_fifo(self.filename, self)
+        self.join()
+
+    def result(self):
+        """Returns the symbol map id, or raises the writer exception"""
+        if self.error is not None:
+            six.reraise(*self.error)
+        return self.symbol_map_id
+
+
+class SolverProgress(object):
+    """
+    A progress report parsed from the log of a running solver.
+    Values that are not reported by the solver are None.
+
+    Attributes:
+        time: Seconds since the solver was started.
+        iteration: The iteration count (e.g., simplex or interior
+            point iterations).
+        nodes: The number of branch-and-bound nodes processed.
+        incumbent: The objective of the best feasible solution.
+        bound: The best bound on the objective.
+        gap: The relative gap between the incumbent and the bound.
+        objective: The objective of the current iterate.
+        line: The log line that the report was parsed from.
+    """
+
+    __slots__ = ('time', 'iteration', 'nodes', 'incumbent', 'bound',
+                 'gap', 'objective', 'line')
+
+    def __init__(self, **kwds):
+        for name in self.__slots__:
+            setattr(self, name, kwds.pop(name, None))
+        if kwds:
+            raise TypeError("SolverProgress got unexpected keywords: %s"
+                            % (", ".join(sorted(kwds)),))
+
+    def __repr__(self):
+        return "SolverProgress(%s)" % (
+            ", ".join("%s=%r" % (name, getattr(self, name))
+                      for name in self.__slots__
+                      if name != 'line' and getattr(self, name) is not None))
+
+
+class LogProgressParser(object):
+    """
+    Base class for the parsers that extract SolverProgress reports
+    from the log of a running solver.  A parser is called with each
+    line of the log, and returns a SolverProgress or None.
+    """
+
+    def __call__(self, line):
+        raise NotImplementedError
+
+    @staticmethod
+    def relative_gap(incumbent, bound):
+        """
+        Returns the relative gap between the incumbent and the bound,
+        or None if either is not finite.
+        """
+        if (incumbent is None) or (bound is None) or \
+           (abs(incumbent) == float('inf')) or \
+           (abs(bound) == float('inf')):
+            return None
+        return abs(incumbent - bound) / (1e-10 + abs(incumbent))
+
 
 class SystemCallSolver(OptSolver):
     """ A generic command line solver """
@@ -36,8 +209,26 @@ class SystemCallSolver(OptSolver):
 
         executable = kwargs.pop('executable', None)
         validate = kwargs.pop('validate', True)
+        tempdir = kwargs.pop('tempdir', None)
+        pipeline = kwargs.pop('pipeline', False)
+        cache = kwargs.pop('cache', None)
 
         OptSolver.__init__(self, **kwargs)
+        self._tempdir = tempdir
+        # The temporary directory of the current solve (None for the
+        # TempfileManager default)
+        self._solve_tempdir = None
+        self._pipeline = pipeline
+        self._cache = cache
+        self._results_cache = None
+        self._cache_key = None
+        self._cached_results = None
+        # Problem formats that the solver can read from a FIFO (i.e.,
+        # sequentially, in a single pass, without reopening the file).
+        # Only list a format once a test has run the solver executable
+        # on a FIFO in that format.
+        self._pipeline_formats = []
+        self._pipelined_writer = None
         self._keepfiles  = False
         self._results_file = None
         self._timer      = ''
@@ -127,6 +318,58 @@ class SystemCallSolver(OptSolver):
             return False
         return True
 
+    def solve(self, *args, **kwds):
+        """
+        Solve the problem.
+
+        In addition to the OptSolver keywords, this accepts the 'tempdir'
+        keyword (which defaults to the 'tempdir' solver option), the
+        directory where the problem, log and solution files are created
+        for this solve.  The value 'memory' selects a memory-backed
+        directory (see memory_tempdir()), which avoids the file system
+        round-trip when the default temporary directory is on a slow
+        (e.g., network) file system.
+
+        For solvers that read their problem file sequentially, the
+        'pipeline' keyword (which defaults to the 'pipeline' solver
+        option) writes the problem to a FIFO in a separate thread while
+        the solver is running, so that the solver parses the problem
+        while Pyomo is still generating it.  Pipelining is only used
+        for Pyomo models, in the problem formats supported by the solver
+        interface, on platforms that support FIFOs, and when keepfiles
+        is False.
+
+        The 'cache' keyword (which defaults to the 'cache' solver
+        option) is a SolverResultsCache, or the name of a directory
+        for one.  The results of each solve are stored in the cache,
+        and when the same problem is solved again with the same solver
+        options the stored results are loaded instead of running the
+        solver.  Pipelining is disabled when a cache is used.
+
+        The 'progress' keyword is a function that is called with a
+        SolverProgress object each time the solver reports its progress
+        in the log, while the solver is running (for solver interfaces
+        that define a log parser in _create_progress_parser).  If the
+        function returns True, the solver is interrupted (SIGINT), which
+        makes most solvers stop and report the best solution found so
+        far.  The termination condition of an interrupted solve is
+        userInterrupt unless the solver finished before it was
+        interrupted.
+        """
+        tempdir = kwds.pop('tempdir', self._tempdir)
+        if tempdir == 'memory':
+            tempdir = memory_tempdir()
+            if tempdir is None:
+                logger.warning(
+                    "No memory-backed temporary directory is available; "
+                    "using the default temporary directory for solver %s"
+                    % (self.name,))
+        self._solve_tempdir = tempdir
+        try:
+            return OptSolver.solve(self, *args, **kwds)
+        finally:
+            self._solve_tempdir = None
+
     def create_command_line(self,executable,problem_files):
         """
         Create the command line that is executed.
@@ -196,6 +439,21 @@ class SystemCallSolver(OptSolver):
         TempfileManager.push()
 
         self._keepfiles = kwds.pop("keepfiles", False)
+        self._pipelined_writer = None
+        self._progress = kwds.pop("progress", None)
+        self._interrupted = False
+        pipeline = kwds.pop("pipeline", self._pipeline)
+        cache = kwds.pop("cache", self._cache)
+        if isinstance(cache, six.string_types):
+            cache = SolverResultsCache(cache)
+        self._results_cache = cache
+        self._cache_key = None
+        self._cached_results = None
+        # The FIFO is not kept, so pipelining is disabled when the
+        # problem files are requested.  The results cache needs to
+        # read the problem files before the solver is run.
+        self._use_pipeline = pipeline and not self._keepfiles and \
+            (cache is None)
 
         OptSolver._presolve(self, *args, **kwds)
 
@@ -209,10 +467,28 @@ class SystemCallSolver(OptSolver):
         #
         # Create command line
         #
-        self._command = self.create_command_line(
-            self.executable(), self._problem_files)
+        try:
+            self._command = self.create_command_line(
+                self.executable(), self._problem_files)
+        except:
+            if self._pipelined_writer is not None:
+                self._pipelined_writer.stop()
+                self._pipelined_writer = None
+            raise
 
         self._log_file=self._command.log_file
+
+        if self._results_cache is not None:
+            self._cache_key = self._results_cache.key(
+                self._problem_files,
+                self.type,
+                self.executable(),
+                str(self._problem_format),
+                str(self._results_format),
+                sorted((str(k), str(v)) for k, v in self.options.items()),
+                sorted(str(suffix) for suffix in self._suffixes),
+                self._timelimit)
+            self._cached_results = self._results_cache.get(self._cache_key)
         #
         # The pre-cleanup is probably unncessary, but also not harmful.
         #
@@ -224,6 +500,11 @@ class SystemCallSolver(OptSolver):
             os.remove(self._soln_file)
 
     def _apply_solver(self):
+        if self._cached_results is not None:
+            logger.debug("Using cached results for solver %s", self.name)
+            self._rc = None
+            self._log = ''
+            return Bunch(rc=self._rc, log=self._log)
         if registered_executable('timer'):
             self._timer = registered_executable('timer').get_path()
         #
@@ -243,12 +524,112 @@ class SystemCallSolver(OptSolver):
                 print("Solver problem files: %s" % str(self._problem_files))
 
         sys.stdout.flush()
-        self._rc, self._log = self._execute_command(self._command)
+        writer = self._pipelined_writer
+        if writer is None:
+            self._rc, self._log = self._execute_command(self._command)
+        else:
+            self._pipelined_writer = None
+            try:
+                self._rc, self._log = self._execute_command(self._command)
+            finally:
+                writer.stop()
+            self._smap_id = writer.result()
         sys.stdout.flush()
         return Bunch(rc=self._rc, log=self._log)
 
+    def _create_tempfile(self, suffix=None, text=False):
+        """
+        Returns a new temporary file in the temporary directory of the
+        current solve.  The file is removed when the TempfileManager
+        context of the solve is popped.
+        """
+        return TempfileManager.create_tempfile(suffix=suffix,
+                                               text=text,
+                                               dir=self._solve_tempdir)
+
+    def _convert_problem(self,
+                         args,
+                         problem_format,
+                         valid_problem_formats,
+                         **kwds):
+        if self._use_pipeline and self._can_pipeline(args, problem_format):
+            return self._start_pipelined_writer(args[0],
+                                                problem_format,
+                                                kwds)
+        if (self._solve_tempdir is not None) and \
+           self._can_write_problem(args, problem_format):
+            return self._write_problem_file(args[0], problem_format, kwds)
+        return OptSolver._convert_problem(self,
+                                          args,
+                                          problem_format,
+                                          valid_problem_formats,
+                                          **kwds)
+
+    def _can_write_problem(self, args, problem_format):
+        """
+        Returns True if the problem is a Pyomo model that the solver
+        interface can write directly (rather than through a converter)
+        """
+        from pyomo.core.base.block import _BlockData
+        return (self._problem is None) and \
+            (len(args) == 1) and \
+            isinstance(args[0], _BlockData) and \
+            (problem_format in _problem_suffixes)
+
+    def _can_pipeline(self, args, problem_format):
+        """
+        Returns True if the problem can be written by a pipelined writer
+        """
+        return hasattr(os, 'mkfifo') and \
+            (problem_format in self._pipeline_formats) and \
+            self._can_write_problem(args, problem_format)
+
+    def _write_problem_file(self, model, problem_format, io_options):
+        """
+        Write the model to a problem file in the temporary directory of
+        the current solve.
+        """
+        problem_filename = self._create_tempfile(
+            suffix=_problem_suffixes[problem_format])
+        if (problem_format == ProblemFormat.nl) and \
+           io_options.get("symbolic_solver_labels", False):
+            TempfileManager.add_tempfile(problem_filename[:-3]+".row",
+                                         exists=False)
+            TempfileManager.add_tempfile(problem_filename[:-3]+".col",
+                                         exists=False)
+        (problem_filename, symbol_map_id) = model.write(
+            filename=problem_filename,
+            format=problem_format,
+            solver_capability=self.has_capability,
+            io_options=io_options)
+        return (problem_filename,), problem_format, symbol_map_id
+
+    def _start_pipelined_writer(self, model, problem_format, io_options):
+        """
+        Create a FIFO for the problem file and start writing the model to
+        it.  The solver reads the FIFO while the model is being written;
+        the symbol map is available once the solver has exited.
+        """
+        problem_filename = self._create_tempfile(
+            suffix=_problem_suffixes[problem_format])
+        os.remove(problem_filename)
+        os.mkfifo(problem_filename)
+        self._pipelined_writer = _PipelinedWriter(model,
+                                                  problem_filename,
+                                                  problem_format,
+                                                  self.has_capability,
+                                                  io_options)
+        self._pipelined_writer.start()
+        return (problem_filename,), problem_format, None
+
     def _postsolve(self):
 
+        if self._cached_results is not None:
+            results = self._cached_results
+            self._cached_results = None
+            TempfileManager.pop(remove=not self._keepfiles)
+            return results
+
         if self._log_file is not None:
             OUTPUT=open(self._log_file,"w")
             OUTPUT.write("Solver command line: "+str(self._command.cmd)+'\n')
@@ -285,15 +666,40 @@ class SystemCallSolver(OptSolver):
                    os.path.exists(self._soln_file):
                     os.remove(self._soln_file)
 
+        if self._interrupted and (results is not None):
+            if results.solver.termination_condition != \
+               TerminationCondition.optimal:
+                results.solver.termination_condition = \
+                    TerminationCondition.userInterrupt
+                if results.solver.status in (SolverStatus.ok,
+                                             SolverStatus.warning):
+                    results.solver.status = SolverStatus.aborted
+
+        if (self._cache_key is not None) and \
+           (results is not None) and \
+           (not self._rc) and \
+           (results.solver.status in (SolverStatus.ok, SolverStatus.warning)):
+            self._results_cache.put(self._cache_key, results)
+
         TempfileManager.pop(remove=not self._keepfiles)
 
         return results
 
+    def _create_progress_parser(self):
+        """
+        Returns a LogProgressParser for the log of this solver, or None
+        if the solver does not report its progress.
+        """
+        return None
+
     def _execute_command(self,command):
         """
         Execute the command
         """
 
+        if self._progress is not None:
+            return self._execute_command_with_progress(command)
+
         start_time = time.time()
 
         try:
@@ -318,6 +724,81 @@ class SystemCallSolver(OptSolver):
 
         return [rc,log]
 
+    def _execute_command_with_progress(self, command):
+        """
+        Execute the command, reading its output while it runs and
+        passing the progress reports to the progress callback.
+        """
+        parser = self._create_progress_parser()
+        if parser is None:
+            logger.warning("Solver %s does not report its progress; the "
+                           "progress callback will not be called"
+                           % (self.name,))
+
+        env = command.env
+        if env is None:
+            env = os.environ.copy()
+        _input = command.script if 'script' in command else None
+
+        start_time = time.time()
+        try:
+            proc = subprocess.Popen(
+                command.cmd,
+                stdin=None if _input is None else subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                env=env,
+                universal_newlines=True)
+        except OSError:
+            err = sys.exc_info()[1]
+            msg = 'Could not execute the command: %s\tError message: %s'
+            raise ApplicationError(msg % (command.cmd, err))
+        if _input is not None:
+            proc.stdin.write(_input)
+            proc.stdin.close()
+
+        timer = None
+        if self._timelimit is not None:
+            timer = threading.Timer(
+                self._timelimit + max(1, 0.01*self._timelimit), proc.kill)
+            timer.daemon = True
+            timer.start()
+
+        log = []
+        try:
+            for line in iter(proc.stdout.readline, ''):
+                log.append(line)
+                if self._tee:
+                    sys.stdout.write(line)
+                    sys.stdout.flush()
+                if (parser is None) or self._interrupted:
+                    continue
+                progress = parser(line)
+                if progress is None:
+                    continue
+                progress.time = time.time() - start_time
+                progress.line = line
+                if self._progress(progress):
+                    self._interrupted = True
+                    if os.name == 'nt':
+                        proc.terminate()
+                    else:
+                        proc.send_signal(signal.SIGINT)
+            rc = proc.wait()
+        except:
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            proc.stdout.close()
+            if timer is not None:
+                timer.cancel()
+        sys.stdout.flush()
+
+        self._last_solve_time = time.time() - start_time
+
+        return [rc, ''.join(log)]
+
     def process_output(self, rc):
         """
         Process the output files.
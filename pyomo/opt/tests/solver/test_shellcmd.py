@@ -12,13 +12,23 @@
 #
 
 import os
+import re
+import shutil
+import stat
+import sys
+import tempfile
 
 import pyutilib.th as unittest
 from pyutilib.common import ApplicationError
+from pyutilib.misc import Bunch
+from pyutilib.services import TempfileManager
 
-from pyomo.opt.base import UnknownSolver
+from pyomo.opt.base import UnknownSolver, ProblemFormat
 from pyomo.opt.base.solvers import SolverFactory
-from pyomo.opt.solver import SystemCallSolver
+from pyomo.opt.results import SolverResults, SolverStatus, \
+    TerminationCondition
+from pyomo.opt.solver import SystemCallSolver, SolverResultsCache, \
+    SolverProgress, LogProgressParser, memory_tempdir
 
 thisdir = os.path.dirname(os.path.abspath(__file__))
 exedirname = "exe_dir"
@@ -284,5 +294,389 @@ class TestSystemCallSolver(unittest.TestCase):
                 self.assertEqual(opt._user_executable, isexe_abspath)
                 self.assertEqual(opt.executable(), isexe_abspath)
 
+
+class _TempdirSolver(SystemCallSolver):
+    """A solver that records where its temporary files are created"""
+
+    def __init__(self, **kwds):
+        kwds['type'] = '_tempdir_solver'
+        SystemCallSolver.__init__(self, **kwds)
+        self.set_executable(sys.executable, validate=False)
+        self.tempfile = None
+
+    def _presolve(self, *args, **kwds):
+        self._smap_id = None
+        self.tempfile = self._create_tempfile(suffix='.test')
+
+    def _apply_solver(self):
+        if self.options.fail:
+            raise RuntimeError("solver failed")
+        return Bunch(rc=0, log='')
+
+    def _postsolve(self):
+        TempfileManager.clear_tempfiles()
+        return SolverResults()
+
+
+class TestSystemCallSolverTempdir(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.orig_tempdir = TempfileManager.tempdir
+
+    def tearDown(self):
+        TempfileManager.tempdir = self.orig_tempdir
+        shutil.rmtree(self.tmpdir)
+
+    def test_default(self):
+        opt = _TempdirSolver()
+        opt.solve()
+        self.assertEqual(os.path.dirname(opt.tempfile),
+                         tempfile.gettempdir())
+
+    def test_tempdir_option(self):
+        opt = _TempdirSolver(tempdir=self.tmpdir)
+        opt.solve()
+        self.assertEqual(os.path.dirname(opt.tempfile), self.tmpdir)
+        self.assertIs(TempfileManager.tempdir, self.orig_tempdir)
+
+    def test_tempdir_keyword(self):
+        opt = _TempdirSolver()
+        opt.solve(tempdir=self.tmpdir)
+        self.assertEqual(os.path.dirname(opt.tempfile), self.tmpdir)
+        self.assertIs(TempfileManager.tempdir, self.orig_tempdir)
+        # the tempdir is restored if the solve fails
+        with self.assertRaises(RuntimeError):
+            opt.solve(tempdir=self.tmpdir, options={'fail': True})
+        self.assertIs(TempfileManager.tempdir, self.orig_tempdir)
+
+    def test_tempdir_memory(self):
+        opt = _TempdirSolver()
+        opt.solve(tempdir='memory')
+        dirname = memory_tempdir()
+        if dirname is None:
+            dirname = tempfile.gettempdir()
+        self.assertEqual(os.path.dirname(opt.tempfile), dirname)
+
+    def test_tempdir_problem_files(self):
+        from pyomo.environ import ConcreteModel, Var, Objective
+        m = ConcreteModel()
+        m.x = Var([1, 2], bounds=(0, 1))
+        m.o = Objective(expr=m.x[1] + m.x[2])
+        opt = _CopySolver()
+        opt.solve(m, load_solutions=False, symbolic_solver_labels=True,
+                  tempdir=self.tmpdir)
+        self.assertIn('x(1)', opt.copied)
+        self.assertEqual(os.path.dirname(opt.problem_file), self.tmpdir)
+        self.assertEqual(os.path.dirname(opt.output), self.tmpdir)
+        self.assertIs(TempfileManager.tempdir, self.orig_tempdir)
+        self.assertEqual(os.listdir(self.tmpdir), [])
+        # later solves use the default directory
+        opt.solve(m, load_solutions=False)
+        self.assertEqual(os.path.dirname(opt.problem_file),
+                         tempfile.gettempdir())
+
+
+class _CopySolver(SystemCallSolver):
+    """A solver that copies its problem file to the output file"""
+
+    script = "import sys; open(sys.argv[2], 'w').write(open(sys.argv[1]).read())"
+
+    def __init__(self, **kwds):
+        kwds['type'] = '_copy_solver'
+        SystemCallSolver.__init__(self, **kwds)
+        self.set_executable(sys.executable, validate=False)
+        self._valid_problem_formats = [ProblemFormat.cpxlp]
+        self.set_problem_format(ProblemFormat.cpxlp)
+        self._pipeline_formats = [ProblemFormat.cpxlp]
+        self.output = None
+        self.problem_file = None
+        self.is_fifo = None
+
+    def create_command_line(self, executable, problem_files):
+        self.problem_file = problem_files[0]
+        self.is_fifo = stat.S_ISFIFO(os.stat(problem_files[0]).st_mode)
+        self.output = self._create_tempfile(suffix='.out')
+        return Bunch(cmd=[executable, '-c', self.script,
+                          problem_files[0], self.output],
+                     log_file=None,
+                     env=None)
+
+    def process_soln_file(self, results):
+        with open(self.output) as INPUT:
+            self.copied = INPUT.read()
+        return results
+
+
+@unittest.skipIf(not hasattr(os, 'mkfifo'), "FIFOs are not supported")
+class TestSystemCallSolverPipeline(unittest.TestCase):
+
+    def _model(self):
+        from pyomo.environ import ConcreteModel, Var, Constraint, \
+            Objective, RangeSet
+        m = ConcreteModel()
+        m.I = RangeSet(1000)
+        m.x = Var(m.I, bounds=(0, 1))
+        m.c = Constraint(m.I, rule=lambda m, i: m.x[i] >= 0.5)
+        m.o = Objective(expr=sum(m.x[i] for i in m.I))
+        return m
+
+    def _solve(self, **kwds):
+        opt = _CopySolver()
+        m = self._model()
+        results = opt.solve(m, load_solutions=False,
+                            symbolic_solver_labels=True,
+                            **kwds)
+        return opt, m, results
+
+    def test_pipeline(self):
+        opt, m, results = self._solve()
+        expected = opt.copied
+        self.assertIn('x(1)', expected)
+        self.assertFalse(opt.is_fifo)
+        opt, m, results = self._solve(pipeline=True)
+        self.assertTrue(opt.is_fifo)
+        self.assertEqual(opt.copied, expected)
+        # the symbol map of the pipelined write is returned
+        self.assertIs(results._smap.bySymbol['x(1)'](), m.x[1])
+
+    def test_pipeline_option(self):
+        opt = _CopySolver(pipeline=True)
+        m = self._model()
+        opt.solve(m, load_solutions=False, keepfiles=True)
+        # pipelining is disabled when the problem file is kept
+        self.assertFalse(opt.is_fifo)
+        os.remove(opt.problem_file)
+        os.remove(opt.output)
+
+    def test_pipeline_writer_error(self):
+        from pyomo.environ import Constraint
+        opt = _CopySolver()
+        m = self._model()
+        m.bad = Constraint(expr=m.x[1]**3 >= 0)
+        with self.assertRaisesRegexp(ValueError, "Cannot write legal LP file"):
+            opt.solve(m, load_solutions=False, pipeline=True)
+
+    def test_pipeline_solver_error(self):
+        opt = _CopySolver()
+        opt.script = "import sys; sys.exit(1)"
+        m = self._model()
+        with self.assertRaises(ApplicationError):
+            opt.solve(m, load_solutions=False, pipeline=True)
+
+
+class _CacheSolver(_CopySolver):
+    """A solver that returns a solution and counts how often it runs"""
+
+    def __init__(self, **kwds):
+        _CopySolver.__init__(self, **kwds)
+        self.runs = 0
+
+    def process_soln_file(self, results):
+        _CopySolver.process_soln_file(self, results)
+        self.runs += 1
+        results.solver.status = SolverStatus.ok
+        results.solver.termination_condition = TerminationCondition.optimal
+        soln = results.solution.add()
+        soln.variable['x(1)'] = {'Value': 0.5}
+        soln.objective['o'] = {'Value': 0.5}
+        return results
+
+
+class TestSystemCallSolverCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _model(self, ub=1):
+        from pyomo.environ import ConcreteModel, Var, Constraint, \
+            Objective, RangeSet
+        m = ConcreteModel()
+        m.I = RangeSet(3)
+        m.x = Var(m.I, bounds=(0, ub))
+        m.c = Constraint(m.I, rule=lambda m, i: m.x[i] >= 0.5)
+        m.o = Objective(expr=sum(m.x[i] for i in m.I))
+        return m
+
+    def _solve(self, m, **kwds):
+        opt = _CacheSolver()
+        results = opt.solve(m, symbolic_solver_labels=True, **kwds)
+        return opt, results
+
+    def test_cache(self):
+        m = self._model()
+        opt, results = self._solve(m, cache=self.tmpdir)
+        self.assertEqual(opt.runs, 1)
+        self.assertEqual(m.x[1].value, 0.5)
+        self.assertEqual(len(SolverResultsCache(self.tmpdir)), 1)
+
+        # the same problem is loaded from the cache
+        m = self._model()
+        opt, results = self._solve(m, cache=self.tmpdir)
+        self.assertEqual(opt.runs, 0)
+        self.assertEqual(m.x[1].value, 0.5)
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.optimal)
+
+        # different options or problem data run the solver
+        opt, results = self._solve(self._model(), cache=self.tmpdir,
+                                   options={'threads': 2})
+        self.assertEqual(opt.runs, 1)
+        opt, results = self._solve(self._model(ub=2), cache=self.tmpdir)
+        self.assertEqual(opt.runs, 1)
+        self.assertEqual(len(SolverResultsCache(self.tmpdir)), 3)
+
+        # no cache
+        opt, results = self._solve(self._model())
+        self.assertEqual(opt.runs, 1)
+
+    def test_cache_option(self):
+        cache = SolverResultsCache(self.tmpdir)
+        opt = _CacheSolver(cache=cache, pipeline=True)
+        opt.solve(self._model(), load_solutions=False)
+        self.assertEqual(opt.runs, 1)
+        # pipelining is disabled when a cache is used
+        self.assertFalse(opt.is_fifo)
+        opt.solve(self._model(), load_solutions=False)
+        self.assertEqual(opt.runs, 1)
+        self.assertEqual(len(cache), 1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_cache_eviction(self):
+        cache = SolverResultsCache(self.tmpdir, max_entries=2)
+        for ub in (1, 2, 3):
+            self._solve(self._model(ub=ub), cache=cache)
+        self.assertEqual(len(cache), 2)
+        # the least recently used entry was removed
+        opt, results = self._solve(self._model(ub=3), cache=cache)
+        self.assertEqual(opt.runs, 0)
+        opt, results = self._solve(self._model(ub=1), cache=cache)
+        self.assertEqual(opt.runs, 1)
+
+        cache = SolverResultsCache(self.tmpdir, max_size=0)
+        cache.evict()
+        self.assertEqual(len(cache), 0)
+
+    def test_cache_error(self):
+        opt = _CacheSolver()
+        opt.script = "import sys; sys.exit(1)"
+        with self.assertRaises(ApplicationError):
+            opt.solve(self._model(), cache=self.tmpdir)
+        self.assertEqual(len(SolverResultsCache(self.tmpdir)), 0)
+
+
+class _CountingParser(LogProgressParser):
+
+    _re = re.compile(r'^iter (\d+) obj (\S+)')
+
+    def __call__(self, line):
+        m = self._re.match(line)
+        if m is None:
+            return None
+        return SolverProgress(iteration=int(m.group(1)),
+                              objective=float(m.group(2)))
+
+
+class _ProgressSolver(_CopySolver):
+    """A solver that reports its progress until it is interrupted"""
+
+    script = """
+import sys, time
+try:
+    for i in range(int(sys.argv[3])):
+        print('iter %d obj %d' % (i, 100 - i))
+        sys.stdout.flush()
+        time.sleep(0.05)
+except KeyboardInterrupt:
+    print('interrupted')
+open(sys.argv[2], 'w').write(open(sys.argv[1]).read())
+"""
+
+    def __init__(self, **kwds):
+        _CopySolver.__init__(self, **kwds)
+        self.iterations = 5
+
+    def create_command_line(self, executable, problem_files):
+        command = _CopySolver.create_command_line(self, executable,
+                                                  problem_files)
+        command.cmd.append(str(self.iterations))
+        return command
+
+    def _create_progress_parser(self):
+        return _CountingParser()
+
+    def process_soln_file(self, results):
+        _CopySolver.process_soln_file(self, results)
+        results.solver.status = SolverStatus.ok
+        results.solver.termination_condition = TerminationCondition.feasible
+        return results
+
+
+class TestSystemCallSolverProgress(unittest.TestCase):
+
+    def _model(self):
+        from pyomo.environ import ConcreteModel, Var, Objective
+        m = ConcreteModel()
+        m.x = Var(bounds=(0, 1))
+        m.o = Objective(expr=m.x)
+        return m
+
+    def test_progress(self):
+        opt = _ProgressSolver()
+        reports = []
+        results = opt.solve(self._model(), load_solutions=False,
+                            progress=reports.append)
+        self.assertEqual([p.iteration for p in reports], [0, 1, 2, 3, 4])
+        self.assertEqual(reports[-1].objective, 96)
+        self.assertEqual(reports[-1].line.strip(), 'iter 4 obj 96')
+        self.assertTrue(all(p.time >= 0 for p in reports))
+        self.assertIn('iter 4 obj 96', opt._log)
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.feasible)
+        self.assertEqual(results.solver.status, SolverStatus.ok)
+
+    @unittest.skipIf(is_windows, "Interrupts are sent with SIGINT")
+    def test_progress_interrupt(self):
+        opt = _ProgressSolver()
+        opt.iterations = 1000
+        reports = []
+        def callback(progress):
+            reports.append(progress)
+            return progress.iteration >= 2
+        results = opt.solve(self._model(), load_solutions=False,
+                            progress=callback)
+        self.assertEqual([p.iteration for p in reports], [0, 1, 2])
+        self.assertIn('interrupted', opt._log)
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.userInterrupt)
+        self.assertEqual(results.solver.status, SolverStatus.aborted)
+
+        # the next solve is not interrupted
+        opt.iterations = 2
+        results = opt.solve(self._model(), load_solutions=False)
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.feasible)
+
+    def test_progress_no_parser(self):
+        opt = _CopySolver()
+        reports = []
+        opt.solve(self._model(), load_solutions=False,
+                  progress=reports.append)
+        self.assertEqual(reports, [])
+
+    def test_relative_gap(self):
+        self.assertAlmostEqual(LogProgressParser.relative_gap(10, 9), 0.1)
+        self.assertIsNone(LogProgressParser.relative_gap(None, 9))
+        self.assertIsNone(LogProgressParser.relative_gap(10, float('-inf')))
+        self.assertEqual(repr(SolverProgress(iteration=3)),
+                         "SolverProgress(iteration=3)")
+        with self.assertRaises(TypeError):
+            SolverProgress(foo=1)
+
+
 if __name__ == "__main__":
     unittest.main()
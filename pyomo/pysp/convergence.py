@@ -11,8 +11,15 @@
 import copy
 from math import fabs
 
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
 from pyomo.pysp.generators import \
     scenario_tree_node_variables_generator_noinstances
+from pyomo.pysp.phutils import indexToString
 
 from six import iteritems, iterkeys
 
@@ -25,6 +32,80 @@ from six import iteritems, iterkeys
 # of instances (with solutions).
 #
 
+#
+# With numpy, the metrics that compare the scenario solutions at a
+# tree node with the node averages are computed from the solution
+# array kept on the node (see ScenarioTreeNode._load_solution_array),
+# which PH refreshes in update_variable_statistics before it updates
+# the convergence metrics of an iteration.
+#
+
+def _node_array_values(tree_node, node_values):
+    """Returns the values in a dictionary keyed by variable id
+    (e.g., the node averages) as an array over the columns of the
+    solution array of the tree node. Missing (None) values are
+    NaN."""
+    return numpy.array(
+        list(map(node_values.__getitem__, tree_node._array_variable_ids)),
+        dtype=float)
+
+def _node_scenario_probabilities(tree_node):
+    """Returns the probabilities of the scenarios at the tree node,
+    in the row order of its solution array."""
+    return numpy.fromiter(
+        (scenario._probability for scenario in tree_node._scenarios),
+        float, len(tree_node._scenarios))
+
+def _node_term_diff_columns(tree_node):
+    """Returns the mask of the columns of the solution array of the
+    tree node that the term-diff metrics include: variables that are
+    fixed at the node or that are not stale in any scenario. Raises
+    the error of the scenario tree variable generator for variables
+    that are fixed in some but not all of the scenarios at the
+    node."""
+    x_array = tree_node._solution_array()
+    columns = tree_node._array_columns
+    tree_node_name = tree_node._name
+    num_scenarios, num_variables = x_array.shape
+
+    stale = numpy.zeros(num_variables, dtype=bool)
+    fixed_count = numpy.zeros(num_variables, dtype=int)
+    for scenario in tree_node._scenarios:
+        stale[[columns[variable_id]
+               for variable_id in scenario._stale[tree_node_name]
+               if variable_id in columns]] = True
+        fixed_count[[columns[variable_id]
+                     for variable_id in scenario._fixed[tree_node_name]
+                     if variable_id in columns]] += 1
+
+    partial = (fixed_count > 0) & (fixed_count < num_scenarios)
+    if partial.any():
+        j = int(numpy.argmax(partial))
+        variable_name, index = tree_node._variable_ids[
+            tree_node._array_variable_ids[j]]
+        raise RuntimeError("Variable="+variable_name+str(index)+" is "
+                           "fixed in "+str(fixed_count[j])+" "
+                           "scenarios, which is less than the number "
+                           "of scenarios at tree node="+tree_node_name)
+
+    included = ~stale
+    included[[columns[variable_id]
+              for variable_id in tree_node._fixed
+              if variable_id in columns]] = True
+
+    # the loops fail on a variable without a value (None)
+    # rather than adding NaN to the metric
+    missing = numpy.isnan(x_array[:, included]).any(axis=0)
+    if missing.any():
+        j = numpy.flatnonzero(included)[int(numpy.argmax(missing))]
+        variable_name, index = tree_node._variable_ids[
+            tree_node._array_variable_ids[j]]
+        raise TypeError("No value is available for variable="
+                        +variable_name+indexToString(index)+" in some "
+                        "scenario at tree node="+tree_node_name)
+
+    return included
+
 class ConvergenceBase(object):
 
     """ Constructor
@@ -143,13 +224,27 @@ class PrimalDualResidualConvergence(ConvergenceBase):
                     copy.deepcopy(tree_node._averages)
         return previous_average
 
+    @staticmethod
+    def _compute_node_residual_squared_norm(tree_node, node_average):
+        x_array = tree_node._solution_array()
+        average_array = _node_array_values(tree_node, node_average)
+        return float(numpy.dot(_node_scenario_probabilities(tree_node),
+                               ((x_array - average_array)**2).sum(axis=1)))
+
     @staticmethod
     def compute_residual_squared_norm(ph, previous_average):
         residual_squared_norm = 0.0
         for stage in ph.scenario_tree.stages[:-1]:
             for tree_node in stage.nodes:
-                node_residual_squared_norm = 0.0
                 node_previous_average = previous_average[tree_node.name]
+                if numpy_available and tree_node._standard_variable_ids:
+                    residual_squared_norm += \
+                        tree_node.conditional_probability * \
+                        PrimalDualResidualConvergence.\
+                        _compute_node_residual_squared_norm(
+                            tree_node, node_previous_average)
+                    continue
+                node_residual_squared_norm = 0.0
                 for scenario in tree_node.scenarios:
                     scenario_node_x = scenario._x[tree_node.name]
                     scenario_residual_squared_norm = 0.0
@@ -170,8 +265,15 @@ class PrimalDualResidualConvergence(ConvergenceBase):
         primal_residual_squared_norm = 0.0
         for stage in ph.scenario_tree.stages[:-1]:
             for tree_node in stage.nodes:
-                node_primal_residual_squared_norm = 0.0
                 node_average = tree_node._averages
+                if numpy_available and tree_node._standard_variable_ids:
+                    primal_residual_squared_norm += \
+                        tree_node.conditional_probability * \
+                        PrimalDualResidualConvergence.\
+                        _compute_node_residual_squared_norm(
+                            tree_node, node_average)
+                    continue
+                node_primal_residual_squared_norm = 0.0
                 for scenario in tree_node.scenarios:
                     scenario_node_x = scenario._x[tree_node.name]
                     scenario_primal_residual_squared_norm = 0.0
@@ -242,6 +344,9 @@ class TermDiffConvergence(ConvergenceBase):
 
     def computeMetric(self, ph, scenario_tree, instances):
 
+        if numpy_available:
+            return self._compute_metric_arrays(scenario_tree)
+
         term_diff = 0.0
 
         for stage, tree_node, variable_id, variable_values, is_fixed, is_stale \
@@ -260,6 +365,24 @@ class TermDiffConvergence(ConvergenceBase):
 
         return term_diff
 
+    def _compute_metric_arrays(self, scenario_tree):
+
+        term_diff = 0.0
+
+        for stage in scenario_tree._stages[:-1]:
+            for tree_node in stage._tree_nodes:
+                if not tree_node._standard_variable_ids:
+                    continue
+                included = _node_term_diff_columns(tree_node)
+                x_array = tree_node._solution_array()[:, included]
+                average_array = _node_array_values(
+                    tree_node, tree_node._averages)[included]
+                term_diff += float(numpy.dot(
+                    _node_scenario_probabilities(tree_node),
+                    numpy.abs(x_array - average_array).sum(axis=1)))
+
+        return term_diff
+
 
 #
 # Implements the normalized "term-diff" metric from our submitted CMS
@@ -283,6 +406,11 @@ class NormalizedTermDiffConvergence(ConvergenceBase):
 
     def computeMetric(self, ph, scenario_tree, instances):
 
+        if numpy_available:
+            normalized_term_diff = self._compute_metric_arrays(scenario_tree)
+            return normalized_term_diff / \
+                (ph._total_discrete_vars + ph._total_continuous_vars)
+
         normalized_term_diff = 0.0
 
         for stage, tree_node, variable_id, variable_values, is_fixed, is_stale \
@@ -310,6 +438,28 @@ class NormalizedTermDiffConvergence(ConvergenceBase):
 
         return normalized_term_diff
 
+    def _compute_metric_arrays(self, scenario_tree):
+
+        normalized_term_diff = 0.0
+
+        for stage in scenario_tree._stages[:-1]:
+            for tree_node in stage._tree_nodes:
+                if not tree_node._standard_variable_ids:
+                    continue
+                average_array = _node_array_values(tree_node,
+                                                   tree_node._averages)
+                included = _node_term_diff_columns(tree_node)
+                with numpy.errstate(invalid='ignore'):
+                    included &= (numpy.abs(average_array) > 0.0001)
+                x_array = tree_node._solution_array()[:, included]
+                average_array = average_array[included]
+                normalized_term_diff += float(numpy.dot(
+                    _node_scenario_probabilities(tree_node),
+                    numpy.abs((x_array - average_array) / \
+                              average_array).sum(axis=1)))
+
+        return normalized_term_diff
+
 #
 # Implements a super-simple convergence criterion based on when a
 # particular number of discrete variables are free (e.g., 20 or
@@ -12,7 +12,6 @@ import time
 import sys
 import argparse
 import shutil
-import filecmp
 import logging
 
 from pyomo.opt import WriterFactory
@@ -35,6 +34,7 @@ from pyomo.pysp.convert.smps import (map_variable_stages,
                                      build_repns,
                                      _safe_remove_file,
                                      _no_negative_zero,
+                                     _file_digest,
                                      _deterministic_check_value,
                                      _deterministic_check_constant,
                                      ProblemStats)
@@ -43,9 +43,7 @@ from pyomo.pysp.util.config import (PySPConfigValue,
                                     safe_register_common_option,
                                     safe_register_unique_option,
                                     _domain_must_be_str)
-from pyomo.pysp.scenariotree.manager import \
-    (ScenarioTreeManagerClientSerial,
-     ScenarioTreeManagerClientPyro)
+from pyomo.pysp.scenariotree.manager import ScenarioTreeManagerFactory
 from pyomo.pysp.util.misc import launch_command
 
 from six import iteritems, itervalues
@@ -700,13 +698,25 @@ def _convert_external_setup_without_cleanup(
     for con, upper in iteritems(modified_constraint_ub):
         con._upper = as_numeric(upper)
 
+    # digests of the files that must be identical across
+    # scenarios, so the consistency checks can be performed
+    # without reading all of the per-scenario files again
+    file_digests = {}
+    for key in ("rhs.sc.struct",
+                "cost.sc.struct",
+                "matrix.sc.struct",
+                "lp.det"):
+        file_digests[key] = _file_digest(
+            os.path.join(output_directory, scenario.name+"."+key))
+
     return (firststage_variable_count,
             secondstage_variable_count,
             firststage_constraint_count,
             secondstage_constraint_count,
             stochastic_cost_count,
             stochastic_rhs_count,
-            stochastic_matrix_count)
+            stochastic_matrix_count,
+            file_digests)
 
 def convert_external(output_directory,
                      firststage_var_suffix,
@@ -753,7 +763,8 @@ def convert_external(output_directory,
      secondstage_constraint_count,
      stochastic_cost_count,
      stochastic_rhs_count,
-     stochastic_matrix_count) = counts[reference_scenario_name]
+     stochastic_matrix_count,
+     reference_digests) = counts[reference_scenario_name]
 
     #
     # Copy the reference scenario's core, row, col, and tim
@@ -846,14 +857,12 @@ def convert_external(output_directory,
                   "prohibitively slow or can not be executed on "
                   "your system, disable it by activating the "
                   "disable_consistency_check option.")
-        has_diff = False
-        try:
-            if not os.system('diff --help > /dev/null'):
-                has_diff = True
-            else:
-                has_diff = False
-        except:
-            has_diff = False
+        #
+        # The per-scenario files are compared using the digests
+        # computed by each worker after writing them
+        #
+        def _matches_reference(scenario, key):
+            return counts[scenario.name][-1][key] == reference_digests[key]
 
         if verbose:
             print(" - Checking structure in stochastic files...")
@@ -865,14 +874,7 @@ def convert_external(output_directory,
                 scenario_struct_filename = \
                     os.path.join(scenario_directory,
                                  scenario.name+"."+basename)
-                if has_diff:
-                    rc = os.system('diff -q '+scenario_struct_filename+' '+
-                                   reference_struct_filename)
-                else:
-                    rc = not filecmp.cmp(scenario_struct_filename,
-                                         reference_struct_filename,
-                                         shallow=False)
-                if rc:
+                if not _matches_reference(scenario, basename):
                     raise ValueError(
                         "The structure indicated in file '%s' does not match "
                         "that for scenario %s indicated in file '%s'. This "
@@ -895,14 +897,7 @@ def convert_external(output_directory,
             scenario_lp_det_filename = \
                 os.path.join(scenario_directory,
                              scenario.name+".lp.det")
-            if has_diff:
-                rc = os.system('diff -q '+scenario_lp_det_filename+' '+
-                               reference_lp_det_filename)
-            else:
-                rc = not filecmp.cmp(scenario_lp_det_filename,
-                                     reference_lp_det_filename,
-                                     shallow=False)
-            if rc:
+            if not _matches_reference(scenario, "lp.det"):
                 raise ValueError(
                     "One or more deterministic parts of the problem found "
                     "in file '%s' do not match those for scenario %s found "
@@ -1054,9 +1049,7 @@ def convertddsip_register_options(options=None):
             ),
             doc=None,
             visibility=0))
-    safe_register_common_option(options, "scenario_tree_manager")
-    ScenarioTreeManagerClientSerial.register_options(options)
-    ScenarioTreeManagerClientPyro.register_options(options)
+    ScenarioTreeManagerFactory.register_options(options)
 
     return options
 
@@ -1077,13 +1070,7 @@ def run_convertddsip(options):
 
     assert not options.compile_scenario_instances
 
-    manager_class = None
-    if options.scenario_tree_manager == 'serial':
-        manager_class = ScenarioTreeManagerClientSerial
-    elif options.scenario_tree_manager == 'pyro':
-        manager_class = ScenarioTreeManagerClientPyro
-
-    with manager_class(options) as scenario_tree_manager:
+    with ScenarioTreeManagerFactory(options) as scenario_tree_manager:
         scenario_tree_manager.initialize()
         files = convert_external(
             options.output_directory,
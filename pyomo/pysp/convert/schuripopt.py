@@ -21,9 +21,7 @@ from pyomo.pysp.util.config import (PySPConfigValue,
                                     safe_register_common_option,
                                     safe_register_unique_option,
                                     _domain_must_be_str)
-from pyomo.pysp.scenariotree.manager import \
-    (ScenarioTreeManagerClientSerial,
-     ScenarioTreeManagerClientPyro)
+from pyomo.pysp.scenariotree.manager import ScenarioTreeManagerFactory
 from pyomo.pysp.scenariotree.util import \
     scenario_tree_id_to_pint32
 from pyomo.pysp.util.misc import (parse_command_line,
@@ -312,9 +310,7 @@ def convertschuripopt_register_options(options=None):
             ),
             doc=None,
             visibility=0))
-    safe_register_common_option(options, "scenario_tree_manager")
-    ScenarioTreeManagerClientSerial.register_options(options)
-    ScenarioTreeManagerClientPyro.register_options(options)
+    ScenarioTreeManagerFactory.register_options(options)
 
     return options
 
@@ -336,13 +332,7 @@ def convertschuripopt(options):
 
     assert not options.compile_scenario_instances
 
-    manager_class = None
-    if options.scenario_tree_manager == 'serial':
-        manager_class = ScenarioTreeManagerClientSerial
-    elif options.scenario_tree_manager == 'pyro':
-        manager_class = ScenarioTreeManagerClientPyro
-
-    with manager_class(options) as scenario_tree_manager:
+    with ScenarioTreeManagerFactory(options) as scenario_tree_manager:
         scenario_tree_manager.initialize()
         files = write_schuripopt_files(
             scenario_tree_manager,
@@ -14,7 +14,7 @@ import sys
 import time
 import operator
 import shutil
-import filecmp
+import hashlib
 import logging
 import itertools
 from collections import namedtuple
@@ -43,9 +43,7 @@ from pyomo.pysp.util.config import (PySPConfigValue,
                                     safe_register_common_option,
                                     safe_register_unique_option,
                                     _domain_must_be_str)
-from pyomo.pysp.scenariotree.manager import \
-    (ScenarioTreeManagerClientSerial,
-     ScenarioTreeManagerClientPyro)
+from pyomo.pysp.scenariotree.manager import ScenarioTreeManagerFactory
 from pyomo.pysp.util.misc import launch_command
 
 from six import iteritems, itervalues
@@ -76,6 +74,16 @@ def _no_negative_zero(val):
         return 0
     return val
 
+def _file_digest(filename):
+    """Return a digest of the contents of a file. Used to check
+    that per-scenario output files are identical without having
+    to compare the files themselves."""
+    digest = hashlib.sha1()
+    with open(filename, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 ProblemStats = namedtuple("ProblemStats",
                           ["firststage_variable_count",
                            "secondstage_variable_count",
@@ -1040,13 +1048,26 @@ def _convert_external_setup_without_cleanup(
     for con, upper in iteritems(modified_constraint_ub):
         con._upper = as_numeric(upper)
 
+    # digests of the files that must be identical across
+    # scenarios, so the consistency checks can be performed
+    # without reading all of the per-scenario files again
+    file_digests = {}
+    for key, prefix in (("row", basename+".row."),
+                        ("col", basename+".col."),
+                        ("tim", basename+".tim."),
+                        ("sto.struct", basename+".sto.struct."),
+                        ("det", basename+"."+file_format+".det.")):
+        file_digests[key] = _file_digest(
+            os.path.join(output_directory, prefix+scenario.name))
+
     return (firststage_variable_count,
             secondstage_variable_count,
             firststage_constraint_count,
             secondstage_constraint_count,
             stochastic_cost_count,
             stochastic_rhs_count,
-            stochastic_matrix_count)
+            stochastic_matrix_count,
+            file_digests)
 
 def convert_external(output_directory,
                      basename,
@@ -1102,7 +1123,8 @@ def convert_external(output_directory,
      secondstage_constraint_count,
      stochastic_cost_count,
      stochastic_rhs_count,
-     stochastic_matrix_count) = counts[reference_scenario_name]
+     stochastic_matrix_count,
+     reference_digests) = counts[reference_scenario_name]
 
     #
     # Copy the reference scenario's core, row, col, and tim
@@ -1223,28 +1245,20 @@ def convert_external(output_directory,
                   "prohibitively slow or can not be executed on "
                   "your system, disable it by activating the "
                   "disable_consistency_check option.")
-        has_diff = False
-        try:
-            if not os.system('diff --help > /dev/null'):
-                has_diff = True
-            else:
-                has_diff = False
-        except:
-            has_diff = False
+        #
+        # The per-scenario files are compared using the digests
+        # computed by each worker after writing them
+        #
+        def _matches_reference(scenario, key):
+            return counts[scenario.name][-1][key] == reference_digests[key]
+
         if verbose:
             print(" - Checking row and column ordering...")
         for scenario in scenario_tree.scenarios:
             scenario_core_row_filename = \
                 os.path.join(scenario_directory,
                              basename+".row."+scenario.name)
-            if has_diff:
-                rc = os.system('diff -q '+scenario_core_row_filename+' '+
-                               core_row_filename)
-            else:
-                rc = not filecmp.cmp(scenario_core_row_filename,
-                                     core_row_filename,
-                                     shallow=False)
-            if rc:
+            if not _matches_reference(scenario, "row"):
                 raise ValueError(
                     "The row ordering indicated in file '%s' does not match "
                     "that for scenario %s indicated in file '%s'. This "
@@ -1259,14 +1273,7 @@ def convert_external(output_directory,
             scenario_core_col_filename = \
                 os.path.join(scenario_directory,
                              basename+".col."+scenario.name)
-            if has_diff:
-                rc = os.system('diff -q '+scenario_core_col_filename+' '+
-                               core_col_filename)
-            else:
-                rc = not filecmp.cmp(scenario_core_col_filename,
-                                     core_col_filename,
-                                     shallow=False)
-            if rc:
+            if not _matches_reference(scenario, "col"):
                 raise ValueError(
                     "The column ordering indicated in file '%s' does not "
                     "match that for scenario %s indicated in file '%s'. "
@@ -1284,14 +1291,7 @@ def convert_external(output_directory,
             scenario_tim_filename = \
                 os.path.join(scenario_directory,
                              basename+".tim."+scenario.name)
-            if has_diff:
-                rc = os.system('diff -q '+scenario_tim_filename+' '+
-                               tim_filename)
-            else:
-                rc = not filecmp.cmp(scenario_tim_filename,
-                                     tim_filename,
-                                     shallow=False)
-            if rc:
+            if not _matches_reference(scenario, "tim"):
                 raise ValueError(
                     "Main .tim file '%s' does not match .tim file for "
                     "scenario %s located at '%s'. This indicates there was "
@@ -1310,14 +1310,7 @@ def convert_external(output_directory,
             scenario_sto_struct_filename = \
                 os.path.join(scenario_directory,
                              basename+".sto.struct."+scenario.name)
-            if has_diff:
-                rc = os.system('diff -q '+scenario_sto_struct_filename+' '+
-                               sto_struct_filename)
-            else:
-                rc = not filecmp.cmp(scenario_sto_struct_filename,
-                                     sto_struct_filename,
-                                     shallow=False)
-            if rc:
+            if not _matches_reference(scenario, "sto.struct"):
                 raise ValueError(
                     "The structure of stochastic entries indicated in file "
                     "'%s' does not match that for scenario %s indicated in "
@@ -1336,14 +1329,7 @@ def convert_external(output_directory,
             scenario_core_det_filename = \
                 os.path.join(scenario_directory,
                              basename+"."+core_format+".det."+scenario.name)
-            if has_diff:
-                rc = os.system('diff -q '+scenario_core_det_filename+' '+
-                               core_det_filename)
-            else:
-                rc = not filecmp.cmp(scenario_core_det_filename,
-                                     core_det_filename,
-                                     shallow=False)
-            if rc:
+            if not _matches_reference(scenario, "det"):
                 raise ValueError(
                     "One or more deterministic parts of the problem found "
                     "in file '%s' do not match those for scenario %s found "
@@ -2180,9 +2166,7 @@ def convertsmps_register_options(options=None):
             ),
             doc=None,
             visibility=0))
-    safe_register_common_option(options, "scenario_tree_manager")
-    ScenarioTreeManagerClientSerial.register_options(options)
-    ScenarioTreeManagerClientPyro.register_options(options)
+    ScenarioTreeManagerFactory.register_options(options)
 
     return options
 
@@ -2211,13 +2195,7 @@ def run_convertsmps(options):
         logger.warn("DEPRECATED: The use of the --explicit option "
                     "is no longer necessary. It is the default behavior")
 
-    manager_class = None
-    if options.scenario_tree_manager == 'serial':
-        manager_class = ScenarioTreeManagerClientSerial
-    elif options.scenario_tree_manager == 'pyro':
-        manager_class = ScenarioTreeManagerClientPyro
-
-    with manager_class(options) as scenario_tree_manager:
+    with ScenarioTreeManagerFactory(options) as scenario_tree_manager:
         scenario_tree_manager.initialize()
         convert_external(
             options.output_directory,
@@ -8,7 +8,20 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import shutil
+import tempfile
+try:
+    from collections import OrderedDict
+except ImportError:                         #pragma:nocover
+    from ordereddict import OrderedDict
+
+from six import itervalues
+
 from pyomo.core.base import *
+from pyomo.core.base.component import _name_index_generator
+from pyomo.core.base.label import cpxlp_label_from_name
+from pyomo.repn import generate_standard_repn
+from pyomo.repn.plugins.cpxlp import ProblemWriter_cpxlp
 from pyomo.opt import (ProblemFormat,
                        SolverFactory,
                        SolverManagerFactory,
@@ -348,6 +361,391 @@ def write_ef(binding_instance,
 
     return smap_id
 
+#
+# write the extensive form to an LP file one scenario at a time,
+# without constructing the EF binding instance. only a single
+# scenario instance is held in memory at any point. the sections of
+# the LP file are accumulated in temporary files (rows for the
+# scenario constraints, the non-anticipativity rows, bounds, etc.)
+# and concatenated once all scenarios have been processed.
+#
+
+class _StreamingEFWriter_cpxlp(ProblemWriter_cpxlp):
+
+    def __init__(self,
+                 ef_instance_name="MASTER",
+                 symbolic_solver_labels=False,
+                 output_fixed_variable_bounds=False,
+                 file_determinism=1,
+                 instance_cache=None):
+        super(_StreamingEFWriter_cpxlp, self).__init__()
+        self._ef_instance_name = ef_instance_name
+        self._instance_cache = instance_cache
+        self._symbolic_solver_labels = symbolic_solver_labels
+        self._output_fixed_variable_bounds = output_fixed_variable_bounds
+        self._sort_order = SortComponents.unsorted
+        if file_determinism >= 1:
+            self._sort_order |= SortComponents.indices
+            if file_determinism >= 2:
+                self._sort_order |= SortComponents.alphabetical
+        # shared across scenarios so that numeric labels are unique
+        self._numeric_labeler = NumericLabeler('x')
+        # (tree node name, variable id) -> label
+        self._master_variable_labels = OrderedDict()
+        # tree node name -> number of blend rows written
+        self._master_constraint_counts = {}
+        self._objective_constant = 0.0
+        self._objective_sense = None
+
+    def _scenario_labeler(self, scenario_name):
+        if not self._symbolic_solver_labels:
+            return self._numeric_labeler
+        prefix = str(scenario_name) + "."
+        def labeler(obj):
+            return cpxlp_label_from_name(
+                prefix + obj.getname(fully_qualified=True))
+        return labeler
+
+    def _master_variable_label(self, tree_node, variable_id):
+        key = (tree_node._name, variable_id)
+        label = self._master_variable_labels.get(key, None)
+        if label is None:
+            if self._symbolic_solver_labels:
+                label = cpxlp_label_from_name(
+                    "MASTER_BLEND_VAR_%s%s"
+                    % (tree_node._name, _name_index_generator(variable_id)))
+            else:
+                label = self._numeric_labeler()
+            self._master_variable_labels[key] = label
+        return label
+
+    def _master_constraint_label(self, tree_node):
+        count = self._master_constraint_counts.get(tree_node._name, 0) + 1
+        self._master_constraint_counts[tree_node._name] = count
+        if self._symbolic_solver_labels:
+            return cpxlp_label_from_name(
+                "MASTER_BLEND_CONSTRAINT_%s[%d]" % (tree_node._name, count))
+        return self._numeric_labeler()
+
+    def write(self,
+              scenario_tree,
+              scenario_instance_factory,
+              output_file,
+              verbose_output=False):
+
+        self._referenced_variable_ids.clear()
+        tmpfiles = dict((section, tempfile.TemporaryFile(mode="w+"))
+                        for section in ("objective",
+                                        "quadratic_objective",
+                                        "constraints",
+                                        "master_constraints",
+                                        "sos",
+                                        "bounds",
+                                        "general",
+                                        "binary"))
+        try:
+            for scenario in scenario_tree.scenarios:
+                if verbose_output:
+                    print("Writing extensive form rows and columns for "
+                          "scenario=%s" % (scenario.name))
+                self._write_scenario(scenario_tree,
+                                     scenario_instance_factory,
+                                     scenario,
+                                     tmpfiles,
+                                     verbose_output)
+
+            output_file.write("\\* Source Pyomo model name=%s *\\\n\n"
+                              % (self._ef_instance_name,))
+            if self._objective_sense == minimize:
+                output_file.write("min \n")
+            else:
+                output_file.write("max \n")
+            if self._symbolic_solver_labels:
+                output_file.write(self._ef_instance_name+":\n")
+            else:
+                output_file.write(self._numeric_labeler()+":\n")
+            self._copy_section(tmpfiles["objective"], output_file)
+            if tmpfiles["quadratic_objective"].tell() > 0:
+                output_file.write("+ [\n")
+                self._copy_section(tmpfiles["quadratic_objective"],
+                                   output_file)
+                output_file.write("] / 2\n")
+            if (self._objective_constant != 0.0) or \
+               ((tmpfiles["objective"].tell() == 0) and \
+                (tmpfiles["quadratic_objective"].tell() == 0)):
+                output_file.write(self.obj_string_template
+                                  % (self._objective_constant,
+                                     'ONE_VAR_CONSTANT'))
+
+            output_file.write("\ns.t.\n\n")
+            self._copy_section(tmpfiles["constraints"], output_file)
+            self._copy_section(tmpfiles["master_constraints"], output_file)
+            output_file.write("c_e_ONE_VAR_CONSTANT: \n")
+            output_file.write("ONE_VAR_CONSTANT = 1.0\n")
+            output_file.write("\n")
+
+            output_file.write("bounds\n")
+            self._copy_section(tmpfiles["bounds"], output_file)
+            # the master blending variables are unbounded
+            for label in itervalues(self._master_variable_labels):
+                output_file.write("    -inf <= %s <= +inf\n" % (label))
+            if tmpfiles["general"].tell() > 0:
+                output_file.write("general\n")
+                self._copy_section(tmpfiles["general"], output_file)
+            if tmpfiles["binary"].tell() > 0:
+                output_file.write("binary\n")
+                self._copy_section(tmpfiles["binary"], output_file)
+            if tmpfiles["sos"].tell() > 0:
+                output_file.write("SOS\n")
+                self._copy_section(tmpfiles["sos"], output_file)
+            output_file.write("end\n")
+        finally:
+            for f in itervalues(tmpfiles):
+                f.close()
+            self._referenced_variable_ids.clear()
+
+    @staticmethod
+    def _copy_section(src, dst):
+        src.seek(0)
+        shutil.copyfileobj(src, dst)
+
+    def _write_scenario(self,
+                        scenario_tree,
+                        scenario_instance_factory,
+                        scenario,
+                        tmpfiles,
+                        verbose_output):
+
+        eq_string_template = self.eq_string_template
+        linear_coef_string_template = self.linear_coef_string_template
+        sort_order = self._sort_order
+
+        scenario_instance = \
+            scenario_instance_factory.construct_scenario_instance(
+                scenario.name,
+                scenario_tree,
+                instance_cache=self._instance_cache,
+                verbose=verbose_output)
+
+        # link the instance to a tree containing only this
+        # scenario, so that the full scenario tree is never
+        # linked to more than a single instance
+        scenario_subtree = scenario_tree.make_compressed([scenario.name])
+        scenario_subtree.linkInInstances({scenario.name: scenario_instance})
+        linked_scenario = scenario_subtree.get_scenario(scenario.name)
+
+        if linked_scenario._instance_objective.is_minimizing():
+            sense = minimize
+        else:
+            sense = maximize
+        if self._objective_sense is None:
+            self._objective_sense = sense
+        elif self._objective_sense != sense:
+            raise ValueError(
+                "Objective sense of scenario %s does not match the "
+                "objective sense of the previous scenarios"
+                % (scenario.name))
+
+        labeler = self._scenario_labeler(scenario.name)
+        symbol_map = SymbolMap()
+        variable_symbol_map = SymbolMap()
+        variable_list = list(scenario_instance.component_data_objects(
+            Var, sort=sort_order))
+        variable_symbol_map.addSymbols(
+            (vardata, SymbolMap.createSymbol(symbol_map, vardata, labeler))
+            for vardata in variable_list)
+        object_symbol_dictionary = symbol_map.byObject
+        variable_symbol_dictionary = variable_symbol_map.byObject
+
+        #
+        # Objective terms
+        #
+        repn = generate_standard_repn(
+            scenario._probability * \
+            linked_scenario._instance_cost_expression.expr)
+        degree = repn.polynomial_degree()
+        if degree is None:
+            raise RuntimeError(
+                "Cannot write legal LP file. The cost expression of "
+                "scenario %s has nonlinear terms that are not quadratic."
+                % (scenario.name))
+        self._objective_constant += repn.constant
+        output = []
+        self._print_linear_terms(repn,
+                                 output,
+                                 variable_symbol_dictionary,
+                                 None)
+        tmpfiles["objective"].write("".join(output))
+        output = []
+        self._print_quadratic_terms(repn,
+                                    output,
+                                    variable_symbol_dictionary,
+                                    True,
+                                    None)
+        tmpfiles["quadratic_objective"].write("".join(output))
+        del repn
+
+        #
+        # Constraints
+        #
+        output = []
+        output_file = tmpfiles["constraints"]
+        for block in scenario_instance.block_data_objects(active=True,
+                                                          sort=sort_order):
+            for constraint_data in block.component_data_objects(
+                    Constraint,
+                    active=True,
+                    sort=sort_order,
+                    descend_into=False):
+
+                if (not constraint_data.has_lb()) and \
+                   (not constraint_data.has_ub()):
+                    assert not constraint_data.equality
+                    continue # non-binding, so skip
+
+                if constraint_data._linear_canonical_form:
+                    repn = constraint_data.canonical_form()
+                else:
+                    repn = generate_standard_repn(constraint_data.body)
+
+                if repn.polynomial_degree() is None:
+                    raise ValueError(
+                        "Cannot write legal LP file.  Constraint '%s' "
+                        "has a body with nonlinear terms."
+                        % (constraint_data.name))
+
+                con_symbol = SymbolMap.createSymbol(symbol_map,
+                                                    constraint_data,
+                                                    labeler)
+                self._print_constraint(constraint_data,
+                                       repn,
+                                       con_symbol,
+                                       output,
+                                       object_symbol_dictionary,
+                                       variable_symbol_dictionary,
+                                       None)
+
+                if len(output) > 1024:
+                    output_file.write("".join(output))
+                    output = []
+        output_file.write("".join(output))
+
+        #
+        # SOS constraints
+        #
+        output = []
+        for soscondata in scenario_instance.component_data_objects(
+                SOSConstraint,
+                active=True,
+                sort=sort_order,
+                descend_into=True):
+            if soscondata.level > 2:
+                raise ValueError(
+                    "Solver does not support SOS level %s constraints"
+                    % (soscondata.level))
+            self.printSOS(symbol_map,
+                          labeler,
+                          variable_symbol_map,
+                          soscondata,
+                          output)
+        tmpfiles["sos"].write("".join(output))
+
+        #
+        # Non-anticipativity constraints
+        #
+        output = []
+        for tree_node in linked_scenario.node_list[:-1]:
+            master_tree_node = scenario_tree.get_node(tree_node._name)
+            tree_node_variable_datas = tree_node._variable_datas
+            for variable_id in sorted(tree_node._standard_variable_ids):
+                # Don't blend fixed variables
+                if master_tree_node.is_variable_fixed(variable_id):
+                    continue
+                master_name = self._master_variable_label(tree_node,
+                                                          variable_id)
+                for vardata, _ in tree_node_variable_datas[variable_id]:
+                    self._referenced_variable_ids[id(vardata)] = vardata
+                    output.append(
+                        'c_e_%s_:\n'
+                        % (self._master_constraint_label(tree_node)))
+                    for coef, name in sorted(
+                            ((-1, variable_symbol_dictionary[id(vardata)]),
+                             (1, master_name)),
+                            key=lambda x: x[1]):
+                        output.append(linear_coef_string_template
+                                      % (coef, name))
+                    output.append(eq_string_template % (0))
+                    output.append("\n")
+        tmpfiles["master_constraints"].write("".join(output))
+
+        #
+        # Bounds
+        #
+        output = []
+        integer_vars, binary_vars = self._print_bounds(
+            variable_list,
+            variable_symbol_dictionary,
+            output,
+            scenario_instance.name,
+            output_fixed_variable_bounds=self._output_fixed_variable_bounds)
+        tmpfiles["bounds"].write("".join(output))
+        tmpfiles["general"].write(
+            "".join('  %s\n' % (name) for name in integer_vars))
+        tmpfiles["binary"].write(
+            "".join('  %s\n' % (name) for name in binary_vars))
+
+        # discard everything related to this scenario before
+        # moving on to the next one
+        self._referenced_variable_ids.clear()
+        del variable_list
+        del symbol_map
+        del variable_symbol_map
+        del linked_scenario
+        del scenario_subtree
+        del scenario_instance
+
+def write_ef_streaming(scenario_tree,
+                       scenario_instance_factory,
+                       output_filename,
+                       ef_instance_name="MASTER",
+                       symbolic_solver_labels=False,
+                       output_fixed_variable_bounds=False,
+                       verbose_output=False,
+                       instance_cache=None):
+    """
+    Write the extensive form of a stochastic program to an LP
+    file without constructing the EF instance. Scenario instances
+    are constructed one at a time using the instance factory and
+    discarded once their rows and columns have been written, so
+    the scenario tree must not already be linked to instances.
+    The resulting file is equivalent to the one produced by
+    write_ef for the instance returned by create_ef_instance
+    (without CVaR or chance constraint terms). The instance_cache
+    argument is passed to the instance factory when constructing
+    each scenario instance.
+    """
+    if not output_filename.endswith(".lp"):
+        raise ValueError("The streaming extensive form writer only "
+                         "supports the LP file format. Invalid output "
+                         "filename: %s" % (output_filename))
+    for scenario in scenario_tree.scenarios:
+        if scenario._instance is not None:
+            raise ValueError(
+                "Cannot stream the extensive form of a scenario tree "
+                "that is linked to Pyomo models. Found model for "
+                "scenario with name: %s" % (scenario.name))
+
+    writer = _StreamingEFWriter_cpxlp(
+        ef_instance_name=ef_instance_name,
+        symbolic_solver_labels=symbolic_solver_labels,
+        output_fixed_variable_bounds=output_fixed_variable_bounds,
+        instance_cache=instance_cache)
+    with open(output_filename, "w") as output_file:
+        writer.write(scenario_tree,
+                     scenario_instance_factory,
+                     output_file,
+                     verbose_output=verbose_output)
+
 #
 # solve the EF binding instance and load the solution
 #
@@ -57,7 +57,11 @@ from pyomo.pysp.solutionioextensions import \
     (IPySPSolutionSaverExtension,
      IPySPSolutionLoaderExtension)
 from pyomo.pysp.solutionwriter import ISolutionWriterExtension
-from pyomo.pysp.ef import write_ef, create_ef_instance
+from pyomo.pysp.scenariotree.instance_factory import \
+    ScenarioTreeInstanceFactory
+from pyomo.pysp.ef import (write_ef,
+                           write_ef_streaming,
+                           create_ef_instance)
 
 logger = logging.getLogger('pyomo.pysp')
 
@@ -586,6 +590,25 @@ def runef_register_options(options=None):
             doc=None,
             visibility=0),
         ap_group=_output_options_group_title)
+    safe_register_unique_option(
+        options,
+        "stream_output",
+        PySPConfigValue(
+            False,
+            domain=bool,
+            description=(
+                "Write the extensive form LP file one scenario at a "
+                "time, without constructing the extensive form model. "
+                "At most one scenario instance is held in memory. This "
+                "option only supports the LP file format, and it can "
+                "not be combined with the --solve, CVaR, or chance "
+                "constraint options. Scenario tree manager callbacks "
+                "(e.g., pysp_postinit_callback) are not invoked. "
+                "Default is False."
+            ),
+            doc=None,
+            visibility=0),
+        ap_group=_output_options_group_title)
     safe_register_unique_option(
         options,
         "solve",
@@ -677,6 +700,62 @@ def runef_register_options(options=None):
 
     return options
 
+#
+# Write the extensive form one scenario at a time, without
+# constructing a scenario tree manager.
+#
+
+def runef_streaming(options):
+
+    import pyomo.environ
+
+    start_time = time.time()
+
+    if options.solve:
+        raise ValueError("The stream_output option can not be used "
+                         "when solving the extensive form")
+    if options.generate_weighted_cvar or \
+       (options.cc_indicator_var is not None):
+        raise ValueError("The stream_output option does not support "
+                         "CVaR or chance constraint terms")
+
+    filename = options.output_file
+    suf = os.path.splitext(filename)[1]
+    if suf == "":
+        filename += ".lp"
+    elif suf != ".lp":
+        raise ValueError("The stream_output option only supports the "
+                         "LP file format. Invalid output file "
+                         "name: %s" % (filename))
+
+    with ScenarioTreeInstanceFactory(options.model_location,
+                                     options.scenario_tree_location) \
+         as factory:
+
+        scenario_tree = factory.generate_scenario_tree(
+            downsample_fraction=options.scenario_tree_downsample_fraction,
+            random_seed=options.scenario_tree_random_seed,
+            verbose=options.verbose)
+        scenario_tree.validate()
+
+        if options.verbose:
+            print("Starting to stream extensive form")
+        write_ef_streaming(
+            scenario_tree,
+            factory,
+            filename,
+            symbolic_solver_labels=options.symbolic_solver_labels,
+            verbose_output=options.verbose,
+            instance_cache=options.scenario_instance_cache)
+
+    print("Extensive form written to file="+filename)
+    print("")
+    print("Total EF execution time=%.2f seconds"
+          % (time.time() - start_time))
+    print("")
+
+    return 0
+
 #
 # Construct a scenario tree manager and an
 # ExtensiveFormAlgorithm to solve it.
@@ -689,6 +768,9 @@ def runef(options,
 
     import pyomo.environ
 
+    if options.stream_output:
+        return runef_streaming(options)
+
     start_time = time.time()
 
     solution_loaders = sort_extensions_by_precedence(solution_loaders)
@@ -16,7 +16,12 @@ import time
 import inspect
 import uuid
 from operator import itemgetter
+from itertools import compress
 from math import fabs, sqrt
+try:
+    from collections import OrderedDict
+except ImportError:                         #pragma:nocover
+    from ordereddict import OrderedDict
 
 try:
     from guppy import hpy
@@ -24,6 +29,12 @@ try:
 except ImportError:
     guppy_available = False
 
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
 import pyutilib.common
 
 from pyomo.core import *
@@ -101,6 +112,12 @@ class ProblemStates(object):
         self.ph_constraints = dict((inst_name,[]) for inst_name in instances)
         self.ph_variables = dict((inst_name,[]) for inst_name in instances)
 
+        # maps between instance name and a list of the ph constraint
+        # datas currently loaded in the persistent solver that the
+        # instance is solved with (if any)
+        self.solver_ph_constraints = \
+            dict((inst_name,[]) for inst_name in instances)
+
         # TODO: Reconcile this new method with the persistent solver plugin
         """
         # keeps track of instances with recently fixed or freed variables
@@ -898,6 +915,28 @@ class _PHBase(object):
            if self._problem_states.has_ph_variables(scenario_name):
                reset_linearization_variables(scenario_instance)
 
+    #
+    # record the ph constraints currently on the scenario instances as
+    # the ones loaded in the persistent solver that the instances are
+    # solved with, after the instance of that solver is (re)set. when
+    # the ph constraints are rebuilt, preprocess_scenario_instance
+    # removes the recorded constraints from the solver.
+    #
+
+    def _record_solver_ph_constraints(self, scenario_names):
+
+        for scenario_name in scenario_names:
+            instance = self._instances[scenario_name]
+            solver_ph_constraints = \
+                self._problem_states.solver_ph_constraints[scenario_name]
+            del solver_ph_constraints[:]
+            for constraint_name in \
+                    self._problem_states.ph_constraints[scenario_name]:
+                for constraint_data in \
+                        itervalues(instance.find_component(constraint_name)):
+                    if constraint_data.active:
+                        solver_ph_constraints.append(constraint_data)
+
     def form_ph_linearized_objective_constraints(self):
 
         start_time = time.time()
@@ -934,6 +973,9 @@ class _PHBase(object):
 
     def _preprocess_scenario_instances(self, ignore_bundles=False, subproblems=None):
 
+        from pyomo.solvers.plugins.solvers.persistent_solver import \
+            PersistentSolver
+
         start_time = time.time()
 
         if (not self._scenario_tree.contains_bundles()) or ignore_bundles:
@@ -952,7 +994,9 @@ class _PHBase(object):
                     self._problem_states.ph_constraints[scenario_name],
                     self._problem_states.objective_updated[scenario_name],
                     not self._write_fixed_variables,
-                    self._solver_map[scenario_name])
+                    self._solver_map[scenario_name],
+                    solver_ph_constraints=\
+                        self._problem_states.solver_ph_constraints[scenario_name])
 
                 # We've preprocessed the instance, reset the relevant flags
                 self._problem_states.clear_update_flags(scenario_name)
@@ -1003,7 +1047,9 @@ class _PHBase(object):
                         self._problem_states.ph_constraints[scenario_name],
                         objective_updated,
                         not self._write_fixed_variables,
-                        bundle_solver)
+                        bundle_solver,
+                        solver_ph_constraints=self._problem_states.\
+                            solver_ph_constraints[scenario_name])
 
                     # We've preprocessed the instance, reset the relevant flags
                     self._problem_states.clear_update_flags(scenario_name)
@@ -1011,11 +1057,14 @@ class _PHBase(object):
                     self._problem_states.clear_freed_variables(scenario_name)
 
                 # TBD - much of this can be done in preprocess_bundle_instance
+                # (persistent solvers do not use these representations)
                 var_id_map = {}
-                if preprocess_bundle_objective:
+                if preprocess_bundle_objective and \
+                   (not isinstance(bundle_solver, PersistentSolver)):
                     preprocess_block_objectives(bundle_ef_instance,
                                                 idMap=var_id_map)
-                if preprocess_bundle_constraints:
+                if preprocess_bundle_constraints and \
+                   (not isinstance(bundle_solver, PersistentSolver)):
                     preprocess_block_constraints(bundle_ef_instance,
                                                  idMap=var_id_map)
 
@@ -2058,11 +2107,20 @@ class ProgressiveHedging(_PHBase):
         # solver servers may need it.
         self._scenario_bundle_specification = options.scenario_bundle_specification
         self._create_random_bundles = options.create_random_bundles
+        self._create_automatic_bundles = options.create_automatic_bundles
+        self._automatic_bundle_update_interval = \
+            options.automatic_bundle_update_interval
+        self._automatic_bundle_criterion = options.automatic_bundle_criterion
         self._scenario_tree_random_seed = options.scenario_tree_random_seed
 
         # validate all "atomic" options (those that can be validated independently)
         if self._max_iterations < 0:
             raise ValueError("Maximum number of PH iterations must be non-negative; value specified=" + str(self._max_iterations))
+        if self._automatic_bundle_update_interval < 0:
+            raise ValueError("The automatic bundle update interval must be non-negative; value specified=" + str(self._automatic_bundle_update_interval))
+        if (self._automatic_bundle_update_interval > 0) and \
+           (self._create_automatic_bundles is None):
+            raise ValueError("An automatic bundle update interval can only be specified when automatic bundles are created")
         if self._nu <= 0.0 or self._nu >= 2:
             raise ValueError("Value of the nu parameter in PH must be on the interval (0, 2); value specified=" + str(self._nu))
         if (self._mipgap is not None) and ((self._mipgap < 0.0) or (self._mipgap > 1.0)):
@@ -2299,6 +2357,20 @@ class ProgressiveHedging(_PHBase):
 
         initialization_action_handles = []
 
+        if isPHPyro and (self._create_automatic_bundles is not None):
+            # the ph solver servers can not re-create automatic
+            # bundles, so they are transmitted explicitly.
+            self._scenario_bundle_specification = OrderedDict(
+                (scenario_bundle._name,
+                 list(scenario_bundle._scenario_names))
+                for scenario_bundle in scenario_tree._scenario_bundles)
+            if self._automatic_bundle_update_interval > 0:
+                print("***WARNING***: Automatic bundles can not be "
+                      "updated when using the PHPyro solver manager. "
+                      "The automatic bundle update interval will be "
+                      "ignored.")
+                self._automatic_bundle_update_interval = 0
+
         if isPHPyro:
 
             if self._verbose:
@@ -2410,6 +2482,8 @@ class ProgressiveHedging(_PHBase):
                             self._bundle_binding_instance_map[scenario_bundle.name],
                             symbolic_solver_labels=self._symbolic_solver_labels,
                             output_fixed_variable_bounds=self._write_fixed_variables)
+                        self._record_solver_ph_constraints(
+                            scenario_bundle.scenario_names)
                 else:
                     for scenario in self._scenario_tree.scenarios:
                         if self._verbose:
@@ -2418,6 +2492,7 @@ class ProgressiveHedging(_PHBase):
                             scenario._instance,
                             symbolic_solver_labels=self._symbolic_solver_labels,
                             output_fixed_variable_bounds=self._write_fixed_variables)
+                        self._record_solver_ph_constraints([scenario.name])
 
 
 
@@ -3416,36 +3491,33 @@ class ProgressiveHedging(_PHBase):
 
                 xbars = tree_node._xbars
 
-                scenario_solutions = \
-                    [(scenario._probability, scenario._x[tree_node._name]) \
-                     for scenario in tree_node._scenarios]
-
-                for variable_id in tree_node._standard_variable_ids:
-
-                    stale = False
-                    values = []
-                    avg_value = 0.0
-                    for probability, var_values in scenario_solutions:
-                        val = var_values[variable_id]
-                        if val is not None:
-                            avg_value += probability * val
-                            values.append(val)
-                        else:
-                            stale = True
-
-                    if not stale:
-
-                        avg_value /= tree_node._probability
-                        tree_node._minimums[variable_id] = min(values)
-                        tree_node._maximums[variable_id] = max(values)
-
-                        if self._ph_xbar_updates_enabled:
-                            if (overrelax) and (current_iteration >= 1):
-                                xbars[variable_id] = self._nu*avg_value + (1-self._nu)*tree_node._averages[variable_id]
-                            else:
-                                xbars[variable_id] = avg_value
+                variable_ids, averages, minimums, maximums, fresh = \
+                    tree_node._compute_standard_variable_statistics()
+
+                # statistics are not updated for variables without a
+                # value in every scenario
+                if not all(fresh):
+                    variable_ids = list(compress(variable_ids, fresh))
+                    averages = list(compress(averages, fresh))
+                    minimums = list(compress(minimums, fresh))
+                    maximums = list(compress(maximums, fresh))
+
+                tree_node._minimums.update(zip(variable_ids, minimums))
+                tree_node._maximums.update(zip(variable_ids, maximums))
+
+                if self._ph_xbar_updates_enabled:
+                    if (overrelax) and (current_iteration >= 1):
+                        nu = self._nu
+                        previous_averages = tree_node._averages
+                        xbars.update(
+                            (variable_id,
+                             nu*avg_value + (1-nu)*previous_averages[variable_id])
+                            for variable_id, avg_value
+                            in zip(variable_ids, averages))
+                    else:
+                        xbars.update(zip(variable_ids, averages))
 
-                        tree_node._averages[variable_id] = avg_value
+                tree_node._averages.update(zip(variable_ids, averages))
 
         end_time = time.time()
         self._cumulative_xbar_time += (end_time - start_time)
@@ -3494,6 +3566,22 @@ class ProgressiveHedging(_PHBase):
                 tree_node_wbars = tree_node._wbars = \
                     dict((var_id,0) for var_id in tree_node._variable_ids)
 
+                if numpy_available and tree_node._standard_variable_ids:
+                    weight_array, updated = \
+                        self._update_node_weights_array(tree_node,
+                                                        slice(None))
+                    wbar_array = numpy.zeros(weight_array.shape[1])
+                    for scenario, scenario_weights, scenario_updated in \
+                            zip(tree_node._scenarios, weight_array, updated):
+                        wbar_array += numpy.where(
+                            scenario_updated,
+                            scenario._probability * \
+                            scenario_weights / tree_node._probability,
+                            0.0)
+                    tree_node_wbars.update(zip(tree_node._array_variable_ids,
+                                               wbar_array.tolist()))
+                    continue
+
                 for scenario in tree_node._scenarios:
 
                     instance = scenario._instance
@@ -3561,6 +3649,81 @@ class ProgressiveHedging(_PHBase):
         if self._output_times:
             print("Weight update time=%.2f seconds" % (end_time - start_time))
 
+    #
+    # the array version of the weight update loops in update_weights
+    # and update_weights_for_scenario: updates the weights at the
+    # tree node of the scenarios in the given rows (a slice) of the
+    # node solution array, which holds the solutions loaded by the
+    # last call to update_variable_statistics. variables without a
+    # value in a scenario are not updated. returns the weights and
+    # the mask of updated variables as (rows x variables) arrays.
+    # requires numpy.
+    #
+
+    def _update_node_weights_array(self, tree_node, rows):
+
+        tree_node_name = tree_node._name
+        x_array = tree_node._solution_array()[rows]
+        scenarios = tree_node._scenarios[rows]
+        variable_ids = tree_node._array_variable_ids
+        num_variables = len(variable_ids)
+
+        if self._dual_mode is True:
+            tree_node_xbars = tree_node._xbars
+        else:
+            tree_node_xbars = tree_node._averages
+        xbar_array = numpy.array(
+            list(map(tree_node_xbars.__getitem__, variable_ids)),
+            dtype=float)
+        blend_array = numpy.fromiter(
+            map(tree_node._blend.__getitem__, variable_ids),
+            float, num_variables)
+        weight_array = numpy.empty(x_array.shape)
+        rho_array = numpy.empty(x_array.shape)
+        for scenario, scenario_weights, scenario_rhos in \
+                zip(scenarios, weight_array, rho_array):
+            scenario_weights[:] = numpy.fromiter(
+                map(scenario._w[tree_node_name].__getitem__, variable_ids),
+                float, num_variables)
+            scenario_rhos[:] = numpy.fromiter(
+                map(scenario._rho[tree_node_name].__getitem__, variable_ids),
+                float, num_variables)
+        updated = ~numpy.isnan(x_array)
+
+        # the loops fail on a variable with a value but no xbar
+        # (None), rather than updating its weight to NaN
+        unset = numpy.isnan(xbar_array) & updated.any(axis=0)
+        if unset.any():
+            variable_name, index = tree_node._variable_ids[
+                variable_ids[int(numpy.argmax(unset))]]
+            raise TypeError("No xbar value is available for variable="
+                            +variable_name+indexToString(index)+" at "
+                            "tree node="+tree_node_name)
+
+        nu_value = 1.0
+        if self._overrelax:
+            nu_value = self._nu
+
+        step = blend_array * rho_array * nu_value * (x_array - xbar_array)
+        if not self._dual_mode:
+            if self._objective_sense == minimize:
+                numpy.add(weight_array, step,
+                          out=weight_array, where=updated)
+            else:
+                numpy.subtract(weight_array, step,
+                               out=weight_array, where=updated)
+        else:
+            # see the asserts in update_weights
+            assert (blend_array[updated.any(axis=0)] == 1.0).all()
+            assert nu_value == 1.0
+            assert self._objective_sense == minimize
+            numpy.copyto(weight_array, step, where=updated)
+
+        for scenario, scenario_weights in zip(scenarios, weight_array):
+            scenario._w[tree_node_name].update(
+                zip(variable_ids, scenario_weights.tolist()))
+        return weight_array, updated
+
     def update_weights_for_scenario(self, scenario):
 
         start_time = time.time()
@@ -3572,6 +3735,12 @@ class ProgressiveHedging(_PHBase):
 
         for tree_node in scenario._node_list[:-1]:
 
+            if numpy_available and tree_node._standard_variable_ids:
+                row = tree_node._scenarios.index(scenario)
+                self._update_node_weights_array(tree_node,
+                                                slice(row, row+1))
+                continue
+
             weight_values = scenario._w[tree_node._name]
             rho_values = scenario._rho[tree_node._name]
             var_values = scenario._x[tree_node._name]
@@ -4237,6 +4406,13 @@ class ProgressiveHedging(_PHBase):
                 if self._linearize_nonbinary_penalty_terms > 0:
                     self.form_ph_linearized_objective_constraints()
 
+                # re-form automatic bundles based on the most
+                # recent scenario sub-problem solves, if requested.
+                if (self._automatic_bundle_update_interval > 0) and \
+                   ((self._current_iteration - 1) % \
+                    self._automatic_bundle_update_interval == 0):
+                    self._update_automatic_bundles()
+
                 try:
                     self.iteration_k_solves()
                 except SystemExit:
@@ -4595,6 +4771,84 @@ class ProgressiveHedging(_PHBase):
 
         self._bundle_binding_instance_map = {}
         self._bundle_scenario_instance_map = {}
+
+    #
+    # re-partitions the scenarios into the same number of automatic
+    # bundles, grouping scenarios with similar first-stage solutions
+    # or balancing the most recent bundle solve times, and re-forms
+    # the bundle binding instances. bundle names are unchanged, so
+    # the existing (serial) solver plugins are reused.
+    #
+
+    def _update_automatic_bundles(self):
+
+        from pyomo.solvers.plugins.solvers.persistent_solver import \
+            PersistentSolver
+
+        start_time = time.time()
+
+        scenario_tree = self._scenario_tree
+        scenario_weights = None
+        scenario_coordinates = None
+        if self._automatic_bundle_criterion == "solve-time":
+            # estimate the solve time of each scenario as its share
+            # of the most recent solve time of its bundle
+            scenario_weights = {}
+            for scenario_bundle in scenario_tree._scenario_bundles:
+                solve_time = self._solve_times.get(scenario_bundle._name)
+                if (solve_time is None) or \
+                   isinstance(solve_time, UndefinedData):
+                    solve_time = \
+                        self._pyomo_solve_times.get(scenario_bundle._name)
+                if (solve_time is None) or \
+                   isinstance(solve_time, UndefinedData):
+                    solve_time = 1.0
+                for scenario_name in scenario_bundle._scenario_names:
+                    scenario_weights[scenario_name] = \
+                        float(solve_time) / \
+                        len(scenario_bundle._scenario_names)
+        else:
+            assert self._automatic_bundle_criterion == "first-stage"
+            root_node = scenario_tree.findRootNode()
+            variable_ids = sorted(root_node._standard_variable_ids)
+            scenario_coordinates = {}
+            for scenario in scenario_tree._scenarios:
+                scenario_x = scenario._x[root_node._name]
+                coordinates = []
+                for variable_id in variable_ids:
+                    variable_value = scenario_x.get(variable_id)
+                    if variable_value is None:
+                        variable_value = root_node._xbars.get(variable_id, 0.0)
+                    coordinates.append(variable_value)
+                scenario_coordinates[scenario._name] = coordinates
+
+        self._destory_bundle_binding_instances()
+        scenario_tree.create_automatic_bundles(
+            len(scenario_tree._scenario_bundles),
+            scenario_weights=scenario_weights,
+            scenario_coordinates=scenario_coordinates)
+        self._form_bundle_binding_instances()
+
+        for scenario_bundle in scenario_tree._scenario_bundles:
+            bundle_solver = self._solver_map[scenario_bundle._name]
+            if isinstance(bundle_solver, PersistentSolver):
+                bundle_solver.set_instance(
+                    self._bundle_binding_instance_map[scenario_bundle._name],
+                    symbolic_solver_labels=self._symbolic_solver_labels,
+                    output_fixed_variable_bounds=self._write_fixed_variables)
+                self._record_solver_ph_constraints(
+                    scenario_bundle._scenario_names)
+
+        if self._verbose:
+            for scenario_bundle in scenario_tree._scenario_bundles:
+                print("Automatic bundle=%s contains scenarios: %s"
+                      % (scenario_bundle._name,
+                         ", ".join(scenario_bundle._scenario_names)))
+
+        if self._output_times:
+            print("Automatic bundle update time=%.2f seconds"
+                  % (time.time() - start_time))
+
     #
     # prints a summary of all collected time statistics
     #
@@ -148,6 +148,24 @@ def construct_ph_options_parser(usage_string):
       dest="create_random_bundles",
       type=int,
       default=None)
+    scenarioTreeOpts.add_argument('--create-automatic-bundles',
+      help="Specification to create the indicated number of scenario bundles, balanced in size, that group scenarios sharing scenario tree nodes. A value of 0 selects the number of bundles automatically, based on the number of scenarios and (when the PHPyro solver manager is selected) the number of required phsolverserver workers. Default is None, indicating disabled.",
+      action="store",
+      dest="create_automatic_bundles",
+      type=int,
+      default=None)
+    scenarioTreeOpts.add_argument('--automatic-bundle-update-interval',
+      help="When automatic bundles are created, re-form the bundles every indicated number of PH iterations, using the results of the most recent scenario sub-problem solves. This is not supported with the PHPyro solver manager. Default is 0, indicating the bundles are never updated.",
+      action="store",
+      dest="automatic_bundle_update_interval",
+      type=int,
+      default=0)
+    scenarioTreeOpts.add_argument('--automatic-bundle-criterion',
+      help="The criterion used to re-form automatic bundles. Choices are 'first-stage', which groups scenarios with similar first-stage solutions, and 'solve-time', which balances the estimated solve times of the bundles. Default is 'first-stage'.",
+      action="store",
+      dest="automatic_bundle_criterion",
+      choices=["first-stage", "solve-time"],
+      default="first-stage")
 
     phOpts.add_argument('-r','--default-rho',
       help="The default (global) rho for all blended variables. *** Required ***",
@@ -624,12 +642,21 @@ def GenerateScenarioTreeForPH(options,
                               scenario_instance_factory,
                               include_scenarios=None):
 
+    # automatic bundles are balanced against the number of
+    # phsolverserver workers, when known.
+    num_workers = 1
+    if (options.solver_manager_type == "phpyro") and \
+       (options.phpyro_required_workers is not None):
+        num_workers = options.phpyro_required_workers
+
     scenario_tree = scenario_instance_factory.generate_scenario_tree(
         include_scenarios=include_scenarios,
         downsample_fraction=options.scenario_tree_downsample_fraction,
         bundles=options.scenario_bundle_specification,
         random_bundles=options.create_random_bundles,
         random_seed=options.scenario_tree_random_seed,
+        automatic_bundles=options.create_automatic_bundles,
+        num_workers=num_workers,
         verbose=options.verbose)
 
     #
@@ -253,7 +253,7 @@ class _PHSolverServer(_PHBase):
             print("Scenario or bundle name: "+object_name)
             if scenario_bundle_specification != None:
                 print("Scenario tree bundle specification: "
-                      +scenario_bundle_specification)
+                      +str(scenario_bundle_specification))
             if create_random_bundles != None:
                 print("Create random bundles: "+str(create_random_bundles))
             if scenario_tree_random_seed != None:
@@ -721,7 +721,8 @@ def preprocess_scenario_instance(scenario_instance,
                                  instance_ph_constraints,
                                  instance_objective_modified,
                                  preprocess_fixed_variables,
-                                 solver):
+                                 solver,
+                                 solver_ph_constraints=None):
 
     # TODO: Does this import need to be delayed because
     #       it is in a plugins subdirectory
@@ -742,13 +743,15 @@ def preprocess_scenario_instance(scenario_instance,
         # the objective function yet.
         return
 
-    if instance_objective_modified:
-        # if only the objective changed, there is minimal work to do.
-        _preprocess(scenario_instance,
-                    objective=True,
-                    constraints=False)
-
-        if persistent_solver_in_use:
+    if persistent_solver_in_use:
+        # persistent solver plugins compile their own representation
+        # of the instance when it is set, so there is no need to
+        # regenerate the canonical representations of the objective
+        # or the constraints (or to write a new problem file). Only
+        # the objective (whose weight and proximal term coefficients
+        # change between PH iterations) and the bounds of fixed or
+        # freed variables need to be updated in the solver.
+        if instance_objective_modified and solver.has_instance():
             active_objective_datas = []
             for active_objective_data in scenario_instance.component_data_objects(Objective,
                                                                                   active=True,
@@ -759,6 +762,39 @@ def preprocess_scenario_instance(scenario_instance,
             elif len(active_objective_datas) == 1:
                 solver.set_objective(active_objective_datas[0])
 
+        if (instance_variables_fixed or instance_variables_freed) and \
+           solver.has_instance():
+            variables_to_change = \
+                instance_variables_fixed + instance_variables_freed
+            for var_name, var_index in variables_to_change:
+                solver.update_var(scenario_instance.find_component(var_name)[var_index])
+
+        if instance_ph_constraints_modified and solver.has_instance():
+            # the linearization constraints are rebuilt in place, so
+            # the constraints from the previous iteration are no
+            # longer on the instance. the caller keeps track of the
+            # ph constraints loaded in the solver (if any) in the
+            # solver_ph_constraints list, which is updated here.
+            if solver_ph_constraints is None:
+                solver_ph_constraints = []
+            for constraint_data in solver_ph_constraints:
+                solver.remove_constraint(constraint_data)
+            del solver_ph_constraints[:]
+            for constraint_name in instance_ph_constraints:
+                constraint = scenario_instance.find_component(constraint_name)
+                for constraint_data in itervalues(constraint):
+                    if constraint_data.active:
+                        solver.add_constraint(constraint_data)
+                        solver_ph_constraints.append(constraint_data)
+
+        return
+
+    if instance_objective_modified:
+        # if only the objective changed, there is minimal work to do.
+        _preprocess(scenario_instance,
+                    objective=True,
+                    constraints=False)
+
     if (instance_variables_fixed or instance_variables_freed) and \
        (preprocess_fixed_variables):
 
@@ -768,18 +804,6 @@ def preprocess_scenario_instance(scenario_instance,
         # anything else
         return
 
-    if (instance_variables_fixed or instance_variables_freed) and \
-       (persistent_solver_in_use):
-        # it can be the case that the solver plugin no longer has an
-        # instance compiled, depending on what state the solver plugin
-        # is in relative to the instance.  if this is the case, just
-        # don't compile the variable bounds.
-        if solver.has_instance():
-            variables_to_change = \
-                instance_variables_fixed + instance_variables_freed
-            for var_name, var_index in variables_to_change:
-                solver.update_var(scenario_instance.find_component(var_name)[var_index])
-
     if instance_user_constraints_modified:
 
         _preprocess(scenario_instance,
@@ -0,0 +1,285 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+__all__ = ("ScenarioTreeActionManagerMultiprocessing",)
+
+import logging
+import multiprocessing
+try:
+    from collections import OrderedDict
+except ImportError:                         #pragma:nocover
+    from ordereddict import OrderedDict
+try:
+    import cPickle as pickle
+except:                                           #pragma:nocover
+    import pickle
+
+from pyutilib.pyro import TaskProcessingError
+from pyomo.opt.parallel.manager import (AsynchronousActionManager,
+                                        ActionStatus)
+from pyomo.pysp.scenariotree.server_multiprocessing import _run_server
+
+from six.moves import queue
+
+logger = logging.getLogger('pyomo.pysp')
+
+# Seconds between checks for server processes that died
+_poll_interval = 1.0
+
+#
+# An asynchronous action manager for scenario tree servers that run
+# in local processes. It implements the interface of the
+# ScenarioTreeActionManagerPyro used by the scenario tree manager
+# clients, without requiring a Pyro nameserver or dispatcher.
+#
+
+class ScenarioTreeActionManagerMultiprocessing(AsynchronousActionManager):
+
+    def __init__(self, verbose=0):
+        self._verbose = verbose
+        self._paused = False
+        self._paused_task_dict = {}
+        self._context = None
+        self._processes = {}
+        self._task_queues = {}
+        self._result_queue = None
+        super(ScenarioTreeActionManagerMultiprocessing, self).__init__()
+        # the ScenarioTreeServerMultiprocessing processes associated
+        # with this manager
+        self.server_pool = []
+        # tells the action manager to ignore task errors
+        # (it will still report them, just take no action)
+        self.ignore_task_errors = False
+        self.results = OrderedDict()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def clear(self):
+        """
+        Clear manager state
+        """
+        super(ScenarioTreeActionManagerMultiprocessing, self).clear()
+        self.results = OrderedDict()
+
+    def close(self):
+        """Close the manager."""
+        if len(self.results):
+            print("WARNING: %s is closing with %s local "
+                  "results waiting to be processed."
+                  % (type(self).__name__, len(self.results)))
+        if len(self._paused_task_dict):
+            print("WARNING: %s is closing with %s paused "
+                  "tasks waiting to be queued."
+                  % (type(self).__name__, len(self._paused_task_dict)))
+        self.results = OrderedDict()
+        self._paused = False
+        self._paused_task_dict = {}
+        if len(self.server_pool):
+            self.release_servers()
+
+    def acquire_servers(self, servers_requested, timeout=None):
+        """Launch the requested number of scenario tree server
+        processes. The timeout argument is accepted for
+        compatibility with the Pyro action manager and ignored."""
+
+        if self._verbose:
+            print("Launching %s scenario tree server processes"
+                  % (servers_requested))
+
+        assert len(self.server_pool) == 0
+        # Servers are forked where possible so that they inherit
+        # the modules (e.g., registered worker types) imported by
+        # this process.
+        if not hasattr(multiprocessing, 'get_context'):
+            self._context = multiprocessing
+        elif 'fork' in multiprocessing.get_all_start_methods():
+            self._context = multiprocessing.get_context('fork')
+        else:
+            self._context = multiprocessing.get_context()
+        self._result_queue = self._context.Queue()
+        for i in range(servers_requested):
+            server_name = "ScenarioTreeServerMultiprocessing_%d" % (i)
+            task_queue = self._context.Queue()
+            process = self._context.Process(
+                target=_run_server,
+                name=server_name,
+                args=(server_name,
+                      task_queue,
+                      self._result_queue,
+                      self._verbose))
+            process.daemon = True
+            process.start()
+            self._task_queues[server_name] = task_queue
+            self._processes[server_name] = process
+            self.server_pool.append(server_name)
+
+    def release_servers(self):
+
+        if self._verbose:
+            print("Releasing scenario tree server processes")
+
+        for server_name in self.server_pool:
+            process = self._processes[server_name]
+            if process.is_alive():
+                try:
+                    self._task_queues[server_name].put(None)
+                except (IOError, OSError):
+                    pass
+        for server_name in self.server_pool:
+            process = self._processes[server_name]
+            process.join(_poll_interval)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+            # do not block on tasks that were never read
+            self._task_queues[server_name].cancel_join_thread()
+            self._task_queues[server_name].close()
+        if self._result_queue is not None:
+            self._result_queue.close()
+
+        self.server_pool = []
+        self._processes = {}
+        self._task_queues = {}
+        self._result_queue = None
+
+    def pause(self):
+        self._paused = True
+
+    def unpause(self):
+        self._paused = False
+        for server_name in self._paused_task_dict:
+            self._task_queues[server_name].put(
+                self._paused_task_dict[server_name])
+        self._paused_task_dict = {}
+
+    def get_results(self, ah):
+        return self.results.pop(ah.id, None)
+
+    def wait_all(self, *args):
+        """
+        Wait for all actions to complete.  The arguments to this method
+        are expected to be ActionHandle objects or iterators that return
+        ActionHandle objects.  If no arguments are provided, then this
+        method will terminate after all queued actions are complete.
+        """
+        # Collect event handlers from the arguments
+        ahs = self._flatten(*args)
+        if len(ahs):
+            while len(ahs) > 0:
+                ahs.difference_update([ah for ah in ahs if ah.id in self.results])
+                if len(ahs):
+                    self._download_results()
+        else:
+            while self.queued_action_counter > 0:
+                self._download_results()
+
+    def wait_any(self, *args):
+        # Collect event handlers from the arguments
+        ahs = self._flatten(*args)
+        if len(ahs):
+            while (1):
+                for ah in ahs:
+                    if ah.id in self.results:
+                        return ah
+                self._download_results()
+        else:
+            while len(self.results) == 0:
+                self._download_results()
+            return self.event_handle[next(iter(self.results))]
+
+    def wait_for(self, ah):
+        """
+        Wait for the specified action to complete.
+        """
+        while ah.id not in self.results:
+            self._download_results()
+        return self.get_results(ah)
+
+    #
+    # Perform the queue operation. This method returns the
+    # ActionHandle, and the ActionHandle status indicates whether
+    # the queue was successful.
+    #
+    def _perform_queue(self,
+                       ah,
+                       *args,
+                       **kwds):
+
+        queue_name = kwds.pop('queue_name', None)
+        generate_response = kwds.pop('generate_response', True)
+
+        # The task data is pickled here (rather than by the queue
+        # feeder thread) so that it is not affected by changes made
+        # to the arguments after the action is queued.
+        task = (ah.id,
+                pickle.dumps(kwds, pickle.HIGHEST_PROTOCOL),
+                generate_response)
+
+        if self._paused:
+            self._paused_task_dict.setdefault(queue_name, []).append(task)
+        else:
+            self._task_queues[queue_name].put([task])
+
+        # only populate the action_handle-to-task dictionary is a
+        # response is expected.
+        if not generate_response:
+            ah.status = ActionStatus.done
+            self.event_handle[ah.id].update(ah)
+            self.queued_action_counter -= 1
+
+        return ah
+
+    def _download_results(self):
+
+        try:
+            task_id, result = self._result_queue.get(timeout=_poll_interval)
+        except queue.Empty:
+            for server_name in self.server_pool:
+                process = self._processes[server_name]
+                if not process.is_alive():
+                    raise RuntimeError(
+                        "Scenario tree server process %s exited with "
+                        "code %s while tasks were pending"
+                        % (server_name, process.exitcode))
+            return
+
+        self.queued_action_counter -= 1
+        result = pickle.loads(result)
+        ah = self.event_handle.get(task_id, None)
+        if ah is None:
+            # if we are here, this is really bad news!
+            raise RuntimeError(
+                "The %s found results for task with id=%s"
+                " - but no corresponding action handle "
+                "could be located! Showing task result "
+                "below:\n%s" % (type(self).__name__,
+                                task_id,
+                                result))
+        if type(result) is TaskProcessingError:
+            ah.status = ActionStatus.error
+            self.event_handle[ah.id].update(ah)
+            msg = ("ScenarioTreeServer reported a processing "
+                   "error for task with id=%s. Reason: \n%s"
+                   % (task_id, result.args[0]))
+            if not self.ignore_task_errors:
+                raise RuntimeError(msg)
+            elif self.ignore_task_errors == 1:
+                logger.warning(msg)
+            # any value other than 0 or 1 will
+            # silently ignore task errors
+            self.results[ah.id] = None
+        else:
+            ah.status = ActionStatus.done
+            self.event_handle[ah.id].update(ah)
+            self.results[ah.id] = result
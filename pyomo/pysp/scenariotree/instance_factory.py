@@ -24,8 +24,10 @@ from pyutilib.misc import (ArchiveReaderFactory,
 
 from pyomo.dataportal import DataPortal
 from pyomo.core import (Block,
+                        Param,
                         IPyomoScriptModifyInstance,
-                        AbstractModel)
+                        AbstractModel,
+                        InstanceCache)
 from pyomo.core.base.block import _BlockData
 from pyomo.common.plugin import ExtensionPoint
 from pyomo.pysp.phutils import _OLD_OUTPUT
@@ -54,6 +56,38 @@ except:                #pragma:nocover
 
 logger = logging.getLogger('pyomo.pysp')
 
+def _mutable_param_updates(base_instance, base_data, data):
+    """Compare the data used to construct a base instance with
+    the data for another instance of the same abstract model.
+
+    Returns a list of (name, values) pairs for the mutable
+    parameters whose values differ, or None if the data differs
+    in any other way (e.g., set data, immutable parameters, or
+    the indices that are assigned values).
+    """
+    if (base_data._default != data._default) or \
+       (set(base_data._data) != set(data._data)):
+        return None
+    updates = []
+    for namespace, items in six.iteritems(data._data):
+        base_items = base_data._data[namespace]
+        if set(base_items) != set(items):
+            return None
+        for name, values in six.iteritems(items):
+            base_values = base_items[name]
+            if values == base_values:
+                continue
+            component = base_instance.component(name)
+            if (component is None) or \
+               (component.type() is not Param) or \
+               (not component._mutable) or \
+               (type(values) is not dict) or \
+               (type(base_values) is not dict) or \
+               (set(values) != set(base_values)):
+                return None
+            updates.append((name, values))
+    return updates
+
 def _extract_pathspec(
         pathspec,
         default_basename,
@@ -323,6 +357,9 @@ class ScenarioTreeInstanceFactory(object):
         self._scenario_tree_model = None
         self._scenario_tree = None
         self._data_directory = None
+        # (cache, data, instance) for the base instance used when
+        # scenario instances are created with an instance cache
+        self._instance_cache_base = None
         try:
             self._init(model, scenario_tree, data)
         except:
@@ -556,6 +593,64 @@ class ScenarioTreeInstanceFactory(object):
     def data_directory(self):
         return self._data_directory
 
+    def _create_instance_from_base(self,
+                                   data,
+                                   instance_cache,
+                                   profile_memory=False,
+                                   output_instance_construction_time=False):
+        """Create an instance of the abstract reference model by
+        cloning a base instance and updating the mutable parameters
+        whose data differs.
+
+        The base instance is constructed from the data for the
+        first scenario passed to this method (or restored from the
+        instance cache) and is kept for the remaining
+        scenarios. When the data differs in a way that can not be
+        applied to a clone of the base instance, the instance is
+        constructed in full.
+        """
+        if isinstance(instance_cache, six.string_types):
+            instance_cache = InstanceCache(instance_cache)
+        if not isinstance(data, DataPortal):
+            if isinstance(data, six.string_types):
+                data = DataPortal(filename=data,
+                                  model=self._model_object)
+            else:
+                data = DataPortal(data_dict=data,
+                                  model=self._model_object)
+
+        if (self._instance_cache_base is None) or \
+           (self._instance_cache_base[0].directory != \
+            instance_cache.directory):
+            cache_key = instance_cache.fingerprint(self._model_object, data)
+            base_instance = instance_cache.get(cache_key)
+            if base_instance is None:
+                base_instance = self._model_object.create_instance(
+                    data,
+                    profile_memory=profile_memory,
+                    report_timing=output_instance_construction_time)
+                instance_cache.put(cache_key, base_instance)
+            self._instance_cache_base = \
+                (instance_cache, data, base_instance)
+            return base_instance.clone()
+
+        _, base_data, base_instance = self._instance_cache_base
+        updates = _mutable_param_updates(base_instance, base_data, data)
+        if updates is None:
+            logger.debug("Scenario data differs from the instance cache "
+                         "base in more than mutable parameter values. "
+                         "The scenario instance will be constructed "
+                         "in full.")
+            return self._model_object.create_instance(
+                data,
+                profile_memory=profile_memory,
+                report_timing=output_instance_construction_time)
+
+        scenario_instance = base_instance.clone()
+        for name, values in updates:
+            scenario_instance.component(name).store_values(values)
+        return scenario_instance
+
     #
     # construct a scenario instance - just like it sounds!
     #
@@ -565,6 +660,7 @@ class ScenarioTreeInstanceFactory(object):
                                     profile_memory=False,
                                     output_instance_construction_time=False,
                                     compile_instance=False,
+                                    instance_cache=None,
                                     verbose=False):
         assert not self._closed
         if not scenario_tree.contains_scenario(scenario_name):
@@ -656,7 +752,16 @@ class ScenarioTreeInstanceFactory(object):
                     if verbose:
                         print("Data for scenario=%s loads from file=%s"
                               % (scenario_name, scenario_data_filename))
-                    if data is None:
+                    if instance_cache is not None:
+                        scenario_instance = \
+                            self._create_instance_from_base(
+                                scenario_data_filename if data is None \
+                                else data,
+                                instance_cache,
+                                profile_memory=profile_memory,
+                                output_instance_construction_time=\
+                                    output_instance_construction_time)
+                    elif data is None:
                         scenario_instance = \
                             self._model_object.create_instance(
                                 filename=scenario_data_filename,
@@ -691,10 +796,21 @@ class ScenarioTreeInstanceFactory(object):
                                   % (scenario_name, data_file))
                         scenario_data.load(filename=data_file)
 
-                    scenario_instance = self._model_object.create_instance(
-                        scenario_data,
-                        profile_memory=profile_memory,
-                        report_timing=output_instance_construction_time)
+                    if instance_cache is not None:
+                        scenario_instance = \
+                            self._create_instance_from_base(
+                                scenario_data,
+                                instance_cache,
+                                profile_memory=profile_memory,
+                                output_instance_construction_time=\
+                                    output_instance_construction_time)
+                    else:
+                        scenario_instance = \
+                            self._model_object.create_instance(
+                                scenario_data,
+                                profile_memory=profile_memory,
+                                report_timing=\
+                                    output_instance_construction_time)
             else:
                 raise RuntimeError("Unable to construct scenario instance. "
                                    "Neither a reference model or callback "
@@ -738,6 +854,7 @@ class ScenarioTreeInstanceFactory(object):
             profile_memory=False,
             output_instance_construction_time=False,
             compile_scenario_instances=False,
+            instance_cache=None,
             verbose=False):
         assert not self._closed
 
@@ -769,6 +886,7 @@ class ScenarioTreeInstanceFactory(object):
                         profile_memory=profile_memory,
                         output_instance_construction_time=output_instance_construction_time,
                         compile_instance=compile_scenario_instances,
+                        instance_cache=instance_cache,
                         verbose=verbose)
 
             scenario_instances[scenario._name] = scenario_instance
@@ -782,6 +900,8 @@ class ScenarioTreeInstanceFactory(object):
                                bundles=None,
                                random_bundles=None,
                                random_seed=None,
+                               automatic_bundles=None,
+                               num_workers=1,
                                verbose=True):
 
         scenario_tree_model = self._scenario_tree_model
@@ -905,6 +1025,32 @@ class ScenarioTreeInstanceFactory(object):
             scenario_tree.create_random_bundles(random_bundles,
                                                 random_seed)
 
+        #
+        # create automatic bundles, if requested. a value of 0
+        # selects the number of bundles based on the number of
+        # scenarios and workers.
+        #
+        if automatic_bundles is not None:
+            if (bundles is not None) or \
+               ((random_bundles is not None) and \
+                (random_bundles > 0)):
+                raise ValueError("Cannot specify automatic bundles "
+                                 "along with random bundles or a "
+                                 "bundles specification")
+
+            if automatic_bundles == 0:
+                automatic_bundles = \
+                    scenario_tree.automatic_bundle_count(num_workers)
+            elif automatic_bundles > len(scenario_tree._scenarios):
+                raise ValueError("Cannot create more automatic bundles "
+                                 "than there are scenarios!")
+
+            if verbose:
+                print("Creating "+str(automatic_bundles)+
+                      " automatic bundles")
+
+            scenario_tree.create_automatic_bundles(automatic_bundles)
+
         scenario_tree._scenario_instance_factory = self
 
         return scenario_tree
@@ -11,10 +11,12 @@
 __all__ = ("InvocationType",
            "ScenarioTreeManagerClientSerial",
            "ScenarioTreeManagerClientPyro",
+           "ScenarioTreeManagerClientMultiprocessing",
            "ScenarioTreeManagerFactory")
 
 import math
 import sys
+import multiprocessing
 import time
 import itertools
 import inspect
@@ -46,6 +48,8 @@ from pyomo.pysp.scenariotree.instance_factory import \
     ScenarioTreeInstanceFactory
 from pyomo.pysp.scenariotree.action_manager_pyro \
     import ScenarioTreeActionManagerPyro
+from pyomo.pysp.scenariotree.action_manager_multiprocessing \
+    import ScenarioTreeActionManagerMultiprocessing
 from pyomo.pysp.scenariotree.server_pyro \
     import ScenarioTreeServerPyro
 from pyomo.pysp.ef import create_ef_instance
@@ -777,6 +781,28 @@ class ScenarioTreeManager(PySPConfiguredObject):
             self._result = result
             return self._result
 
+        @staticmethod
+        def wait_any(async_results):
+            """Wait until an action of any of the uncompleted job
+            requests has finished and return that job request. All
+            job requests must use the same action manager."""
+            action_manager = None
+            ah_to_async_result = {}
+            for async_result in async_results:
+                assert async_result._result is None
+                assert async_result._action_handle_data is not None
+                if action_manager is None:
+                    action_manager = async_result._action_manager
+                assert async_result._action_manager is action_manager
+                if isinstance(async_result._action_handle_data, ActionHandle):
+                    ah_to_async_result[async_result._action_handle_data] = \
+                        async_result
+                else:
+                    for ah in async_result._action_handle_data:
+                        ah_to_async_result[ah] = async_result
+            ah = action_manager.wait_any(set(ah_to_async_result))
+            return ah_to_async_result[ah]
+
     # This class ensures that a chain of asynchronous
     # actions are completed in order
     class AsyncResultChain(Async):
@@ -2114,6 +2140,8 @@ class ScenarioTreeManagerClientSerial(_ScenarioTreeManagerWorker,
                                    "output_instance_construction_time")
         safe_declare_common_option(options,
                                    "compile_scenario_instances")
+        safe_declare_common_option(options,
+                                   "scenario_instance_cache")
 
         return options
 
@@ -2169,6 +2197,7 @@ class ScenarioTreeManagerClientSerial(_ScenarioTreeManagerWorker,
                 profile_memory=self._options.profile_memory,
                 compile_scenario_instances=\
                     self._options.compile_scenario_instances,
+                instance_cache=self._options.scenario_instance_cache,
                 verbose=self._options.verbose)
 
         if self._options.output_times or \
@@ -2622,6 +2651,12 @@ class _ScenarioTreeManagerClientPyroAdvanced(ScenarioTreeManagerClient,
     def _invoke_method_impl(self, *args, **kwds):
         raise NotImplementedError                  #pragma:nocover
 
+    def _create_action_manager(self):
+        return ScenarioTreeActionManagerPyro(
+            verbose=self._options.verbose,
+            host=self._options.pyro_host,
+            port=self._options.pyro_port)
+
     #
     # Extended interface for Pyro
     #
@@ -2631,10 +2666,7 @@ class _ScenarioTreeManagerClientPyroAdvanced(ScenarioTreeManagerClient,
         action manager."""
 
         assert self._action_manager is None
-        self._action_manager = ScenarioTreeActionManagerPyro(
-            verbose=self._options.verbose,
-            host=self._options.pyro_host,
-            port=self._options.pyro_port)
+        self._action_manager = self._create_action_manager()
         self._action_manager.acquire_servers(num_servers, timeout=timeout)
 
         scenario_instance_factory = \
@@ -3820,6 +3852,59 @@ class ScenarioTreeManagerClientPyro(_ScenarioTreeManagerClientPyroAdvanced,
         return self.get_server_for_worker(
             self.get_worker_for_bundle(bundle_name))
 
+#
+# This class replaces the Pyro nameserver, dispatcher and
+# scenariotreeserver processes used by ScenarioTreeManagerClientPyro
+# with scenario tree server processes launched on the local machine
+# using the multiprocessing module. Scenario tree servers and
+# workers behave exactly as they do in the Pyro setting, so all
+# functionality of ScenarioTreeManagerClientPyro (including the
+# manager solver) is available.
+#
+
+class ScenarioTreeManagerClientMultiprocessing(ScenarioTreeManagerClientPyro,
+                                               PySPConfiguredObject):
+
+    @classmethod
+    def _declare_options(cls, options=None):
+        if options is None:
+            options = PySPConfigBlock()
+
+        safe_declare_common_option(options,
+                                   "scenario_tree_processes")
+
+        return options
+
+    def _create_action_manager(self):
+        return ScenarioTreeActionManagerMultiprocessing(
+            verbose=self._options.verbose)
+
+    #
+    # Abstract methods for ScenarioTreeManager:
+    #
+
+    def _close_impl(self):
+        # there are no Pyro components to shut down
+        if self._action_manager is not None:
+            if self._error_shutdown:
+                self.release_scenariotreeservers(ignore_errors=2)
+            else:
+                self.release_scenariotreeservers()
+
+    #
+    # Extended interface for Pyro
+    #
+
+    def acquire_scenariotreeservers(self, num_servers, timeout=None):
+        """Launch a pool of at most num_servers scenario tree server
+        processes and initialize the action manager."""
+        processes = self._options.scenario_tree_processes
+        if processes == 0:
+            processes = multiprocessing.cpu_count()
+        return super(ScenarioTreeManagerClientMultiprocessing, self).\
+            acquire_scenariotreeservers(min(num_servers, processes),
+                                        timeout=timeout)
+
 def ScenarioTreeManagerFactory(options, *args, **kwds):
     type_ = options.scenario_tree_manager
     try:
@@ -3839,6 +3924,8 @@ ScenarioTreeManagerFactory.registered_types['serial'] = \
     ScenarioTreeManagerClientSerial
 ScenarioTreeManagerFactory.registered_types['pyro'] = \
     ScenarioTreeManagerClientPyro
+ScenarioTreeManagerFactory.registered_types['multiprocessing'] = \
+    ScenarioTreeManagerClientMultiprocessing
 
 def _register_scenario_tree_manager_options(*args, **kwds):
     if len(args) == 0:
@@ -3860,6 +3947,8 @@ def _register_scenario_tree_manager_options(*args, **kwds):
                                                      **kwds)
     ScenarioTreeManagerClientPyro.register_options(options,
                                                    **kwds)
+    ScenarioTreeManagerClientMultiprocessing.register_options(options,
+                                                              **kwds)
 
     return options
 
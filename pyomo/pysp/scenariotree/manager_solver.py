@@ -375,6 +375,221 @@ class ScenarioTreeManagerSolver(PySPConfiguredObject):
                                    check_status,
                                    async_call)
 
+    def solve_subproblems_asynchronously(self,
+                                         update,
+                                         subproblems=None,
+                                         min_fraction=1.0,
+                                         max_staleness=None,
+                                         requeue_stale=False,
+                                         max_iterations=None,
+                                         ephemeral_solver_options=None,
+                                         disable_warmstart=False,
+                                         check_status=True):
+        """Repeatedly solve scenarios or bundles (if they exist)
+        without waiting for the slowest subproblems.
+
+        Solves are queued for all subproblems. Each iteration
+        waits until results have been returned for at least
+        the fraction :attr:`min_fraction` of the subproblems,
+        loads these results into the scenario tree and calls
+        :attr:`update`. The subproblems that returned are then
+        re-queued immediately, while the solves of the
+        remaining subproblems continue and are picked up by a
+        later iteration. This is meant to implement
+        asynchronous algorithms (e.g., progressive hedging)
+        that update their parameters (e.g., xbar and w) with
+        whatever subproblem solutions are available.
+
+        Args:
+            update: A function called as
+                :const:`update(iteration, results)` after
+                each set of results is loaded, where
+                :attr:`results` is a
+                :class:`ScenarioTreeSolveResults` object for
+                the subproblems that returned since the
+                previous iteration. The subproblems are
+                re-queued after this function returns, so it
+                should transmit any parameter changes to the
+                subproblems using :const:`oneway_call=True`
+                (to avoid waiting on servers that are still
+                busy solving). Returning :const:`True` stops
+                the iterations.
+            subproblems (list): The list of subproblem names
+                to solve. The default value of :const:`None`
+                indicates that all subproblems should be
+                solved.
+            min_fraction (float): The fraction of the
+                subproblems (in (0, 1]) that must return
+                before an iteration is performed. The
+                default of 1.0 waits for all subproblems
+                (i.e., synchronous iterations).
+            max_staleness (int): The maximum number of
+                iterations that can be performed while a
+                subproblem solve is in progress. Iterations
+                wait for the subproblems that reach this
+                bound (unless :attr:`requeue_stale` is
+                :const:`True`). The default value of
+                :const:`None` indicates no bound.
+            requeue_stale (bool): Do not wait for the
+                subproblems that reach the
+                :attr:`max_staleness` bound. Instead, when
+                a subproblem returns a solution computed
+                more than :attr:`max_staleness` iterations
+                ago, the solution is discarded and the
+                subproblem is re-queued immediately (with
+                the current parameters). The solution of a
+                re-queued solve is always used, so a
+                subproblem is restarted at most once in a
+                row. Default is :const:`False`.
+            max_iterations (int): The maximum number of
+                iterations. The default value of
+                :const:`None` indicates no limit.
+            ephemeral_solver_options (dict): A dictionary of
+                solver options to override any persistent
+                solver options for these solves only.
+            disable_warmstart (bool): Disable any warmstart
+                functionality available for the selected
+                subproblem solvers. Default is
+                :const:`False`.
+            check_status (bool): Verify that all subproblem
+                solves successfully completed (optimal or
+                feasible solutions are loaded). Default is
+                :const:`True`.
+
+        Returns:
+            The number of iterations performed. When the \
+            iterations stop, the solves still in progress are \
+            completed and loaded into the scenario tree \
+            (without calling :attr:`update`).
+
+        Examples:
+            The following lines run iterations using at
+            least 90 percent of the subproblem solutions,
+            without letting any subproblem fall more than 5
+            iterations behind.
+
+            >>> def update(iteration, results):
+            >>>     # ... update xbar using all scenario solutions,
+            >>>     # ... w for the scenarios in results, and
+            >>>     # ... transmit them to the subproblems
+            >>>     return converged
+            >>> sp.solve_subproblems_asynchronously(
+            >>>     update, min_fraction=0.9, max_staleness=5)
+
+            The following lines instead restart the solves
+            of subproblems that fall more than 5 iterations
+            behind.
+
+            >>> sp.solve_subproblems_asynchronously(
+            >>>     update, min_fraction=0.9, max_staleness=5,
+            >>>     requeue_stale=True)
+
+        Raises:
+            :class:`PySPFailedSolveStatus` if the \
+            :attr:`check_status` keyword is :const:`True` \
+            and any solves fail.
+        """
+        if self.manager.scenario_tree.contains_bundles():
+            object_type = 'bundles'
+            if subproblems is None:
+                subproblems = [bundle.name for bundle
+                               in self.manager.scenario_tree.bundles]
+        else:
+            object_type = 'scenarios'
+            if subproblems is None:
+                subproblems = [scenario.name for scenario
+                               in self.manager.scenario_tree.scenarios]
+        if len(subproblems) == 0:
+            raise ValueError("No subproblems to solve")
+        if not (0 < min_fraction <= 1):
+            raise ValueError(
+                "The min_fraction argument must be in (0, 1], "
+                "not %s" % (min_fraction))
+        if (max_staleness is not None) and (max_staleness < 0):
+            raise ValueError(
+                "The max_staleness argument must be nonnegative, "
+                "not %s" % (max_staleness))
+        min_count = max(1, int(math.ceil(min_fraction * len(subproblems))))
+
+        def _queue(name):
+            return self._queue_object_solves(object_type,
+                                             [name],
+                                             ephemeral_solver_options,
+                                             disable_warmstart)
+
+        # maps subproblem name to the async result of the
+        # solve in progress and to the iteration in which it
+        # was queued
+        pending = {}
+        queued_iteration = {}
+        for name in subproblems:
+            pending[name] = _queue(name)
+            queued_iteration[name] = 0
+        # the subproblems whose stale solution was discarded
+        requeued = set()
+        iteration = 0
+        try:
+            while (max_iterations is None) or (iteration < max_iterations):
+                arrived = {}
+                while pending:
+                    # the subproblems this iteration must wait for
+                    if (max_staleness is None) or requeue_stale:
+                        stale = False
+                    else:
+                        stale = any(iteration - queued_iteration[name]
+                                    >= max_staleness
+                                    for name in pending)
+                    if (len(arrived) >= min_count) and (not stale):
+                        break
+                    async_result = self.manager.AsyncResult.wait_any(
+                        itervalues(pending))
+                    for name, result in iteritems(async_result.complete()):
+                        del pending[name]
+                        if requeue_stale and \
+                           (max_staleness is not None) and \
+                           (name not in requeued) and \
+                           (iteration - queued_iteration[name] >
+                            max_staleness):
+                            if self.get_option("verbose"):
+                                print("Asynchronous iteration %s: "
+                                      "re-queuing stale solve for %s %s"
+                                      % (iteration,
+                                         object_type[:-1],
+                                         name))
+                            requeued.add(name)
+                            pending[name] = _queue(name)
+                            queued_iteration[name] = iteration
+                        else:
+                            requeued.discard(name)
+                            arrived[name] = result
+
+                if self.get_option("verbose"):
+                    print("Asynchronous iteration %s: loading results for "
+                          "%s of %s %s" % (iteration,
+                                           len(arrived),
+                                           len(subproblems),
+                                           object_type))
+                results = self._process_solve_results(object_type,
+                                                      arrived,
+                                                      check_status)
+                iteration += 1
+                if update(iteration, results):
+                    break
+                for name in arrived:
+                    pending[name] = _queue(name)
+                    queued_iteration[name] = iteration
+        finally:
+            # complete the solves still in progress
+            solve_results = {}
+            for async_result in itervalues(pending):
+                solve_results.update(async_result.complete())
+            if len(solve_results):
+                self._process_solve_results(object_type,
+                                            solve_results,
+                                            False)
+
+        return iteration
+
     def _process_solve_results(self,
                                object_type,
                                solve_results,
@@ -0,0 +1,79 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+__all__ = ("ScenarioTreeServerMultiprocessing",)
+
+import sys
+import logging
+import traceback
+try:
+    import cPickle as pickle
+except:                                           #pragma:nocover
+    import pickle
+
+from pyutilib.pyro import TaskProcessingError
+
+from pyomo.pysp.scenariotree.server_pyro import _ScenarioTreeServerBase
+
+logger = logging.getLogger('pyomo.pysp')
+
+#
+# A scenario tree server that runs in a local process launched by
+# the ScenarioTreeActionManagerMultiprocessing. It processes the
+# same actions as the ScenarioTreeServerPyro, but receives them
+# through a multiprocessing queue rather than a Pyro dispatcher.
+#
+
+class ScenarioTreeServerMultiprocessing(_ScenarioTreeServerBase):
+
+    def __init__(self, name, verbose=False, modules_imported=None):
+        self.WORKERNAME = name
+        self._verbose = verbose
+        if modules_imported is None:
+            modules_imported = {}
+        self._modules_imported = modules_imported
+        self._worker_shutdown = False
+        self._init_server()
+
+    def process(self, data):
+        try:
+            return pickle.dumps(self._process(pickle.loads(data)),
+                                pickle.HIGHEST_PROTOCOL)
+        except:
+            logger.error(
+                "Scenario tree server %s caught an exception of type "
+                "%s while processing a task."
+                % (self.WORKERNAME, sys.exc_info()[0].__name__))
+            traceback.print_exception(*sys.exc_info())
+            return pickle.dumps(TaskProcessingError(traceback.format_exc()),
+                                pickle.HIGHEST_PROTOCOL)
+
+    def serve(self, task_queue, result_queue):
+        """Process lists of (task id, task data, generate response)
+        tuples from the task queue until a shutdown request or None
+        is received."""
+        try:
+            while not self._worker_shutdown:
+                tasks = task_queue.get()
+                if tasks is None:
+                    break
+                for task_id, data, generate_response in tasks:
+                    result = self.process(data)
+                    if generate_response:
+                        result_queue.put((task_id, result))
+                    if self._worker_shutdown:
+                        break
+        finally:
+            if not self._worker_shutdown:
+                self.reset()
+
+def _run_server(name, task_queue, result_queue, verbose):
+    server = ScenarioTreeServerMultiprocessing(name, verbose=verbose)
+    server.serve(task_queue, result_queue)
@@ -65,7 +65,13 @@ from six import iteritems
 
 logger = logging.getLogger('pyomo.pysp')
 
-class ScenarioTreeServerPyro(TaskWorker):
+#
+# The transport independent part of a scenario tree server. It
+# manages the scenario tree workers on a server process and
+# executes the actions sent by a scenario tree manager client.
+#
+
+class _ScenarioTreeServerBase(object):
 
     # Maps name to a registered worker class to instantiate
     _registered_workers = {}
@@ -77,26 +83,8 @@ class ScenarioTreeServerPyro(TaskWorker):
         raise KeyError("No worker type has been registered under the name "
                        "'%s' for ScenarioTreeServerPyro" % (name))
 
-    def __init__(self, *args, **kwds):
-
-        mpi = kwds.pop('mpi', None)
-        # add for purposes of diagnostic output.
-        kwds["name"] = ("ScenarioTreeServerPyro_%d@%s"
-                        % (os.getpid(), socket.gethostname()))
-        if mpi is not None:
-            assert len(mpi) == 2
-            kwds["name"] += "_MPIRank_"+str(mpi[1].rank)
-        kwds["caller_name"] = kwds["name"]
-        self._modules_imported = kwds.pop('modules_imported', {})
-
-        TaskWorker.__init__(self, **kwds)
-        assert hasattr(self, "_bulk_task_collection")
-        self._bulk_task_collection = True
-        self._contiguous_task_processing = False
+    def _init_server(self, mpi=None):
 
-        self.type = self.WORKERNAME
-        self.block = True
-        self.timeout = None
         self._worker_map = {}
         self._init_verbose = self._verbose
 
@@ -140,31 +128,6 @@ class ScenarioTreeServerPyro(TaskWorker):
         self._worker_map[name].close()
         del self._worker_map[name]
 
-    def process(self, data):
-        self._worker_task_return_queue = self._current_task_client
-        try:
-            # The only reason we are go through this much
-            # effort to deal with the serpent serializer
-            # is because it is the default in Pyro4.
-            if using_pyro4 and \
-               (Pyro4.config.SERIALIZER == 'serpent'):
-                if six.PY3:
-                    assert type(data) is dict
-                    assert data['encoding'] == 'base64'
-                    data = base64.b64decode(data['data'])
-                else:
-                    assert type(data) is unicode
-                    data = str(data)
-            return pickle.dumps(self._process(pickle.loads(data)))
-        except:
-            logger.error(
-                "Scenario tree server %s caught an exception of type "
-                "%s while processing a task. Going idle."
-                % (self.WORKERNAME, sys.exc_info()[0].__name__))
-            traceback.print_exception(*sys.exc_info())
-            self._worker_error = True
-            return pickle.dumps(TaskProcessingError(traceback.format_exc()))
-
     def _process(self, data):
         data = pyutilib.misc.Bunch(**data)
         result = None
@@ -289,6 +252,55 @@ class ScenarioTreeServerPyro(TaskWorker):
 
         return result
 
+class ScenarioTreeServerPyro(_ScenarioTreeServerBase, TaskWorker):
+
+    def __init__(self, *args, **kwds):
+
+        mpi = kwds.pop('mpi', None)
+        # add for purposes of diagnostic output.
+        kwds["name"] = ("ScenarioTreeServerPyro_%d@%s"
+                        % (os.getpid(), socket.gethostname()))
+        if mpi is not None:
+            assert len(mpi) == 2
+            kwds["name"] += "_MPIRank_"+str(mpi[1].rank)
+        kwds["caller_name"] = kwds["name"]
+        self._modules_imported = kwds.pop('modules_imported', {})
+
+        TaskWorker.__init__(self, **kwds)
+        assert hasattr(self, "_bulk_task_collection")
+        self._bulk_task_collection = True
+        self._contiguous_task_processing = False
+
+        self.type = self.WORKERNAME
+        self.block = True
+        self.timeout = None
+        self._init_server(mpi=mpi)
+
+    def process(self, data):
+        self._worker_task_return_queue = self._current_task_client
+        try:
+            # The only reason we are go through this much
+            # effort to deal with the serpent serializer
+            # is because it is the default in Pyro4.
+            if using_pyro4 and \
+               (Pyro4.config.SERIALIZER == 'serpent'):
+                if six.PY3:
+                    assert type(data) is dict
+                    assert data['encoding'] == 'base64'
+                    data = base64.b64decode(data['data'])
+                else:
+                    assert type(data) is unicode
+                    data = str(data)
+            return pickle.dumps(self._process(pickle.loads(data)))
+        except:
+            logger.error(
+                "Scenario tree server %s caught an exception of type "
+                "%s while processing a task. Going idle."
+                % (self.WORKERNAME, sys.exc_info()[0].__name__))
+            traceback.print_exception(*sys.exc_info())
+            self._worker_error = True
+            return pickle.dumps(TaskProcessingError(traceback.format_exc()))
+
 def RegisterWorker(name, class_type):
     if name in ScenarioTreeServerPyro._registered_workers:
         raise ValueError("The name %s is already registered "
@@ -19,12 +19,19 @@ import random
 import copy
 import math
 import logging
+from itertools import compress
 
 try:
     from collections import OrderedDict
 except ImportError:                         #pragma:nocover
     from ordereddict import OrderedDict
 
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
 from pyomo.core import (value, minimize, maximize,
                         Var, Expression, Block,
                         CounterLabeler, IntegerSet,
@@ -66,89 +73,139 @@ class _CUIDLabeler(object):
             self._cuid_map[obj] = cuid
             return cuid
 
-class ScenarioTreeNode(object):
-
-    """ Constructor
+def _intern_name(name):
+    """Intern a scenario tree object name so that the many
+    dictionaries keyed by these names (on every scenario and
+    node) share a single string object."""
+    if type(name) is str:
+        return six.moves.intern(name)
+    return name
+
+class _ScenarioTreeObject(object):
+    """Base class for the objects that make up a scenario tree.
+
+    Attributes are stored in __slots__ to keep the per-object
+    footprint small for trees with very many nodes and
+    scenarios. Containers listed in _lazy_slots are only
+    allocated on first access. Attributes not declared by a
+    subclass (e.g., those added by plugins) fall back to an
+    instance dictionary, which is not created until needed.
     """
 
-    VARIABLE_FIXED = 0
-    VARIABLE_FREED = 1
-
-    def __init__(self, name, conditional_probability, stage):
-
-        # self-explanatory!
-        self._name = name
-
-        # the stage to which this tree node belongs.
-        self._stage = stage
-
-        # defines the tree structure
-        self._parent = None
+    __slots__ = ("__dict__",)
+
+    # maps attribute name -> factory for the default value
+    _lazy_slots = {}
+
+    def __getattr__(self, name):
+        factory = type(self)._lazy_slots.get(name, None)
+        if factory is None:
+            raise AttributeError("'%s' object has no attribute '%s'"
+                                 % (type(self).__name__, name))
+        obj = factory()
+        setattr(self, name, obj)
+        return obj
+
+    def __getstate__(self):
+        state = {}
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if name == "__dict__":
+                    continue
+                try:
+                    state[name] = object.__getattribute__(self, name)
+                except AttributeError:
+                    pass
+        try:
+            state.update(object.__getattribute__(self, "__dict__"))
+        except AttributeError:                    #pragma:nocover
+            pass
+        return state
 
-        # a collection of ScenarioTreeNodes
-        self._children = []
+    def __setstate__(self, state):
+        for name, val in iteritems(state):
+            setattr(self, name, val)
 
-        # conditional on parent
-        self._conditional_probability = conditional_probability
+class ScenarioTreeNode(_ScenarioTreeObject):
 
-        # a collection of all Scenario objects passing through this
-        # node in the tree
-        self._scenarios = []
+    """ Constructor
+    """
 
-        # the cumulative probability of scenarios at this node.
-        # cached for efficiency.
-        self._probability = 0.0
+    VARIABLE_FIXED = 0
+    VARIABLE_FREED = 1
 
+    __slots__ = ("_name",
+                 "_stage",
+                 "_parent",
+                 "_children",
+                 "_conditional_probability",
+                 "_scenarios",
+                 "_probability",
+                 "_variable_templates",
+                 "_derived_variable_templates",
+                 "_variable_ids",
+                 "_name_index_to_id",
+                 "_variable_datas",
+                 "_variable_indices",
+                 "_standard_variable_ids",
+                 "_derived_variable_ids",
+                 "_integer",
+                 "_binary",
+                 "_semicontinuous",
+                 "_cost_variable",
+                 "_cost_variable_datas",
+                 "_minimums",
+                 "_averages",
+                 "_maximums",
+                 "_xbars",
+                 "_blend",
+                 "_wbars",
+                 "_fixed",
+                 "_fix_queue",
+                 "_solution",
+                 "_array_variable_ids",
+                 "_array_columns",
+                 "_x_array")
+
+    _lazy_slots = {
         # a map between a variable name and a list of original index
         # match templates, specified as strings.  we want to maintain
         # these for a variety of reasons, perhaps the most important
         # being that for output purposes. specific indices that match
         # belong to the tree node, as that may be specific to a tree
         # node.
-        self._variable_templates = {}
-        self._derived_variable_templates = {}
-
+        "_variable_templates": dict,
+        "_derived_variable_templates": dict,
         #
         # information relating to all variables blended at this node, whether
         # of the standard or derived varieties.
         #
         # maps id -> (name, index)
-        self._variable_ids = {}
+        "_variable_ids": dict,
         # maps (name,index) -> id
-        self._name_index_to_id = {}
+        "_name_index_to_id": dict,
         # maps id -> list of (vardata,probability) across all scenarios
-        self._variable_datas = {}
-
+        "_variable_datas": dict,
         # keep track of the variable indices at this node, independent
         # of type.  this is useful for iterating. maps variable name
         # to a list of indices.
-        self._variable_indices = {}
-
+        "_variable_indices": dict,
         # variables are either standard or derived - but not both.
         # partition the ids into two sets, as we deal with these
         # differently in algorithmic and reporting contexts.
-        self._standard_variable_ids = set()
-        self._derived_variable_ids = set()
+        "_standard_variable_ids": set,
+        "_derived_variable_ids": set,
         # A temporary solution to help wwphextension and other code
         # for when pyomo instances no longer live on the master node
         # when using PHPyro
-        self._integer = set()
-        self._binary = set()
-        self._semicontinuous = set()
-
-        # a tuple consisting of (1) the name of the variable that
-        # stores the stage-specific cost in all scenarios and (2) the
-        # corresponding index *string* - this is converted in the tree
-        # node to a real index.
-        # TODO: Change the code so that this is a ComponentUID string
-        self._cost_variable = None
-
+        "_integer": set,
+        "_binary": set,
+        "_semicontinuous": set,
         # a list of _VarData objects, representing the cost variables
         # for each scenario passing through this tree node.
         # NOTE: This list actually contains tuples of
         #       (_VarData, scenario-probability) pairs.
-        self._cost_variable_datas = []
-
+        "_cost_variable_datas": list,
         # general use statistics for the variables at each node.
         # each attribute is a map between the variable name and a
         # parameter (over the same index set) encoding the corresponding
@@ -160,24 +217,69 @@ class ScenarioTreeNode(object):
         # NOTE: the parameter names are basically irrelevant, and the
         #       convention is assumed to be enforced by whoever populates
         #       these parameters.
-        self._minimums = {}
-        self._averages = {}
-        self._maximums = {}
+        "_minimums": dict,
+        "_averages": dict,
+        "_maximums": dict,
         # This gets pushed into PHXBAR on the instances
-        self._xbars = {}
+        "_xbars": dict,
         # This gets pushed into PHBLEND on the instances
-        self._blend = {}
-        self._wbars = {} # USED IN THE DUAL
+        "_blend": dict,
+        "_wbars": dict, # USED IN THE DUAL
         # node variables ids that are fixed (along with the value to fix)
-        self._fixed = {}
+        "_fixed": dict,
         # variable ids currently out of sync with instance data
         # variable_id -> VARIABLE_FIXED | VARIABLE_FREED
-        self._fix_queue = {}
-
+        "_fix_queue": dict,
         # solution (variable) values for this node. assumed to be distinct
         # from self._averages, as the latter are not necessarily feasible.
         # keys are variable ids.
-        self._solution = {}
+        "_solution": dict,
+    }
+
+    def __init__(self, name, conditional_probability, stage):
+
+        # self-explanatory!
+        self._name = _intern_name(name)
+
+        # the stage to which this tree node belongs.
+        self._stage = stage
+
+        # defines the tree structure
+        self._parent = None
+
+        # a collection of ScenarioTreeNodes
+        self._children = []
+
+        # conditional on parent
+        self._conditional_probability = conditional_probability
+
+        # a collection of all Scenario objects passing through this
+        # node in the tree
+        self._scenarios = []
+
+        # the cumulative probability of scenarios at this node.
+        # cached for efficiency.
+        self._probability = 0.0
+
+        # a tuple consisting of (1) the name of the variable that
+        # stores the stage-specific cost in all scenarios and (2) the
+        # corresponding index *string* - this is converted in the tree
+        # node to a real index.
+        # TODO: Change the code so that this is a ComponentUID string
+        self._cost_variable = None
+
+        # the remaining variable bookkeeping containers are
+        # declared in _lazy_slots and allocated on first use
+
+        # a (scenarios x variables) array of the scenario solutions
+        # for the standard variables at this node, allocated on the
+        # first call to _load_solution_array. the rows follow
+        # self._scenarios and the columns follow
+        # self._array_variable_ids; self._array_columns maps a
+        # variable id to its column.
+        self._array_variable_ids = None
+        self._array_columns = None
+        self._x_array = None
 
     @property
     def name(self):
@@ -213,11 +315,112 @@ class ScenarioTreeNode(object):
     #
     def updateNodeStatistics(self):
 
+        statistics = [self._compute_standard_variable_statistics()]
+        if self._derived_variable_ids:
+            variable_ids = list(self._derived_variable_ids)
+            statistics.append(
+                (variable_ids,) + \
+                self._compute_variable_statistics(variable_ids))
+
+        for variable_ids, averages, minimums, maximums, fresh \
+                in statistics:
+            self._averages.update(zip(variable_ids, averages))
+            self._minimums.update(zip(variable_ids, minimums))
+            self._maximums.update(zip(variable_ids, maximums))
+            for variable_id in compress(variable_ids,
+                                        [not flag for flag in fresh]):
+                self._minimums[variable_id] = None
+                self._maximums[variable_id] = None
+                self._averages[variable_id] = None
+
+    #
+    # Refills the solution array of this node (see the constructor)
+    # from the values stored on the scenario objects and returns
+    # it. The array is allocated once and kept on the node: PH loads
+    # it once per iteration, in update_variable_statistics, and
+    # computes the weight updates and convergence metrics of that
+    # iteration from it. Missing (None) values are NaN. Requires
+    # numpy.
+    #
+    def _load_solution_array(self):
+
+        x_array = self._x_array
+        if (x_array is None) or \
+           (x_array.shape != (len(self._scenarios),
+                              len(self._standard_variable_ids))):
+            variable_ids = self._array_variable_ids = \
+                list(self._standard_variable_ids)
+            self._array_columns = \
+                dict((variable_id, j)
+                     for j, variable_id in enumerate(variable_ids))
+            x_array = self._x_array = \
+                numpy.empty((len(self._scenarios), len(variable_ids)))
+
+        name = self._name
+        variable_ids = self._array_variable_ids
+        for scenario, scenario_values in zip(self._scenarios, x_array):
+            scenario_values[:] = \
+                list(map(scenario._x[name].__getitem__, variable_ids))
+        return x_array
+
+    #
+    # Returns the solution array of this node as of the last call
+    # to _load_solution_array, loading it if it was never loaded.
+    # Requires numpy.
+    #
+    def _solution_array(self):
+        if self._x_array is None:
+            return self._load_solution_array()
+        return self._x_array
+
+    #
+    # Computes the statistics of _compute_variable_statistics for
+    # the standard variables of this node. Returns the variable ids
+    # followed by the four lists for those ids. With numpy, the
+    # statistics are computed from the solution array of the node,
+    # which is refilled by this call.
+    #
+    def _compute_standard_variable_statistics(self):
+
+        if numpy_available and self._standard_variable_ids and \
+           self._scenarios:
+            values = self._load_solution_array()
+            # accumulate in scenario order so the averages are
+            # identical to the loop in _compute_variable_statistics
+            averages = numpy.zeros(values.shape[1])
+            for scenario, scenario_values in zip(self._scenarios, values):
+                averages += scenario._probability * scenario_values
+            averages /= self._probability
+            fresh = ~numpy.isnan(values).any(axis=0)
+            return (self._array_variable_ids,
+                    averages.tolist(),
+                    values.min(axis=0).tolist(),
+                    values.max(axis=0).tolist(),
+                    fresh.tolist())
+
+        variable_ids = list(self._standard_variable_ids)
+        return (variable_ids,) + \
+            self._compute_variable_statistics(variable_ids)
+
+    #
+    # Computes the (probability-weighted) average, minimum, and
+    # maximum of the scenario solutions for each of the given
+    # variable ids. Returns four lists in the order of variable_ids:
+    # the averages, minimums, and maximums, and flags that are False
+    # for variables that have no value (None) in some scenario, whose
+    # statistics are not meaningful.
+    #
+    def _compute_variable_statistics(self, variable_ids):
+
         scenario_solutions = \
             [(scenario._probability, scenario._x[self._name]) \
              for scenario in self._scenarios]
 
-        for variable_id in self._variable_ids:
+        averages = []
+        minimums = []
+        maximums = []
+        fresh = []
+        for variable_id in variable_ids:
 
             stale = False
             values = []
@@ -232,14 +435,16 @@ class ScenarioTreeNode(object):
                     break
 
             if stale:
-                self._minimums[variable_id] = None
-                self._maximums[variable_id] = None
-                self._averages[variable_id] = None
+                averages.append(None)
+                minimums.append(None)
+                maximums.append(None)
             else:
-                avg_value /= self._probability
-                self._minimums[variable_id] = min(values)
-                self._maximums[variable_id] = max(values)
-                self._averages[variable_id] = avg_value
+                averages.append(avg_value / self._probability)
+                minimums.append(min(values))
+                maximums.append(max(values))
+            fresh.append(not stale)
+
+        return averages, minimums, maximums, fresh
 
     #
     # given a set of scenario instances, compute the set of indices
@@ -851,10 +1056,18 @@ class ScenarioTreeNode(object):
 
         self._fix_queue.clear()
 
-class ScenarioTreeStage(object):
+class ScenarioTreeStage(_ScenarioTreeObject):
 
     """ Constructor
     """
+
+    __slots__ = ("_name",
+                 "_tree_nodes",
+                 "_scenario_tree",
+                 "_variable_templates",
+                 "_derived_variable_templates",
+                 "_cost_variable")
+
     def __init__(self):
 
         self._name = ""
@@ -924,10 +1137,32 @@ class ScenarioTreeStage(object):
 
         return self == self._scenario_tree._stages[-1]
 
-class Scenario(object):
+class Scenario(_ScenarioTreeObject):
 
     """ Constructor
     """
+
+    __slots__ = ("_name",
+                 "_leaf_node",
+                 "_node_list",
+                 "_probability",
+                 "_instance",
+                 "_instance_cost_expression",
+                 "_instance_objective",
+                 "_instance_original_objective_object",
+                 "_objective_sense",
+                 "_objective_name",
+                 "_objective",
+                 "_cost",
+                 "_stage_costs",
+                 "_weight_term_cost",
+                 "_proximal_term_cost",
+                 "_x",
+                 "_w",
+                 "_rho",
+                 "_fixed",
+                 "_stale")
+
     def __init__(self):
 
         self._name = None
@@ -1288,7 +1523,41 @@ class Scenario(object):
 
         return deepest_node
 
-class ScenarioTreeBundle(object):
+#
+# returns the projection of each point (a sequence of values) onto
+# the direction of largest spread among the points, i.e., the
+# first principal component. without numpy, the coordinate with
+# the largest variance is used instead.
+#
+
+def _project_coordinates(points):
+
+    num_points = len(points)
+    if (num_points == 0) or (len(points[0]) == 0):
+        return [0.0] * num_points
+
+    if numpy_available:
+        data = numpy.array(points, dtype=float).reshape(num_points, -1)
+        data -= data.mean(axis=0)
+        if not data.any():
+            return [0.0] * num_points
+        _, _, vt = numpy.linalg.svd(data, full_matrices=False)
+        return data.dot(vt[0]).tolist()
+    else:
+        dimension = len(points[0])
+        means = [sum(point[k] for point in points) / float(num_points)
+                 for k in xrange(dimension)]
+        k = max(xrange(dimension),
+                key=lambda k: sum((point[k] - means[k])**2
+                                  for point in points))
+        return [float(point[k]) for point in points]
+
+class ScenarioTreeBundle(_ScenarioTreeObject):
+
+    __slots__ = ("_name",
+                 "_scenario_names",
+                 "_scenario_tree",
+                 "_probability")
 
     def __init__(self):
 
@@ -1361,7 +1630,7 @@ class ScenarioTree(object):
         for stage_name in stage_names:
 
             new_stage = ScenarioTreeStage()
-            new_stage._name = stage_name
+            new_stage._name = _intern_name(stage_name)
             new_stage._scenario_tree = self
 
             for variable_string in stage_variable_names[stage_name]:
@@ -1613,7 +1882,7 @@ class ScenarioTree(object):
         # two-pass logic necessary when constructing scenarios.
         for scenario_name in scenario_ids:
             new_scenario = Scenario()
-            new_scenario._name = scenario_name
+            new_scenario._name = _intern_name(scenario_name)
 
             if scenario_name not in scenario_leaf_ids:
                 raise ValueError("No leaf tree node specified for scenario=%s"
@@ -2457,6 +2726,113 @@ class ScenarioTree(object):
         finally:
             random.setstate(random_state)
 
+    #
+    # a utility to select the number of bundles used by
+    # create_automatic_bundles when none is specified. this is
+    # roughly the square root of the number of scenarios (trading
+    # off per-solve overhead against bundle size), rounded up to a
+    # multiple of the number of workers so that each worker is
+    # assigned the same number of bundles.
+    #
+
+    def automatic_bundle_count(self, num_workers=1):
+
+        num_scenarios = len(self._scenarios)
+        num_workers = max(1, num_workers)
+        num_bundles = \
+            int(math.ceil(math.sqrt(num_scenarios) / num_workers)) * num_workers
+        return max(1, min(num_bundles, num_scenarios))
+
+    #
+    # partitions the scenarios into the indicated number of bundles,
+    # replacing any existing bundles. if scenario_coordinates (a map
+    # from scenario name to a sequence of values, e.g., first-stage
+    # solution values) is supplied, scenarios that are close in these
+    # coordinates are placed in the same bundle. otherwise,
+    # scenarios are kept in tree order, so that scenarios sharing
+    # tree nodes tend to be placed in the same bundle. if
+    # scenario_weights (a map from scenario name to, e.g., an
+    # estimated solve time) is supplied, bundles are balanced by
+    # total weight rather than by number of scenarios.
+    #
+
+    def create_automatic_bundles(self,
+                                 num_bundles,
+                                 scenario_weights=None,
+                                 scenario_coordinates=None):
+
+        num_scenarios = len(self._scenarios)
+        if (num_bundles < 1) or (num_bundles > num_scenarios):
+            raise ValueError("The number of automatic bundles must be "
+                             "between 1 and the number of scenarios (%s); "
+                             "value specified=%s"
+                             % (num_scenarios, num_bundles))
+
+        # the scenarios in depth-first order of their leaf nodes
+        ordered_scenarios = []
+        node_stack = [self.findRootNode()]
+        while len(node_stack):
+            tree_node = node_stack.pop()
+            if tree_node.is_leaf_node():
+                ordered_scenarios.extend(tree_node._scenarios)
+            else:
+                node_stack.extend(reversed(tree_node._children))
+        scenario_names = [scenario._name for scenario in ordered_scenarios]
+
+        if scenario_weights is not None:
+            weights = [float(scenario_weights[name])
+                       for name in scenario_names]
+        else:
+            weights = [1.0] * num_scenarios
+
+        bundle_names = ["Bundle"+str(i)
+                        for i in xrange(1, num_bundles+1)]
+        bundles = OrderedDict((bundle_name, [])
+                              for bundle_name in bundle_names)
+
+        if (scenario_coordinates is None) and \
+           (scenario_weights is not None):
+            # balance the estimated bundle weights by assigning the
+            # heaviest remaining scenario to the lightest bundle
+            bundle_weights = [0.0] * num_bundles
+            for i in sorted(xrange(num_scenarios),
+                            key=lambda i: -weights[i]):
+                bundle_index = min(xrange(num_bundles),
+                                   key=lambda j: (bundle_weights[j], j))
+                bundles[bundle_names[bundle_index]].append(
+                    scenario_names[i])
+                bundle_weights[bundle_index] += weights[i]
+        else:
+            if scenario_coordinates is not None:
+                # order the scenarios by their projection onto the
+                # direction of largest spread in the coordinates
+                projection = _project_coordinates(
+                    [scenario_coordinates[name]
+                     for name in scenario_names])
+                order = sorted(xrange(num_scenarios),
+                               key=lambda i: projection[i])
+                scenario_names = [scenario_names[i] for i in order]
+                weights = [weights[i] for i in order]
+            # split the ordered scenarios into contiguous groups of
+            # (approximately) equal total weight, assigning at least
+            # one scenario to each bundle
+            total_weight = sum(weights)
+            bundle_index = 0
+            cumulative_weight = 0.0
+            for i, scenario_name in enumerate(scenario_names):
+                if (bundle_index < num_bundles - 1) and \
+                   len(bundles[bundle_names[bundle_index]]) and \
+                   ((num_scenarios - i == num_bundles - bundle_index - 1) or \
+                    (cumulative_weight + 0.5 * weights[i] >
+                     total_weight * (bundle_index + 1) / num_bundles)):
+                    bundle_index += 1
+                bundles[bundle_names[bundle_index]].append(scenario_name)
+                cumulative_weight += weights[i]
+
+        for bundle in list(self._scenario_bundles):
+            self.remove_bundle(bundle._name)
+        self._construct_scenario_bundles(bundles)
+
     #
     # a utility function to pretty-print the static/non-cost
     # information associated with a scenario tree
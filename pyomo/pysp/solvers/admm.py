@@ -33,6 +33,8 @@ from pyomo.pysp.util.config import (PySPConfigValue,
                                     safe_declare_common_option,
                                     safe_declare_unique_option,
                                     _domain_positive,
+                                    _domain_unit_interval,
+                                    _domain_nonnegative_integer,
                                     _domain_must_be_str)
 from pyomo.pysp.util.misc import (parse_command_line,
                                   launch_command)
@@ -519,19 +521,22 @@ class ADMMAlgorithm(PySPConfiguredObject):
             invocation_type=InvocationType.PerScenario,
             oneway_call=True)
 
-    def run_x_update(self, x, y, z, rho):
+    def update_subproblem_parameters(self, y, z, rho, scenario_names=None):
         self._manager.invoke_function(
             "EXTERNAL_update_rho",
             thisfile,
             invocation_type=InvocationType.PerScenario,
             function_args=(rho,),
             oneway_call=True)
-        for scenario in self._manager.scenario_tree.scenarios:
+        if scenario_names is None:
+            scenario_names = [scenario.name for scenario
+                              in self._manager.scenario_tree.scenarios]
+        for scenario_name in scenario_names:
             self._manager.invoke_function(
                 "EXTERNAL_update_y",
                 thisfile,
-                invocation_type=InvocationType.OnScenario(scenario.name),
-                function_args=(y[scenario.name],),
+                invocation_type=InvocationType.OnScenario(scenario_name),
+                function_args=(y[scenario_name],),
                 oneway_call=True)
         self._manager.invoke_function(
             "EXTERNAL_update_z",
@@ -540,13 +545,14 @@ class ADMMAlgorithm(PySPConfiguredObject):
             function_args=(z,),
             oneway_call=True)
 
-        self._manager_solver.solve_scenarios()
-
-        objective = 0.0
-        for scenario in self._manager.scenario_tree.scenarios:
+    def collect_x(self, x, scenario_names=None):
+        if scenario_names is None:
+            scenario_names = [scenario.name for scenario
+                              in self._manager.scenario_tree.scenarios]
+        for scenario_name in scenario_names:
+            scenario = self._manager.scenario_tree.get_scenario(scenario_name)
             x_scenario = x[scenario.name]
             x_scenario_solution = scenario._x
-            objective += scenario._objective
             for tree_node in scenario.node_list[:-1]:
                 assert not tree_node.is_leaf_node()
                 x_node = x_scenario[tree_node.name]
@@ -554,8 +560,64 @@ class ADMMAlgorithm(PySPConfiguredObject):
                 for id_ in tree_node._standard_variable_ids:
                     x_node[id_] = x_node_solution[id_]
 
+        objective = 0.0
+        for scenario in self._manager.scenario_tree.scenarios:
+            objective += scenario._objective
         return objective
 
+    def run_x_update(self, x, y, z, rho):
+        self.update_subproblem_parameters(y, z, rho)
+
+        self._manager_solver.solve_scenarios()
+
+        return self.collect_x(x)
+
+    def run_async_x_updates(self,
+                            x, y, z, rho,
+                            update,
+                            min_fraction=1.0,
+                            max_staleness=None,
+                            requeue_stale=False,
+                            max_iterations=None):
+        """Repeatedly solve the subproblems asynchronously.
+
+        Each iteration collects x for the scenarios whose
+        solutions arrived and calls :const:`update(iteration,
+        scenario_names, objective)`, which should update z
+        using all available scenario solutions and y for the
+        arrived scenarios only. Unless :attr:`update` returns
+        :const:`True` (to stop the iterations), rho and z are
+        then transmitted to all scenarios and y to the arrived
+        scenarios, without waiting on the subproblems that are
+        still being solved. Every scenario must have been
+        solved once (e.g., by :meth:`run_x_update`) before
+        calling this method. Returns the number of iterations
+        performed.
+        """
+        scenario_tree = self._manager.scenario_tree
+
+        def _update(iteration, results):
+            if results.solve_type == 'bundles':
+                scenario_names = []
+                for bundle_name in results.solver_status:
+                    scenario_names.extend(
+                        scenario_tree.get_bundle(bundle_name).scenario_names)
+            else:
+                scenario_names = list(results.solver_status)
+            objective = self.collect_x(x, scenario_names)
+            if update(iteration, scenario_names, objective):
+                return True
+            self.update_subproblem_parameters(y, z, rho,
+                                              scenario_names=scenario_names)
+            return False
+
+        return self._manager_solver.solve_subproblems_asynchronously(
+            _update,
+            min_fraction=min_fraction,
+            max_staleness=max_staleness,
+            requeue_stale=requeue_stale,
+            max_iterations=max_iterations)
+
     def run_z_update(self, x, y, z, rho):
         primal_residual = 0.0
         dual_residual = 0.0
@@ -568,9 +630,15 @@ class ADMMAlgorithm(PySPConfiguredObject):
                 for id_ in tree_node._standard_variable_ids:
                     z_var_prev = z_node[id_]
                     rho_var = rho_node[id_]
+                    # this reduces to the average of x when the y
+                    # values sum to zero, which no longer holds
+                    # once asynchronous iterations update y for a
+                    # subset of the scenarios
                     z_var = 0.0
                     for scenario in tree_node.scenarios:
-                        z_var += scenario._x[tree_node.name][id_]
+                        z_var += scenario._x[tree_node.name][id_] + \
+                                 y[scenario.name][tree_node.name][id_] / \
+                                 rho_var
                     z_var /= float(len(tree_node.scenarios))
                     if tree_node.is_variable_binary(id_) or \
                        tree_node.is_variable_integer(id_):
@@ -589,9 +657,16 @@ class ADMMAlgorithm(PySPConfiguredObject):
                 math.sqrt(x_scale),
                 math.sqrt(z_scale))
 
-    def run_y_update(self, x, y, z, rho):
+    def run_y_update(self, x, y, z, rho, scenario_names=None):
+        # when scenario_names is given, y is only updated for
+        # those scenarios (e.g., the scenarios whose solutions
+        # arrived in an asynchronous iteration)
+        if scenario_names is not None:
+            scenario_names = set(scenario_names)
         y_scale = 0.0
         for scenario in self._manager.scenario_tree.scenarios:
+            update = (scenario_names is None) or \
+                     (scenario.name in scenario_names)
             y_scenario = y[scenario.name]
             x_scenario = scenario._x
             for tree_node in scenario.node_list[:-1]:
@@ -601,7 +676,9 @@ class ADMMAlgorithm(PySPConfiguredObject):
                 y_node = y_scenario[tree_node.name]
                 x_node = x_scenario[tree_node.name]
                 for id_ in tree_node._standard_variable_ids:
-                    y_node[id_] += rho_node[id_] * (x_node[id_] - z_node[id_])
+                    if update:
+                        y_node[id_] += \
+                            rho_node[id_] * (x_node[id_] - z_node[id_])
                     y_scale += y_node[id_]**2
         return math.sqrt(y_scale)
 
@@ -707,6 +784,53 @@ class ADMMSolver(SPSolver, PySPConfiguredObject):
                 doc=None,
                 visibility=0),
             ap_group=_admm_group_label)
+        safe_declare_unique_option(
+            options,
+            "async_min_fraction",
+            PySPConfigValue(
+                1.0,
+                domain=_domain_unit_interval,
+                description=(
+                    "The fraction of the scenario solutions that must "
+                    "be available before each iteration updates z "
+                    "(xbar) and y (w). Values less than 1 enable "
+                    "asynchronous iterations that update z using all "
+                    "available scenario solutions and y for the "
+                    "scenarios whose solutions arrived, without "
+                    "waiting for the slowest subproblems. Default is "
+                    "1.0 (synchronous iterations)."
+                ),
+                doc=None,
+                visibility=0),
+            ap_group=_admm_group_label)
+        safe_declare_unique_option(
+            options,
+            "async_max_staleness",
+            PySPConfigValue(
+                None,
+                domain=_domain_nonnegative_integer,
+                description=(
+                    "The maximum number of asynchronous iterations "
+                    "that can be performed while a scenario solve is "
+                    "in progress. Default is None, indicating no bound."
+                ),
+                doc=None,
+                visibility=0),
+            ap_group=_admm_group_label)
+        safe_declare_unique_option(
+            options,
+            "async_requeue_stale",
+            PySPConfigValue(
+                False,
+                domain=bool,
+                description=(
+                    "Discard and restart scenario solves that exceed "
+                    "the asynchronous staleness bound rather than "
+                    "waiting for them. Default is False."
+                ),
+                doc=None,
+                visibility=0),
+            ap_group=_admm_group_label)
         ADMMAlgorithm._declare_options(options)
         for rstype in RhoStrategyFactory.registered_types.values():
             rstype._declare_options(options)
@@ -809,6 +933,12 @@ class ADMMSolver(SPSolver, PySPConfiguredObject):
             self.get_option("dual_residual_relative_tolerance")
         max_iterations = \
             self.get_option("max_iterations")
+        async_min_fraction = \
+            self.get_option("async_min_fraction")
+        async_max_staleness = \
+            self.get_option("async_max_staleness")
+        async_requeue_stale = \
+            self.get_option("async_requeue_stale")
 
         self.objective_history = OrderedDict()
         self.primal_residual_history = OrderedDict()
@@ -826,17 +956,19 @@ class ADMMSolver(SPSolver, PySPConfiguredObject):
                 self.get_option("rho_strategy"),
                 self._options)
             rho_strategy.initialize(sp, x, y, z, rho)
-            for i in xrange(max_iterations):
 
-                objective = \
-                    admm.run_x_update(x, y, z, rho)
+            # stores the results of the most recent iteration
+            last = {}
+            def _iterate(objective, scenario_names=None):
+                i = self.iterations
                 (unscaled_primal_residual,
                  unscaled_dual_residual,
                  x_scale,
                  z_scale) = \
                     admm.run_z_update(x, y, z, rho)
                 y_scale = \
-                    admm.run_y_update(x, y, z, rho)
+                    admm.run_y_update(x, y, z, rho,
+                                      scenario_names=scenario_names)
 
                 # we've completed another iteration
                 self.iterations += 1
@@ -868,20 +1000,51 @@ class ADMMSolver(SPSolver, PySPConfiguredObject):
                              dual_residual,
                              math.log(admm.compute_nodevector_norm(rho))))
 
-                if (primal_residual < rel_tol_primal) and \
-                   (dual_residual < rel_tol_dual):
-                    if output_solver_log:
-                        print("\nNumber of Iterations....: %s"
-                              % (self.iterations))
-                    break
-                else:
+                last['objective'] = objective
+                last['primal_residual'] = primal_residual
+                last['dual_residual'] = dual_residual
+                last['unscaled_primal_residual'] = unscaled_primal_residual
+                last['unscaled_dual_residual'] = unscaled_dual_residual
+                last['converged'] = \
+                    (primal_residual < rel_tol_primal) and \
+                    (dual_residual < rel_tol_dual)
+                if not last['converged']:
                     rho_strategy.update_rho(sp, x, y, z, rho)
+                return last['converged']
+
+            converged = False
+            while (not converged) and (self.iterations < max_iterations):
+                if (self.iterations > 0) and (async_min_fraction < 1):
+                    # every scenario has been solved once, so the
+                    # remaining iterations can update z using
+                    # whatever scenario solutions are available
+                    admm.run_async_x_updates(
+                        x, y, z, rho,
+                        lambda iteration, scenario_names, objective: \
+                            _iterate(objective,
+                                     scenario_names=scenario_names),
+                        min_fraction=async_min_fraction,
+                        max_staleness=async_max_staleness,
+                        requeue_stale=async_requeue_stale,
+                        max_iterations=max_iterations-self.iterations)
+                    converged = last['converged']
+                    break
+                converged = _iterate(admm.run_x_update(x, y, z, rho))
 
-            else:
-                if output_solver_log:
+            if output_solver_log:
+                if converged:
+                    print("\nNumber of Iterations....: %s"
+                          % (self.iterations))
+                else:
                     print("\nMaximum number of iterations reached: %s"
                           % (max_iterations))
 
+        objective = last['objective']
+        primal_residual = last['primal_residual']
+        dual_residual = last['dual_residual']
+        unscaled_primal_residual = last['unscaled_primal_residual']
+        unscaled_dual_residual = last['unscaled_dual_residual']
+
         if output_solver_log:
             print("")
             print("                        {0:^24} {1:^24}".\
@@ -51,6 +51,7 @@ from pyomo.pysp.util.config import (PySPConfigValue,
                                     safe_declare_unique_option,
                                     _domain_percent,
                                     _domain_nonnegative,
+                                    _domain_nonnegative_integer,
                                     _domain_positive_integer,
                                     _domain_must_be_str,
                                     _domain_unit_interval,
@@ -79,6 +80,10 @@ logger = logging.getLogger('pyomo.pysp')
 
 _benders_group_label = "Benders Options"
 
+# Relative tolerance used to decide whether a cut is binding
+# at the current master solution
+_cut_binding_tolerance = 1e-6
+
 def EXTERNAL_deactivate_rootnode_costs(manager,
                                        scenario):
     assert len(manager.scenario_tree.stages) == 2
@@ -381,6 +386,35 @@ class BendersOptimalityCut(object):
         self.ssc = ssc
         self.duals = duals
 
+class _BendersMasterCut(object):
+    """A row of the master problem generated from a
+    BendersOptimalityCut for a single cut group. The row
+    has the form
+
+        constant + sum(coefficients[i] * x[i]) - alpha
+
+    where alpha is the cut variable for the group."""
+    __slots__ = ("group", "coefficients", "constant", "norm", "age")
+    def __init__(self, group, coefficients, constant):
+        self.group = group
+        self.coefficients = coefficients
+        self.constant = constant
+        # includes the coefficient (-1) of the alpha variable
+        self.norm = (1.0 + sum(c*c for c in coefficients))**0.5
+        # the number of consecutive master solves for which
+        # this row has not been binding
+        self.age = 0
+
+    def evaluate(self, x):
+        return self.constant + \
+            sum(c*xi for c, xi in zip(self.coefficients, x))
+
+    def is_parallel(self, other, tolerance):
+        cosine = (1.0 + sum(c1*c2 for c1, c2 in zip(self.coefficients,
+                                                    other.coefficients))) / \
+                 (self.norm * other.norm)
+        return cosine >= 1.0 - tolerance
+
 class BendersAlgorithm(PySPConfiguredObject):
 
     @classmethod
@@ -431,6 +465,40 @@ class BendersAlgorithm(PySPConfiguredObject):
                 doc=None,
                 visibility=0),
             ap_group=_benders_group_label)
+        safe_declare_unique_option(
+            options,
+            "cut_pool_parallel_tolerance",
+            PySPConfigValue(
+                1e-8,
+                domain=_domain_nonnegative,
+                description=(
+                    "Tolerance used to identify a new cut as a duplicate "
+                    "of a cut already in the master problem for the same "
+                    "cut group. Cuts are considered duplicates when one "
+                    "minus the cosine of the angle between them is no "
+                    "larger than this value, in which case only the cut "
+                    "that is tighter at the current first-stage solution "
+                    "is kept. Default is 1e-8."
+                ),
+                doc=None,
+                visibility=0),
+            ap_group=_benders_group_label)
+        safe_declare_unique_option(
+            options,
+            "cut_pool_max_age",
+            PySPConfigValue(
+                0,
+                domain=_domain_nonnegative_integer,
+                description=(
+                    "Remove a cut from the master problem after it has "
+                    "not been binding for this many consecutive master "
+                    "solves. The most recent cut for each cut group is "
+                    "never removed. Default is 0, meaning cuts are never "
+                    "removed."
+                ),
+                doc=None,
+                visibility=0),
+            ap_group=_benders_group_label)
         safe_declare_unique_option(
             options,
             "optimality_gap_epsilon",
@@ -635,7 +703,18 @@ class BendersAlgorithm(PySPConfiguredObject):
         # each iteration within the solve() method.
         self.master = None
         self.cut_pool = []
+        # no. of cut rows not added to the master because
+        # they duplicate an existing row
+        self.cuts_discarded = 0
+        # no. of cut rows removed from the master because
+        # they were not binding (see cut_pool_max_age)
+        self.cuts_removed = 0
         self._num_first_stage_constraints = None
+        # the rows of the PYSP_BENDERS_CUTS_SSC constraint
+        # list (in the same order) and the ordered first-stage
+        # variable ids used for the row coefficients
+        self._master_cuts = []
+        self._master_cut_variable_ids = None
 
         super(BendersAlgorithm, self).__init__(*args, **kwds)
 
@@ -976,20 +1055,32 @@ class BendersAlgorithm(PySPConfiguredObject):
         cutlist_constraint_name = "PYSP_BENDERS_CUTS_SSC"
         assert not hasattr(master, cutlist_constraint_name)
         # I am using the XConstraintList prototype because
-        # it is zero-based, meaning the index within self.cut_pool
-        # (which stores the benders cuts objects) will correspond
-        # directly with the index within this constraint.
+        # it is zero-based, meaning the index within
+        # self._master_cuts (which stores the cut rows
+        # generated from the benders cut objects) will
+        # correspond directly with the index within this
+        # constraint.
         master.add_component(cutlist_constraint_name,
                              XConstraintList())
 
         self.master = master
         self.cut_pool = []
+        self.cuts_discarded = 0
+        self.cuts_removed = 0
+        self._master_cuts = []
+        self._master_cut_variable_ids = \
+            sorted(rootnode._standard_variable_ids)
 
     def add_cut(self, benders_cut, ignore_cut_bundles=False):
         """
         Add the cut defined by the benders_cut object to the
-        master problem. The optional keyword ignore_cut_bundles
-        can be used generate the cut using the single master
+        master problem. One row is added for each cut group
+        (see the multicut_level option), bounding the alpha
+        cut variable for that group. Rows that duplicate a
+        row already on the master for the same group are
+        discarded (see the cut_pool_parallel_tolerance
+        option). The optional keyword ignore_cut_bundles can
+        be used generate the cut using the single master
         alpha cut variable rather than over the possibly many
         bundle cut groups.
         """
@@ -1005,61 +1096,148 @@ class BendersAlgorithm(PySPConfiguredObject):
         self.cut_pool.append(benders_cut)
 
         scenario_tree = self._manager.scenario_tree
-        objective_sense = self._manager.objective_sense
         master = self.master
-        rootnode = scenario_tree.findRootNode()
-        master_variable = master.find_component(
-            "MASTER_BLEND_VAR_"+str(rootnode.name))
-        benders_cuts = master.find_component(
-            "PYSP_BENDERS_CUTS_SSC")
-        master_alpha = master.find_component(
-            "PYSP_BENDERS_ALPHA_SSC")
-        bundle_alpha = master.find_component(
-            "PYSP_BENDERS_BUNDLE_ALPHA_SSC")
 
-        xhat = benders_cut.xhat
-        cut_expression = 0.0
         if not ignore_cut_bundles:
-            for i, cut_scenarios in enumerate(
-                    getattr(master, "PYSP_BENDERS_CUT_BUNDLES_SSC")):
-
-                for scenario_name in cut_scenarios:
-                    assert scenario_name not in master._scenarios_included
-                    scenario_duals = benders_cut.duals[scenario_name]
-                    scenario_ssc = benders_cut.ssc[scenario_name]
-                    scenario = scenario_tree.get_scenario(scenario_name)
-                    cut_expression += \
-                        scenario.probability * \
-                        (scenario_ssc + \
-                         sum(scenario_duals[variable_id] * \
-                             (master_variable[variable_id] - xhat[variable_id]) \
-                             for variable_id in xhat))
-
-                cut_expression -= bundle_alpha[i]
-
+            cut_groups = enumerate(
+                getattr(master, "PYSP_BENDERS_CUT_BUNDLES_SSC"))
         else:
-            for scenario in scenario_tree.scenarios:
-                if scenario.name in master._scenarios_included:
-                    continue
-                scenario_name = scenario.name
+            cut_groups = [(None,
+                           [scenario.name for scenario
+                            in scenario_tree.scenarios
+                            if scenario.name not in
+                            master._scenarios_included])]
+
+        variable_ids = self._master_cut_variable_ids
+        xhat = benders_cut.xhat
+        for group, cut_scenarios in cut_groups:
+            # aggregate the scenario cuts for this group into
+            # a single linear function of the first-stage
+            # variables
+            coefficients = [0.0] * len(variable_ids)
+            constant = 0.0
+            for scenario_name in cut_scenarios:
+                assert scenario_name not in master._scenarios_included
                 scenario_duals = benders_cut.duals[scenario_name]
-                scenario_ssc = benders_cut.ssc[scenario_name]
-                scenario = scenario_tree.get_scenario(scenario_name)
-                cut_expression += \
-                    scenario.probability * \
-                    (scenario_ssc + \
-                     sum(scenario_duals[variable_id] * \
-                         (master_variable[variable_id] - xhat[variable_id]) \
-                         for variable_id in xhat))
+                probability = \
+                    scenario_tree.get_scenario(scenario_name).probability
+                constant += probability * benders_cut.ssc[scenario_name]
+                for k, variable_id in enumerate(variable_ids):
+                    if variable_id in xhat:
+                        dual = probability * scenario_duals[variable_id]
+                        coefficients[k] += dual
+                        constant -= dual * xhat[variable_id]
+            self._add_master_cut(
+                _BendersMasterCut(group, coefficients, constant),
+                xhat)
+
+    def _add_master_cut(self, new_cut, xhat):
+        """
+        Add a cut row to the master problem unless a nearly
+        parallel row exists for the same cut group. In that
+        case, only the row that is tighter at xhat is kept.
+        """
+        objective_sense = self._manager.objective_sense
+        tolerance = self.get_option("cut_pool_parallel_tolerance")
+        x = [xhat.get(variable_id, 0.0)
+             for variable_id in self._master_cut_variable_ids]
+        for i, cut in enumerate(self._master_cuts):
+            if (cut.group == new_cut.group) and \
+               cut.is_parallel(new_cut, tolerance):
+                new_value = new_cut.evaluate(x)
+                current_value = cut.evaluate(x)
+                if objective_sense == minimize:
+                    tighter = new_value > current_value + \
+                        _cut_binding_tolerance * (1.0 + abs(new_value))
+                else:
+                    tighter = new_value < current_value - \
+                        _cut_binding_tolerance * (1.0 + abs(new_value))
+                self.cuts_discarded += 1
+                if not tighter:
+                    return
+                self._remove_master_cut(i)
+                break
 
-            cut_expression -= master_alpha
+        master = self.master
+        rootnode = self._manager.scenario_tree.findRootNode()
+        master_variable = master.find_component(
+            "MASTER_BLEND_VAR_"+str(rootnode.name))
+        if new_cut.group is None:
+            alpha = master.find_component(
+                "PYSP_BENDERS_ALPHA_SSC")
+        else:
+            alpha = master.find_component(
+                "PYSP_BENDERS_BUNDLE_ALPHA_SSC")[new_cut.group]
+        cut_expression = new_cut.constant + \
+            sum(c * master_variable[variable_id]
+                for c, variable_id in zip(new_cut.coefficients,
+                                          self._master_cut_variable_ids)
+                if c != 0) - alpha
 
+        benders_cuts = master.find_component(
+            "PYSP_BENDERS_CUTS_SSC")
         if objective_sense == minimize:
             benders_cuts.append(
                 _GeneralConstraintData((None,cut_expression,0.0)))
         else:
             benders_cuts.append(
                 _GeneralConstraintData((0.0,cut_expression,None)))
+        self._master_cuts.append(new_cut)
+
+    def _remove_master_cut(self, i):
+        benders_cuts = self.master.find_component(
+            "PYSP_BENDERS_CUTS_SSC")
+        del benders_cuts[i]
+        del self._master_cuts[i]
+
+    def update_cut_ages(self):
+        """
+        Update the number of consecutive master solves for
+        which each cut row has not been binding, using the
+        current master solution, and remove the rows whose
+        age exceeds the cut_pool_max_age option. The most
+        recently added row for each cut group is always kept.
+        """
+        if self.master is None:
+            raise RuntimeError("The master problem has not been constructed."
+                               "Call the build_master_problem() method to "
+                               "construct it.")
+
+        master = self.master
+        rootnode = self._manager.scenario_tree.findRootNode()
+        master_variable = master.find_component(
+            "MASTER_BLEND_VAR_"+str(rootnode.name))
+        master_alpha = master.find_component(
+            "PYSP_BENDERS_ALPHA_SSC")
+        bundle_alpha = master.find_component(
+            "PYSP_BENDERS_BUNDLE_ALPHA_SSC")
+        x = [master_variable[variable_id].value or 0.0
+             for variable_id in self._master_cut_variable_ids]
+        for cut in self._master_cuts:
+            if cut.group is None:
+                alpha = master_alpha.value
+            else:
+                alpha = bundle_alpha[cut.group].value
+            cut_value = cut.evaluate(x)
+            if (alpha is not None) and \
+               (abs(cut_value - alpha) <= \
+                _cut_binding_tolerance * (1.0 + abs(cut_value))):
+                cut.age = 0
+            else:
+                cut.age += 1
+
+        max_age = self.get_option("cut_pool_max_age")
+        if max_age == 0:
+            return
+        newest = {}
+        for i, cut in enumerate(self._master_cuts):
+            newest[cut.group] = i
+        newest = set(newest.values())
+        for i in reversed(xrange(len(self._master_cuts))):
+            if (self._master_cuts[i].age > max_age) and \
+               (i not in newest):
+                self._remove_master_cut(i)
+                self.cuts_removed += 1
 
     def extract_master_xhat(self):
 
@@ -1218,6 +1396,8 @@ class BendersAlgorithm(PySPConfiguredObject):
             master.solutions.load_from(results_master)
             stop_time_master = time.time()
 
+            self.update_cut_ages()
+
             if master_alpha.fixed:
                 assert i == 1
                 assert master_alpha.value == 0.0
@@ -1309,6 +1489,13 @@ class BendersAlgorithm(PySPConfiguredObject):
                 print("-" * width_log_table)
                 print("Maximum number of iterations reached.")
 
+        if output_solver_log:
+            print("Cuts in master problem: %s (duplicates discarded: %s, "
+                  "inactive removed: %s)"
+                  % (len(self._master_cuts),
+                     self.cuts_discarded,
+                     self.cuts_removed))
+
         self.bound = float('-inf') if (objective_sense is minimize) else float('inf')
         if len(self.master_bound_history):
             if objective_sense is minimize:
@@ -26,6 +26,12 @@ from pyomo.environ import *
 
 from six import StringIO
 
+try:
+    import swiglpk
+    glpkpy_available = True
+except ImportError:
+    glpkpy_available = False
+
 thisdir = dirname(abspath(__file__))
 baselineDir = join(thisdir, "baselines")
 pysp_examples_dir = \
@@ -289,6 +295,80 @@ for solver_name, solver_io in [('cplex','lp'),
                         solver_io,
                         ('nightly','expensive'))
 
+@unittest.skipIf(not glpkpy_available,
+                 "The 'swiglpk' python bindings are not available")
+@unittest.category('nightly','expensive')
+class TestBendersCutPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        import pyomo.environ
+
+    def setUp(self):
+        if "ReferenceModel" in sys.modules:
+            del sys.modules["ReferenceModel"]
+
+    def _solve(self, **kwds):
+        from pyomo.pysp.scenariotree.manager import \
+            ScenarioTreeManagerClientSerial
+        from pyomo.pysp.solvers.benders import BendersAlgorithm
+        farmer_examples_dir = join(pysp_examples_dir, "farmer")
+        options = ScenarioTreeManagerClientSerial.register_options()
+        options.model_location = join(farmer_examples_dir, "models")
+        options.scenario_tree_location = \
+            join(farmer_examples_dir, "scenariodata")
+        BendersAlgorithm.register_options(options)
+        options.master_solver = "glpk"
+        options.master_solver_io = "python"
+        options.subproblem_solver = "glpk"
+        options.subproblem_solver_io = "python"
+        for name, val in kwds.items():
+            setattr(options, name, val)
+        with ScenarioTreeManagerClientSerial(options) as sp:
+            sp.initialize()
+            with BendersAlgorithm(sp, options) as benders:
+                benders.initialize_subproblems()
+                benders.build_master_problem()
+                objective = benders.solve()
+                self.assertAlmostEqual(objective, -108390.0, places=3)
+                self.assertAlmostEqual(benders.bound, -108390.0, places=3)
+                self.assertEqual(len(benders._master_cuts),
+                                 len(benders.master.PYSP_BENDERS_CUTS_SSC))
+                # adding the same cut again only produces duplicates
+                num_cuts = len(benders._master_cuts)
+                cuts_discarded = benders.cuts_discarded
+                benders.add_cut(benders.cut_pool[-1])
+                self.assertEqual(len(benders._master_cuts), num_cuts)
+                self.assertEqual(
+                    benders.cuts_discarded - cuts_discarded,
+                    len(benders.master.PYSP_BENDERS_CUT_BUNDLES_SSC))
+                return benders
+
+    def test_single_cut(self):
+        benders = self._solve(multicut_level=1)
+        self.assertEqual(benders.cuts_removed, 0)
+        self.assertEqual(set(cut.group for cut in benders._master_cuts),
+                         set([0]))
+
+    def test_multicut(self):
+        benders = self._solve(multicut_level=0)
+        self.assertEqual(benders.cuts_removed, 0)
+        # one row per scenario each iteration (less duplicates)
+        self.assertEqual(set(cut.group for cut in benders._master_cuts),
+                         set([0, 1, 2]))
+        self.assertEqual(len(benders._master_cuts) + \
+                         benders.cuts_discarded - 3,
+                         3 * benders.iterations)
+
+    def test_multicut_max_age(self):
+        benders = self._solve(multicut_level=0,
+                              cut_pool_max_age=1)
+        self.assertTrue(benders.cuts_removed > 0)
+        self.assertTrue(all(cut.age <= 1
+                            for cut in benders._master_cuts))
+        self.assertEqual(set(cut.group for cut in benders._master_cuts),
+                         set([0, 1, 2]))
+
 """
 # this example is big
 for solver_name, solver_io in [('cplex','lp')]:
@@ -558,6 +558,17 @@ def create_test_classes(test_class_suffix,
     globals()[class_names[-1]] = type(
         class_names[-1], (TestConvertSMPS_Serial, unittest.TestCase), {})
 
+    @unittest.category(*categories)
+    class TestConvertSMPS_Multiprocessing(_base,
+                                          _SMPSTesterBase):
+        def setUp(self):
+            _SMPSTesterBase.setUp(self)
+            self.options['--scenario-tree-manager'] = 'multiprocessing'
+            self.options['--scenario-tree-processes'] = 2
+    class_names.append(TestConvertSMPS_Multiprocessing.__name__ + "_"+test_class_suffix)
+    globals()[class_names[-1]] = type(
+        class_names[-1], (TestConvertSMPS_Multiprocessing, unittest.TestCase), {})
+
     @unittest.skipIf(not (using_pyro3 or using_pyro4),
                      "Pyro or Pyro4 is not available")
     @unittest.category('parallel')
@@ -36,6 +36,7 @@ from pyomo.pysp.scenariotree.manager import (ScenarioTreeManager,
                                              _ScenarioTreeManagerWorker,
                                              ScenarioTreeManagerClientSerial,
                                              ScenarioTreeManagerClientPyro,
+                                             ScenarioTreeManagerClientMultiprocessing,
                                              ScenarioTreeManagerFactory,
                                              InvocationType)
 from pyomo.pysp.scenariotree.manager_worker_pyro import \
@@ -1508,5 +1509,53 @@ class TestScenarioTreeManagerClientPyro_HandshakeAtStartup(
         _ScenarioTreeManagerClientPyroTesterBase._setup(self, options, servers=servers)
         options.pyro_handshake_at_startup = True
 
+@unittest.category('parallel')
+class TestScenarioTreeManagerClientMultiprocessing(
+        unittest.TestCase,
+        _ScenarioTreeManagerClientPyroTesterBase):
+
+    cls = ScenarioTreeManagerClientMultiprocessing
+
+    def setUp(self):
+        self.options = PySPConfigBlock()
+        ScenarioTreeManagerClientMultiprocessing.register_options(
+            self.options,
+            registered_worker_name='ScenarioTreeManagerWorkerTest')
+
+    @unittest.nottest
+    def _setup(self, options, servers=None):
+        _ScenarioTreeManagerTesterBase._setup(self, options)
+        if servers is not None:
+            options.scenario_tree_processes = servers
+
+    def test_factory(self):
+        options = ScenarioTreeManagerFactory.register_options()
+        options.scenario_tree_manager = 'multiprocessing'
+        options.model_location = os.path.join(thisdir, 'dummy_model.py')
+        options.scenario_tree_processes = 2
+        with ScenarioTreeManagerFactory(options) as manager:
+            self.assertTrue(isinstance(
+                manager, ScenarioTreeManagerClientMultiprocessing))
+            manager.initialize()
+            self.assertEqual(len(manager._action_manager.server_pool), 2)
+            self.assertEqual(
+                sorted(manager.invoke_function(
+                    "_PerScenario",
+                    thisfile,
+                    invocation_type=InvocationType.PerScenario)),
+                sorted(scenario.name for scenario
+                       in manager.scenario_tree.scenarios))
+            processes = list(manager._action_manager._processes.values())
+        self.assertEqual(len(processes), 2)
+        for proc in processes:
+            self.assertFalse(proc.is_alive())
+
+    def test_task_error(self):
+        self._setup(self.options, servers=1)
+        with self.cls(self.options, **_init_kwds) as manager:
+            manager.initialize()
+            with self.assertRaises(RuntimeError):
+                manager.invoke_method("_not_a_method")
+
 if __name__ == "__main__":
     unittest.main()
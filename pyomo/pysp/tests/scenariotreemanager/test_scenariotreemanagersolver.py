@@ -24,6 +24,7 @@ from pyomo.pysp.util.config import PySPConfigBlock
 from pyomo.pysp.scenariotree.manager import \
     (ScenarioTreeManagerClientSerial,
      ScenarioTreeManagerClientPyro,
+     ScenarioTreeManagerClientMultiprocessing,
      InvocationType)
 from pyomo.pysp.scenariotree.instance_factory import \
     ScenarioTreeInstanceFactory
@@ -715,6 +716,77 @@ class _ScenarioTreeManagerSolverTesterBase(object):
                                                 bundles=names)
                     results = job.complete()
                 problem.validate_solve(self, sp, results, names=names)
+
+    def test_solve_subproblems_asynchronously(self):
+        problem = _SP_Feasible
+        names = ['s0', 's1', 's2']
+        for min_fraction, max_staleness, requeue_stale in \
+                [(1.0, None, False),
+                 (0.3, None, False),
+                 (0.3, 0, False),
+                 (0.3, 1, False),
+                 (0.3, 0, True)]:
+            with self._init(problem.get_factory()) as sp:
+                with ScenarioTreeManagerSolverFactory(sp, _default_test_options) as manager:
+                    arrived = []
+                    def update(iteration, results):
+                        self.assertEqual(iteration, len(arrived) + 1)
+                        for name in results.solver_status:
+                            scenario = sp.scenario_tree.get_scenario(name)
+                            self.assertAlmostEqual(
+                                scenario._objective,
+                                1.0 + float(name[1:]))
+                        arrived.append(sorted(results.solver_status))
+                    iterations = manager.solve_subproblems_asynchronously(
+                        update,
+                        min_fraction=min_fraction,
+                        max_staleness=max_staleness,
+                        requeue_stale=requeue_stale,
+                        max_iterations=6)
+                self.assertEqual(iterations, 6)
+                self.assertEqual(len(arrived), 6)
+                for iteration_names in arrived:
+                    self.assertTrue(len(iteration_names) >= 1)
+                    self.assertTrue(set(iteration_names) <= set(names))
+                if (min_fraction == 1.0) or \
+                   ((max_staleness == 0) and (not requeue_stale)):
+                    self.assertEqual(arrived, [names]*6)
+                elif (max_staleness is not None) and (not requeue_stale):
+                    # a subproblem solve can not be in progress
+                    # for more than max_staleness iterations
+                    for name in names:
+                        last = 0
+                        for i, iteration_names in enumerate(arrived, 1):
+                            if name in iteration_names:
+                                self.assertTrue(i - last <= max_staleness + 1)
+                                last = i
+                # solves still in progress were loaded
+                for name in names:
+                    scenario = sp.scenario_tree.get_scenario(name)
+                    self.assertAlmostEqual(scenario._objective,
+                                           1.0 + float(name[1:]))
+
+        with self._init(problem.get_factory()) as sp:
+            with ScenarioTreeManagerSolverFactory(sp, _default_test_options) as manager:
+                arrived = []
+                def update(iteration, results):
+                    arrived.append(sorted(results.solver_status))
+                    return iteration == 2
+                iterations = manager.solve_subproblems_asynchronously(
+                    update,
+                    subproblems=['s0', 's2'])
+                self.assertEqual(iterations, 2)
+                self.assertEqual(arrived, [['s0', 's2']]*2)
+                with self.assertRaises(ValueError):
+                    manager.solve_subproblems_asynchronously(
+                        update, min_fraction=0)
+                with self.assertRaises(ValueError):
+                    manager.solve_subproblems_asynchronously(
+                        update, min_fraction=1.5)
+                with self.assertRaises(ValueError):
+                    manager.solve_subproblems_asynchronously(
+                        update, max_staleness=-1)
+
 #
 # create the actual testing classes
 #
@@ -770,5 +842,28 @@ class TestScenarioTreeManagerSolverPyro(
         sp.initialize()
         return sp
 
+@unittest.skipIf(not has_networkx, "Networkx is not available")
+@unittest.skipIf(not has_dill, "Dill is not available")
+@unittest.category('parallel')
+class TestScenarioTreeManagerSolverMultiprocessing(
+        unittest.TestCase,
+        _ScenarioTreeManagerSolverTesterBase):
+
+    @classmethod
+    def setUpClass(cls):
+        if not solver['glpk','lp']:
+            raise unittest.SkipTest(
+                "The glpk solver is not available")
+
+    @unittest.nottest
+    def _init(self, factory):
+        options = ScenarioTreeManagerClientMultiprocessing.register_options()
+        options.scenario_tree_processes = 2
+        sp = ScenarioTreeManagerClientMultiprocessing(
+            options,
+            factory=factory)
+        sp.initialize()
+        return sp
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,159 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import os
+from os.path import join, dirname, abspath
+
+import pyutilib.th as unittest
+
+import pyomo.environ
+from pyomo.pysp.scenariotree.manager import \
+    ScenarioTreeManagerClientSerial
+from pyomo.pysp.solvers.admm import (ADMMAlgorithm,
+                                     ADMMSolver)
+
+from pyomo.solvers.tests.solvers import test_solver_cases as _test_solver_cases
+
+# the admm subproblems have a quadratic penalty term
+qp_solver = None
+for _solver, _io in [('cplex', 'lp'),
+                     ('gurobi', 'lp'),
+                     ('cplex', 'python'),
+                     ('gurobi', 'python'),
+                     ('ipopt', 'nl')]:
+    if _test_solver_cases(_solver, _io).available:
+        qp_solver = (_solver, _io)
+        break
+
+thisdir = dirname(abspath(__file__))
+farmer_examples_dir = join(dirname(dirname(dirname(dirname(thisdir)))),
+                           "examples", "pysp", "farmer")
+
+# the objective value of the farmer extensive form
+_farmer_ef_objective = -108390.0
+
+def _farmer_manager():
+    options = ScenarioTreeManagerClientSerial.register_options()
+    options.model_location = join(farmer_examples_dir, "models")
+    options.scenario_tree_location = join(farmer_examples_dir,
+                                          "scenariodata")
+    sp = ScenarioTreeManagerClientSerial(options)
+    sp.initialize()
+    return sp
+
+class TestADMMAsynchronous(unittest.TestCase):
+
+    def _admm_params(self, scenario):
+        node_block = getattr(scenario._instance, ".admm").RootNode
+        return (dict((id_, node_block.z[id_].value)
+                     for id_ in node_block.node_index_set),
+                dict((id_, node_block.y[id_].value)
+                     for id_ in node_block.node_index_set),
+                dict((id_, node_block.rho[id_].value)
+                     for id_ in node_block.node_index_set))
+
+    def test_update_arrived_scenarios(self):
+        with _farmer_manager() as sp:
+            with ADMMAlgorithm(sp, ADMMSolver.register_options()) as admm:
+                rho, x, y, z = admm.initialize_algorithm_data(rho_init=2.0)
+                scenarios = sp.scenario_tree.scenarios
+                root_node = sp.scenario_tree.findRootNode()
+                ids = sorted(root_node._standard_variable_ids)
+                # load a fake solution into each scenario
+                for k, scenario in enumerate(scenarios, 1):
+                    x_node = scenario._x.setdefault(root_node.name, {})
+                    for id_ in ids:
+                        x_node[id_] = 10.0 * k
+                    scenario._objective = float(k)
+
+                # only the first scenario arrived
+                arrived = [scenarios[0].name]
+                objective = admm.collect_x(x, arrived)
+                self.assertEqual(objective, 6.0)
+                for id_ in ids:
+                    self.assertEqual(x[scenarios[0].name][root_node.name][id_],
+                                     10.0)
+                    self.assertEqual(x[scenarios[1].name][root_node.name][id_],
+                                     None)
+
+                # z averages all available solutions, while y
+                # is only updated for the arrived scenario
+                admm.run_z_update(x, y, z, rho)
+                admm.run_y_update(x, y, z, rho, scenario_names=arrived)
+                for id_ in ids:
+                    self.assertAlmostEqual(z[root_node.name][id_], 20.0)
+                    self.assertAlmostEqual(
+                        y[scenarios[0].name][root_node.name][id_], -20.0)
+                    self.assertEqual(
+                        y[scenarios[1].name][root_node.name][id_], 0.0)
+                    self.assertEqual(
+                        y[scenarios[2].name][root_node.name][id_], 0.0)
+
+                # z and rho are sent to all scenarios, y only to
+                # the arrived scenario
+                admm.update_subproblem_parameters(y, z, rho,
+                                                  scenario_names=arrived)
+                for scenario in scenarios:
+                    z_params, y_params, rho_params = \
+                        self._admm_params(scenario)
+                    for id_ in ids:
+                        self.assertAlmostEqual(z_params[id_], 20.0)
+                        self.assertAlmostEqual(rho_params[id_], 2.0)
+                        if scenario.name in arrived:
+                            self.assertAlmostEqual(y_params[id_], -20.0)
+                        else:
+                            self.assertEqual(y_params[id_], 0.0)
+
+    def test_async_options(self):
+        options = ADMMSolver.register_options()
+        self.assertEqual(options.async_min_fraction, 1.0)
+        self.assertEqual(options.async_max_staleness, None)
+        self.assertEqual(options.async_requeue_stale, False)
+        with self.assertRaises(ValueError):
+            options.async_min_fraction = 1.5
+        with self.assertRaises(ValueError):
+            options.async_max_staleness = -1
+
+    def _solve(self, **kwds):
+        with _farmer_manager() as sp:
+            admm = ADMMSolver()
+            options = {'subproblem_solver': qp_solver[0],
+                       'subproblem_solver_io': qp_solver[1],
+                       'max_iterations': 200}
+            options.update(kwds)
+            results = admm.solve(sp, options=options, rho=1.0)
+            iterations = admm.iterations
+        return results, iterations
+
+    @unittest.skipIf(qp_solver is None,
+                     "No QP solver is available")
+    def test_solve_asynchronous(self):
+        sync_results, sync_iterations = self._solve()
+        self.assertTrue(sync_iterations < 200)
+        for kwds in [dict(async_min_fraction=0.5),
+                     dict(async_min_fraction=0.5,
+                          async_max_staleness=1),
+                     dict(async_min_fraction=0.5,
+                          async_max_staleness=0,
+                          async_requeue_stale=True)]:
+            results, iterations = self._solve(**kwds)
+            if not kwds.get('async_requeue_stale', False):
+                self.assertTrue(iterations < 200)
+            self.assertAlmostEqual(results.objective,
+                                   _farmer_ef_objective,
+                                   delta=1e-3*abs(_farmer_ef_objective))
+            for id_, z_var in results.xhat['RootNode'].items():
+                self.assertAlmostEqual(
+                    z_var,
+                    sync_results.xhat['RootNode'][id_],
+                    delta=1.0)
+
+if __name__ == "__main__":
+    unittest.main()
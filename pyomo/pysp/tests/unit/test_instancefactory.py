@@ -21,6 +21,8 @@ from pyomo.pysp.scenariotree.tree_structure_model import \
 from pyomo.pysp.scenariotree.tree_structure import \
     ScenarioTree
 from pyomo.pysp.util.misc import load_external_module
+from pyomo.core import (AbstractModel, Param, Var, Constraint,
+                        InstanceCache, value)
 
 try:
     import networkx
@@ -39,6 +41,9 @@ thisfile = abspath(__file__)
 thisdir = dirname(thisfile)
 testdatadir = join(thisdir, "testdata")
 
+def _cache_test_c_rule(model):
+    return model.x >= model.p + model.q
+
 reference_test_model = None
 def setUpModule():
     global reference_test_model
@@ -98,6 +103,14 @@ class Test(unittest.TestCase):
         scenario_tree = factory.generate_scenario_tree(random_bundles=2, verbose=True)
         self.assertEqual(scenario_tree.contains_bundles(), True)
         self.assertEqual(len(scenario_tree._scenario_bundles), 2)
+        with self.assertRaises(ValueError):
+            scenario_tree = factory.generate_scenario_tree(automatic_bundles=1000, verbose=True)
+        with self.assertRaises(ValueError):
+            scenario_tree = factory.generate_scenario_tree(automatic_bundles=2, random_bundles=2, verbose=True)
+        scenario_tree = factory.generate_scenario_tree(automatic_bundles=0, verbose=True)
+        self.assertEqual(len(scenario_tree.bundles), 2)
+        scenario_tree = factory.generate_scenario_tree(automatic_bundles=0, num_workers=3, verbose=True)
+        self.assertEqual(len(scenario_tree.bundles), 3)
         scenario_tree = factory.generate_scenario_tree(downsample_fraction=0.1, verbose=True)
         scenario_tree = factory.generate_scenario_tree(bundles={'b1': ['s1'],
                                                                 'b2': ['s2'],
@@ -704,5 +717,84 @@ class Test(unittest.TestCase):
         self.assertEqual(len(factory._archives), 0)
         self.assertTrue("both_callbacks" in sys.modules)
 
+    # model: name of .py file with model
+    # scenario_tree: name of .dat file
+    # instance_cache: directory name
+    def test_instance_cache(self):
+        cachedir = self._get_testfname_prefix()+".cache"
+        shutil.rmtree(cachedir, ignore_errors=True)
+        self.assertFalse(exists(cachedir))
+        try:
+            # the second pass restores the base instance from disk
+            for i in range(2):
+                with ScenarioTreeInstanceFactory(
+                        model=join(testdatadir,
+                                   "reference_test_model.py"),
+                        scenario_tree=join(testdatadir,
+                                           "reference_test_scenario_tree.dat")) as factory:
+                    scenario_tree = factory.generate_scenario_tree()
+                    instances = factory.construct_instances_for_scenario_tree(
+                        scenario_tree,
+                        instance_cache=cachedir,
+                        verbose=True)
+                    self.assertEqual(len(instances), 3)
+                    for scenario_name, p in (("s1", 1), ("s2", 2), ("s3", 3)):
+                        instance = instances[scenario_name]
+                        self.assertEqual(instance.name, scenario_name)
+                        self.assertEqual(instance.p(), p)
+                        self.assertEqual(value(instance.c.lower), p)
+                    self.assertEqual(len(os.listdir(cachedir)), 1)
+                    # instances do not share the base instance data
+                    instances["s1"].p = 5.0
+                    self.assertEqual(instances["s2"].p(), 2)
+                    self.assertEqual(
+                        factory.construct_scenario_instance(
+                            "s1",
+                            scenario_tree,
+                            instance_cache=cachedir).p(), 1)
+                if "reference_test_model" in sys.modules:
+                    del sys.modules["reference_test_model"]
+        finally:
+            shutil.rmtree(cachedir, ignore_errors=True)
+
+    # model: Pyomo model with immutable data that changes
+    #        across scenarios
+    # scenario_tree: name of .dat file
+    # instance_cache: InstanceCache
+    def test_instance_cache_immutable(self):
+        datadir = self._get_testfname_prefix()+".data"
+        shutil.rmtree(datadir, ignore_errors=True)
+        os.mkdir(datadir)
+        try:
+            for scenario_name, q in (("s1", 1), ("s2", 1), ("s3", 2)):
+                with open(join(datadir, scenario_name+".dat"), "w") as f:
+                    f.write("param p := %s;\nparam q := %s;\n"
+                            % (scenario_name[1:], q))
+            model = AbstractModel()
+            model.x = Var()
+            model.p = Param(mutable=True)
+            model.q = Param()
+            model.c = Constraint(rule=_cache_test_c_rule)
+            cache = InstanceCache(join(datadir, "cache"))
+            with ScenarioTreeInstanceFactory(
+                    model=model,
+                    scenario_tree=join(testdatadir,
+                                       "reference_test_scenario_tree.dat"),
+                    data=datadir) as factory:
+                scenario_tree = factory.generate_scenario_tree()
+                instances = factory.construct_instances_for_scenario_tree(
+                    scenario_tree,
+                    instance_cache=cache)
+                self.assertEqual(len(instances), 3)
+                for scenario_name, p, q in (("s1", 1, 1),
+                                            ("s2", 2, 1),
+                                            ("s3", 3, 2)):
+                    instance = instances[scenario_name]
+                    self.assertEqual(instance.p(), p)
+                    self.assertEqual(instance.q, q)
+                    self.assertEqual(value(instance.c.lower), p + q)
+        finally:
+            shutil.rmtree(datadir, ignore_errors=True)
+
 if __name__ == "__main__":
     unittest.main()
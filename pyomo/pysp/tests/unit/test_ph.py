@@ -12,12 +12,16 @@
 # files are located.
 #
 
+import copy
 import os
+import random
 import sys
 import subprocess
 import time
 from os.path import abspath, dirname
 
+from six import iteritems
+
 try:
     from subprocess import check_output as _run_cmd
 except:
@@ -50,6 +54,12 @@ import pyomo.pysp
 import pyomo.pysp.phinit
 import pyomo.pysp.ef_writer_script
 
+try:
+    import numpy
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
 _diff_tolerance = 1e-5
 _diff_tolerance_relaxed = 1e-3
 
@@ -674,6 +684,28 @@ class TestPH(unittest.TestCase):
             filter=filter_time_and_data_dirs,
             tolerance=_diff_tolerance)
 
+    def test_linearized_farmer_glpk_persistent(self):
+        if not pyomo.opt.SolverFactory('glpk_persistent').available(
+                exception_flag=False):
+            self.skipTest("The 'glpk_persistent' solver is not available")
+        solver_string="glpk_persistent"
+        farmer_examples_dir = pysp_examples_dir + "farmer"
+        model_dir = farmer_examples_dir + os.sep + "models"
+        instance_dir = farmer_examples_dir + os.sep + "scenariodata"
+        argstring = "runph --traceback -r 1.0 --solver="+solver_string+" --solver-manager=serial --model-directory="+model_dir+" --instance-directory="+instance_dir+" --linearize-nonbinary-penalty-terms=10"
+        print("Testing command: " + argstring)
+
+        pyutilib.misc.setup_redirect(
+            this_test_file_directory+"farmer_linearized_glpk_persistent.out")
+        args = argstring.split()
+        pyomo.pysp.phinit.main(args=args[1:])
+        pyutilib.misc.reset_redirect()
+        self.assertFileEqualsBaseline(
+            this_test_file_directory+"farmer_linearized_glpk_persistent.out",
+            baseline_dir+"farmer_linearized_glpk_persistent.baseline",
+            filter=filter_time_and_data_dirs,
+            tolerance=_diff_tolerance)
+
     def test_linearized_farmer_maximize_cplex(self):
         if not solver['cplex','lp']:
             self.skipTest("The 'cplex' executable is not available")
@@ -801,6 +833,32 @@ class TestPH(unittest.TestCase):
             ef_output_file,
             baseline_dir+"farmer_ef.baseline.lp")
 
+    def test_farmer_ef_streaming(self):
+        farmer_examples_dir = pysp_examples_dir + "farmer"
+        model_dir = farmer_examples_dir + os.sep + "models"
+        instance_dir = farmer_examples_dir + os.sep + "scenariodata"
+        ef_output_file = this_test_file_directory+"test_farmer_ef_streaming.lp"
+        argstring = "runef --symbolic-solver-labels --stream-output -m "+model_dir+" -s "+instance_dir+" --output-file="+ef_output_file
+        print("Testing command: " + argstring)
+
+        pyutilib.misc.setup_redirect(
+            this_test_file_directory+"farmer_ef_streaming.out")
+        args = argstring.split()
+        pyomo.pysp.ef_writer_script.main(args=args[1:])
+        pyutilib.misc.reset_redirect()
+        _remove(this_test_file_directory+"farmer_ef_streaming.out")
+        # the streamed file contains the same rows and columns as
+        # the file written from the extensive form instance, only
+        # in a different order
+        with open(ef_output_file) as f:
+            streamed_lines = sorted(f)
+        with open(baseline_dir+"farmer_ef.baseline.lp") as f:
+            ef_lines = sorted(f)
+        self.assertEqual(streamed_lines, ef_lines)
+        self.assertFileEqualsBaseline(
+            ef_output_file,
+            baseline_dir+"farmer_ef_streaming.baseline.lp")
+
     def test_farmer_maximize_ef(self):
         farmer_examples_dir = pysp_examples_dir + "farmer"
         model_dir = farmer_examples_dir + os.sep + "maxmodels"
@@ -1302,6 +1360,340 @@ class TestPH(unittest.TestCase):
             tolerance=_diff_tolerance)
         _remove(baseline_dir+"lagrange_pr_testPRmore.csv")
 
+class TestPHArrays(unittest.TestCase):
+
+    def tearDown(self):
+        if "ReferenceModel" in sys.modules:
+            del sys.modules["ReferenceModel"]
+
+    def _create_farmer_ph(self):
+        import pyomo.environ
+        farmer_examples_dir = pysp_examples_dir + "farmer"
+        parser = pyomo.pysp.phinit.construct_ph_options_parser("")
+        options = parser.parse_args(
+            ["--model-directory", farmer_examples_dir+os.sep+"models",
+             "--instance-directory",
+             farmer_examples_dir+os.sep+"scenariodata",
+             "--default-rho", "1"])
+        options._ef_options = parser._ef_options
+        options._ef_options.import_argparse(options)
+        ph = pyomo.pysp.phinit.PHFromScratch(options)
+        self.addCleanup(pyomo.pysp.phinit.PHCleanup, ph)
+
+        # load arbitrary scenario solutions, rhos, and weights
+        rng = random.Random(1234)
+        for scenario in ph._scenario_tree._scenarios:
+            for tree_node in scenario._node_list:
+                for variable_id in tree_node._variable_ids:
+                    scenario._x[tree_node._name][variable_id] = \
+                        rng.uniform(0, 500)
+            for tree_node in scenario._node_list[:-1]:
+                for variable_id in tree_node._standard_variable_ids:
+                    scenario._rho[tree_node._name][variable_id] = \
+                        rng.uniform(0.5, 2)
+                    scenario._w[tree_node._name][variable_id] = \
+                        rng.uniform(-10, 10)
+        (ph._total_discrete_vars, ph._total_continuous_vars) = \
+            ph.compute_blended_variable_counts()
+        return ph
+
+    def _run_without_numpy(self, func, *args):
+        import pyomo.pysp.ph
+        import pyomo.pysp.convergence
+        import pyomo.pysp.scenariotree.tree_structure
+        modules = (pyomo.pysp.ph,
+                   pyomo.pysp.convergence,
+                   pyomo.pysp.scenariotree.tree_structure)
+        numpy_available = [module.numpy_available for module in modules]
+        for module in modules:
+            module.numpy_available = False
+        try:
+            return func(*args)
+        finally:
+            for module, available in zip(modules, numpy_available):
+                module.numpy_available = available
+
+    def _snapshot(self, ph):
+        return (dict((scenario._name, copy.deepcopy(scenario._w))
+                     for scenario in ph._scenario_tree._scenarios),
+                dict((tree_node._name, dict(tree_node._wbars))
+                     for tree_node in ph._scenario_tree._tree_nodes))
+
+    def _restore_weights(self, ph, weights):
+        for scenario in ph._scenario_tree._scenarios:
+            scenario._w = copy.deepcopy(weights[scenario._name])
+
+    def _check_update_weights(self, ph):
+        ph.update_variable_statistics()
+        initial_weights, _ = self._snapshot(ph)
+        self._run_without_numpy(ph.update_weights)
+        expected = self._snapshot(ph)
+        self._restore_weights(ph, initial_weights)
+        ph.update_weights()
+        self.assertEqual(self._snapshot(ph), expected)
+
+        scenario = ph._scenario_tree._scenarios[1]
+        self._restore_weights(ph, initial_weights)
+        self._run_without_numpy(ph.update_weights_for_scenario, scenario)
+        expected, _ = self._snapshot(ph)
+        self._restore_weights(ph, initial_weights)
+        ph.update_weights_for_scenario(scenario)
+        self.assertEqual(self._snapshot(ph)[0], expected)
+
+    @unittest.skipIf(not numpy_available, "numpy is not available")
+    def test_update_weights_equivalence(self):
+        ph = self._create_farmer_ph()
+        self._check_update_weights(ph)
+
+    @unittest.skipIf(not numpy_available, "numpy is not available")
+    def test_update_weights_equivalence_maximize_overrelax(self):
+        from pyomo.core import maximize
+        ph = self._create_farmer_ph()
+        ph._objective_sense = maximize
+        ph._overrelax = True
+        ph._nu = 1.5
+        self._check_update_weights(ph)
+
+    @unittest.skipIf(not numpy_available, "numpy is not available")
+    def test_update_weights_stale_values(self):
+        ph = self._create_farmer_ph()
+        root = ph._scenario_tree.findRootNode()
+        variable_id = sorted(root._standard_variable_ids)[0]
+        ph._scenario_tree._scenarios[0]._x[root._name][variable_id] = None
+        self._check_update_weights(ph)
+
+    @unittest.skipIf(not numpy_available, "numpy is not available")
+    def test_update_weights_xbar_unset(self):
+        ph = self._create_farmer_ph()
+        ph.update_variable_statistics()
+        root = ph._scenario_tree.findRootNode()
+        variable_id = sorted(root._standard_variable_ids)[0]
+        root._averages[variable_id] = None
+        with self.assertRaises(TypeError):
+            self._run_without_numpy(ph.update_weights)
+        with self.assertRaises(TypeError):
+            ph.update_weights()
+        # the weights of a variable without a value are not updated
+        for scenario in root._scenarios:
+            scenario._x[root._name][variable_id] = None
+        ph.update_variable_statistics()
+        self.assertIsNone(root._averages[variable_id])
+        self._check_update_weights(ph)
+
+    @unittest.skipIf(not numpy_available, "numpy is not available")
+    def test_solution_array_persistent(self):
+        ph = self._create_farmer_ph()
+        ph.update_variable_statistics()
+        root = ph._scenario_tree.findRootNode()
+        x_array = root._solution_array()
+        for i, scenario in enumerate(root._scenarios):
+            for variable_id, j in root._array_columns.items():
+                self.assertEqual(x_array[i, j],
+                                 scenario._x[root._name][variable_id])
+        for scenario in root._scenarios:
+            for variable_id in root._standard_variable_ids:
+                scenario._x[root._name][variable_id] += 1.0
+        ph.update_variable_statistics()
+        # the array is refilled in place
+        self.assertIs(root._solution_array(), x_array)
+        for i, scenario in enumerate(root._scenarios):
+            for variable_id, j in root._array_columns.items():
+                self.assertEqual(x_array[i, j],
+                                 scenario._x[root._name][variable_id])
+
+    @unittest.skipIf(not numpy_available, "numpy is not available")
+    def test_convergence_metrics_equivalence(self):
+        import pyomo.pysp.convergence
+        ph = self._create_farmer_ph()
+        root = ph._scenario_tree.findRootNode()
+        stale_id, fixed_id = sorted(root._standard_variable_ids)[:2]
+        for scenario in root._scenarios:
+            scenario._stale[root._name].add(stale_id)
+        ph.update_variable_statistics()
+        for converger in (pyomo.pysp.convergence.TermDiffConvergence(),
+                          pyomo.pysp.convergence.NormalizedTermDiffConvergence()):
+            expected = self._run_without_numpy(converger.computeMetric,
+                                               ph, ph._scenario_tree, None)
+            self.assertAlmostEqual(
+                converger.computeMetric(ph, ph._scenario_tree, None),
+                expected)
+        PrimalDual = pyomo.pysp.convergence.PrimalDualResidualConvergence
+        previous_average = PrimalDual.snapshot_average(ph)
+        for scenario in ph._scenario_tree._scenarios:
+            for variable_id in root._standard_variable_ids:
+                scenario._x[root._name][variable_id] *= 0.5
+        ph.update_variable_statistics()
+        self.assertAlmostEqual(
+            PrimalDual.compute_residual_squared_norm(ph, previous_average),
+            self._run_without_numpy(PrimalDual.compute_residual_squared_norm,
+                                    ph, previous_average))
+        self.assertAlmostEqual(
+            PrimalDual.compute_primal_residual_squared_norm(ph),
+            self._run_without_numpy(
+                PrimalDual.compute_primal_residual_squared_norm, ph))
+
+        # variables fixed in some, but not all, of the scenarios
+        root._scenarios[0]._fixed[root._name].add(fixed_id)
+        converger = pyomo.pysp.convergence.TermDiffConvergence()
+        with self.assertRaises(RuntimeError):
+            self._run_without_numpy(converger.computeMetric,
+                                    ph, ph._scenario_tree, None)
+        with self.assertRaises(RuntimeError):
+            converger.computeMetric(ph, ph._scenario_tree, None)
+
+class TestPHAutomaticBundles(unittest.TestCase):
+
+    def tearDown(self):
+        if "ReferenceModel" in sys.modules:
+            del sys.modules["ReferenceModel"]
+
+    def _create_farmer_ph(self, criterion, solver=None):
+        import pyomo.environ
+        farmer_examples_dir = pysp_examples_dir + "farmer"
+        args = ["--model-directory", farmer_examples_dir+os.sep+"models",
+                "--instance-directory",
+                farmer_examples_dir+os.sep+"scenariodata",
+                "--default-rho", "1",
+                "--create-automatic-bundles=2",
+                "--automatic-bundle-update-interval=1",
+                "--automatic-bundle-criterion="+criterion]
+        if solver is not None:
+            args.extend(["--solver="+solver,
+                         "--solver-manager=serial",
+                         "--linearize-nonbinary-penalty-terms=10"])
+        parser = pyomo.pysp.phinit.construct_ph_options_parser("")
+        options = parser.parse_args(args)
+        options._ef_options = parser._ef_options
+        options._ef_options.import_argparse(options)
+        ph = pyomo.pysp.phinit.PHFromScratch(options)
+        self.addCleanup(pyomo.pysp.phinit.PHCleanup, ph)
+        return ph
+
+    def _check_bundles(self, ph):
+        from pyomo.solvers.plugins.solvers.persistent_solver import \
+            PersistentSolver
+        scenario_tree = ph._scenario_tree
+        bundle_names = sorted(bundle._name
+                              for bundle in scenario_tree._scenario_bundles)
+        self.assertEqual(bundle_names, ["Bundle1", "Bundle2"])
+        self.assertEqual(sorted(ph._bundle_binding_instance_map),
+                         bundle_names)
+        self.assertEqual(sorted(ph._bundle_scenario_instance_map),
+                         bundle_names)
+        self.assertEqual(sorted(ph._scenario_to_bundle_map),
+                         sorted(scenario._name
+                                for scenario in scenario_tree._scenarios))
+        for scenario_bundle in scenario_tree._scenario_bundles:
+            binding_instance = \
+                ph._bundle_binding_instance_map[scenario_bundle._name]
+            self.assertEqual(
+                sorted(ph._bundle_scenario_instance_map
+                       [scenario_bundle._name]),
+                sorted(scenario_bundle._scenario_names))
+            for scenario_name in scenario_bundle._scenario_names:
+                instance = ph._instances[scenario_name]
+                self.assertEqual(ph._scenario_to_bundle_map[scenario_name],
+                                 scenario_bundle._name)
+                self.assertIs(ph._bundle_scenario_instance_map
+                              [scenario_bundle._name][scenario_name],
+                              instance)
+                self.assertIs(instance.parent_block(), binding_instance)
+            solver = ph._solver_map[scenario_bundle._name]
+            if isinstance(solver, PersistentSolver):
+                self.assertIs(solver._pyomo_model, binding_instance)
+                for scenario_name in scenario_bundle._scenario_names:
+                    for constraint_data in ph._problem_states.\
+                            solver_ph_constraints[scenario_name]:
+                        self.assertIn(constraint_data,
+                                      solver._pyomo_con_to_solver_con_map)
+                        self.assertIs(constraint_data.model(),
+                                      binding_instance)
+
+    def test_update_first_stage(self):
+        ph = self._create_farmer_ph("first-stage")
+        self._check_bundles(ph)
+        self.assertEqual(ph._scenario_to_bundle_map,
+                         {"BelowAverageScenario": "Bundle1",
+                          "AverageScenario": "Bundle1",
+                          "AboveAverageScenario": "Bundle2"})
+        old_binding_instances = dict(ph._bundle_binding_instance_map)
+
+        # place the average scenario furthest from the others
+        root_node = ph._scenario_tree.findRootNode()
+        offsets = {"BelowAverageScenario": 0.0,
+                   "AboveAverageScenario": 1.0,
+                   "AverageScenario": 10.0}
+        for scenario in ph._scenario_tree._scenarios:
+            for variable_id in root_node._standard_variable_ids:
+                scenario._x[root_node._name][variable_id] = \
+                    offsets[scenario._name]
+        ph._update_automatic_bundles()
+        self._check_bundles(ph)
+        self.assertNotEqual(
+            ph._scenario_to_bundle_map["BelowAverageScenario"],
+            ph._scenario_to_bundle_map["AverageScenario"])
+        for bundle_name, binding_instance in \
+                iteritems(ph._bundle_binding_instance_map):
+            self.assertIsNot(binding_instance,
+                             old_binding_instances[bundle_name])
+
+        # an update with the same solutions leaves the grouping alone
+        scenario_to_bundle_map = dict(ph._scenario_to_bundle_map)
+        ph._update_automatic_bundles()
+        self._check_bundles(ph)
+        self.assertEqual(ph._scenario_to_bundle_map, scenario_to_bundle_map)
+
+    def test_update_solve_time(self):
+        ph = self._create_farmer_ph("solve-time")
+        self._check_bundles(ph)
+        old_binding_instances = dict(ph._bundle_binding_instance_map)
+
+        # Bundle1 (two scenarios) was ten times slower than Bundle2
+        ph._solve_times = {"Bundle1": 10.0, "Bundle2": 1.0}
+        ph._update_automatic_bundles()
+        self._check_bundles(ph)
+        self.assertEqual(ph._scenario_to_bundle_map,
+                         {"BelowAverageScenario": "Bundle1",
+                          "AboveAverageScenario": "Bundle1",
+                          "AverageScenario": "Bundle2"})
+        for bundle_name, binding_instance in \
+                iteritems(ph._bundle_binding_instance_map):
+            self.assertIsNot(binding_instance,
+                             old_binding_instances[bundle_name])
+
+    def _solve_farmer_glpk_persistent(self, criterion):
+        if not pyomo.opt.SolverFactory('glpk_persistent').available(
+                exception_flag=False):
+            self.skipTest("The 'glpk_persistent' solver is not available")
+        ph = self._create_farmer_ph(criterion, solver="glpk_persistent")
+        self._check_bundles(ph)
+        bundle_updates = []
+        update_automatic_bundles = ph._update_automatic_bundles
+        def _update_automatic_bundles():
+            update_automatic_bundles()
+            self._check_bundles(ph)
+            bundle_updates.append(dict(ph._scenario_to_bundle_map))
+        ph._update_automatic_bundles = _update_automatic_bundles
+        pyutilib.misc.setup_redirect(
+            this_test_file_directory+"farmer_rebundle_glpk_persistent.out")
+        try:
+            retval = ph.solve()
+        finally:
+            pyutilib.misc.reset_redirect()
+            _remove(this_test_file_directory+
+                    "farmer_rebundle_glpk_persistent.out")
+        self.assertIsNone(retval)
+        self.assertGreater(ph._current_iteration, 1)
+        self.assertEqual(len(bundle_updates), ph._current_iteration)
+        self._check_bundles(ph)
+        self.assertTrue(ph.is_converged())
+
+    def test_solve_first_stage_glpk_persistent(self):
+        self._solve_farmer_glpk_persistent("first-stage")
+
+    def test_solve_solve_time_glpk_persistent(self):
+        self._solve_farmer_glpk_persistent("solve-time")
+
 class TestPHExpensive(unittest.TestCase):
 
     @classmethod
@@ -7,8 +7,12 @@
 #  rights in this software.
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
+import copy
+import pickle
+
 import pyutilib.th as unittest
 
+import pyomo.pysp.scenariotree.tree_structure
 from pyomo.pysp.scenariotree.tree_structure_model import \
     (ScenarioTreeModelFromNetworkX,
      CreateConcreteTwoStageScenarioTreeModel)
@@ -357,6 +361,187 @@ class TestScenarioTree(unittest.TestCase):
                 self.assertEqual(
                     (name,index) in root._name_index_to_id, True)
 
+    def _get_statistics_tree(self):
+        st_model = CreateConcreteTwoStageScenarioTreeModel(3)
+        st_model.StageVariables['Stage1'].add("x")
+        st_model.StageDerivedVariables['Stage1'].add("y")
+        st_model.StageCost['Stage1'] = "FirstStageCost"
+        st_model.StageCost['Stage2'] = "SecondStageCost"
+        st_model.ConditionalProbability['LeafNode_Scenario1'] = 0.5
+        st_model.ConditionalProbability['LeafNode_Scenario2'] = 0.25
+        st_model.ConditionalProbability['LeafNode_Scenario3'] = 0.25
+        scenario_tree = ScenarioTree(scenariotreeinstance=st_model)
+
+        instances = {}
+        for i, scenario in enumerate(scenario_tree.scenarios):
+            model = ConcreteModel()
+            model.s = Set(initialize=[1,2,3])
+            model.x = Var(model.s)
+            model.y = Var()
+            model.FirstStageCost = Expression(expr=0.0)
+            model.SecondStageCost = Expression(expr=0.0)
+            model.obj = Objective(expr=0.0)
+            for j in model.s:
+                model.x[j].value = 0.1*i + j
+            model.y.value = 2.0*i
+            instances[scenario.name] = model
+        scenario_tree.linkInInstances(instances)
+        for scenario in scenario_tree.scenarios:
+            scenario.update_solution_from_instance()
+        return scenario_tree
+
+    def _check_node_statistics(self):
+        scenario_tree = self._get_statistics_tree()
+        root = scenario_tree.findRootNode()
+        root.updateNodeStatistics()
+        for j in (1,2,3):
+            variable_id = root._name_index_to_id[("x", j)]
+            self.assertAlmostEqual(root._averages[variable_id],
+                                   0.5*j + 0.25*(0.1+j) + 0.25*(0.2+j))
+            self.assertAlmostEqual(root._minimums[variable_id], j)
+            self.assertAlmostEqual(root._maximums[variable_id], 0.2+j)
+        variable_id = root._name_index_to_id[("y", None)]
+        self.assertAlmostEqual(root._averages[variable_id], 1.5)
+        self.assertEqual(root._minimums[variable_id], 0)
+        self.assertEqual(root._maximums[variable_id], 4)
+
+        # statistics are stale when a scenario has no value
+        stale_id = root._name_index_to_id[("x", 2)]
+        scenario_tree.scenarios[1]._x[root.name][stale_id] = None
+        root.updateNodeStatistics()
+        self.assertIsNone(root._averages[stale_id])
+        self.assertIsNone(root._minimums[stale_id])
+        self.assertIsNone(root._maximums[stale_id])
+        variable_id = root._name_index_to_id[("x", 3)]
+        self.assertAlmostEqual(root._averages[variable_id], 3.075)
+
+        averages, minimums, maximums, fresh = \
+            root._compute_variable_statistics(
+                [variable_id, stale_id])
+        self.assertEqual(fresh, [True, False])
+        self.assertAlmostEqual(averages[0], 3.075)
+        return root
+
+    def test_update_node_statistics(self):
+        self._check_node_statistics()
+
+    def test_update_node_statistics_nonumpy(self):
+        tree_structure = pyomo.pysp.scenariotree.tree_structure
+        numpy_available = tree_structure.numpy_available
+        tree_structure.numpy_available = False
+        try:
+            root = self._check_node_statistics()
+        finally:
+            tree_structure.numpy_available = numpy_available
+        if numpy_available:
+            # the averages do not depend on the implementation
+            expected = dict(root._averages)
+            root.updateNodeStatistics()
+            self.assertEqual(root._averages, expected)
+
+    def test_compact_objects(self):
+        stm = CreateConcreteTwoStageScenarioTreeModel(3)
+        stm.StageCost["Stage1"] = "FirstStageCost"
+        stm.StageCost["Stage2"] = "SecondStageCost"
+        stm.StageVariables["Stage1"].add("x")
+        scenario_tree = ScenarioTree(scenariotreeinstance=stm)
+        root = scenario_tree.findRootNode()
+        scenario = scenario_tree.scenarios[0]
+        # containers are allocated on first access
+        with self.assertRaises(AttributeError):
+            object.__getattribute__(root, "_xbars")
+        self.assertEqual(root._xbars, {})
+        root._xbars[1] = 2.0
+        self.assertEqual(root._xbars, {1: 2.0})
+        self.assertFalse(hasattr(root, "_not_an_attribute"))
+        # ad-hoc attributes are still supported
+        root._plugin_data = 1
+        scenario._plugin_data = 2
+        for protocol in range(pickle.HIGHEST_PROTOCOL+1):
+            tree = pickle.loads(pickle.dumps(scenario_tree, protocol))
+            new_root = tree.findRootNode()
+            self.assertEqual(new_root.name, root.name)
+            self.assertEqual(new_root._xbars, {1: 2.0})
+            self.assertEqual(new_root._plugin_data, 1)
+            self.assertEqual(tree.scenarios[0]._plugin_data, 2)
+            self.assertEqual(tree.scenarios[0]._x, scenario._x)
+            self.assertIs(tree.scenarios[0]._node_list[0], new_root)
+        tree = copy.deepcopy(scenario_tree)
+        self.assertEqual(tree.findRootNode()._xbars, {1: 2.0})
+        self.assertEqual([s.name for s in tree.scenarios],
+                         [s.name for s in scenario_tree.scenarios])
+
+    def _get_automatic_bundle_tree(self, num_scenarios):
+        stm = CreateConcreteTwoStageScenarioTreeModel(num_scenarios)
+        stm.StageCost["Stage1"] = "FirstStageCost"
+        stm.StageCost["Stage2"] = "SecondStageCost"
+        stm.StageVariables["Stage1"].add("x")
+        return ScenarioTree(scenariotreeinstance=stm)
+
+    def _get_bundles(self, scenario_tree):
+        return [list(bundle.scenario_names)
+                for bundle in scenario_tree.bundles]
+
+    def test_automatic_bundle_count(self):
+        scenario_tree = self._get_automatic_bundle_tree(10)
+        self.assertEqual(scenario_tree.automatic_bundle_count(), 4)
+        self.assertEqual(scenario_tree.automatic_bundle_count(3), 6)
+        self.assertEqual(scenario_tree.automatic_bundle_count(8), 8)
+        self.assertEqual(scenario_tree.automatic_bundle_count(20), 10)
+
+    def test_automatic_bundles(self):
+        scenario_tree = self._get_automatic_bundle_tree(10)
+        names = [s.name for s in scenario_tree.scenarios]
+        with self.assertRaises(ValueError):
+            scenario_tree.create_automatic_bundles(0)
+        with self.assertRaises(ValueError):
+            scenario_tree.create_automatic_bundles(11)
+
+        scenario_tree.create_automatic_bundles(3)
+        self.assertEqual([b.name for b in scenario_tree.bundles],
+                         ["Bundle1", "Bundle2", "Bundle3"])
+        self.assertEqual(self._get_bundles(scenario_tree),
+                         [names[:3], names[3:7], names[7:]])
+        for bundle in scenario_tree.bundles:
+            self.assertAlmostEqual(bundle.probability,
+                                   0.1 * len(bundle.scenario_names))
+
+        # bundles are replaced, and each receives a scenario
+        scenario_tree.create_automatic_bundles(10)
+        self.assertEqual(self._get_bundles(scenario_tree),
+                         [[name] for name in names])
+
+        # balance the weights
+        weights = dict((name, 1.0) for name in names)
+        weights[names[0]] = 6.0
+        weights[names[1]] = 3.0
+        scenario_tree.create_automatic_bundles(
+            3, scenario_weights=weights)
+        bundles = self._get_bundles(scenario_tree)
+        self.assertEqual(bundles[0], [names[0]])
+        self.assertEqual(sorted(sum(bundles, [])), sorted(names))
+        self.assertEqual(
+            sorted(sum(weights[name] for name in bundle)
+                   for bundle in bundles),
+            [5.0, 6.0, 6.0])
+
+        # group similar scenarios
+        coordinates = dict((name, (i % 2, 0.0, 2.0 * (i % 2)))
+                           for i, name in enumerate(names))
+        scenario_tree.create_automatic_bundles(
+            2, scenario_coordinates=coordinates)
+        self.assertEqual(sorted(self._get_bundles(scenario_tree)),
+                         [names[0::2], names[1::2]])
+
+    def test_automatic_bundles_nonumpy(self):
+        tree_structure = pyomo.pysp.scenariotree.tree_structure
+        numpy_available = tree_structure.numpy_available
+        tree_structure.numpy_available = False
+        try:
+            self.test_automatic_bundles()
+        finally:
+            tree_structure.numpy_available = numpy_available
+
 @unittest.skipIf(not has_networkx, "Requires networkx module")
 class TestScenarioTreeFromNetworkX(unittest.TestCase):
 
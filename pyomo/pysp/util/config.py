@@ -779,7 +779,30 @@ safe_declare_unique_option(
             "process and performs all scenario tree operations "
             "sequentially. If 'pyro' is specified, the scenario tree "
             "is fully distributed and scenario tree operations are "
-            "performed asynchronously."
+            "performed asynchronously. If 'multiprocessing' is "
+            "specified, the scenario tree is distributed over "
+            "processes launched on the local machine (see the "
+            "scenario_tree_processes option), which does not require "
+            "a Pyro nameserver or dispatcher."
+        ),
+        doc=None,
+        visibility=0),
+    ap_group=_scenario_tree_options_group_title)
+
+safe_declare_unique_option(
+    common_block,
+    "scenario_tree_processes",
+    PySPConfigValue(
+        0,
+        domain=_domain_nonnegative_integer,
+        description=(
+            "Set the number of local scenario tree server processes "
+            "launched when the 'multiprocessing' scenario tree manager "
+            "is selected. Scenarios (or bundles) are distributed "
+            "evenly over the processes. The default value of 0 "
+            "indicates that one process should be launched for each "
+            "scenario (or bundle), up to the number of CPUs on the "
+            "machine."
         ),
         doc=None,
         visibility=0),
@@ -1996,6 +2019,28 @@ safe_declare_unique_option(
         visibility=0),
     ap_group=_other_options_group_title)
 
+safe_declare_unique_option(
+    common_block,
+    "scenario_instance_cache",
+    PySPConfigValue(
+        None,
+        domain=_domain_must_be_str,
+        description=(
+            "The name of a directory used to store a snapshot of the "
+            "first scenario instance constructed from an abstract "
+            "reference model. Each remaining scenario is created by "
+            "cloning the snapshot and updating the mutable parameters "
+            "whose data differs, falling back to a full construction "
+            "when any other data differs. This is only valid when "
+            "those parameter values are not used to build the model "
+            "structure (e.g., sets, bounds, or other parameters). The "
+            "snapshot is reused across runs while the model and data "
+            "files are unchanged."
+        ),
+        doc=None,
+        visibility=0),
+    ap_group=_other_options_group_title)
+
 #
 # Deprecated command-line option names
 # (DO NOT REGISTER THEM OUTSIDE OF THIS FILE)
@@ -146,6 +146,20 @@ def _get_bound(exp):
         return value(exp)
     raise ValueError("non-fixed bound or weight: " + str(exp))
 
+
+def _bound_line(L, U):
+    """Returns the "b" segment line for a variable with bounds L and U"""
+    if L is not None:
+        if U is not None:
+            if L == U:
+                return "4 %r\n" % (L)
+            return "0 %r %r\n" % (L, U)
+        return "2 %r\n" % (L)
+    elif U is not None:
+        return "1 %r\n" % (U)
+    return "3\n"
+
+
 class StopWatch(object):
 
     def __init__(self):
@@ -1655,18 +1669,7 @@ class ProblemWriter_nl(AbstractProblemWriter):
                 U = None
                 if var.has_ub():
                     U = _get_bound(var.ub)
-            if L is not None:
-                if U is not None:
-                    if L == U:
-                        var_bound_list.append("4 %r\n" % (L))
-                    else:
-                        var_bound_list.append("0 %r %r\n" % (L, U))
-                else:
-                    var_bound_list.append("2 %r\n" % (L))
-            elif U is not None:
-                var_bound_list.append("1 %r\n" % (U))
-            else:
-                var_bound_list.append("3\n")
+            var_bound_list.append(_bound_line(L, U))
 
         OUTPUT.write("x%d" % (len(x_init_list)))
         if symbolic_solver_labels:
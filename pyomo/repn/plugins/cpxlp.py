@@ -198,8 +198,6 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
           x: A Pyomo canonical expression to write in LP format
         """
         assert (not force_objective_constant) or (is_objective)
-        linear_coef_string_template = self.linear_coef_string_template
-        quad_coef_string_template = self.quad_coef_string_template
 
         constant=True
         #
@@ -207,102 +205,23 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
         #
         if len(x.linear_vars) > 0:
             constant=False
-            for vardata in x.linear_vars:
-                self._referenced_variable_ids[id(vardata)] = vardata
-
-            if column_order is None:
-                #
-                # Order columns by dictionary names
-                #
-                names = [variable_symbol_dictionary[id(var)] for var in x.linear_vars]
-                    
-                for i, name in sorted(enumerate(names), key=lambda x: x[1]):
-                    output.append(linear_coef_string_template % (x.linear_coefs[i], name))
-            else:
-                #
-                # Order columns by the value of column_order[]
-                #
-                for i, var in sorted(enumerate(x.linear_vars), key=lambda x: column_order[x[1]]):
-                    name = variable_symbol_dictionary[id(var)]
-                    output.append(linear_coef_string_template % (x.linear_coefs[i], name))
+            self._print_linear_terms(x,
+                                     output,
+                                     variable_symbol_dictionary,
+                                     column_order)
         #
         # Quadratic
         #
         if len(x.quadratic_vars) > 0:
             constant=False
-            for var1, var2 in x.quadratic_vars:
-                self._referenced_variable_ids[id(var1)] = var1
-                self._referenced_variable_ids[id(var2)] = var2
 
             output.append("+ [\n")
 
-            if column_order is None:
-                #
-                # Order columns by dictionary names
-                #
-                quad = set()
-                names = []
-                i = 0
-                for var1, var2 in x.quadratic_vars:
-                    name1 = variable_symbol_dictionary[id(var1)]
-                    name2 = variable_symbol_dictionary[id(var2)]
-                    if name1 < name2:
-                        names.append( (name1,name2) )
-                    elif name1 > name2:
-                        names.append( (name2,name1) )
-                    else:
-                        quad.add(i)
-                        names.append( (name1,name1) )
-                    i += 1
-                for i, names_ in sorted(enumerate(names), key=lambda x: x[1]):
-                    #
-                    # Times 2 because LP format requires /2 for all the quadratic
-                    # terms /of the objective only/.  Discovered the last bit thru
-                    # trial and error.  Obnoxious.
-                    # Ref: ILog CPlex 8.0 User's Manual, p197.
-                    #
-                    if is_objective:
-                        tmp = 2*x.quadratic_coefs[i]
-                        output.append(quad_coef_string_template % tmp)
-                    else:
-                        output.append(quad_coef_string_template % x.quadratic_coefs[i])
-                    if i in quad:
-                        output.append("%s ^ 2\n" % (names_[0]))
-                    else:
-                        output.append("%s * %s\n" % (names_[0], names_[1]))
-            else:
-                #
-                # Order columns by the value of column_order[]
-                #
-                quad = set()
-                cols = []
-                i = 0
-                for var1, var2 in x.quadratic_vars:
-                    col1 = column_order[var1]
-                    col2 = column_order[var2]
-                    if col1 < col2:
-                        cols.append( (((col1,col2) , variable_symbol_dictionary[id(var1)], variable_symbol_dictionary[id(var2)])) )
-                    elif col1 > col2:
-                        cols.append( (((col2,col1) , variable_symbol_dictionary[id(var2)], variable_symbol_dictionary[id(var1)])) )
-                    else:
-                        quad.add(i)
-                        cols.append( ((col1,col1), variable_symbol_dictionary[id(var1)]) )
-                    i += 1
-                for i, cols_ in sorted(enumerate(cols), key=lambda x: x[1][0]):
-                    #
-                    # Times 2 because LP format requires /2 for all the quadratic
-                    # terms /of the objective only/.  Discovered the last bit thru
-                    # trial and error.  Obnoxious.
-                    # Ref: ILog CPlex 8.0 User's Manual, p197.
-                    #
-                    if is_objective:
-                        output.append(quad_coef_string_template % 2*x.quadratic_coefs[i])
-                    else:
-                        output.append(quad_coef_string_template % x.quadratic_coefs[i])
-                    if i in quad:
-                        output.append("%s ^ 2\n" % cols_[1])
-                    else:
-                        output.append("%s * %s\n" % (cols_[1], cols_[2]))
+            self._print_quadratic_terms(x,
+                                        output,
+                                        variable_symbol_dictionary,
+                                        is_objective,
+                                        column_order)
 
             output.append("]")
 
@@ -320,7 +239,7 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
             # constraint for the benefit of solvers like
             # Glpk that cannot parse an LP file without
             # a variable on the left hand side.
-            output.append(linear_coef_string_template % (0, 'ONE_VAR_CONSTANT'))
+            output.append(self.linear_coef_string_template % (0, 'ONE_VAR_CONSTANT'))
 
         #
         # Constant offset
@@ -336,6 +255,120 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
         #
         return x.constant
 
+    def _print_linear_terms(self,
+                            x,
+                            output,
+                            variable_symbol_dictionary,
+                            column_order):
+        """
+        Print the linear terms of a Pyomo canonical expression in LP
+        format, one term per line.
+        """
+        linear_coef_string_template = self.linear_coef_string_template
+
+        for vardata in x.linear_vars:
+            self._referenced_variable_ids[id(vardata)] = vardata
+
+        if column_order is None:
+            #
+            # Order columns by dictionary names
+            #
+            names = [variable_symbol_dictionary[id(var)] for var in x.linear_vars]
+                
+            for i, name in sorted(enumerate(names), key=lambda x: x[1]):
+                output.append(linear_coef_string_template % (x.linear_coefs[i], name))
+        else:
+            #
+            # Order columns by the value of column_order[]
+            #
+            for i, var in sorted(enumerate(x.linear_vars), key=lambda x: column_order[x[1]]):
+                name = variable_symbol_dictionary[id(var)]
+                output.append(linear_coef_string_template % (x.linear_coefs[i], name))
+
+    def _print_quadratic_terms(self,
+                               x,
+                               output,
+                               variable_symbol_dictionary,
+                               is_objective,
+                               column_order):
+        """
+        Print the quadratic terms of a Pyomo canonical expression in
+        LP format, one term per line, without the enclosing brackets.
+        """
+        quad_coef_string_template = self.quad_coef_string_template
+
+        for var1, var2 in x.quadratic_vars:
+            self._referenced_variable_ids[id(var1)] = var1
+            self._referenced_variable_ids[id(var2)] = var2
+
+        if column_order is None:
+            #
+            # Order columns by dictionary names
+            #
+            quad = set()
+            names = []
+            i = 0
+            for var1, var2 in x.quadratic_vars:
+                name1 = variable_symbol_dictionary[id(var1)]
+                name2 = variable_symbol_dictionary[id(var2)]
+                if name1 < name2:
+                    names.append( (name1,name2) )
+                elif name1 > name2:
+                    names.append( (name2,name1) )
+                else:
+                    quad.add(i)
+                    names.append( (name1,name1) )
+                i += 1
+            for i, names_ in sorted(enumerate(names), key=lambda x: x[1]):
+                #
+                # Times 2 because LP format requires /2 for all the quadratic
+                # terms /of the objective only/.  Discovered the last bit thru
+                # trial and error.  Obnoxious.
+                # Ref: ILog CPlex 8.0 User's Manual, p197.
+                #
+                if is_objective:
+                    tmp = 2*x.quadratic_coefs[i]
+                    output.append(quad_coef_string_template % tmp)
+                else:
+                    output.append(quad_coef_string_template % x.quadratic_coefs[i])
+                if i in quad:
+                    output.append("%s ^ 2\n" % (names_[0]))
+                else:
+                    output.append("%s * %s\n" % (names_[0], names_[1]))
+        else:
+            #
+            # Order columns by the value of column_order[]
+            #
+            quad = set()
+            cols = []
+            i = 0
+            for var1, var2 in x.quadratic_vars:
+                col1 = column_order[var1]
+                col2 = column_order[var2]
+                if col1 < col2:
+                    cols.append( (((col1,col2) , variable_symbol_dictionary[id(var1)], variable_symbol_dictionary[id(var2)])) )
+                elif col1 > col2:
+                    cols.append( (((col2,col1) , variable_symbol_dictionary[id(var2)], variable_symbol_dictionary[id(var1)])) )
+                else:
+                    quad.add(i)
+                    cols.append( ((col1,col1), variable_symbol_dictionary[id(var1)]) )
+                i += 1
+            for i, cols_ in sorted(enumerate(cols), key=lambda x: x[1][0]):
+                #
+                # Times 2 because LP format requires /2 for all the quadratic
+                # terms /of the objective only/.  Discovered the last bit thru
+                # trial and error.  Obnoxious.
+                # Ref: ILog CPlex 8.0 User's Manual, p197.
+                #
+                if is_objective:
+                    output.append(quad_coef_string_template % 2*x.quadratic_coefs[i])
+                else:
+                    output.append(quad_coef_string_template % x.quadratic_coefs[i])
+                if i in quad:
+                    output.append("%s ^ 2\n" % cols_[1])
+                else:
+                    output.append("%s * %s\n" % (cols_[1], cols_[2]))
+
     def printSOS(self,
                  symbol_map,
                  labeler,
@@ -377,6 +410,170 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                               % (variable_symbol_map.getSymbol(vardata),
                                  weight))
 
+    def _print_constraint(self,
+                          constraint_data,
+                          repn,
+                          con_symbol,
+                          output,
+                          object_symbol_dictionary,
+                          variable_symbol_dictionary,
+                          column_order,
+                          symbol_map=None):
+        """
+        Print the LP rows for a constraint, given the canonical
+        representation of its body. If a symbol map is provided, the
+        row labels are added to it as aliases of the constraint.
+        """
+        if constraint_data.equality:
+            assert value(constraint_data.lower) == \
+                value(constraint_data.upper)
+            label = 'c_e_%s_' % con_symbol
+            if symbol_map is not None:
+                symbol_map.alias(constraint_data, label)
+            output.append(label)
+            output.append(':\n')
+            offset = self._print_expr_canonical(repn,
+                                                output,
+                                                object_symbol_dictionary,
+                                                variable_symbol_dictionary,
+                                                False,
+                                                column_order)
+            bound = constraint_data.lower
+            bound = _get_bound(bound) - offset
+            output.append(self.eq_string_template
+                              % (_no_negative_zero(bound)))
+            output.append("\n")
+        else:
+            if constraint_data.has_lb():
+                if constraint_data.has_ub():
+                    label = 'r_l_%s_' % con_symbol
+                else:
+                    label = 'c_l_%s_' % con_symbol
+                if symbol_map is not None:
+                    symbol_map.alias(constraint_data, label)
+                output.append(label)
+                output.append(':\n')
+                offset = self._print_expr_canonical(repn,
+                                                    output,
+                                                    object_symbol_dictionary,
+                                                    variable_symbol_dictionary,
+                                                    False,
+                                                    column_order)
+                bound = constraint_data.lower
+                bound = _get_bound(bound) - offset
+                output.append(self.geq_string_template
+                              % (_no_negative_zero(bound)))
+            else:
+                assert constraint_data.has_ub()
+
+            if constraint_data.has_ub():
+                if constraint_data.has_lb():
+                    label = 'r_u_%s_' % con_symbol
+                else:
+                    label = 'c_u_%s_' % con_symbol
+                if symbol_map is not None:
+                    symbol_map.alias(constraint_data, label)
+                output.append(label)
+                output.append(':\n')
+                offset = self._print_expr_canonical(repn,
+                                                    output,
+                                                    object_symbol_dictionary,
+                                                    variable_symbol_dictionary,
+                                                    False,
+                                                    column_order)
+                bound = constraint_data.upper
+                bound = _get_bound(bound) - offset
+                output.append(self.leq_string_template
+                              % (_no_negative_zero(bound)))
+            else:
+                assert constraint_data.has_lb()
+
+    def _print_bounds(self,
+                      variable_list,
+                      variable_symbol_dictionary,
+                      output,
+                      model_name,
+                      output_fixed_variable_bounds=False,
+                      include_all_variable_bounds=False):
+        """
+        Print the bounds section entries for the variables in
+        variable_list that were referenced by the rows written so far
+        (or all of them when include_all_variable_bounds is True).
+        Returns the names of the integer and binary variables, in the
+        order they were written.
+        """
+        integer_vars = []
+        binary_vars = []
+        for vardata in variable_list:
+
+            # TODO: We could just loop over the set of items in
+            #       self._referenced_variable_ids, except this is
+            #       a dictionary that is hashed by id(vardata)
+            #       which would make the bounds section
+            #       nondeterministic (bad for unit testing)
+            if (not include_all_variable_bounds) and \
+               (id(vardata) not in self._referenced_variable_ids):
+                continue
+
+            name_to_output = variable_symbol_dictionary[id(vardata)]
+            if name_to_output == "e":
+                raise ValueError(
+                    "Attempting to write variable with name 'e' in a CPLEX LP "
+                    "formatted file will cause a parse failure due to confusion with "
+                    "numeric values expressed in scientific notation")
+
+            # track the number of integer and binary variables, so we know whether
+            # to output the general / binary sections below.
+            if vardata.is_binary():
+                binary_vars.append(name_to_output)
+            elif vardata.is_integer():
+                integer_vars.append(name_to_output)
+            elif not vardata.is_continuous():
+                raise TypeError("Invalid domain type for variable with name '%s'. "
+                                "Variable is not continuous, integer, or binary."
+                                % (vardata.name))
+
+            if vardata.fixed:
+                if not output_fixed_variable_bounds:
+                    raise ValueError(
+                        "Encountered a fixed variable (%s) inside an active "
+                        "objective or constraint expression on model %s, which is "
+                        "usually indicative of a preprocessing error. Use the "
+                        "IO-option 'output_fixed_variable_bounds=True' to suppress "
+                        "this error and fix the variable by overwriting its bounds "
+                        "in the LP file." % (vardata.name, model_name))
+                if vardata.value is None:
+                    raise ValueError("Variable cannot be fixed to a value of None.")
+                vardata_lb = value(vardata.value)
+                vardata_ub = value(vardata.value)
+
+                output.append("   ")
+                output.append(self.lb_string_template
+                                      % (_no_negative_zero(vardata_lb)))
+                output.append(name_to_output)
+                output.append(self.ub_string_template
+                                      % (_no_negative_zero(vardata_ub)))
+            else:
+                vardata_lb = _get_bound(vardata.lb)
+                vardata_ub = _get_bound(vardata.ub)
+
+                # Pyomo assumes that the default variable bounds are -inf and +inf
+                output.append("   ")
+                if vardata.has_lb():
+                    output.append(self.lb_string_template
+                                      % (_no_negative_zero(vardata_lb)))
+                else:
+                    output.append(" -inf <= ")
+
+                output.append(name_to_output)
+                if vardata.has_ub():
+                    output.append(self.ub_string_template
+                                      % (_no_negative_zero(vardata_ub)))
+                else:
+                    output.append(" <= +inf\n")
+
+        return integer_vars, binary_vars
+
     def _print_model_LP(self,
                         model,
                         output_file,
@@ -390,12 +587,6 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
                         force_objective_constant=False,
                         include_all_variable_bounds=False):
 
-        eq_string_template = self.eq_string_template
-        leq_string_template = self.leq_string_template
-        geq_string_template = self.geq_string_template
-        ub_string_template = self.ub_string_template
-        lb_string_template = self.lb_string_template
-
         symbol_map = SymbolMap()
         variable_symbol_map = SymbolMap()
         # NOTE: we use createSymbol instead of getSymbol because we
@@ -404,7 +595,6 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
         # cache frequently called functions
         create_symbol_func = SymbolMap.createSymbol
         create_symbols_func = SymbolMap.createSymbols
-        alias_symbol_func = SymbolMap.alias
         variable_label_pairs = []
 
         # populate the symbol map in a single pass.
@@ -641,66 +831,14 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
             # Create symbol
             con_symbol = create_symbol_func(symbol_map, constraint_data, labeler)
 
-            if constraint_data.equality:
-                assert value(constraint_data.lower) == \
-                    value(constraint_data.upper)
-                label = 'c_e_%s_' % con_symbol
-                alias_symbol_func(symbol_map, constraint_data, label)
-                output.append(label)
-                output.append(':\n')
-                offset = print_expr_canonical(repn,
-                                              output,
-                                              object_symbol_dictionary,
-                                              variable_symbol_dictionary,
-                                              False,
-                                              column_order)
-                bound = constraint_data.lower
-                bound = _get_bound(bound) - offset
-                output.append(eq_string_template
-                                  % (_no_negative_zero(bound)))
-                output.append("\n")
-            else:
-                if constraint_data.has_lb():
-                    if constraint_data.has_ub():
-                        label = 'r_l_%s_' % con_symbol
-                    else:
-                        label = 'c_l_%s_' % con_symbol
-                    alias_symbol_func(symbol_map, constraint_data, label)
-                    output.append(label)
-                    output.append(':\n')
-                    offset = print_expr_canonical(repn,
-                                                  output,
-                                                  object_symbol_dictionary,
-                                                  variable_symbol_dictionary,
-                                                  False,
-                                                  column_order)
-                    bound = constraint_data.lower
-                    bound = _get_bound(bound) - offset
-                    output.append(geq_string_template
-                                      % (_no_negative_zero(bound)))
-                else:
-                    assert constraint_data.has_ub()
-
-                if constraint_data.has_ub():
-                    if constraint_data.has_lb():
-                        label = 'r_u_%s_' % con_symbol
-                    else:
-                        label = 'c_u_%s_' % con_symbol
-                    alias_symbol_func(symbol_map, constraint_data, label)
-                    output.append(label)
-                    output.append(':\n')
-                    offset = print_expr_canonical(repn,
-                                                  output,
-                                                  object_symbol_dictionary,
-                                                  variable_symbol_dictionary,
-                                                  False,
-                                                  column_order)
-                    bound = constraint_data.upper
-                    bound = _get_bound(bound) - offset
-                    output.append(leq_string_template
-                                      % (_no_negative_zero(bound)))
-                else:
-                    assert constraint_data.has_lb()
+            self._print_constraint(constraint_data,
+                                   repn,
+                                   con_symbol,
+                                   output,
+                                   object_symbol_dictionary,
+                                   variable_symbol_dictionary,
+                                   column_order,
+                                   symbol_map=symbol_map)
 
             # A simple hack to avoid caching super large files
             if len(output) > 1024:
@@ -780,75 +918,13 @@ class ProblemWriter_cpxlp(AbstractProblemWriter):
 
         # Track the number of integer and binary variables, so you can
         # output their status later.
-        integer_vars = []
-        binary_vars = []
-        for vardata in variable_list:
-
-            # TODO: We could just loop over the set of items in
-            #       self._referenced_variable_ids, except this is
-            #       a dictionary that is hashed by id(vardata)
-            #       which would make the bounds section
-            #       nondeterministic (bad for unit testing)
-            if (not include_all_variable_bounds) and \
-               (id(vardata) not in self._referenced_variable_ids):
-                continue
-
-            name_to_output = variable_symbol_dictionary[id(vardata)]
-            if name_to_output == "e":
-                raise ValueError(
-                    "Attempting to write variable with name 'e' in a CPLEX LP "
-                    "formatted file will cause a parse failure due to confusion with "
-                    "numeric values expressed in scientific notation")
-
-            # track the number of integer and binary variables, so we know whether
-            # to output the general / binary sections below.
-            if vardata.is_binary():
-                binary_vars.append(name_to_output)
-            elif vardata.is_integer():
-                integer_vars.append(name_to_output)
-            elif not vardata.is_continuous():
-                raise TypeError("Invalid domain type for variable with name '%s'. "
-                                "Variable is not continuous, integer, or binary."
-                                % (vardata.name))
-
-            if vardata.fixed:
-                if not output_fixed_variable_bounds:
-                    raise ValueError(
-                        "Encountered a fixed variable (%s) inside an active "
-                        "objective or constraint expression on model %s, which is "
-                        "usually indicative of a preprocessing error. Use the "
-                        "IO-option 'output_fixed_variable_bounds=True' to suppress "
-                        "this error and fix the variable by overwriting its bounds "
-                        "in the LP file." % (vardata.name, model.name))
-                if vardata.value is None:
-                    raise ValueError("Variable cannot be fixed to a value of None.")
-                vardata_lb = value(vardata.value)
-                vardata_ub = value(vardata.value)
-
-                output.append("   ")
-                output.append(lb_string_template
-                                      % (_no_negative_zero(vardata_lb)))
-                output.append(name_to_output)
-                output.append(ub_string_template
-                                      % (_no_negative_zero(vardata_ub)))
-            else:
-                vardata_lb = _get_bound(vardata.lb)
-                vardata_ub = _get_bound(vardata.ub)
-
-                # Pyomo assumes that the default variable bounds are -inf and +inf
-                output.append("   ")
-                if vardata.has_lb():
-                    output.append(lb_string_template
-                                      % (_no_negative_zero(vardata_lb)))
-                else:
-                    output.append(" -inf <= ")
-
-                output.append(name_to_output)
-                if vardata.has_ub():
-                    output.append(ub_string_template
-                                      % (_no_negative_zero(vardata_ub)))
-                else:
-                    output.append(" <= +inf\n")
+        integer_vars, binary_vars = self._print_bounds(
+            variable_list,
+            variable_symbol_dictionary,
+            output,
+            model.name,
+            output_fixed_variable_bounds=output_fixed_variable_bounds,
+            include_all_variable_bounds=include_all_variable_bounds)
 
         if len(integer_vars) > 0:
 
@@ -102,8 +102,7 @@ class ASL(SystemCallSolver):
         #
         solver_name = os.path.basename(self.options.solver)
         if self._log_file is None:
-            self._log_file = pyutilib.services.TempfileManager.\
-                             create_tempfile(suffix="_%s.log" % solver_name)
+            self._log_file = self._create_tempfile(suffix="_%s.log" % solver_name)
 
         #
         # Define solution file
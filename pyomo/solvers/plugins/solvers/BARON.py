@@ -219,18 +219,15 @@ class BARONSHELL(SystemCallSolver):
         # Define log file
         #
         if self._log_file is None:
-            self._log_file = pyutilib.services.TempfileManager.\
-                            create_tempfile(suffix = '.baron.log')
+            self._log_file = self._create_tempfile(suffix = '.baron.log')
 
         #
         # Define solution file
         #
         if self._soln_file is None:
-            self._soln_file = pyutilib.services.TempfileManager.\
-                              create_tempfile(suffix = '.baron.soln')
+            self._soln_file = self._create_tempfile(suffix = '.baron.soln')
 
-        self._tim_file = pyutilib.services.TempfileManager.\
-                         create_tempfile(suffix = '.baron.tim')
+        self._tim_file = self._create_tempfile(suffix = '.baron.tim')
 
         #
         # Create options to send through as io_options
@@ -57,6 +57,50 @@ def configure_cbc():
         _cbc_old_version = _cbc_version < (2,7,0,0)
 
 
+def _cbc_value(value):
+    value = float(value)
+    if abs(value) >= 1e50:
+        return None
+    return value
+
+
+class CBCLogProgressParser(LogProgressParser):
+    """
+    Parses the branch-and-bound progress messages in the CBC log.
+    """
+
+    _node_re = re.compile(r'Cbc0010I After (\d+) nodes, \d+ on tree, '
+                          r'(\S+) best solution, best possible (\S+)')
+    _solution_re = re.compile(r'Cbc00(?:04|12|16)I Integer solution of '
+                              r'(\S+) found.* after (\d+) iterations '
+                              r'and (\d+) nodes')
+
+    def __init__(self):
+        self._incumbent = None
+        self._bound = None
+
+    def __call__(self, line):
+        m = self._node_re.search(line)
+        if m is not None:
+            self._incumbent = _cbc_value(m.group(2))
+            self._bound = _cbc_value(m.group(3))
+            return SolverProgress(
+                nodes=int(m.group(1)),
+                incumbent=self._incumbent,
+                bound=self._bound,
+                gap=self.relative_gap(self._incumbent, self._bound))
+        m = self._solution_re.search(line)
+        if m is not None:
+            self._incumbent = _cbc_value(m.group(1))
+            return SolverProgress(
+                iteration=int(m.group(2)),
+                nodes=int(m.group(3)),
+                incumbent=self._incumbent,
+                bound=self._bound,
+                gap=self.relative_gap(self._incumbent, self._bound))
+        return None
+
+
 @SolverFactory.register('cbc', doc='The CBC LP/MIP solver')
 class CBC(OptSolver):
     """The CBC LP/MIP solver
@@ -190,6 +234,9 @@ class CBCSHELL(SystemCallSolver):
             return None
         return executable.get_path()
 
+    def _create_progress_parser(self):
+        return CBCLogProgressParser()
+
     def _get_version(self):
         """
         Returns a tuple describing the solver executable version.
@@ -203,7 +250,7 @@ class CBCSHELL(SystemCallSolver):
         # Define the log file
         #
         if self._log_file is None:
-            self._log_file = pyutilib.services.TempfileManager.create_tempfile(suffix=".cbc.log")
+            self._log_file = self._create_tempfile(suffix=".cbc.log")
 
         #
         # Define the solution file
@@ -89,8 +89,7 @@ class CONOPT(SystemCallSolver):
         # Define log file
         #
         if self._log_file is None:
-            self._log_file = pyutilib.services.TempfileManager.\
-                             create_tempfile(suffix="_conopt.log")
+            self._log_file = self._create_tempfile(suffix="_conopt.log")
 
         fname = problem_files[0]
         if '.' in fname:
@@ -67,6 +67,50 @@ _validate_file_name.illegal_characters = re.compile(
     '[^%s]' % (_validate_file_name.allowed_characters,))
 
 
+class CPLEXLogProgressParser(LogProgressParser):
+    """
+    Parses the simplex iteration and node log lines in the CPLEX log.
+    """
+
+    _iteration_re = re.compile(r'Iteration:\s+(\d+)\s+.*objective\s+=\s+(\S+)')
+
+    def __call__(self, line):
+        m = self._iteration_re.search(line)
+        if m is not None:
+            try:
+                return SolverProgress(iteration=int(m.group(1)),
+                                      objective=float(m.group(2)))
+            except ValueError:
+                return None
+        #
+        # Node log lines end with the gap, e.g.,
+        #   *    15     8      integral     0       11.0000       14.0000       35   27.27%
+        # The ItCnt column is omitted on heuristic solution lines.
+        #
+        tokens = line.split()
+        if (len(tokens) < 4) or (not tokens[-1].endswith('%')):
+            return None
+        if tokens[0] == '*':
+            tokens = tokens[1:]
+        try:
+            nodes = int(tokens[0].strip('*+'))
+            gap = float(tokens[-1][:-1]) / 100.0
+            try:
+                int(tokens[-2])
+            except ValueError:
+                bound = float(tokens[-2])
+                incumbent = float(tokens[-3])
+            else:
+                bound = float(tokens[-3])
+                incumbent = float(tokens[-4])
+        except (ValueError, IndexError):
+            return None
+        return SolverProgress(nodes=nodes,
+                              incumbent=incumbent,
+                              bound=bound,
+                              gap=gap)
+
+
 @SolverFactory.register('cplex', doc='The CPLEX LP/MIP solver')
 class CPLEX(OptSolver):
     """The CPLEX LP/MIP solver
@@ -230,8 +274,7 @@ class CPLEXSHELL(ILMLicensedSystemCallSolver):
             # and the warm start file-name is (obviously) needed there.
             if self._warm_start_file_name is None:
                 assert not user_warmstart
-                self._warm_start_file_name = pyutilib.services.TempfileManager.\
-                                             create_tempfile(suffix = '.cplex.mst')
+                self._warm_start_file_name = self._create_tempfile(suffix = '.cplex.mst')
 
         # let the base class handle any remaining keywords/actions.
         ILMLicensedSystemCallSolver._presolve(self, *args, **kwds)
@@ -268,6 +311,9 @@ class CPLEXSHELL(ILMLicensedSystemCallSolver):
             return None
         return executable.get_path()
 
+    def _create_progress_parser(self):
+        return CPLEXLogProgressParser()
+
     def _get_version(self):
         """
         Returns a tuple describing the solver executable version.
@@ -285,8 +331,7 @@ class CPLEXSHELL(ILMLicensedSystemCallSolver):
         # The log file in CPLEX contains the solution trace, but the solver status can be found in the solution file.
         #
         if self._log_file is None:
-            self._log_file = pyutilib.services.TempfileManager.\
-                            create_tempfile(suffix = '.cplex.log')
+            self._log_file = self._create_tempfile(suffix = '.cplex.log')
         self._log_file = _validate_file_name(self, self._log_file, "log")
 
         #
@@ -294,8 +339,7 @@ class CPLEXSHELL(ILMLicensedSystemCallSolver):
         # As indicated above, contains (in XML) both the solution and solver status.
         #
         if self._soln_file is None:
-            self._soln_file = pyutilib.services.TempfileManager.\
-                              create_tempfile(suffix = '.cplex.sol')
+            self._soln_file = self._create_tempfile(suffix = '.cplex.sol')
         self._soln_file = _validate_file_name(self, self._soln_file, "solution")
 
         #
@@ -338,8 +382,7 @@ class CPLEXSHELL(ILMLicensedSystemCallSolver):
         # dump the script and warm-start file names for the
         # user if we're keeping files around.
         if self._keepfiles:
-            script_fname = pyutilib.services.TempfileManager.\
-                           create_tempfile(suffix = '.cplex.script')
+            script_fname = self._create_tempfile(suffix = '.cplex.script')
             tmp = open(script_fname,'w')
             tmp.write(script)
             tmp.close()
@@ -10,7 +10,7 @@
 
 from six import StringIO, iteritems, string_types
 from tempfile import mkdtemp
-import os, sys, math, logging, shutil, time
+import os, sys, math, logging, shutil, time, threading
 
 from pyomo.core.base import Constraint, Var, value, Objective
 from pyomo.opt import ProblemFormat, SolverFactory
@@ -36,6 +36,65 @@ logger = logging.getLogger('pyomo.solvers')
 
 pyomo.common.register_executable(name="gams")
 
+class _GamsWorkspacePool(object):
+    """
+    A bounded pool of GAMS workspaces that are reused across GAMSDirect
+    solves.
+
+    Creating a workspace starts the GAMS system (to locate it, query
+    its version and check the license), which dominates the time of
+    short solves.  A workspace is retired after max_jobs jobs (its
+    working directory, which holds the files of all of its jobs, is
+    removed with it), and it is discarded when its working directory
+    no longer exists.  Workspaces are only returned to the pool after a
+    successful solve.
+    """
+
+    def __init__(self, max_size=4, max_jobs=100, factory=None):
+        self.max_size = max_size
+        self.max_jobs = max_jobs
+        self._factory = factory
+        # (workspace, number of jobs run) tuples
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._idle)
+
+    def _new_workspace(self):
+        if self._factory is not None:
+            return self._factory()
+        from gams import GamsWorkspace, DebugLevel
+        return GamsWorkspace(debug=DebugLevel.Off)
+
+    @staticmethod
+    def _healthy(ws):
+        return os.path.isdir(ws.working_directory)
+
+    def acquire(self):
+        """Returns a (workspace, number of jobs run) tuple"""
+        with self._lock:
+            while self._idle:
+                ws, njobs = self._idle.pop()
+                if self._healthy(ws):
+                    return ws, njobs
+        return self._new_workspace(), 0
+
+    def release(self, ws, njobs):
+        """Returns a workspace that has run njobs jobs to the pool"""
+        if njobs >= self.max_jobs or not self._healthy(ws):
+            return
+        with self._lock:
+            if len(self._idle) < self.max_size:
+                self._idle.append((ws, njobs))
+
+    def clear(self):
+        """Discard all idle workspaces"""
+        with self._lock:
+            del self._idle[:]
+
+_workspace_pool = _GamsWorkspacePool()
+
 class _GAMSSolver(object):
     """Aggregate of common methods for GAMS interfaces"""
 
@@ -161,9 +220,9 @@ class GAMSDirect(_GAMSSolver):
         """Returns a tuple describing the solver executable version."""
         if not self.available(exception_flag=False):
             return _extract_version('')
-        from gams import GamsWorkspace
-        ws = GamsWorkspace()
+        ws, njobs = _workspace_pool.acquire()
         version = tuple(int(i) for i in ws._version.split('.'))
+        _workspace_pool.release(ws, njobs)
         while(len(version) < 4):
             version += (0,)
         version = version[:4]
@@ -191,6 +250,10 @@ class GAMSDirect(_GAMSSolver):
             By default uses the system default temporary path.
         report_timing=False: bool
             Print timing reports for presolve, solver, postsolve, etc.
+        reuse_workspace=True: bool
+            Run the model in a GAMS workspace reused from earlier
+            solves, instead of starting a new workspace.  This is
+            ignored when keepfiles or tmpdir are specified.
         io_options: dict
             Options that get passed to the writer.
             See writer in pyomo.repn.plugins.gams_writer for details.
@@ -219,6 +282,7 @@ class GAMSDirect(_GAMSSolver):
         keepfiles      = options.pop("keepfiles", False)
         tmpdir         = options.pop("tmpdir", None)
         report_timing  = options.pop("report_timing", False)
+        reuse_workspace = options.pop("reuse_workspace", True)
         io_options     = options.pop("io_options", {})
 
         # Pass remaining keywords to writer, which will handle
@@ -266,9 +330,13 @@ class GAMSDirect(_GAMSSolver):
         if tmpdir is not None and os.path.exists(tmpdir):
             newdir = False
 
-        ws = GamsWorkspace(debug=DebugLevel.KeepFiles if keepfiles
-                           else DebugLevel.Off,
-                           working_directory=tmpdir)
+        pooled = reuse_workspace and not keepfiles and tmpdir is None
+        if pooled:
+            ws, njobs = _workspace_pool.acquire()
+        else:
+            ws = GamsWorkspace(debug=DebugLevel.KeepFiles if keepfiles
+                               else DebugLevel.Off,
+                               working_directory=tmpdir)
 
         t1 = ws.add_job_from_string(output_file.getvalue())
 
@@ -511,6 +579,11 @@ class GAMSDirect(_GAMSSolver):
 
         results.solution.insert(soln)
 
+        if pooled:
+            # Release all references to t1.out_db before the workspace
+            # runs another job
+            t1 = rec = rec_lo = rec_hi = None
+            _workspace_pool.release(ws, njobs + 1)
         if keepfiles:
             print("\nGAMS WORKING DIRECTORY: %s\n" % ws.working_directory)
         elif tmpdir is not None:
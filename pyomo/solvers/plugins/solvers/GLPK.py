@@ -16,11 +16,11 @@ import csv
 import pyutilib.subprocess
 from pyutilib.misc import Bunch, Options
 from pyutilib.services import register_executable, registered_executable
-from pyutilib.services import TempfileManager
 
 from pyomo.opt import *
 from pyomo.opt.base.solvers import _extract_version
-from pyomo.opt.solver import SystemCallSolver
+from pyomo.opt.solver import SystemCallSolver, SolverProgress, \
+    LogProgressParser
 
 from six import iteritems, string_types
 
@@ -90,7 +90,7 @@ class GLPK(OptSolver):
             opt.set_problem_format(ProblemFormat.mps)
             return opt
         if mode == 'python':
-            opt = SolverFactory('_glpk_direct', **kwds)
+            opt = SolverFactory('glpk_direct', **kwds)
             if opt is None:
                 logger.error('Python API for GLPK is not installed')
                 return
@@ -105,6 +105,45 @@ class GLPK(OptSolver):
         return opt
 
 
+def _glpk_value(value):
+    if value in ('not found yet', 'tree is empty'):
+        return None
+    return float(value)
+
+
+class GLPKLogProgressParser(LogProgressParser):
+    """
+    Parses the simplex and branch-and-bound progress messages in the
+    glpsol log.
+    """
+
+    _mip_re = re.compile(r'^[+*]\s*(\d+): mip =\s+(not found yet|\S+)\s+'
+                         r'[<>]=\s+(tree is empty|\S+)\s*(?:(\S+)%)?\s*'
+                         r'\((\d+); (\d+)\)')
+    _simplex_re = re.compile(r'^[ *]\s*(\d+): obj =\s+(\S+)\s+'
+                             r'(?:inf|infeas) =')
+
+    def __call__(self, line):
+        m = self._mip_re.match(line)
+        if m is not None:
+            incumbent = _glpk_value(m.group(2))
+            bound = _glpk_value(m.group(3))
+            if m.group(4) is not None:
+                gap = float(m.group(4)) / 100.0
+            else:
+                gap = self.relative_gap(incumbent, bound)
+            return SolverProgress(iteration=int(m.group(1)),
+                                  nodes=int(m.group(6)),
+                                  incumbent=incumbent,
+                                  bound=bound,
+                                  gap=gap)
+        m = self._simplex_re.match(line)
+        if m is not None:
+            return SolverProgress(iteration=int(m.group(1)),
+                                  objective=float(m.group(2)))
+        return None
+
+
 @SolverFactory.register(
         '_glpk_shell',
         doc='Shell interface to the GNU Linear Programming Kit')
@@ -133,6 +172,10 @@ class GLPKSHELL(SystemCallSolver):
           ProblemFormat.mps:   ResultsFormat.soln,
         }
         self.set_problem_format(ProblemFormat.cpxlp)
+        # glpsol reads LP files in a single pass (and only writes its
+        # results to other files), so they can be written while the
+        # solver is running
+        self._pipeline_formats = [ProblemFormat.cpxlp]
 
         # Note: Undefined capabilities default to 'None'
         self._capabilities = Options()
@@ -152,6 +195,9 @@ class GLPKSHELL(SystemCallSolver):
             return None
         return executable.get_path()
 
+    def _create_progress_parser(self):
+        return GLPKLogProgressParser()
+
     def _get_version(self):
         """
         Returns a tuple describing the solver executable version.
@@ -165,13 +211,13 @@ class GLPKSHELL(SystemCallSolver):
         # Define log file
         #
         if self._log_file is None:
-            self._log_file = TempfileManager.create_tempfile(suffix='.glpk.log')
+            self._log_file = self._create_tempfile(suffix='.glpk.log')
 
         #
         # Define solution file
         #
-        self._glpfile = TempfileManager.create_tempfile(suffix='.glpk.glp')
-        self._rawfile = TempfileManager.create_tempfile(suffix='.glpk.raw')
+        self._glpfile = self._create_tempfile(suffix='.glpk.glp')
+        self._rawfile = self._create_tempfile(suffix='.glpk.raw')
         self._soln_file = self._rawfile
 
         #
@@ -16,7 +16,6 @@ import sys
 from pyutilib.common import ApplicationError
 from pyutilib.misc import Bunch, Options
 from pyutilib.services import register_executable, registered_executable
-from pyutilib.services import TempfileManager
 import pyutilib.subprocess
 
 from pyomo.opt.base import *
@@ -107,13 +106,13 @@ class GLPKSHELL_4_42(SystemCallSolver):
         # Define log file
         #
         if self._log_file is None:
-            self._log_file = TempfileManager.create_tempfile(suffix='.glpk.log')
+            self._log_file = self._create_tempfile(suffix='.glpk.log')
 
         #
         # Define solution file
         #
-        self._glpfile = TempfileManager.create_tempfile(suffix='.glpk.glp')
-        self._rawfile = TempfileManager.create_tempfile(suffix='.glpk.raw')
+        self._glpfile = self._create_tempfile(suffix='.glpk.glp')
+        self._rawfile = self._create_tempfile(suffix='.glpk.raw')
         self._soln_file = self._rawfile
 
         #
@@ -466,12 +465,12 @@ class GLPKSHELL_old(SystemCallSolver):
         # Define log file
         #
         if self._log_file is None:
-            self._log_file = TempfileManager.create_tempfile(suffix='.glpk.log')
+            self._log_file = self._create_tempfile(suffix='.glpk.log')
 
         #
         # Define solution file
         #
-        self._soln_file = TempfileManager.create_tempfile(suffix='.glpk.soln')
+        self._soln_file = self._create_tempfile(suffix='.glpk.soln')
 
         #
         # Define command line
@@ -216,8 +216,7 @@ class GUROBISHELL(ILMLicensedSystemCallSolver):
             # and the warm start file-name is (obviously) needed there.
             if self._warm_start_file_name is None:
                 assert not user_warmstart
-                self._warm_start_file_name = pyutilib.services.TempfileManager.\
-                                             create_tempfile(suffix = '.gurobi.mst')
+                self._warm_start_file_name = self._create_tempfile(suffix = '.gurobi.mst')
 
         # let the base class handle any remaining keywords/actions.
         ILMLicensedSystemCallSolver._presolve(self, *args, **kwds)
@@ -285,16 +284,14 @@ class GUROBISHELL(ILMLicensedSystemCallSolver):
         # The log file in CPLEX contains the solution trace, but the solver status can be found in the solution file.
         #
         if self._log_file is None:
-            self._log_file = pyutilib.services.TempfileManager.\
-                            create_tempfile(suffix = '.gurobi.log')
+            self._log_file = self._create_tempfile(suffix = '.gurobi.log')
 
         #
         # Define solution file
         # As indicated above, contains (in XML) both the solution and solver status.
         #
         if self._soln_file is None:
-            self._soln_file = pyutilib.services.TempfileManager.\
-                              create_tempfile(suffix = '.gurobi.txt')
+            self._soln_file = self._create_tempfile(suffix = '.gurobi.txt')
 
         #
         # Write the GUROBI execution script
@@ -336,7 +333,7 @@ class GUROBISHELL(ILMLicensedSystemCallSolver):
         # dump the script and warm-start file names for the
         # user if we're keeping files around.
         if self._keepfiles:
-            script_fname = pyutilib.services.TempfileManager.create_tempfile(suffix = '.gurobi.script')
+            script_fname = self._create_tempfile(suffix = '.gurobi.script')
             script_file = open(script_fname, 'w')
             script_file.write( script )
             script_file.close()
@@ -9,6 +9,7 @@
 #  ___________________________________________________________________________
 
 import os
+import re
 
 import pyomo.common
 import pyutilib.misc
@@ -27,6 +28,22 @@ except:
     basestring = str
 
 
+class IPOPTLogProgressParser(LogProgressParser):
+    """
+    Parses the iteration summary lines in the Ipopt log.
+    """
+
+    _iteration_re = re.compile(r'^\s*(\d+)r?\s+([-+]?\d\.\d+e[-+]\d+)\s+'
+                               r'(\d\.\d+e[-+]\d+)\s+(\d\.\d+e[-+]\d+)')
+
+    def __call__(self, line):
+        m = self._iteration_re.match(line)
+        if m is None:
+            return None
+        return SolverProgress(iteration=int(m.group(1)),
+                              objective=float(m.group(2)))
+
+
 @SolverFactory.register('ipopt', doc='The Ipopt NLP solver')
 class IPOPT(SystemCallSolver):
     """
@@ -69,6 +86,9 @@ class IPOPT(SystemCallSolver):
             return None
         return executable.get_path()
 
+    def _create_progress_parser(self):
+        return IPOPTLogProgressParser()
+
     def _get_version(self):
         """
         Returns a tuple describing the solver executable version.
@@ -88,8 +108,7 @@ class IPOPT(SystemCallSolver):
         # Define log file
         #
         if self._log_file is None:
-            self._log_file = pyutilib.services.TempfileManager.\
-                             create_tempfile(suffix="_ipopt.log")
+            self._log_file = self._create_tempfile(suffix="_ipopt.log")
 
         fname = problem_files[0]
         if '.' in fname:
@@ -170,8 +189,7 @@ class IPOPT(SystemCallSolver):
                                                 default_of_name))
 
             # Now write the new options file
-            options_filename = pyutilib.services.TempfileManager.\
-                               create_tempfile(suffix="_ipopt.opt")
+            options_filename = self._create_tempfile(suffix="_ipopt.opt")
             with open(options_filename, "w") as f:
                 for key, val in of_opt:
                     f.write(key+" "+str(val)+"\n")
@@ -150,8 +150,7 @@ class PICOSHELL(SystemCallSolver):
         # Define log file
         #
         if self._log_file is None:
-            self._log_file = pyutilib.services.TempfileManager.\
-                            create_tempfile(suffix="PICO.log")
+            self._log_file = self._create_tempfile(suffix="PICO.log")
 
         problem_filename_prefix = problem_files[0]
         if '.' in problem_filename_prefix:
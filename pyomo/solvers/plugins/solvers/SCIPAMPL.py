@@ -87,8 +87,7 @@ class SCIPAMPL(SystemCallSolver):
         # Define log file
         #
         if self._log_file is None:
-            self._log_file = pyutilib.services.TempfileManager.\
-                             create_tempfile(suffix="_scipampl.log")
+            self._log_file = self._create_tempfile(suffix="_scipampl.log")
 
         fname = problem_files[0]
         if '.' in fname:
@@ -156,8 +155,7 @@ class SCIPAMPL(SystemCallSolver):
                                % (default_of_name, default_of_name))
 
             # Now write the new options file
-            options_filename = pyutilib.services.TempfileManager.\
-                               create_tempfile(suffix="_scip.set")
+            options_filename = self._create_tempfile(suffix="_scip.set")
             with open(options_filename, "w") as f:
                 for line in of_opt:
                     f.write(line+"\n")
@@ -128,15 +128,13 @@ class XPRESS_shell(ILMLicensedSystemCallSolver):
         # The log file in XPRESS contains the solution trace, but the solver status can be found in the solution file.
         #
         if self._log_file is None:
-            self._log_file = pyutilib.services.TempfileManager.\
-                            create_tempfile(suffix = '.xpress.log')
+            self._log_file = self._create_tempfile(suffix = '.xpress.log')
 
         #
         # Define solution file
         # As indicated above, contains (in XML) both the solution and solver status.
         #
-        self._soln_file = pyutilib.services.TempfileManager.\
-                          create_tempfile(suffix = '.xpress.wrtsol')
+        self._soln_file = self._create_tempfile(suffix = '.xpress.wrtsol')
 
         #
         # Write the XPRESS execution script
@@ -178,7 +176,7 @@ class XPRESS_shell(ILMLicensedSystemCallSolver):
         # dump the script and warm-start file names for the
         # user if we're keeping files around.
         if self._keepfiles:
-            script_fname = pyutilib.services.TempfileManager.create_tempfile(suffix = '.xpress.script')
+            script_fname = self._create_tempfile(suffix = '.xpress.script')
             tmp = open(script_fname,'w')
             tmp.write(script)
             tmp.close()
@@ -15,6 +15,7 @@ import pyomo.solvers.plugins.solvers.CBCplugin
 import pyomo.solvers.plugins.solvers.GLPK
 import pyomo.solvers.plugins.solvers.GLPK_old
 import pyomo.solvers.plugins.solvers.glpk_direct
+import pyomo.solvers.plugins.solvers.glpk_persistent
 import pyomo.solvers.plugins.solvers.CPLEX
 import pyomo.solvers.plugins.solvers.GUROBI
 import pyomo.solvers.plugins.solvers.BARON
@@ -29,3 +30,4 @@ import pyomo.solvers.plugins.solvers.gurobi_persistent
 import pyomo.solvers.plugins.solvers.cplex_direct
 import pyomo.solvers.plugins.solvers.cplex_persistent
 import pyomo.solvers.plugins.solvers.GAMS
+import pyomo.solvers.plugins.solvers.ipopt_persistent
@@ -88,6 +88,7 @@ class CPLEXDirect(DirectSolver):
             self._python_api_exists = False
 
         self._range_constraints = set()
+        self._quadratic_constraints = set()
 
         self._max_constraint_degree = 2
         self._max_obj_degree = 2
@@ -253,6 +254,7 @@ class CPLEXDirect(DirectSolver):
         self._pyomo_var_to_ndx_map = ComponentMap()
         self._ndx_count = 0
         self._range_constraints = set()
+        self._quadratic_constraints = set()
         DirectOrPersistentSolver._set_instance(self, model, kwds)
         try:
             self._solver_model = self._cplex.Cplex()
@@ -353,6 +355,7 @@ class CPLEXDirect(DirectSolver):
                 sense=my_sense,
                 rhs=my_rhs[0],
                 name=conname)
+            self._quadratic_constraints.add(con)
 
         for var in referenced_vars:
             self._referenced_variables[var] += 1
@@ -713,70 +716,76 @@ class CPLEXDirect(DirectSolver):
         if vars_to_load is None:
             vars_to_load = var_map.keys()
 
+        vars_to_load = [var for var in vars_to_load if ref_vars[var] > 0]
         cplex_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
         vals = self._solver_model.solution.get_reduced_costs(cplex_vars_to_load)
 
-        for i, pyomo_var in enumerate(vars_to_load):
-            if ref_vars[pyomo_var] > 0:
-                rc[pyomo_var] = vals[i]
+        rc.update(zip(vars_to_load, vals))
 
-    def _load_duals(self, cons_to_load=None):
-        if not hasattr(self._pyomo_model, 'dual'):
-            self._pyomo_model.dual = Suffix(direction=Suffix.IMPORT)
+    def _get_cons_to_load(self, cons_to_load):
+        """
+        Split the constraints into linear and quadratic
+        constraints. Returns the pyomo constraints and the cplex
+        constraint names of each.
+        """
         con_map = self._pyomo_con_to_solver_con_map
         reverse_con_map = self._solver_con_to_pyomo_con_map
-        dual = self._pyomo_model.dual
-
         if cons_to_load is None:
-            linear_cons_to_load = self._solver_model.linear_constraints.get_names()
-            vals = self._solver_model.solution.get_dual_values()
+            linear_names = self._solver_model.linear_constraints.get_names()
+            linear_cons = [reverse_con_map[name] for name in linear_names]
+            quadratic_names = self._solver_model.quadratic_constraints.get_names()
+            quadratic_cons = [reverse_con_map[name] for name in quadratic_names]
         else:
-            cplex_cons_to_load = set([con_map[pyomo_con] for pyomo_con in cons_to_load])
-            linear_cons_to_load = cplex_cons_to_load.intersection(set(self._solver_model.linear_constraints.get_names()))
-            vals = self._solver_model.solution.get_dual_values(linear_cons_to_load)
+            linear_cons = []
+            quadratic_cons = []
+            for pyomo_con in cons_to_load:
+                if pyomo_con in self._quadratic_constraints:
+                    quadratic_cons.append(pyomo_con)
+                else:
+                    linear_cons.append(pyomo_con)
+            linear_names = [con_map[pyomo_con] for pyomo_con in linear_cons]
+            quadratic_names = [con_map[pyomo_con] for pyomo_con in quadratic_cons]
+        return linear_cons, linear_names, quadratic_cons, quadratic_names
+
+    def _load_duals(self, cons_to_load=None):
+        if not hasattr(self._pyomo_model, 'dual'):
+            self._pyomo_model.dual = Suffix(direction=Suffix.IMPORT)
+        dual = self._pyomo_model.dual
 
-        for i, cplex_con in enumerate(linear_cons_to_load):
-            pyomo_con = reverse_con_map[cplex_con]
-            dual[pyomo_con] = vals[i]
+        linear_cons, linear_names, _, _ = self._get_cons_to_load(cons_to_load)
+        if len(linear_cons) > 0:
+            vals = self._solver_model.solution.get_dual_values(linear_names)
+            dual.update(zip(linear_cons, vals))
 
     def _load_slacks(self, cons_to_load=None):
         if not hasattr(self._pyomo_model, 'slack'):
             self._pyomo_model.slack = Suffix(direction=Suffix.IMPORT)
-        con_map = self._pyomo_con_to_solver_con_map
-        reverse_con_map = self._solver_con_to_pyomo_con_map
         slack = self._pyomo_model.slack
 
-        if cons_to_load is None:
-            linear_cons_to_load = self._solver_model.linear_constraints.get_names()
-            linear_vals = self._solver_model.solution.get_linear_slacks()
-            quadratic_cons_to_load = self._solver_model.quadratic_constraints.get_names()
-            quadratic_vals = self._solver_model.solution.get_quadratic_slacks()
-        else:
-            cplex_cons_to_load = set([con_map[pyomo_con] for pyomo_con in cons_to_load])
-            linear_cons_to_load = cplex_cons_to_load.intersection(set(self._solver_model.linear_constraints.get_names()))
-            linear_vals = self._solver_model.solution.get_linear_slacks(linear_cons_to_load)
-            quadratic_cons_to_load = cplex_cons_to_load.intersection(set(self._solver_model.quadratic_constraints.get_names()))
-            quadratic_vals = self._solver_model.solution.get_quadratic_slacks(quadratic_cons_to_load)
-
-        for i, cplex_con in enumerate(linear_cons_to_load):
-            pyomo_con = reverse_con_map[cplex_con]
-            if pyomo_con in self._range_constraints:
-                R_ = self._solver_model.linear_constraints.get_range_values(cplex_con)
-                if R_ == 0:
-                    slack[pyomo_con] = linear_vals[i]
-                else:
-                    Ls_ = linear_vals[i]
-                    Us_ = R_ - Ls_
-                    if abs(Us_) > abs(Ls_):
-                        slack[pyomo_con] = Us_
-                    else:
-                        slack[pyomo_con] = -Ls_
-            else:
-                slack[pyomo_con] = linear_vals[i]
+        linear_cons, linear_names, quadratic_cons, quadratic_names = \
+            self._get_cons_to_load(cons_to_load)
+
+        if len(linear_cons) > 0:
+            linear_vals = self._solver_model.solution.get_linear_slacks(linear_names)
+            range_ndx = [i for i, pyomo_con in enumerate(linear_cons)
+                         if pyomo_con in self._range_constraints]
+            if len(range_ndx) > 0:
+                linear_vals = list(linear_vals)
+                range_vals = self._solver_model.linear_constraints.get_range_values(
+                    [linear_names[i] for i in range_ndx])
+                for i, R_ in zip(range_ndx, range_vals):
+                    if R_ != 0:
+                        Ls_ = linear_vals[i]
+                        Us_ = R_ - Ls_
+                        if abs(Us_) > abs(Ls_):
+                            linear_vals[i] = Us_
+                        else:
+                            linear_vals[i] = -Ls_
+            slack.update(zip(linear_cons, linear_vals))
 
-        for i, cplex_con in enumerate(quadratic_cons_to_load):
-            pyomo_con = reverse_con_map[cplex_con]
-            slack[pyomo_con] = quadratic_vals[i]
+        if len(quadratic_cons) > 0:
+            quadratic_vals = self._solver_model.solution.get_quadratic_slacks(quadratic_names)
+            slack.update(zip(quadratic_cons, quadratic_vals))
 
     def load_duals(self, cons_to_load=None):
         """
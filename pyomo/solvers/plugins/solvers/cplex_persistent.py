@@ -51,6 +51,9 @@ class CPLEXPersistent(PersistentSolver, CPLEXDirect):
             self.set_instance(self._pyomo_model, **kwds)
 
     def _remove_constraint(self, solver_con):
+        pyomo_con = self._solver_con_to_pyomo_con_map[solver_con]
+        self._range_constraints.discard(pyomo_con)
+        self._quadratic_constraints.discard(pyomo_con)
         try:
             self._solver_model.linear_constraints.delete(solver_con)
         except self._cplex.exceptions.CplexError:
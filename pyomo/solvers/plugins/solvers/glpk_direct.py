@@ -2,610 +2,964 @@
 #
 #  Pyomo: Python Optimization Modeling Objects
 #  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
-#  Under the terms of Contract DE-NA0003525 with National Technology and 
-#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain 
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
 #  rights in this software.
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
-# NOTE: this solver is disabled (see the first try block below).  This
-# code is out of date, and this code is not regularly tested by Pyomo developers.
-# The python-glpk package is only supported on Debian Linux platforms, so
-# it is not clear if this is a valuable solver interface, particularly since
-# commercial vendors now have good support for Python interfaces (e.g. CPLEX and
-# Gurobi).
-
+import logging
+import re
 import sys
-_glpk_version = None
-glpk_python_api_exists = None
-def configure_glpk_direct():
-    global _glpk_version
-    global glpk_python_api_exists
-    try:
-        # import all the glp_* functions
-        if False:  # DISABLED
-            import glpk
-            glpk_python_api_exists = True
-        else:
-            glpk_python_api_exists = False
-    except ImportError:
-        glpk_python_api_exists = False
-    except Exception as e:
-        # other forms of exceptions can be thrown by the glpk python
-        # import. For example, an error in code invoked by the module's
-        # __init__.  We should continue gracefully and not cause a fatal
-        # error in Pyomo.
-        print("Import of glpk failed - glpk message="+str(e)+"\n")
-        glpk_python_api_exists = False
-
-from pyutilib.misc import Bunch, Options
-
-from pyomo.opt.base import *
-from pyomo.opt.base.solvers import _extract_version
-from pyomo.opt.results import *
-from pyomo.opt.solver import *
-from pyomo.core.base.numvalue import value
+import time
+from pyutilib.misc import Bunch
+from pyutilib.services import TempfileManager
+from pyomo.core.expr.numvalue import is_fixed
+from pyomo.core.expr.numvalue import value
+from pyomo.repn import generate_standard_repn
+from pyomo.solvers.plugins.solvers.direct_solver import DirectSolver
+from pyomo.solvers.plugins.solvers.direct_or_persistent_solver import DirectOrPersistentSolver
+from pyomo.core.kernel.objective import minimize, maximize
+from pyomo.core.kernel.component_set import ComponentSet
+from pyomo.core.kernel.component_map import ComponentMap
+from pyomo.opt.results.results_ import SolverResults
+from pyomo.opt.results.solution import Solution, SolutionStatus
+from pyomo.opt.results.solver import TerminationCondition, SolverStatus
+from pyomo.opt.base import SolverFactory
+from pyomo.core.base.suffix import Suffix
+import pyomo.core.base.var
+
 
-import logging
 logger = logging.getLogger('pyomo.solvers')
 
 
+class DegreeError(ValueError):
+    pass
 
-@SolverFactory.register('_glpk_direct', doc='Direct Python interface to the GLPK LP/MIP solver.')
-class GLPKDirect ( OptSolver ):
-    """The GLPK LP/MIP solver (direct API plugin)
+def _is_numeric(x):
+    try:
+        float(x)
+    except ValueError:
+        return False
+    return True
 
- The glpk_direct plugin offers an API interface to the GLPK.  It requires the
- Python-GLPK API interface provided via the SWIG interface available through
- most Linux distributions repositories.  For more information, see Jo~ao Pedro
- Pedroso's (the author) page at http://www.dcc.fc.up.pt/~jpp/
 
- Because of the direct connection with the GLPK API, no temporary files need be
- written or read.  That ostensibly makes this a faster plugin than the
- file-based glpk plugin.  However, you will likely not notice any speed up
- unless you are using the GLPK solver with PySP problems (due to the rapid
- re-solves).
+class _GLPKMatrixBuffer(object):
+    """
+    Columns, rows and coefficients waiting to be loaded into the GLPK
+    problem, and the numbers of the columns and rows waiting to be
+    deleted from it.  The coefficients are stored in coordinate
+    (triplet) format using the 1-based GLPK row and column numbers so
+    that the constraint matrix of a new problem can be loaded with a
+    single call to glp_load_matrix.
+    """
+
+    def __init__(self):
+        self.cols = []
+        self.rows = []
+        self.ia = []
+        self.ja = []
+        self.ar = []
+        self.row_starts = []
+        self.obj = None
+        self.del_cols = []
+        self.del_rows = []
 
- One downside to the lack of temporary files, is that there is no LP file to
- inspect for clues while debugging a model.  For that, use the write_lp solver
- option:
+    def __len__(self):
+        return len(self.cols) + len(self.rows) + (self.obj is not None) + \
+            len(self.del_cols) + len(self.del_rows)
 
- $ pyomo model.{py,dat} \
-   --solver=glpk_direct \
-   --solver-options  write_lp=/path/to/some/file.lp
 
- One can also specify the particular GLPK algorithm to use with the 'algorithm'
- solver option.  There are 4 algorithms:
+@SolverFactory.register('glpk_direct', doc='Direct python interface to GLPK')
+class GLPKDirect(DirectSolver):
+    """
+    A direct interface to GLPK through the swiglpk python bindings.
+
+    The variables and constraints of a model are collected into a
+    sparse (coordinate format) constraint matrix, which is loaded into
+    GLPK with a single glp_load_matrix call.  GLPK has no array
+    getters, so primal values, duals, reduced costs and slacks are
+    retrieved with one call per column / row.
 
-   simplex  - the default algorithm for non-MIP problems (primal simplex)
-   intopt   - the default algorithm for MIP problems
-   exact    - tentative implementation of two-phase primal simplex with exact
-              arithmetic internally.
-   interior - only aplicable to LP problems
+    The GLPK algorithm can be selected with the 'algorithm' option:
 
- $ pyomo model.{py,dat} \
-   --solver glpk_direct \
-   --solver-options  algorithm=exact
+      simplex  - primal simplex (the default for LP problems)
+      exact    - simplex method using exact (rational) arithmetic
+      interior - interior point method (LP problems only)
 
- For more information on available algorithms, see the GLPK documentation.
+    Problems with integer variables are always solved with glp_intopt.
+    Any other option is assigned to the matching field of the GLPK
+    control parameter structure (glp_smcp, glp_iptcp or glp_iocp;
+    e.g., 'tm_lim', 'mip_gap' or 'it_lim').
     """
 
     def __init__(self, **kwds):
-        #
-        # Call base class constructor
-        #
         kwds['type'] = 'glpk_direct'
-        OptSolver.__init__(self, **kwds)
+        DirectSolver.__init__(self, **kwds)
+        self._init()
 
-        # NOTE: eventually both of the following attributes should be migrated
-        # to a common base class.  Is the current solve warm-started?  A
-        # transient data member to communicate state information across the
-        # _presolve, _apply_solver, and _postsolve methods.
-        self.warm_start_solve = False
-        self._timelimit = None
-
-        # Note: Undefined capabilities default to 'None'
-        self._capabilities = Options()
+    def _init(self):
+        self._name = None
+        try:
+            import swiglpk
+            self._glpk = swiglpk
+            self._python_api_exists = True
+            self._version = tuple(
+                int(k) for k in self._glpk.glp_version().split('.'))
+            self._name = "GLPK %s" % (self._glpk.glp_version(),)
+            while len(self._version) < 4:
+                self._version += (0,)
+            self._version = self._version[:4]
+            self._version_major = self._version[0]
+        except ImportError:
+            self._python_api_exists = False
+        except Exception as e:
+            # other forms of exceptions can be thrown by the glpk python
+            # import. For example, an error in code invoked by the
+            # module's __init__.  We should continue gracefully and not
+            # cause a fatal error in Pyomo.
+            print("Import of swiglpk failed - glpk message=" + str(e) + "\n")
+            self._python_api_exists = False
+
+        # The pyomo variables / constraints in GLPK column / row
+        # order.  The GLPK column (row) number of a component is its
+        # position in the list plus 1.  Removed components are None
+        # until they are deleted from GLPK (see _flush).
+        self._glpk_cols = []
+        self._glpk_rows = []
+        self._col_numbers = None
+        self._row_numbers = None
+        self._buffer = _GLPKMatrixBuffer()
+        self._buffering = False
+        self._is_mip = False
+        self._algorithm = None
+        self._solve_return_code = None
+
+        self._max_obj_degree = 1
+        self._max_constraint_degree = 1
+
+        # Note: Undefined capabilites default to None
         self._capabilities.linear = True
         self._capabilities.integer = True
 
-    def _get_version(self):
+    def _int_array(self, values):
+        # GLPK arrays are 1-based; element 0 is ignored (as_intArray
+        # stores the list starting at element 1)
+        if hasattr(self._glpk, 'as_intArray'):
+            return self._glpk.as_intArray(list(values))
+        array = self._glpk.intArray(len(values) + 1)
+        for i, val in enumerate(values):
+            array[i+1] = val
+        return array
+
+    def _double_array(self, values):
+        if hasattr(self._glpk, 'as_doubleArray'):
+            return self._glpk.as_doubleArray([float(v) for v in values])
+        array = self._glpk.doubleArray(len(values) + 1)
+        for i, val in enumerate(values):
+            array[i+1] = float(val)
+        return array
+
+    def _col_number(self, solver_var):
+        if self._col_numbers is None:
+            self._col_numbers = dict(
+                (self._pyomo_var_to_solver_var_map[var], j)
+                for j, var in enumerate(self._glpk_cols, 1)
+                if var is not None)
+        return self._col_numbers[solver_var]
+
+    def _row_number(self, solver_con):
+        if self._row_numbers is None:
+            self._row_numbers = dict(
+                (self._pyomo_con_to_solver_con_map[con], i)
+                for i, con in enumerate(self._glpk_rows, 1)
+                if con is not None)
+        return self._row_numbers[solver_con]
+
+    def _glpk_bound_type(self, lb, ub):
+        glpk = self._glpk
+        if lb is None:
+            if ub is None:
+                return glpk.GLP_FR, 0.0, 0.0
+            return glpk.GLP_UP, 0.0, ub
+        elif ub is None:
+            return glpk.GLP_LO, lb, 0.0
+        elif lb == ub:
+            return glpk.GLP_FX, lb, ub
+        return glpk.GLP_DB, lb, ub
+
+    def _glpk_vtype_from_var(self, var):
         """
-        Returns a tuple describing the solver executable version.
+        This function takes a pyomo variable and returns the appropriate glpk variable type
+        :param var: pyomo.core.base.var.Var
+        :return: GLP_CV or GLP_BV or GLP_IV
         """
-        if _glpk_version is None:
-            return _extract_version('')
-        return _glpk_version
+        if var.is_binary():
+            vtype = self._glpk.GLP_BV
+        elif var.is_integer():
+            vtype = self._glpk.GLP_IV
+        elif var.is_continuous():
+            vtype = self._glpk.GLP_CV
+        else:
+            raise ValueError('Variable domain type is not recognized for {0}'.format(var.domain))
+        return vtype
+
+    def _glpk_var_bounds(self, var):
+        if var.is_fixed():
+            return var.value, var.value
+        lb = ub = None
+        if var.has_lb():
+            lb = value(var.lb)
+        if var.has_ub():
+            ub = value(var.ub)
+        return lb, ub
+
+    def _set_glpk_col(self, j, var):
+        glpk = self._glpk
+        lp = self._solver_model
+        # set the kind first: GLP_BV resets the column bounds to [0,1]
+        glpk.glp_set_col_kind(lp, j, self._glpk_vtype_from_var(var))
+        btype, lb, ub = self._glpk_bound_type(*self._glpk_var_bounds(var))
+        glpk.glp_set_col_bnds(lp, j, btype, lb, ub)
+
+    def _get_expr_from_pyomo_repn(self, repn, max_degree=1):
+        referenced_vars = ComponentSet()
+
+        degree = repn.polynomial_degree()
+        if (degree is None) or (degree > max_degree):
+            raise DegreeError('GLPKDirect does not support expressions of degree {0}.'.format(degree))
+
+        var_map = self._pyomo_var_to_solver_var_map
+        coefs = ComponentMap()
+        for var, coef in zip(repn.linear_vars, repn.linear_coefs):
+            referenced_vars.add(var)
+            if var in coefs:
+                coefs[var] += coef
+            else:
+                coefs[var] = coef
+        new_expr = ([self._col_number(var_map[var]) for var in coefs],
+                    list(coefs.values()))
 
-    def _populate_glpk_instance ( self, model ):
+        return new_expr, repn.constant, referenced_vars
 
-        from pyomo.core.base import Var, Objective, Constraint, SOSConstraint
+    def _get_expr_from_pyomo_expr(self, expr, max_degree=1):
+        repn = generate_standard_repn(expr, quadratic=False)
 
         try:
-            lp = glp_create_prob()
+            glpk_expr, constant, referenced_vars = \
+                self._get_expr_from_pyomo_repn(repn, max_degree)
+        except DegreeError as e:
+            msg = e.args[0]
+            msg += '\nexpr: {0}'.format(expr)
+            raise DegreeError(msg)
+
+        return glpk_expr, constant, referenced_vars
+
+    def _add_var(self, var):
+        varname = self._symbol_map.getSymbol(var, self._labeler)
+
+        self._glpk_cols.append(var)
+        if self._col_numbers is not None:
+            self._col_numbers[varname] = len(self._glpk_cols)
+        self._buffer.cols.append((var, varname))
+
+        self._pyomo_var_to_solver_var_map[var] = varname
+        self._solver_var_to_pyomo_var_map[varname] = var
+        self._referenced_variables[var] = 0
+
+        if not self._buffering:
+            self._flush()
+
+    def _set_instance(self, model, kwds={}):
+        DirectOrPersistentSolver._set_instance(self, model, kwds)
+        self._pyomo_con_to_solver_con_map = dict()
+        self._solver_con_to_pyomo_con_map = dict()
+        self._pyomo_var_to_solver_var_map = ComponentMap()
+        self._solver_var_to_pyomo_var_map = dict()
+        self._glpk_cols = []
+        self._glpk_rows = []
+        self._col_numbers = None
+        self._row_numbers = None
+        self._buffer = _GLPKMatrixBuffer()
+        if self._solver_model is not None:
+            self._glpk.glp_delete_prob(self._solver_model)
+            self._solver_model = None
+        try:
+            self._solver_model = self._glpk.glp_create_prob()
+            if model.name is not None:
+                self._glpk.glp_set_prob_name(self._solver_model,
+                                             model.name[:255])
         except Exception:
             e = sys.exc_info()[1]
-            msg = 'Unable to create GLPK problem instance.  Have you installed' \
-            '\n       the Python bindings for GLPK?\n\n\tError message: %s'
-            raise Exception(msg % e)
-
-        objective = sorted( model.component_map(Objective, active=True).values() )[0]
-        # so we can correctly map the solution to the correct objective label in _postsolve
-        lp.objective_name = sorted( model.component_map(Objective, active=True).keys() )[0]
-        sense = GLP_MAX
-        if objective.is_minimizing(): sense = GLP_MIN
-
-        constraint_list = model.component_map(Constraint, active=True)
-        variable_list   = model.component_map(Var)
-        num_constraints = model.statistics.number_of_constraints
-        num_variables   = model.statistics.number_of_variables
-
-        sosn = self._capabilities.sosn
-        sos1 = self._capabilities.sos1
-        sos2 = self._capabilities.sos2
-
-        for soscondata in model.component_data_objects(SOSConstraint, active=True):
-            raise Exception("Solver: glpk_direct does not support SOSConstraint declarations")
-
-        glp_set_prob_name(lp, model.name)
-
-        glp_set_obj_dir( lp, sense )
-        glp_add_rows( lp, num_constraints )
-        glp_add_cols( lp, num_variables )
-
-        # 1 extra because GLPK's arrays in this context are 1-based, not 0-based
-        coef_count = num_constraints * num_variables + 1
-        Ai = intArray( coef_count )
-        Aj = intArray( coef_count )
-        Ar = doubleArray( coef_count )
-
-        row = col = coef_count = 0
-        colvar_map = dict()
-        rowvar_map = dict()
-
-        # In matrix parlance, variables are columns
-        for name in variable_list:
-            var_set = variable_list[ name ]
-            for ii in var_set:
-                var = var_set[ ii ]
-                if var.fixed is True:
-                    continue
-
-                lb = ub = 0.0
-                if (not var.has_lb()) and \
-                   (not var.has_ub()):
-                    var_type = GLP_FR
-                elif not var.has_lb():
-                    var_type = GLP_UB
-                    ub = value(var.ub)
-                elif not var.has_ub():
-                    var_type = GLP_LO
-                    lb = value(var.lb)
-                else:
-                    var_type = GLP_DB
-                    lb = value(var.lb)
-                    ub = value(var.ub)
-
-                col += 1
-                colvar_map[ var.label ] = col
-
-                # the name is perhaps not necessary, but for completeness ...
-                glp_set_col_name( lp, col, var.label )
-                glp_set_col_bnds( lp, col, var_type, lb, ub )
-
-                # Be sure to impart the integer and binary nature of any variables
-                if var.is_integer():
-                    glp_set_col_kind( lp, col, GLP_IV )
-                elif var.is_binary():
-                    glp_set_col_kind( lp, col, GLP_BV )
-                elif var.is_continuous():
-                    glp_set_col_kind( lp, col, GLP_CV )   # continuous
-                else:
-                    raise TypeError("Invalid domain type for variable with name '%s'. "
-                                    "Variable is not continuous, integer, or binary.")
-
-        model_canonical_repn = getattr(model, "_canonical_repn", None)
-        if model_canonical_repn is None:
-            raise ValueError("No _canonical_repn ComponentMap was found on "
-                             "block with name %s. Did you forget to preprocess?"
-                             % (model.name))
-
-        for name in constraint_list:
-            constraint_set = constraint_list[ name ]
-
-            for ii in constraint_set:
-                constraint = constraint_set[ ii ]
-                if not constraint.active: continue
-                elif (not constraint.has_lb()) and \
-                     (not constraint.has_ub()):
-                    continue
-
-                expression = model_canonical_repn.get(constraint)
-                if constraint is None:
-                    raise ValueError("No entry found in _canonical_repn ComponentMap on "
-                                     "block %s for active constraint with name %s. "
-                                     "Did you forget to preprocess?"
-                                     % (model.name, constraint.name))
-
-                offset = 0.0
-                if 0 in expression:
-                    offset = expression[0][None]
-
-                lbound = ubound = -offset
-
-                if constraint.equality:
-                    var_type = GLP_FX    # Fixed
-                    lbound = ubound = constraint.lower() - offset
-                elif not constraint.has_lb():
-                    var_type = GLP_UP    # Upper bounded only
-                    ubound += constraint.upper()
-                elif not constraint.has_ub():
-                    var_type = GLP_LO    # Lower bounded only
-                    lbound += constraint.lower()
-                else:
-                    var_type = GLP_DB    # Double bounded
-                    lbound += constraint.lower()
-                    ubound += constraint.upper()
-
-                row += 1
-                rowvar_map[ constraint.label ] = row
-
-                # just as with variables, set the name just for completeness ...
-                glp_set_row_name( lp, row, constraint.label )
-                glp_set_row_bnds( lp, row, var_type, lbound, ubound )
-
-                if 1 in expression: # first-order terms
-                    keys = sorted( expression[1].keys() )
-                    for var_key in keys:
-                        index = var_key.keys()[0]
-                        var = expression[-1][ index ]
-                        coef  = expression[ 1][ var_key ]
-                        col = colvar_map[ var.label ]
-
-                        coef_count += 1
-                        Ai[ coef_count ] = row
-                        Aj[ coef_count ] = col
-                        Ar[ coef_count ] = coef
-
-        # with the rows and columns named and bounded, load the coefficients
-        glp_load_matrix( lp, coef_count, Ai, Aj, Ar )
-
-        for key in objective:
-
-            expression = model_canonical_repn.get(objective[key])
-            if expression is None:
-                raise ValueError("No entry found in _canonical_repn ComponentMap on "
-                                 "block %s for active objective with name %s. "
-                                 "Did you forget to preprocess?"
-                                 % (model.name, objective[key].name))
-
-            if expression.is_constant():
-                msg = "Ignoring objective '%s[%s]' which is constant"
-                logger.warning( msg % (str(objective), str(key)) )
-                continue
+            msg = ("Unable to create GLPK problem. "
+                   "Have you installed the Python "
+                   "bindings for GLPK (swiglpk)?\n\n\t"+
+                   "Error message: {0}".format(e))
+            raise Exception(msg)
+
+        self._add_block(model)
+
+        for var, n_ref in self._referenced_variables.items():
+            if n_ref != 0:
+                if var.fixed:
+                    if not self._output_fixed_variable_bounds:
+                        raise ValueError(
+                            "Encountered a fixed variable (%s) inside "
+                            "an active objective or constraint "
+                            "expression on model %s, which is usually "
+                            "indicative of a preprocessing error. Use "
+                            "the IO-option 'output_fixed_variable_bounds=True' "
+                            "to suppress this error and fix the variable "
+                            "by overwriting its bounds in the GLPK instance."
+                            % (var.name, self._pyomo_model.name,))
+
+    def _add_block(self, block):
+        # Collect all of the columns and rows of the block, and load
+        # them into GLPK at once
+        buffering = self._buffering
+        self._buffering = True
+        try:
+            DirectOrPersistentSolver._add_block(self, block)
+        finally:
+            self._buffering = buffering
+        if not buffering:
+            self._flush()
+
+    def _add_constraint(self, con):
+        if not con.active:
+            return None
+
+        if is_fixed(con.body):
+            if self._skip_trivial_constraints:
+                return None
+
+        conname = self._symbol_map.getSymbol(con, self._labeler)
+
+        if con._linear_canonical_form:
+            glpk_expr, constant, referenced_vars = \
+                self._get_expr_from_pyomo_repn(
+                    con.canonical_form(),
+                    self._max_constraint_degree)
+        else:
+            glpk_expr, constant, referenced_vars = \
+                self._get_expr_from_pyomo_expr(
+                    con.body,
+                    self._max_constraint_degree)
+
+        if con.has_lb():
+            if not is_fixed(con.lower):
+                raise ValueError("Lower bound of constraint {0} "
+                                 "is not constant.".format(con))
+        if con.has_ub():
+            if not is_fixed(con.upper):
+                raise ValueError("Upper bound of constraint {0} "
+                                 "is not constant.".format(con))
+
+        lb = ub = None
+        if con.equality:
+            lb = ub = value(con.lower) - constant
+        else:
+            if con.has_lb():
+                lb = value(con.lower) - constant
+            if con.has_ub():
+                ub = value(con.upper) - constant
+            if lb is None and ub is None:
+                raise ValueError("Constraint does not have a lower "
+                                 "or an upper bound: {0} \n".format(con))
+
+        self._glpk_rows.append(con)
+        i = len(self._glpk_rows)
+        if self._row_numbers is not None:
+            self._row_numbers[conname] = i
+        buf = self._buffer
+        buf.rows.append((conname, lb, ub))
+        buf.row_starts.append(len(buf.ia))
+        cols, coefs = glpk_expr
+        buf.ia.extend(i for _ in cols)
+        buf.ja.extend(cols)
+        buf.ar.extend(coefs)
+
+        for var in referenced_vars:
+            self._referenced_variables[var] += 1
+        self._vars_referenced_by_con[con] = referenced_vars
+        self._pyomo_con_to_solver_con_map[con] = conname
+        self._solver_con_to_pyomo_con_map[conname] = con
+
+        if not self._buffering:
+            self._flush()
+
+    def _add_sos_constraint(self, con):
+        raise ValueError("Solver={0} does not support SOS constraints: "
+                         "{1}".format(self.type, con))
+
+    def _set_objective(self, obj):
+        if self._objective is not None:
+            for var in self._vars_referenced_by_obj:
+                self._referenced_variables[var] -= 1
+            self._vars_referenced_by_obj = ComponentSet()
+            self._objective = None
+
+        if obj.active is False:
+            raise ValueError('Cannot add inactive objective to solver.')
+
+        if obj.sense == minimize:
+            sense = self._glpk.GLP_MIN
+        elif obj.sense == maximize:
+            sense = self._glpk.GLP_MAX
+        else:
+            raise ValueError('Objective sense is not recognized: {0}'.format(obj.sense))
 
-            if 1 in expression: # first-order terms
-                keys = sorted( expression[1].keys() )
-                for var_key in keys:
-                    index = var_key.keys()[0]
-                    label = expression[-1][ index ].label
-                    coef  = expression[ 1][ var_key ]
-                    col = colvar_map[ label ]
-                    glp_set_obj_coef( lp, col, coef )
-
-            elif -1 in expression:
-                pass
-            else:
-                msg = "Nonlinear objective to GLPK.  GLPK can only handle "       \
-                      "linear problems."
-                raise RuntimeError( msg )
+        glpk_expr, constant, referenced_vars = \
+            self._get_expr_from_pyomo_expr(obj.expr, self._max_obj_degree)
 
+        for var in referenced_vars:
+            self._referenced_variables[var] += 1
 
-        self._glpk_instance = lp
-        self._glpk_rowvar_map = rowvar_map
-        self._glpk_colvar_map = colvar_map
+        self._buffer.obj = (sense, glpk_expr, constant)
+        self._objective = obj
+        self._vars_referenced_by_obj = referenced_vars
 
+        if not self._buffering:
+            self._flush()
 
-    def warm_start_capable(self):
-        # Note to dev who gets back here: GLPK has the notion of presolving, but
-        # it's "built-in" to each optimization function.  To disable it, make use
-        # of the second argument of glp_smcp type.  See the GLPK documentation
-        # PDF for further information.
-        msg = "GLPK has the ability to use warmstart solutions.  However, it "  \
-              "has not yet been implemented into the Pyomo glpk_direct plugin."
-        logger.info( msg )
-        return False
+    def _flush(self):
+        """
+        Load the buffered columns, rows and objective into GLPK, and
+        delete the removed columns and rows.  The buffered rows use the
+        column and row numbers from before the deletions, so the
+        deletions are applied last.
+        """
+        buf = self._buffer
+        if not len(buf):
+            return
+        self._buffer = _GLPKMatrixBuffer()
+        glpk = self._glpk
+        lp = self._solver_model
+        symbolic = self._symbolic_solver_labels
+
+        if buf.cols:
+            first = glpk.glp_add_cols(lp, len(buf.cols))
+            for j, (var, varname) in enumerate(buf.cols, first):
+                if symbolic and len(varname) <= 255:
+                    glpk.glp_set_col_name(lp, j, varname)
+                self._set_glpk_col(j, var)
+
+        if buf.rows:
+            nnz_before = glpk.glp_get_num_nz(lp)
+            first = glpk.glp_add_rows(lp, len(buf.rows))
+            for i, (conname, lb, ub) in enumerate(buf.rows, first):
+                if symbolic and len(conname) <= 255:
+                    glpk.glp_set_row_name(lp, i, conname)
+                btype, lb, ub = self._glpk_bound_type(lb, ub)
+                glpk.glp_set_row_bnds(lp, i, btype, lb, ub)
+            if buf.ia:
+                if nnz_before == 0:
+                    # the matrix is empty, so it can be loaded in bulk
+                    glpk.glp_load_matrix(lp, len(buf.ia),
+                                         self._int_array(buf.ia),
+                                         self._int_array(buf.ja),
+                                         self._double_array(buf.ar))
+                else:
+                    row_ends = buf.row_starts[1:] + [len(buf.ia)]
+                    for i, start, end in zip(
+                            range(first, first + len(buf.rows)),
+                            buf.row_starts, row_ends):
+                        if start == end:
+                            continue
+                        glpk.glp_set_mat_row(
+                            lp, i, end - start,
+                            self._int_array(buf.ja[start:end]),
+                            self._double_array(buf.ar[start:end]))
+
+        if buf.obj is not None:
+            sense, (cols, coefs), constant = buf.obj
+            glpk.glp_set_obj_dir(lp, sense)
+            for j in range(1, glpk.glp_get_num_cols(lp) + 1):
+                glpk.glp_set_obj_coef(lp, j, 0.0)
+            glpk.glp_set_obj_coef(lp, 0, constant)
+            for j, coef in zip(cols, coefs):
+                glpk.glp_set_obj_coef(lp, j, coef)
+
+        if buf.del_rows:
+            glpk.glp_del_rows(lp, len(buf.del_rows),
+                              self._int_array(buf.del_rows))
+            self._glpk_rows = [con for con in self._glpk_rows
+                               if con is not None]
+            self._row_numbers = None
+        if buf.del_cols:
+            glpk.glp_del_cols(lp, len(buf.del_cols),
+                              self._int_array(buf.del_cols))
+            self._glpk_cols = [var for var in self._glpk_cols
+                               if var is not None]
+            self._col_numbers = None
+
+    def _set_parm(self, parm, key, option):
+        if not hasattr(parm, key):
+            raise ValueError("Solver={0} has no option '{1}' for the {2} "
+                             "algorithm".format(self.type, key, self._algorithm))
+        try:
+            setattr(parm, key, option)
+        except TypeError:
+            # When options come from the pyomo command, all values
+            # are string types, so we try to cast them to a numeric
+            # value in the event that setting the parameter fails.
+            if not _is_numeric(option):
+                raise
+            try:
+                setattr(parm, key, int(option))
+            except (TypeError, ValueError):
+                setattr(parm, key, float(option))
 
+    def _apply_solver(self):
+        if not self._save_results:
+            for block in self._pyomo_model.block_data_objects(descend_into=True,
+                                                              active=True):
+                for var in block.component_data_objects(ctype=pyomo.core.base.var.Var,
+                                                        descend_into=False,
+                                                        active=True,
+                                                        sort=False):
+                    var.stale = True
+        self._flush()
+        glpk = self._glpk
+        lp = self._solver_model
+
+        self._is_mip = glpk.glp_get_num_int(lp) > 0
+        algorithm = self.options.get('algorithm', None)
+        if self._is_mip:
+            if algorithm not in (None, 'intopt'):
+                logger.warning("Ignoring the '%s' algorithm for a problem "
+                               "with integer variables" % (algorithm,))
+            self._algorithm = 'intopt'
+            parm = glpk.glp_iocp()
+            glpk.glp_init_iocp(parm)
+            # without presolve, glp_intopt requires an optimal basis
+            # of the LP relaxation
+            parm.presolve = glpk.GLP_ON
+        elif algorithm in (None, 'simplex', 'exact'):
+            self._algorithm = algorithm or 'simplex'
+            parm = glpk.glp_smcp()
+            glpk.glp_init_smcp(parm)
+        elif algorithm == 'interior':
+            self._algorithm = algorithm
+            parm = glpk.glp_iptcp()
+            glpk.glp_init_iptcp(parm)
+        else:
+            raise ValueError("Solver={0} does not support the '{1}' "
+                             "algorithm".format(self.type, algorithm))
 
-    def warm_start(self, instance):
-        pass
-
-
-    def _presolve(self, *args, **kwargs):
-        from pyomo.core.base.PyomoModel import Model
-
-        self.warm_start_solve = kwargs.pop( 'warmstart', False )
-
-        model = args[0]
-        if len(args) != 1:
-            msg = "The glpk_direct plugin method '_presolve' must be supplied "  \
-                  "a single problem instance - %s were supplied"
-            raise ValueError(msg % len(args))
-        elif not isinstance(model, Model):
-            msg = "The problem instance supplied to the glpk_direct plugin "     \
-                  "'_presolve' method must be of type 'Model'"
-            raise ValueError(msg)
-
-        self._populate_glpk_instance( model )
-        lp = self._glpk_instance
-        self.is_integer = ( glp_get_num_int( lp ) > 0 and True or False )
-
-        if 'write_lp' in self.options:
-            fname = self.options.write_lp
-            glp_write_lp( lp, None, fname )
-
-        self.algo = 'Simplex (primal)'
-        algorithm = glp_simplex
-        if self.is_integer > 0:
-            self.algo = 'Mixed Integer'
-            algorithm = glp_intopt
-
-        if 'algorithm' in self.options:
-            if 'simplex' == self.options.algorithm:
-                self.algo = 'Simplex (primal)'
-                algorithm = glp_simplex
-            elif 'exact' == self.options.algorithm:
-                self.algo = 'Simplex (two-phase primal)'
-                algorithm = glp_exact
-            elif 'interior' == self.options.algorithm:
-                self.algo = 'Interior Point'
-                algorithm = glp_interior
-            elif 'intopt' == self.options.algorithm:
-                self.alpo = 'Mixed Integer'
-                algorithm = glp_intopt
-            else:
-                msg = "Unknown solver specified\n  Unknown: %s\n  Using:   %s\n"
-                logger.warning( msg % (self.options.algorithm, self.algo) )
-        self._algorithm = algorithm
-
-        if 'Simplex (primal)' == self.algo:
-            parm = glp_smcp()
-            glp_init_smcp( parm )
-        elif 'Simplex (two-phase primal)' == self.algo:
-            parm = glp_smcp()
-            glp_init_smcp( parm )
-        elif 'Interior Point' == self.algo:
-            parm = glp_iptcp()
-            glp_init_iptcp( parm )
-        elif 'Mixed Integer' == self.algo:
-            parm = glp_iocp()
-            glp_init_iocp( parm )
-            if self.options.mipgap:
-                parm.mip_gap = self.options.mipgap
-
-        if self._timelimit and self._timelimit > 0.0:
-            parm.tm_lim = self._timelimit
-
-        parm.msg_lev = GLP_MSG_OFF
-        parm.presolve = GLP_ON
-
-        self._solver_params = parm
-
-        # Scaffolding in place: I /believe/ GLPK can do warmstarts; just supply
-        # the basis solution and turn of the presolver
-        if self.warm_start_solve is True:
-
-            if len(args) != 1:
-                msg = "The glpk_direct _presolve method can only handle a single "\
-                      "problem instance - %s were supplied"
-                raise ValueError(msg % len(args))
-
-            parm.presolve = GLP_OFF
-            self.warm_start( model )
+        if self._tee:
+            parm.msg_lev = glpk.GLP_MSG_ALL
+        else:
+            parm.msg_lev = glpk.GLP_MSG_OFF
+        if self._timelimit is not None and \
+           hasattr(parm, 'tm_lim'):
+            parm.tm_lim = int(1000*self._timelimit)
 
+        for key, option in self.options.items():
+            if key == 'algorithm':
+                continue
+            self._set_parm(parm, key, option)
 
-    def _apply_solver(self):
-        lp = self._glpk_instance
-        parm = self._solver_params
-        algorithm = self._algorithm
+        if self._keepfiles:
+            print("Solver log file: "+self._log_file)
 
-        # Actually solve the problem.
+        if self._tee:
+            term_out = glpk.glp_term_out(glpk.GLP_ON)
+        else:
+            term_out = glpk.glp_term_out(glpk.GLP_OFF)
+        glpk.glp_open_tee(self._log_file)
         try:
-            beg = glp_time()
-            self.solve_return_code = algorithm( self._glpk_instance, parm )
-            end = glp_time()
-            self._glpk_solve_time = glp_difftime( end, beg )
-        except Exception:
-            e = sys.exc_info()[1]
-            msg = str(e)
-            if 'algorithm' in self.options:
-                msg = "Unexpected error using '%s' algorithm.  Is it the correct "\
-                      "correct algorithm for the problem type?"
-                msg %= self.options.algorithm
-            logger.error( msg )
-            raise
-
-        # FIXME: can we get a return code indicating if GLPK had a
-        # significant failure?
-        return Bunch(rc=None, log=None)
+            start = time.time()
+            if self._algorithm == 'intopt':
+                rc = glpk.glp_intopt(lp, parm)
+            elif self._algorithm == 'interior':
+                rc = glpk.glp_interior(lp, parm)
+            else:
+                if self._algorithm == 'exact':
+                    solve = glpk.glp_exact
+                else:
+                    solve = glpk.glp_simplex
+                rc = solve(lp, parm)
+                if rc in (glpk.GLP_EBADB, glpk.GLP_ESING, glpk.GLP_ECOND):
+                    # The current basis is not valid for the modified
+                    # problem; start from an advanced initial basis
+                    glpk.glp_adv_basis(lp, 0)
+                    rc = solve(lp, parm)
+            self._wallclock_time = time.time() - start
+        finally:
+            glpk.glp_close_tee()
+            glpk.glp_term_out(term_out)
+        self._solve_return_code = rc
 
+        return Bunch(rc=None, log=None)
 
-    def _glpk_return_code_to_message ( self ):
-        code = self.solve_return_code
-        if 0 == code:
-            return "Algorithm completed successfully.  (This does not "         \
-                   "necessarily mean an optimal solution was found.)"
-        elif GLP_EBADB == code:
-            return "Unable to start the search, because the initial basis "     \
-               "specified in the problem object is invalid -- the number of "   \
-               "basic (auxiliary and structural) variables is not the same as " \
-               "the number of rows in the problem object."
-        elif GLP_ESING == code:
-            return "Unable to start the search, because the basis matrix "      \
-               "corresponding to the initial basis is singular within the "     \
-               "working precision."
-        elif GLP_ECOND == code:
-            return "Unable to start the search, because the basis matrix "       \
-               "corresponding to the initial basis is ill-conditioned, i.e. its "\
-               "condition number is too large."
-        elif GLP_EBOUND == code:
-            return "Unable to start the search, because some double-bounded "    \
-               "(auxiliary or structural) variables have incorrect bounds."
-        elif GLP_EFAIL == code:
-            return "The search was prematurely terminated due to the solver "    \
-               "failure."
-        elif GLP_EOBJLL == code:
-            return "The search was prematurely terminated, because the "         \
-               "objective function being maximized has reached its lower limit " \
-               "and continues decreasing (the dual simplex only)."
-        elif GLP_EOBJUL == code:
-            return "The search was prematurely terminated, because the "         \
-               "objective function being minimized has reached its upper limit " \
-               "and continues increasing (the dual simplex only)."
-        elif GLP_EITLIM == code:
-            return "The search was prematurely terminated, because the simplex " \
-               "iteration limit has been exceeded."
-        elif GLP_ETMLIM == code:
-            return "The search was prematurely terminated, because the time "    \
-               "limit has been exceeded."
-        elif GLP_ENOPFS == code:
-            return "The LP problem instance has no primal feasible solution "    \
-               "(only if the LP presolver is used)."
-        elif GLP_ENODFS == code:
-            return "The LP problem instance has no dual feasible solution "     \
-               "(only if the LP presolver is used)."
+    def _glpk_value_getters(self):
+        glpk = self._glpk
+        if self._algorithm == 'intopt':
+            return Bunch(status=glpk.glp_mip_status,
+                         obj=glpk.glp_mip_obj_val,
+                         col_prim=glpk.glp_mip_col_val,
+                         row_prim=glpk.glp_mip_row_val,
+                         col_dual=None,
+                         row_dual=None)
+        elif self._algorithm == 'interior':
+            return Bunch(status=glpk.glp_ipt_status,
+                         obj=glpk.glp_ipt_obj_val,
+                         col_prim=glpk.glp_ipt_col_prim,
+                         row_prim=glpk.glp_ipt_row_prim,
+                         col_dual=glpk.glp_ipt_col_dual,
+                         row_dual=glpk.glp_ipt_row_dual)
+        return Bunch(status=glpk.glp_get_status,
+                     obj=glpk.glp_get_obj_val,
+                     col_prim=glpk.glp_get_col_prim,
+                     row_prim=glpk.glp_get_row_prim,
+                     col_dual=glpk.glp_get_col_dual,
+                     row_dual=glpk.glp_get_row_dual)
+
+    def _col_values(self, getter, solver_vars=None):
+        lp = self._solver_model
+        if solver_vars is None:
+            return [getter(lp, j)
+                    for j in range(1, len(self._glpk_cols) + 1)]
+        return [getter(lp, self._col_number(v)) for v in solver_vars]
+
+    def _row_values(self, getter, solver_cons=None):
+        lp = self._solver_model
+        if solver_cons is None:
+            return [getter(lp, i)
+                    for i in range(1, len(self._glpk_rows) + 1)]
+        return [getter(lp, self._row_number(c)) for c in solver_cons]
+
+    def _row_slacks(self, solver_cons=None):
+        glpk = self._glpk
+        lp = self._solver_model
+        if solver_cons is None:
+            rows = range(1, len(self._glpk_rows) + 1)
         else:
-            return "Unexpected error condition.  Please consider remitting "    \
-               "this problem to the Pyomo developers and/or the GLPK project "  \
-               "so they can improve their softwares."
-
-
-    def _glpk_get_solution_status ( self ):
-        getstatus = glp_get_status
-        if self.is_integer: getstatus = glp_mip_status
-
-        status = getstatus( self._glpk_instance )
-        if   GLP_OPT    == status: return SolutionStatus.optimal
-        elif GLP_FEAS   == status: return SolutionStatus.feasible
-        elif GLP_INFEAS == status: return SolutionStatus.infeasible
-        elif GLP_NOFEAS == status: return SolutionStatus.other
-        elif GLP_UNBND  == status: return SolutionStatus.other
-        elif GLP_UNDEF  == status: return SolutionStatus.other
-        raise RuntimeError("Unknown solution status returned by GLPK solver")
-
-
-    def _glpk_get_solver_status ( self ):
-        rc = self.solve_return_code
-        if 0 == rc:            return SolverStatus.ok
-        elif GLP_EBADB  == rc: return SolverStatus.error
-        elif GLP_ESING  == rc: return SolverStatus.error
-        elif GLP_ECOND  == rc: return SolverStatus.error
-        elif GLP_EBOUND == rc: return SolverStatus.error
-        elif GLP_EFAIL  == rc: return SolverStatus.aborted
-        elif GLP_EOBJLL == rc: return SolverStatus.aborted
-        elif GLP_EOBJUL == rc: return SolverStatus.aborted
-        elif GLP_EITLIM == rc: return SolverStatus.aborted
-        elif GLP_ETMLIM == rc: return SolverStatus.aborted
-        elif GLP_ENOPFS == rc: return SolverStatus.warning
-        elif GLP_ENODFS == rc: return SolverStatus.warning
-        else: return SolverStatus.unkown
-
+            rows = [self._row_number(c) for c in solver_cons]
+        activity = self._glpk_value_getters().row_prim
+        slacks = []
+        for i in rows:
+            val = activity(lp, i)
+            btype = glpk.glp_get_row_type(lp, i)
+            if btype == glpk.GLP_LO:
+                slacks.append(glpk.glp_get_row_lb(lp, i) - val)
+            elif btype in (glpk.GLP_UP, glpk.GLP_FX):
+                slacks.append(glpk.glp_get_row_ub(lp, i) - val)
+            elif btype == glpk.GLP_DB:
+                Us_ = glpk.glp_get_row_ub(lp, i) - val
+                Ls_ = val - glpk.glp_get_row_lb(lp, i)
+                if Us_ > Ls_:
+                    slacks.append(Us_)
+                else:
+                    slacks.append(-Ls_)
+            else:
+                slacks.append(0.0)
+        return slacks
 
     def _postsolve(self):
-        lp = self._glpk_instance
-        num_variables = glp_get_num_cols( lp )
-        bin_variables = glp_get_num_bin( lp )
-        int_variables = glp_get_num_int( lp )
-
-        # check suffixes
+        # the only suffixes that we extract from GLPK are
+        # constraint duals, constraint slacks, and variable
+        # reduced-costs. scan through the solver suffix list
+        # and throw an exception if the user has specified
+        # any others.
+        extract_duals = False
+        extract_slacks = False
+        extract_reduced_costs = False
         for suffix in self._suffixes:
-            if True:
+            flag = False
+            if re.match(suffix, "dual"):
+                extract_duals = True
+                flag = True
+            if re.match(suffix, "slack"):
+                extract_slacks = True
+                flag = True
+            if re.match(suffix, "rc"):
+                extract_reduced_costs = True
+                flag = True
+            if not flag:
                 raise RuntimeError("***The glpk_direct solver plugin cannot extract solution suffix="+suffix)
 
+        glpk = self._glpk
+        lp = self._solver_model
+        getters = self._glpk_value_getters()
+        rc = self._solve_return_code
 
-        tpeak = glp_long()
-        glp_mem_usage( None, None, None, tpeak )
-        # black magic trickery, thanks to Python's lack of pointers and SWIG's
-        # automatic API conversion
-        peak_mem = tpeak.lo
+        if self._is_mip:
+            if extract_reduced_costs:
+                logger.warning("Cannot get reduced costs for MIP.")
+            if extract_duals:
+                logger.warning("Cannot get duals for MIP.")
+            extract_reduced_costs = False
+            extract_duals = False
 
-        results = SolverResults()
+        self.results = SolverResults()
         soln = Solution()
-        prob = results.problem
-        solv = results.solver
-
-        solv.name = "GLPK " + glp_version()
-        solv.status = self._glpk_get_solver_status()
-        solv.return_code = self.solve_return_code
-        solv.message = self._glpk_return_code_to_message()
-        solv.algorithm = self.algo
-        solv.memory_used = "%d bytes, (%d KiB)" % (peak_mem, peak_mem/1024)
-        # solv.user_time = None
-        # solv.system_time = None
-        solv.wallclock_time = self._glpk_solve_time
-        # solv.termination_condition = None
-        # solv.termination_message = None
-
-        prob.name = glp_get_prob_name(lp)
-        prob.number_of_constraints = glp_get_num_rows(lp)
-        prob.number_of_nonzeros = glp_get_num_nz(lp)
-        prob.number_of_variables = num_variables
-        prob.number_of_binary_variables = bin_variables
-        prob.number_of_integer_variables = int_variables
-        prob.number_of_continuous_variables = num_variables - int_variables
-        prob.number_of_objectives = 1
-
-        prob.sense = ProblemSense.minimize
-        if GLP_MAX == glp_get_obj_dir( lp ):
-            prob.sense = ProblemSense.maximize
-
-        soln.status = self._glpk_get_solution_status()
-
-        if soln.status in ( SolutionStatus.optimal, SolutionStatus.feasible ):
-            get_col_prim = glp_get_col_prim
-            get_row_prim = glp_get_row_prim
-            get_obj_val  = glp_get_obj_val
-            if self.is_integer:
-                get_col_prim = glp_mip_col_val
-                get_row_prim = glp_mip_row_val
-                get_obj_val  = glp_mip_obj_val
-
-            obj_val = get_obj_val( lp )
-            if prob.sense == ProblemSense.minimize:
-                prob.lower_bound = obj_val
-            else:
-                prob.upper_bound = obj_val
 
-            objective_name = lp.objective_name
-            soln.objective[objective_name] = {'Value': obj_val}
+        self.results.solver.name = self._name
+        self.results.solver.wallclock_time = self._wallclock_time
+        self.results.solver.return_code = rc
+
+        status = getters.status(lp)
+        has_solution = False
+        if rc == glpk.GLP_ETMLIM:
+            self.results.solver.status = SolverStatus.aborted
+            self.results.solver.termination_message = "The search was prematurely terminated, because the time " \
+                                                      "limit has been exceeded."
+            self.results.solver.termination_condition = TerminationCondition.maxTimeLimit
+            soln.status = SolutionStatus.stoppedByLimit
+            has_solution = status in (glpk.GLP_FEAS, glpk.GLP_OPT)
+        elif rc == glpk.GLP_EITLIM:
+            self.results.solver.status = SolverStatus.aborted
+            self.results.solver.termination_message = "The search was prematurely terminated, because the simplex " \
+                                                      "iteration limit has been exceeded."
+            self.results.solver.termination_condition = TerminationCondition.maxIterations
+            soln.status = SolutionStatus.stoppedByLimit
+            has_solution = status in (glpk.GLP_FEAS, glpk.GLP_OPT)
+        elif rc == glpk.GLP_EMIPGAP:
+            self.results.solver.status = SolverStatus.ok
+            self.results.solver.termination_message = "The search was prematurely terminated, because the relative " \
+                                                      "mip gap tolerance has been reached."
+            self.results.solver.termination_condition = TerminationCondition.optimal
+            soln.status = SolutionStatus.optimal
+            has_solution = True
+        elif rc == glpk.GLP_ENOPFS or \
+             (rc == 0 and status in (glpk.GLP_NOFEAS, glpk.GLP_INFEAS)):
+            self.results.solver.status = SolverStatus.warning
+            self.results.solver.termination_message = "Model was proven to be infeasible"
+            self.results.solver.termination_condition = TerminationCondition.infeasible
+            soln.status = SolutionStatus.infeasible
+        elif rc == glpk.GLP_ENODFS:
+            self.results.solver.status = SolverStatus.warning
+            self.results.solver.termination_message = "Problem proven to be infeasible or unbounded."
+            self.results.solver.termination_condition = TerminationCondition.infeasibleOrUnbounded
+            soln.status = SolutionStatus.unsure
+        elif rc == 0 and status == glpk.GLP_UNBND:
+            self.results.solver.status = SolverStatus.warning
+            self.results.solver.termination_message = "Model was proven to be unbounded."
+            self.results.solver.termination_condition = TerminationCondition.unbounded
+            soln.status = SolutionStatus.unbounded
+        elif rc == 0 and status == glpk.GLP_OPT:
+            self.results.solver.status = SolverStatus.ok
+            self.results.solver.termination_message = "Model was solved to optimality (subject to tolerances), " \
+                                                      "and an optimal solution is available."
+            self.results.solver.termination_condition = TerminationCondition.optimal
+            soln.status = SolutionStatus.optimal
+            has_solution = True
+        elif rc == 0 and status == glpk.GLP_FEAS:
+            self.results.solver.status = SolverStatus.warning
+            self.results.solver.termination_message = "A feasible solution is available, but optimality was " \
+                                                      "not proven."
+            self.results.solver.termination_condition = TerminationCondition.other
+            soln.status = SolutionStatus.feasible
+            has_solution = True
+        else:
+            self.results.solver.status = SolverStatus.error
+            self.results.solver.termination_message = \
+                ("Unhandled GLPK solve return code / status "
+                 "("+str(rc)+" / "+str(status)+")")
+            self.results.solver.termination_condition = TerminationCondition.error
+            soln.status = SolutionStatus.error
 
-            colvar_map = self._glpk_colvar_map
-            rowvar_map = self._glpk_rowvar_map
+        self.results.problem.name = glpk.glp_get_prob_name(lp)
 
-            for var_label in colvar_map:
-                col = colvar_map[ var_label ]
-                soln.variable[ var_label ] = {"Value" : get_col_prim( lp, col )}
+        if glpk.glp_get_obj_dir(lp) == glpk.GLP_MIN:
+            self.results.problem.sense = minimize
+        else:
+            self.results.problem.sense = maximize
+
+        self.results.problem.upper_bound = None
+        self.results.problem.lower_bound = None
+        if has_solution:
+            obj_val = getters.obj(lp)
+            if (not self._is_mip) or \
+               (soln.status == SolutionStatus.optimal and
+                rc != glpk.GLP_EMIPGAP):
+                self.results.problem.upper_bound = obj_val
+                self.results.problem.lower_bound = obj_val
+            elif self.results.problem.sense == minimize:
+                self.results.problem.upper_bound = obj_val
+            else:
+                self.results.problem.lower_bound = obj_val
 
-            for row_label in rowvar_map:
-                row = rowvar_map[ row_label ]
-                soln.constraint[ row_label ] = {"Value" : get_row_prim( lp, row )}
+        try:
+            soln.gap = self.results.problem.upper_bound - self.results.problem.lower_bound
+        except TypeError:
+            soln.gap = None
+
+        num_cols = glpk.glp_get_num_cols(lp)
+        num_int = glpk.glp_get_num_int(lp)
+        num_bin = glpk.glp_get_num_bin(lp)
+        self.results.problem.number_of_constraints = glpk.glp_get_num_rows(lp)
+        self.results.problem.number_of_nonzeros = glpk.glp_get_num_nz(lp)
+        self.results.problem.number_of_variables = num_cols
+        self.results.problem.number_of_binary_variables = num_bin
+        self.results.problem.number_of_integer_variables = num_int - num_bin
+        self.results.problem.number_of_continuous_variables = num_cols - num_int
+        self.results.problem.number_of_objectives = 1
+        self.results.problem.number_of_solutions = int(has_solution)
+
+        # if a solve was stopped by a limit, we still need to check to
+        # see if there is a solution available - this may not always
+        # be the case, both in LP and MIP contexts.
+        if self._save_results:
+            """
+            This code in this if statement is only needed for backwards compatability. It is more efficient to set
+            _save_results to False and use load_vars, load_duals, etc.
+            """
+            if has_solution:
+                soln_variables = soln.variable
+                soln_constraints = soln.constraint
+
+                ref_vars = self._referenced_variables
+                var_map = self._pyomo_var_to_solver_var_map
+                var_vals = self._col_values(getters.col_prim)
+                if extract_reduced_costs:
+                    rc_vals = self._col_values(getters.col_dual)
+                for j, pyomo_var in enumerate(self._glpk_cols):
+                    if ref_vars[pyomo_var] > 0:
+                        pyomo_var.stale = False
+                        data = {"Value": var_vals[j]}
+                        if extract_reduced_costs:
+                            data["Rc"] = rc_vals[j]
+                        soln_variables[var_map[pyomo_var]] = data
+
+                if extract_duals or extract_slacks:
+                    con_map = self._pyomo_con_to_solver_con_map
+                    con_names = [con_map[con] for con in self._glpk_rows]
+                    for name in con_names:
+                        soln_constraints[name] = {}
+
+                if extract_duals:
+                    vals = self._row_values(getters.row_dual)
+                    for val, name in zip(vals, con_names):
+                        soln_constraints[name]["Dual"] = val
+
+                if extract_slacks:
+                    vals = self._row_slacks()
+                    for val, name in zip(vals, con_names):
+                        soln_constraints[name]["Slack"] = val
+        elif self._load_solutions:
+            if has_solution:
+
+                self._load_vars()
+
+                if extract_reduced_costs:
+                    self._load_rc()
+
+                if extract_duals:
+                    self._load_duals()
+
+                if extract_slacks:
+                    self._load_slacks()
+
+        self.results.solution.insert(soln)
+
+        # finally, clean any temporary files registered with the temp file
+        # manager, created populated *directly* by this plugin.
+        TempfileManager.pop(remove=not self._keepfiles)
+
+        return DirectOrPersistentSolver._postsolve(self)
 
-        results.solution.insert(soln)
+    def warm_start_capable(self):
+        return False
 
-        self.results = results
+    def _load_vars(self, vars_to_load=None):
+        self._flush()
+        var_map = self._pyomo_var_to_solver_var_map
+        ref_vars = self._referenced_variables
+        getter = self._glpk_value_getters().col_prim
+        if vars_to_load is None:
+            vars_to_load = self._glpk_cols
+            vals = self._col_values(getter)
+        else:
+            vals = self._col_values(getter, [var_map[pyomo_var] for pyomo_var in vars_to_load])
+
+        for var, val in zip(vars_to_load, vals):
+            if ref_vars[var] > 0:
+                var.stale = False
+                var.value = val
+
+    def _load_rc(self, vars_to_load=None):
+        self._flush()
+        if not hasattr(self._pyomo_model, 'rc'):
+            self._pyomo_model.rc = Suffix(direction=Suffix.IMPORT)
+        var_map = self._pyomo_var_to_solver_var_map
+        ref_vars = self._referenced_variables
+        rc = self._pyomo_model.rc
+        getter = self._glpk_value_getters().col_dual
+        if getter is None:
+            raise RuntimeError("Cannot get reduced costs for MIP.")
+        if vars_to_load is None:
+            vars_to_load = self._glpk_cols
+            vals = self._col_values(getter)
+        else:
+            vals = self._col_values(getter, [var_map[pyomo_var] for pyomo_var in vars_to_load])
+
+        for var, val in zip(vars_to_load, vals):
+            if ref_vars[var] > 0:
+                rc[var] = val
+
+    def _load_duals(self, cons_to_load=None):
+        self._flush()
+        if not hasattr(self._pyomo_model, 'dual'):
+            self._pyomo_model.dual = Suffix(direction=Suffix.IMPORT)
+        con_map = self._pyomo_con_to_solver_con_map
+        dual = self._pyomo_model.dual
+        getter = self._glpk_value_getters().row_dual
+        if getter is None:
+            raise RuntimeError("Cannot get duals for MIP.")
+        if cons_to_load is None:
+            cons_to_load = self._glpk_rows
+            vals = self._row_values(getter)
+        else:
+            vals = self._row_values(getter, [con_map[pyomo_con] for pyomo_con in cons_to_load])
+
+        for con, val in zip(cons_to_load, vals):
+            dual[con] = val
+
+    def _load_slacks(self, cons_to_load=None):
+        self._flush()
+        if not hasattr(self._pyomo_model, 'slack'):
+            self._pyomo_model.slack = Suffix(direction=Suffix.IMPORT)
+        con_map = self._pyomo_con_to_solver_con_map
+        slack = self._pyomo_model.slack
+        if cons_to_load is None:
+            cons_to_load = self._glpk_rows
+            vals = self._row_slacks()
+        else:
+            vals = self._row_slacks([con_map[pyomo_con] for pyomo_con in cons_to_load])
+
+        for con, val in zip(cons_to_load, vals):
+            slack[con] = val
 
-        # All done with the GLPK object, so free up some memory.
-        glp_free( lp )
-        del self._glpk_instance, lp
+    def load_duals(self, cons_to_load=None):
+        """
+        Load the duals into the 'dual' suffix. The 'dual' suffix must live on the parent model.
 
-        # let the base class deal with returning results.
-        return OptSolver._postsolve(self)
+        Parameters
+        ----------
+        cons_to_load: list of Constraint
+        """
+        self._load_duals(cons_to_load)
 
+    def load_rc(self, vars_to_load):
+        """
+        Load the reduced costs into the 'rc' suffix. The 'rc' suffix must live on the parent model.
 
-# TODO: add MockGLPKDirect class
+        Parameters
+        ----------
+        vars_to_load: list of Var
+        """
+        self._load_rc(vars_to_load)
 
-if not glpk_python_api_exists:
-    SolverFactory().unregister('_glpk_direct')
-    # SolverFactory().deactivate('_mock_glpk_direct')
+    def load_slacks(self, cons_to_load=None):
+        """
+        Load the values of the slack variables into the 'slack' suffix. The 'slack' suffix must live on the parent
+        model.
 
-# vim: set fileencoding=utf-8
+        Parameters
+        ----------
+        cons_to_load: list of Constraint
+        """
+        self._load_slacks(cons_to_load)
@@ -0,0 +1,103 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+from pyomo.solvers.plugins.solvers.glpk_direct import GLPKDirect
+from pyomo.solvers.plugins.solvers.persistent_solver import PersistentSolver
+from pyomo.opt.base import SolverFactory
+
+
+@SolverFactory.register('glpk_persistent', doc='Persistent python interface to GLPK')
+class GLPKPersistent(PersistentSolver, GLPKDirect):
+    """
+    A class that provides a persistent interface to GLPK. Direct solver interfaces do not use any file io.
+    Rather, they interface directly with the python bindings for the specific solver. Persistent solver interfaces
+    are similar except that they "remember" their model. Thus, persistent solver interfaces allow incremental changes
+    to the solver model (e.g., the gurobi python model or the cplex python model). Note that users are responsible
+    for notifying the persistent solver interfaces when changes are made to the corresponding pyomo model.
+
+    Blocks passed to set_instance or add_block are loaded into GLPK with a single bulk matrix load. Removed
+    constraints and variables are deleted from GLPK with a single glp_del_rows / glp_del_cols call before the next
+    solve. The basis from the previous solve is kept, so LP re-solves after incremental changes start from it.
+
+    Keyword Arguments
+    -----------------
+    model: ConcreteModel
+        Passing a model to the constructor is equivalent to calling the set_instance mehtod.
+    type: str
+        String indicating the class type of the solver instance.
+    name: str
+        String representing either the class type of the solver instance or an assigned name.
+    doc: str
+        Documentation for the solver
+    options: dict
+        Dictionary of solver options
+    """
+
+    def __init__(self, **kwds):
+        kwds['type'] = 'glpk_persistent'
+        PersistentSolver.__init__(self, **kwds)
+        GLPKDirect._init(self)
+
+        self._pyomo_model = kwds.pop('model', None)
+        if self._pyomo_model is not None:
+            self.set_instance(self._pyomo_model, **kwds)
+
+    def _remove_constraint(self, solver_con):
+        # The row is deleted (together with any other removed rows and
+        # columns) on the next _flush
+        i = self._row_number(solver_con)
+        self._glpk_rows[i-1] = None
+        del self._row_numbers[solver_con]
+        self._buffer.del_rows.append(i)
+
+    def _remove_sos_constraint(self, solver_sos_con):
+        raise ValueError("Solver={0} does not support SOS constraints".format(self.type))
+
+    def _remove_var(self, solver_var):
+        j = self._col_number(solver_var)
+        self._glpk_cols[j-1] = None
+        del self._col_numbers[solver_var]
+        self._buffer.del_cols.append(j)
+
+    def update_var(self, var):
+        """Update a single variable in the solver's model.
+
+        This will update bounds, fix/unfix the variable as needed, and
+        update the variable type.
+
+        Parameters
+        ----------
+        var: Var (scalar Var or single _VarData)
+
+        """
+        # see PR #366 for discussion about handling indexed
+        # objects and keeping compatibility with the
+        # pyomo.kernel objects
+        #if var.is_indexed():
+        #    for child_var in var.values():
+        #        self.update_var(child_var)
+        #    return
+        if var not in self._pyomo_var_to_solver_var_map:
+            raise ValueError('The Var provided to update_var needs to be added first: {0}'.format(var))
+        self._flush()
+        j = self._col_number(self._pyomo_var_to_solver_var_map[var])
+        self._set_glpk_col(j, var)
+
+    def write(self, filename):
+        """
+        Write the model to an LP file.
+
+        Parameters
+        ----------
+        filename: str
+            Name of the file to which the model should be written.
+        """
+        self._flush()
+        self._glpk.glp_write_lp(self._solver_model, None, filename)
@@ -32,7 +32,6 @@ import pyomo.core.base.var
 
 logger = logging.getLogger('pyomo.solvers')
 
-
 class DegreeError(ValueError):
     pass
 
@@ -80,6 +79,13 @@ class GurobiDirect(DirectSolver):
             self._python_api_exists = False
 
         self._range_constraints = set()
+        self._range_con_vars = dict()
+
+        # Variables and linear constraints are collected while a block
+        # is added to the model and are then passed to Gurobi in bulk
+        self._buffering = False
+        self._buffered_vars = []
+        self._buffered_cons = []
 
         self._max_obj_degree = 2
         self._max_constraint_degree = 2
@@ -203,14 +209,22 @@ class GurobiDirect(DirectSolver):
     def _add_var(self, var):
         varname = self._symbol_map.getSymbol(var, self._labeler)
         vtype = self._gurobi_vtype_from_var(var)
-        if var.has_lb():
-            lb = value(var.lb)
-        else:
-            lb = -self._gurobipy.GRB.INFINITY
-        if var.has_ub():
-            ub = value(var.ub)
+        if var.is_fixed():
+            lb = var.value
+            ub = var.value
         else:
-            ub = self._gurobipy.GRB.INFINITY
+            if var.has_lb():
+                lb = value(var.lb)
+            else:
+                lb = -self._gurobipy.GRB.INFINITY
+            if var.has_ub():
+                ub = value(var.ub)
+            else:
+                ub = self._gurobipy.GRB.INFINITY
+
+        if self._buffering:
+            self._buffered_vars.append((var, varname, vtype, lb, ub))
+            return
 
         gurobipy_var = self._solver_model.addVar(lb=lb, ub=ub, vtype=vtype, name=varname)
 
@@ -218,12 +232,40 @@ class GurobiDirect(DirectSolver):
         self._solver_var_to_pyomo_var_map[gurobipy_var] = var
         self._referenced_variables[var] = 0
 
-        if var.is_fixed():
-            gurobipy_var.setAttr('lb', var.value)
-            gurobipy_var.setAttr('ub', var.value)
+    def _flush_vars(self):
+        """
+        Add the buffered variables to the Gurobi model.
+        """
+        if len(self._buffered_vars) == 0:
+            return
+        buffered_vars = self._buffered_vars
+        self._buffered_vars = []
+
+        pyomo_vars, names, vtypes, lbs, ubs = zip(*buffered_vars)
+        if hasattr(self._solver_model, 'addVars'):
+            # Gurobi 7.0 and later
+            new_vars = self._solver_model.addVars(len(pyomo_vars),
+                                                  lb=list(lbs),
+                                                  ub=list(ubs),
+                                                  vtype=list(vtypes))
+            gurobipy_vars = [new_vars[i] for i in range(len(pyomo_vars))]
+            # names passed to addVars are used as prefixes for the
+            # index of each variable, so they are set separately
+            self._solver_model.setAttr('VarName', gurobipy_vars, list(names))
+        else:
+            gurobipy_vars = [self._solver_model.addVar(lb=lb, ub=ub, vtype=vtype, name=name)
+                             for _, name, vtype, lb, ub in buffered_vars]
+
+        for var, gurobipy_var in zip(pyomo_vars, gurobipy_vars):
+            self._pyomo_var_to_solver_var_map[var] = gurobipy_var
+            self._solver_var_to_pyomo_var_map[gurobipy_var] = var
+            self._referenced_variables[var] = 0
 
     def _set_instance(self, model, kwds={}):
         self._range_constraints = set()
+        self._range_con_vars = dict()
+        self._buffered_vars = []
+        self._buffered_cons = []
         DirectOrPersistentSolver._set_instance(self, model, kwds)
         self._pyomo_con_to_solver_con_map = dict()
         self._solver_con_to_pyomo_con_map = ComponentMap()
@@ -259,7 +301,15 @@ class GurobiDirect(DirectSolver):
                             % (var.name, self._pyomo_model.name,))
 
     def _add_block(self, block):
-        DirectOrPersistentSolver._add_block(self, block)
+        buffering = self._buffering
+        self._buffering = True
+        try:
+            DirectOrPersistentSolver._add_block(self, block)
+        finally:
+            self._buffering = buffering
+        if not buffering:
+            self._flush_vars()
+            self._flush_constraints()
         self._solver_model.update()
 
     def _add_constraint(self, con):
@@ -272,19 +322,6 @@ class GurobiDirect(DirectSolver):
 
         conname = self._symbol_map.getSymbol(con, self._labeler)
 
-        if con._linear_canonical_form:
-            gurobi_expr, referenced_vars = self._get_expr_from_pyomo_repn(
-                con.canonical_form(),
-                self._max_constraint_degree)
-        #elif isinstance(con, LinearCanonicalRepn):
-        #    gurobi_expr, referenced_vars = self._get_expr_from_pyomo_repn(
-        #        con,
-        #        self._max_constraint_degree)
-        else:
-            gurobi_expr, referenced_vars = self._get_expr_from_pyomo_expr(
-                con.body,
-                self._max_constraint_degree)
-
         if con.has_lb():
             if not is_fixed(con.lower):
                 raise ValueError("Lower bound of constraint {0} "
@@ -294,6 +331,30 @@ class GurobiDirect(DirectSolver):
                 raise ValueError("Upper bound of constraint {0} "
                                  "is not constant.".format(con))
 
+        if con._linear_canonical_form:
+            repn = con.canonical_form()
+        else:
+            repn = generate_standard_repn(con.body,
+                                          quadratic=(self._max_constraint_degree == 2))
+
+        if self._buffering:
+            self._flush_vars()
+            if repn.is_linear() and \
+               (con.equality or not (con.has_lb() and con.has_ub())):
+                # Linear (non-range) constraints are added to the model
+                # at the end of _add_block
+                self._buffered_cons.append((con, conname, repn))
+                return
+
+        try:
+            gurobi_expr, referenced_vars = self._get_expr_from_pyomo_repn(
+                repn,
+                self._max_constraint_degree)
+        except DegreeError as e:
+            msg = e.args[0]
+            msg += '\nexpr: {0}'.format(con.body)
+            raise DegreeError(msg)
+
         if con.equality:
             gurobipy_con = self._solver_model.addConstr(lhs=gurobi_expr,
                                                         sense=self._gurobipy.GRB.EQUAL,
@@ -325,10 +386,93 @@ class GurobiDirect(DirectSolver):
         self._pyomo_con_to_solver_con_map[con] = gurobipy_con
         self._solver_con_to_pyomo_con_map[gurobipy_con] = con
 
+    def _flush_constraints(self):
+        """
+        Add the buffered linear constraints to the Gurobi model. When
+        scipy and Gurobi 10.0 or later are available, the constraints
+        are passed to Gurobi as a single sparse matrix.
+        """
+        if len(self._buffered_cons) == 0:
+            return
+        buffered_cons = self._buffered_cons
+        self._buffered_cons = []
+
+        GRB = self._gurobipy.GRB
+        names = []
+        senses = []
+        rhs = []
+        referenced_vars_list = []
+        for con, conname, repn in buffered_cons:
+            names.append(conname)
+            if con.equality:
+                senses.append(GRB.EQUAL)
+                rhs.append(value(con.lower) - repn.constant)
+            elif con.has_lb():
+                senses.append(GRB.GREATER_EQUAL)
+                rhs.append(value(con.lower) - repn.constant)
+            else:
+                senses.append(GRB.LESS_EQUAL)
+                rhs.append(value(con.upper) - repn.constant)
+            referenced_vars_list.append(ComponentSet(repn.linear_vars))
+
+        var_map = self._pyomo_var_to_solver_var_map
+        # addMConstr was added in Gurobi 10.0; like gurobipy, numpy and
+        # scipy are only imported when they are needed
+        use_matrix_api = self._version_major >= 10
+        if use_matrix_api:
+            try:
+                import numpy
+                import scipy.sparse
+            except ImportError:
+                use_matrix_api = False
+        if use_matrix_api:
+            columns = ComponentMap()
+            gurobi_vars = []
+            data = []
+            indices = []
+            indptr = [0]
+            for con, conname, repn in buffered_cons:
+                for v, coef in zip(repn.linear_vars, repn.linear_coefs):
+                    j = columns.get(v)
+                    if j is None:
+                        j = columns[v] = len(gurobi_vars)
+                        gurobi_vars.append(var_map[v])
+                    indices.append(j)
+                    data.append(value(coef))
+                indptr.append(len(indices))
+            A = scipy.sparse.csr_matrix((data, indices, indptr),
+                                        shape=(len(buffered_cons), len(gurobi_vars)))
+            gurobipy_cons = self._solver_model.addMConstr(A,
+                                                          gurobi_vars,
+                                                          numpy.array(senses),
+                                                          numpy.array(rhs, dtype=float)).tolist()
+            self._solver_model.setAttr('ConstrName', gurobipy_cons, names)
+        else:
+            gurobipy_cons = []
+            for i, (con, conname, repn) in enumerate(buffered_cons):
+                gurobi_expr = self._gurobipy.LinExpr(
+                    [value(coef) for coef in repn.linear_coefs],
+                    [var_map[v] for v in repn.linear_vars])
+                gurobipy_cons.append(self._solver_model.addConstr(lhs=gurobi_expr,
+                                                                  sense=senses[i],
+                                                                  rhs=rhs[i],
+                                                                  name=conname))
+
+        for (con, conname, repn), referenced_vars, gurobipy_con in \
+                zip(buffered_cons, referenced_vars_list, gurobipy_cons):
+            for var in referenced_vars:
+                self._referenced_variables[var] += 1
+            self._vars_referenced_by_con[con] = referenced_vars
+            self._pyomo_con_to_solver_con_map[con] = gurobipy_con
+            self._solver_con_to_pyomo_con_map[gurobipy_con] = con
+
     def _add_sos_constraint(self, con):
         if not con.active:
             return None
 
+        if self._buffering:
+            self._flush_vars()
+
         conname = self._symbol_map.getSymbol(con, self._labeler)
         level = con.level
         if level == 1:
@@ -394,6 +538,9 @@ class GurobiDirect(DirectSolver):
         else:
             raise ValueError('Objective sense is not recognized: {0}'.format(obj.sense))
 
+        if self._buffering:
+            self._flush_vars()
+
         gurobi_expr, referenced_vars = self._get_expr_from_pyomo_expr(obj.expr, self._max_obj_degree)
 
         for var in referenced_vars:
@@ -715,83 +862,92 @@ class GurobiDirect(DirectSolver):
         if vars_to_load is None:
             vars_to_load = var_map.keys()
 
+        vars_to_load = [var for var in vars_to_load if ref_vars[var] > 0]
         gurobi_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
         vals = self._solver_model.getAttr("Rc", gurobi_vars_to_load)
 
-        for var, val in zip(vars_to_load, vals):
-            if ref_vars[var] > 0:
-                rc[var] = val
-
-    def _load_duals(self, cons_to_load=None):
-        if not hasattr(self._pyomo_model, 'dual'):
-            self._pyomo_model.dual = Suffix(direction=Suffix.IMPORT)
-        con_map = self._pyomo_con_to_solver_con_map
-        reverse_con_map = self._solver_con_to_pyomo_con_map
-        dual = self._pyomo_model.dual
+        rc.update(zip(vars_to_load, vals))
 
+    def _get_cons_to_load(self, cons_to_load):
+        """
+        Split the constraints into linear and quadratic
+        constraints. Returns two lists of (pyomo constraint,
+        gurobi constraint) pairs.
+        """
         if cons_to_load is None:
-            linear_cons_to_load = self._solver_model.getConstrs()
-            if self._version_major >= 5:
-                quadratic_cons_to_load = self._solver_model.getQConstrs()
+            con_items = self._pyomo_con_to_solver_con_map.items()
         else:
-            gurobi_cons_to_load = set([con_map[pyomo_con] for pyomo_con in cons_to_load])
-            linear_cons_to_load = gurobi_cons_to_load.intersection(set(self._solver_model.getConstrs()))
-            if self._version_major >= 5:
-                quadratic_cons_to_load = gurobi_cons_to_load.intersection(set(self._solver_model.getQConstrs()))
-        linear_vals = self._solver_model.getAttr("Pi", linear_cons_to_load)
-        if self._version_major >= 5:
-            quadratic_vals = self._solver_model.getAttr("QCPi", quadratic_cons_to_load)
+            con_map = self._pyomo_con_to_solver_con_map
+            con_items = [(pyomo_con, con_map[pyomo_con]) for pyomo_con in cons_to_load]
 
-        for gurobi_con, val in zip(linear_cons_to_load, linear_vals):
-            pyomo_con = reverse_con_map[gurobi_con]
-            dual[pyomo_con] = val
+        Constr = self._gurobipy.Constr
+        linear_cons = [item for item in con_items if isinstance(item[1], Constr)]
         if self._version_major >= 5:
-            for gurobi_con, val in zip(quadratic_cons_to_load, quadratic_vals):
-                pyomo_con = reverse_con_map[gurobi_con]
-                dual[pyomo_con] = val
-
-    def _load_slacks(self, cons_to_load=None):
-        if not hasattr(self._pyomo_model, 'slack'):
-            self._pyomo_model.slack = Suffix(direction=Suffix.IMPORT)
-        con_map = self._pyomo_con_to_solver_con_map
-        reverse_con_map = self._solver_con_to_pyomo_con_map
-        slack = self._pyomo_model.slack
+            QConstr = self._gurobipy.QConstr
+            quadratic_cons = [item for item in con_items if isinstance(item[1], QConstr)]
+        else:
+            quadratic_cons = []
+        return linear_cons, quadratic_cons
 
-        gurobi_range_con_vars = set(self._solver_model.getVars()) - set(self._pyomo_var_to_solver_var_map.values())
+    def _load_duals(self, cons_to_load=None):
+        if not hasattr(self._pyomo_model, 'dual'):
+            self._pyomo_model.dual = Suffix(direction=Suffix.IMPORT)
+        dual = self._pyomo_model.dual
 
-        if cons_to_load is None:
-            linear_cons_to_load = self._solver_model.getConstrs()
-            if self._version_major >= 5:
-                quadratic_cons_to_load = self._solver_model.getQConstrs()
-        else:
-            gurobi_cons_to_load = set([con_map[pyomo_con] for pyomo_con in cons_to_load])
-            linear_cons_to_load = gurobi_cons_to_load.intersection(set(self._solver_model.getConstrs()))
-            if self._version_major >= 5:
-                quadratic_cons_to_load = gurobi_cons_to_load.intersection(set(self._solver_model.getQConstrs()))
-        linear_vals = self._solver_model.getAttr("Slack", linear_cons_to_load)
-        if self._version_major >= 5:
-            quadratic_vals = self._solver_model.getAttr("QCSlack", quadratic_cons_to_load)
+        linear_cons, quadratic_cons = self._get_cons_to_load(cons_to_load)
+        if len(linear_cons) > 0:
+            pyomo_cons, gurobi_cons = zip(*linear_cons)
+            dual.update(zip(pyomo_cons, self._solver_model.getAttr("Pi", list(gurobi_cons))))
+        if len(quadratic_cons) > 0:
+            pyomo_cons, gurobi_cons = zip(*quadratic_cons)
+            dual.update(zip(pyomo_cons, self._solver_model.getAttr("QCPi", list(gurobi_cons))))
 
-        for gurobi_con, val in zip(linear_cons_to_load, linear_vals):
-            pyomo_con = reverse_con_map[gurobi_con]
-            if pyomo_con in self._range_constraints:
+    def _get_range_con_vars(self, range_cons):
+        """
+        Return the variables Gurobi added for the given range
+        constraints.
+        """
+        range_con_vars = self._range_con_vars
+        missing = [(pyomo_con, gurobi_con) for pyomo_con, gurobi_con in range_cons
+                   if pyomo_con not in range_con_vars]
+        if len(missing) > 0:
+            gurobi_range_con_vars = set(self._solver_model.getVars()) - set(self._pyomo_var_to_solver_var_map.values())
+            for pyomo_con, gurobi_con in missing:
                 lin_expr = self._solver_model.getRow(gurobi_con)
                 for i in reversed(range(lin_expr.size())):
                     v = lin_expr.getVar(i)
                     if v in gurobi_range_con_vars:
-                        Us_ = v.X
-                        Ls_ = v.UB - v.X
-                        if Us_ > Ls_:
-                            slack[pyomo_con] = Us_
-                        else:
-                            slack[pyomo_con] = -Ls_
+                        range_con_vars[pyomo_con] = v
                         break
-            else:
-                slack[pyomo_con] = val
-        if self._version_major >= 5:
-            for gurobi_con, val in zip(quadratic_cons_to_load, quadratic_vals):
-                pyomo_con = reverse_con_map[gurobi_con]
-                slack[pyomo_con] = val
+        return [range_con_vars[pyomo_con] for pyomo_con, gurobi_con in range_cons]
+
+    def _load_slacks(self, cons_to_load=None):
+        if not hasattr(self._pyomo_model, 'slack'):
+            self._pyomo_model.slack = Suffix(direction=Suffix.IMPORT)
+        slack = self._pyomo_model.slack
+
+        linear_cons, quadratic_cons = self._get_cons_to_load(cons_to_load)
+        range_cons = [item for item in linear_cons if item[0] in self._range_constraints]
+        if len(range_cons) > 0:
+            linear_cons = [item for item in linear_cons if item[0] not in self._range_constraints]
+        if len(linear_cons) > 0:
+            pyomo_cons, gurobi_cons = zip(*linear_cons)
+            slack.update(zip(pyomo_cons, self._solver_model.getAttr("Slack", list(gurobi_cons))))
+        if len(range_cons) > 0:
+            range_vars = self._get_range_con_vars(range_cons)
+            vals = self._solver_model.getAttr("X", range_vars)
+            ubs = self._solver_model.getAttr("UB", range_vars)
+            range_slacks = []
+            for Us_, ub in zip(vals, ubs):
+                Ls_ = ub - Us_
+                if Us_ > Ls_:
+                    range_slacks.append(Us_)
+                else:
+                    range_slacks.append(-Ls_)
+            slack.update(zip([pyomo_con for pyomo_con, _ in range_cons], range_slacks))
+        if len(quadratic_cons) > 0:
+            pyomo_cons, gurobi_cons = zip(*quadratic_cons)
+            slack.update(zip(pyomo_cons, self._solver_model.getAttr("QCSlack", list(gurobi_cons))))
 
     def load_duals(self, cons_to_load=None):
         """
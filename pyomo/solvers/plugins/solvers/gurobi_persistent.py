@@ -48,6 +48,9 @@ class GurobiPersistent(PersistentSolver, GurobiDirect):
             self.set_instance(self._pyomo_model, **kwds)
 
     def _remove_constraint(self, solver_con):
+        pyomo_con = self._solver_con_to_pyomo_con_map[solver_con]
+        self._range_constraints.discard(pyomo_con)
+        self._range_con_vars.pop(pyomo_con, None)
         self._solver_model.remove(solver_con)
 
     def _remove_sos_constraint(self, solver_sos_con):
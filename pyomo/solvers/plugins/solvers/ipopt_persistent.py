@@ -0,0 +1,337 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import os
+import shutil
+import tempfile
+
+from pyomo.core.base.block import _BlockData
+from pyomo.core.base.param import Param
+from pyomo.core.base.var import Var
+from pyomo.opt.base import SolverFactory, ProblemFormat
+from pyomo.opt.results import TerminationCondition
+from pyomo.repn.plugins.ampl.ampl_ import _get_bound, _bound_line
+from pyomo.solvers.plugins.solvers.IPOPT import IPOPT
+
+from six import iteritems, itervalues
+
+# The first character of the lines that start a segment of an NL
+# file. Expression and data lines within a segment never start with
+# one of these characters.
+_nl_segment_keys = frozenset('FSVCLOdxrbkJG')
+_nl_header_lines = 10
+
+# Ipopt suffixes used to warm start from the previous solution
+_warm_start_suffixes = ('dual', 'ipopt_zL_out', 'ipopt_zU_out')
+
+
+def _split_nl_segments(text):
+    """
+    Split the contents of an NL file into the header and a list of
+    (key, text) segments, in file order.
+    """
+    lines = text.splitlines(True)
+    header = ''.join(lines[:_nl_header_lines])
+    segments = []
+    for line in lines[_nl_header_lines:]:
+        if line[0] in _nl_segment_keys:
+            segments.append([line[0], [line]])
+        else:
+            segments[-1][1].append(line)
+    return header, [(key, ''.join(seg_lines))
+                    for key, seg_lines in segments]
+
+
+@SolverFactory.register('ipopt_persistent',
+                        doc='Persistent interface to the Ipopt NLP solver')
+class IPOPTPersistent(IPOPT):
+    """
+    A persistent interface to the Ipopt optimizer.
+
+    The model passed to set_instance is written to an NL file once.
+    Subsequent solves regenerate only the segments of the file that
+    hold the variable bounds and the initial point, and warm start
+    Ipopt from the primal and dual solution of the previous solve.
+
+    The NL writer substitutes the values of the variables that are
+    fixed when the file is written.  Variables that are free when the
+    file is written may be fixed, unfixed or fixed to new values
+    between solves (e.g., to pass new measurements to the model)
+    without rewriting the file: they are fixed through their bounds.
+    Unfixing a variable that was fixed when the file was written,
+    changing its value, or changing the value of a mutable Param
+    causes the file to be rewritten on the next solve.  Any other
+    change to the model (adding, removing, activating or deactivating
+    components, or modifying expressions) requires another call to
+    set_instance.
+
+    Keyword Arguments
+    -----------------
+    model: ConcreteModel
+        Passing a model to the constructor is equivalent to calling
+        the set_instance method.
+    """
+
+    def __init__(self, **kwds):
+        model = kwds.pop('model', None)
+        super(IPOPTPersistent, self).__init__(**kwds)
+        self._instance = None
+        self._io_options = {}
+        self._symbol_map = None
+        self._nl_header = None
+        self._nl_segments = None
+        self._nl_vars = None
+        self._nl_params = None
+        self._nl_fixed_vars = None
+        self._warm_start = True
+        self._use_warm_start = False
+        self._warm_start_option = False
+        self._reset_warm_start()
+        if model is not None:
+            self.set_instance(model)
+
+    def set_instance(self, model, **kwds):
+        """
+        Write the NL file for the model.  Any keywords are passed as
+        io_options to the NL writer (e.g., symbolic_solver_labels).
+
+        Parameters
+        ----------
+        model: ConcreteModel
+            The model that will be solved.
+        """
+        if not isinstance(model, _BlockData):
+            raise ValueError(
+                "The %s solver only supports Pyomo Block models"
+                % (self.name,))
+        self._instance = model
+        self._io_options = dict(kwds)
+        self._reset_warm_start()
+        self._write_instance()
+
+    def has_instance(self):
+        """
+        True if set_instance has been called and this solver
+        interface has a Pyomo model.
+
+        Returns
+        -------
+        tmp: bool
+        """
+        return self._instance is not None
+
+    def solve(self, *args, **kwds):
+        """
+        Solve the model that was passed to set_instance.
+
+        Keyword Arguments
+        -----------------
+        warm_start: bool
+            If True (the default), the primal and dual solution of the
+            previous successful solve are used to initialize Ipopt.
+
+        See the IPOPT solver for the remaining keyword arguments.
+        """
+        if self._instance is None:
+            raise RuntimeError(
+                "The %s solver has no instance; call set_instance before "
+                "calling solve" % (self.name,))
+        if len(args) == 0:
+            args = (self._instance,)
+        elif len(args) != 1 or args[0] is not self._instance:
+            raise ValueError(
+                "The %s solver can only solve the model passed to "
+                "set_instance" % (self.name,))
+        self._warm_start = kwds.pop('warm_start', True)
+        return super(IPOPTPersistent, self).solve(*args, **kwds)
+
+    def _reset_warm_start(self):
+        self._zL = None
+        self._zU = None
+        self._duals = None
+
+    def _write_instance(self):
+        """
+        Write the NL file for the instance and split it into segments.
+        """
+        model = self._instance
+        tmpdir = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(tmpdir, 'model.pyomo.nl')
+            _, smap_id = model.write(filename=filename,
+                                     format=ProblemFormat.nl,
+                                     io_options=self._io_options)
+            with open(filename) as INPUT:
+                text = INPUT.read()
+        finally:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+        self._symbol_map = model.solutions.symbol_map[smap_id]
+        model.solutions.delete_symbol_map(smap_id)
+        self._nl_header, self._nl_segments = _split_nl_segments(text)
+        nvars = int(self._nl_header.splitlines()[1].split()[0])
+        bySymbol = self._symbol_map.bySymbol
+        self._nl_vars = [bySymbol['v%d' % i]() for i in range(nvars)]
+        self._nl_params = []
+        for param in model.component_objects(Param, descend_into=True):
+            if param._mutable:
+                for param_data in itervalues(param):
+                    self._nl_params.append((param_data, param_data.value))
+        # The values of these variables were substituted by the writer
+        self._nl_fixed_vars = [
+            (var, var.value) for var in model.component_data_objects(
+                Var, descend_into=True) if var.fixed]
+
+    def _instance_modified(self):
+        """
+        Returns True if the NL file must be rewritten, because a mutable
+        Param or a variable that was fixed when the file was written
+        changed.
+        """
+        for param_data, val in self._nl_params:
+            if param_data.value != val:
+                return True
+        for var, val in self._nl_fixed_vars:
+            if (not var.fixed) or (var.value != val):
+                return True
+        return False
+
+    def _nl_text(self, warm_start):
+        """
+        Return the contents of the NL file for the current state of the
+        instance.
+        """
+        labels = self._io_options.get('symbolic_solver_labels', False)
+        if warm_start:
+            s_segments = []
+            for name, vals in (('ipopt_zL_in', self._zL),
+                               ('ipopt_zU_in', self._zU)):
+                s_segments.append(
+                    "S4 %d %s\n" % (len(vals), name) +
+                    "".join("%d %r\n" % (i, vals[i]) for i in sorted(vals)))
+            d_segment = "d%d" % (len(self._duals))
+            if labels:
+                d_segment += "\t# dual initial guess"
+            d_segment += "\n" + "".join("%d %r\n" % (i, self._duals[i])
+                                        for i in sorted(self._duals))
+
+        x_lines = []
+        b_lines = []
+        for i, var in enumerate(self._nl_vars):
+            if var.value is not None:
+                x_lines.append("%d %r\n" % (i, var.value))
+            if var.fixed:
+                if var.value is None:
+                    raise ValueError(
+                        "Variable cannot be fixed to a value of None.")
+                L = U = _get_bound(var.value)
+            else:
+                L = None
+                if var.has_lb():
+                    L = _get_bound(var.lb)
+                U = None
+                if var.has_ub():
+                    U = _get_bound(var.ub)
+            b_lines.append(_bound_line(L, U))
+
+        x_segment = "x%d" % (len(x_lines))
+        b_segment = "b"
+        if labels:
+            x_segment += "\t# initial guess"
+            b_segment += "\t#%d bounds (on variables)" % (len(b_lines))
+        x_segment += "\n" + "".join(x_lines)
+        b_segment += "\n" + "".join(b_lines)
+
+        text = [self._nl_header]
+        for key, segment in self._nl_segments:
+            if key == 'S' and warm_start and \
+               segment.split(None, 3)[2] in ('ipopt_zL_in', 'ipopt_zU_in'):
+                continue
+            elif key == 'd' and warm_start:
+                continue
+            elif key == 'x':
+                if warm_start:
+                    text.extend(s_segments)
+                    text.append(d_segment)
+                text.append(x_segment)
+            elif key == 'b':
+                text.append(b_segment)
+            else:
+                text.append(segment)
+        return "".join(text)
+
+    def _remove_warm_start_option(self):
+        if self._warm_start_option:
+            self._warm_start_option = False
+            self.options.pop('warm_start_init_point', None)
+
+    def _presolve(self, *args, **kwds):
+        if self._instance_modified():
+            self._write_instance()
+        self._use_warm_start = self._warm_start and \
+            (self._duals is not None)
+        # The option is only set for this solve, and is removed in
+        # _postsolve (if the solve fails, OptSolver.solve restores the
+        # options that were set before the solve)
+        self._warm_start_option = False
+        if self._use_warm_start and \
+           ('warm_start_init_point' not in self.options):
+            self.options['warm_start_init_point'] = 'yes'
+            self._warm_start_option = True
+        super(IPOPTPersistent, self)._presolve(*args, **kwds)
+        # Always request the multipliers so that the next solve can be
+        # warm started
+        self._suffixes = list(self._suffixes)
+        for suffix in _warm_start_suffixes:
+            if suffix not in self._suffixes:
+                self._suffixes.append(suffix)
+
+    def _convert_problem(self,
+                         args,
+                         problem_format,
+                         valid_problem_formats,
+                         **kwds):
+        if len(kwds):
+            raise ValueError(
+                "Solver=%s passed unrecognized keywords: \n\t%s\n"
+                "NL writer options must be passed to set_instance"
+                % (self.type, "\n\t".join("%s = %s" % (k, v)
+                                          for k, v in iteritems(kwds))))
+        filename = self._create_tempfile(suffix='.pyomo.nl')
+        with open(filename, 'w') as OUTPUT:
+            OUTPUT.write(self._nl_text(self._use_warm_start))
+        # The symbol map is removed from the model when the solution is
+        # loaded, so it is added back for every solve
+        self._instance.solutions.add_symbol_map(self._symbol_map)
+        return (filename,), ProblemFormat.nl, id(self._symbol_map)
+
+    def _postsolve(self):
+        self._remove_warm_start_option()
+        results = super(IPOPTPersistent, self)._postsolve()
+        self._reset_warm_start()
+        if (len(results.solution) > 0) and \
+           (results.solver.termination_condition ==
+            TerminationCondition.optimal):
+            soln = results.solution(0)
+            zL = {}
+            zU = {}
+            for symbol, data in iteritems(soln.variable):
+                if 'ipopt_zL_out' in data:
+                    zL[int(symbol[1:])] = data['ipopt_zL_out']
+                if 'ipopt_zU_out' in data:
+                    zU[int(symbol[1:])] = data['ipopt_zU_out']
+            duals = {}
+            for symbol, data in iteritems(soln.constraint):
+                if 'Dual' in data:
+                    duals[int(symbol[1:])] = data['Dual']
+            self._zL = zL
+            self._zU = zU
+            self._duals = duals
+        return results
@@ -10,7 +10,8 @@
 
 
 from pyomo.environ import *
-from pyomo.solvers.plugins.solvers.GAMS import GAMSShell, GAMSDirect
+from pyomo.solvers.plugins.solvers.GAMS import GAMSShell, GAMSDirect, \
+    _GamsWorkspacePool
 import pyutilib.th as unittest
 from pyutilib.misc import capture_output
 import os, shutil
@@ -418,6 +419,59 @@ class GAMSLogfilePyTests(GAMSLogfileTestBase):
         self._check_logfile(exists=True)
 
 
+class _FakeWorkspace(object):
+
+    def __init__(self):
+        self.working_directory = mkdtemp()
+
+
+class GAMSWorkspacePoolTests(unittest.TestCase):
+
+    def setUp(self):
+        self.created = []
+        def factory():
+            ws = _FakeWorkspace()
+            self.created.append(ws)
+            return ws
+        self.pool = _GamsWorkspacePool(max_size=2, max_jobs=3,
+                                       factory=factory)
+
+    def tearDown(self):
+        for ws in self.created:
+            if os.path.exists(ws.working_directory):
+                shutil.rmtree(ws.working_directory)
+
+    def test_reuse(self):
+        ws, njobs = self.pool.acquire()
+        self.assertEqual(njobs, 0)
+        self.pool.release(ws, njobs + 1)
+        self.assertEqual(len(self.pool), 1)
+        ws2, njobs = self.pool.acquire()
+        self.assertIs(ws2, ws)
+        self.assertEqual(njobs, 1)
+        self.assertEqual(len(self.created), 1)
+
+    def test_bounds(self):
+        workspaces = [self.pool.acquire() for i in range(3)]
+        for ws, njobs in workspaces:
+            self.pool.release(ws, njobs + 1)
+        # at most max_size idle workspaces are kept
+        self.assertEqual(len(self.pool), 2)
+        # workspaces are retired after max_jobs jobs
+        ws, njobs = self.pool.acquire()
+        self.pool.release(ws, 3)
+        self.assertEqual(len(self.pool), 1)
+        self.pool.clear()
+        self.assertEqual(len(self.pool), 0)
+
+    def test_health_check(self):
+        ws, njobs = self.pool.acquire()
+        self.pool.release(ws, njobs + 1)
+        shutil.rmtree(ws.working_directory)
+        ws2, njobs = self.pool.acquire()
+        self.assertIsNot(ws2, ws)
+        self.assertEqual(njobs, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
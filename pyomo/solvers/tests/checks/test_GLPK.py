@@ -0,0 +1,89 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import os
+import stat
+
+import pyutilib.th as unittest
+from pyomo.opt import *
+from pyomo.environ import *
+
+from pyomo.solvers.tests.solvers import test_solver_cases as _test_solver_cases
+glpk_available = _test_solver_cases('glpk', 'lp').available
+
+
+def _lp_model(n=1000):
+    model = ConcreteModel()
+    model.I = RangeSet(n)
+    model.x = Var(model.I, bounds=(0, 10))
+    model.y = Var(model.I, bounds=(0, 1))
+    model.c = Constraint(model.I,
+                         rule=lambda m, i: m.x[i] <= 10*m.y[i])
+    model.d = Constraint(expr=sum(model.x[i] for i in model.I) >= 50)
+    model.o = Objective(expr=sum((i % 7 + 1)*model.x[i] + model.y[i]
+                                 for i in model.I))
+    return model
+
+
+@unittest.skipIf(not glpk_available,
+                 "The 'glpk' executable is not available")
+class GLPKPipelineTests(unittest.TestCase):
+
+    def _solve(self, model, **kwds):
+        problem_files = []
+        with SolverFactory("glpk") as opt:
+            start_pipelined_writer = opt._start_pipelined_writer
+            def _start_pipelined_writer(*args):
+                ans = start_pipelined_writer(*args)
+                problem_files.extend(ans[0])
+                self.assertTrue(stat.S_ISFIFO(os.stat(ans[0][0]).st_mode))
+                return ans
+            opt._start_pipelined_writer = _start_pipelined_writer
+            results = opt.solve(model, **kwds)
+        return results, problem_files
+
+    def test_pipeline(self):
+        model = _lp_model()
+        results, problem_files = self._solve(model)
+        self.assertEqual(problem_files, [])
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.optimal)
+        x = dict((i, value(model.x[i])) for i in model.I)
+        obj = value(model.o)
+
+        model = _lp_model()
+        results, problem_files = self._solve(model, pipeline=True)
+        self.assertEqual(len(problem_files), 1)
+        self.assertFalse(os.path.exists(problem_files[0]))
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.optimal)
+        self.assertAlmostEqual(value(model.o), obj)
+        for i in model.I:
+            self.assertAlmostEqual(value(model.x[i]), x[i])
+
+    def test_pipeline_symbolic_solver_labels(self):
+        model = _lp_model(10)
+        results, problem_files = self._solve(model,
+                                             pipeline=True,
+                                             symbolic_solver_labels=True)
+        self.assertEqual(len(problem_files), 1)
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.optimal)
+        self.assertAlmostEqual(value(model.o), 115)
+
+    def test_pipeline_writer_error(self):
+        model = _lp_model(10)
+        model.nonlinear = Constraint(expr=model.x[1]**3 <= 1)
+        with self.assertRaisesRegexp(ValueError, "nonlinear"):
+            self._solve(model, pipeline=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
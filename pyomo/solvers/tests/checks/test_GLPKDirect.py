@@ -0,0 +1,198 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyutilib.th as unittest
+from pyomo.opt import *
+from pyomo.environ import *
+
+try:
+    import swiglpk
+    glpkpy_available = True
+except ImportError:
+    glpkpy_available = False
+
+diff_tol = 1e-6
+
+
+def _lp_model():
+    model = ConcreteModel()
+    model.X = Var(within=NonNegativeReals)
+    model.Y = Var(within=NonNegativeReals)
+    model.C1 = Constraint(expr= model.X + 2*model.Y >= 4)
+    model.C2 = Constraint(expr= (1, model.X - model.Y, 3))
+    model.O = Objective(expr= model.X + 3*model.Y)
+    return model
+
+
+class GLPKDirectTests(unittest.TestCase):
+
+    @unittest.skipIf(not glpkpy_available,
+                     "The 'swiglpk' python bindings are not available")
+    def test_infeasible_lp(self):
+        with SolverFactory("glpk", solver_io="python") as opt:
+
+            model = ConcreteModel()
+            model.X = Var(within=NonNegativeReals)
+            model.C1 = Constraint(expr= model.X==1)
+            model.C2 = Constraint(expr= model.X==2)
+            model.O = Objective(expr= model.X)
+
+            results = opt.solve(model)
+
+            self.assertEqual(results.solver.termination_condition,
+                             TerminationCondition.infeasible)
+
+    @unittest.skipIf(not glpkpy_available,
+                     "The 'swiglpk' python bindings are not available")
+    def test_unbounded_lp(self):
+        with SolverFactory("glpk", solver_io="python") as opt:
+
+            model = ConcreteModel()
+            model.X = Var()
+            model.O = Objective(expr= model.X)
+
+            results = opt.solve(model)
+
+            self.assertIn(results.solver.termination_condition,
+                          (TerminationCondition.unbounded,
+                           TerminationCondition.infeasibleOrUnbounded))
+
+    @unittest.skipIf(not glpkpy_available,
+                     "The 'swiglpk' python bindings are not available")
+    def test_get_duals_lp(self):
+        with SolverFactory("glpk", solver_io="python") as opt:
+
+            model = _lp_model()
+            model.dual = Suffix(direction=Suffix.IMPORT)
+            model.rc = Suffix(direction=Suffix.IMPORT)
+            model.slack = Suffix(direction=Suffix.IMPORT)
+
+            results = opt.solve(model)
+
+            self.assertEqual(results.problem.number_of_nonzeros, 4)
+            self.assertAlmostEqual(model.X.value, 10.0/3, delta=diff_tol)
+            self.assertAlmostEqual(model.Y.value, 1.0/3, delta=diff_tol)
+            self.assertAlmostEqual(model.dual[model.C1], 4.0/3,
+                                   delta=diff_tol)
+            self.assertAlmostEqual(model.dual[model.C2], -1.0/3,
+                                   delta=diff_tol)
+            self.assertAlmostEqual(model.rc[model.X], 0.0, delta=diff_tol)
+            self.assertAlmostEqual(model.slack[model.C1], 0.0,
+                                   delta=diff_tol)
+            self.assertAlmostEqual(model.slack[model.C2], -2.0,
+                                   delta=diff_tol)
+
+    @unittest.skipIf(not glpkpy_available,
+                     "The 'swiglpk' python bindings are not available")
+    def test_optimal_mip(self):
+        with SolverFactory("glpk", solver_io="python") as opt:
+
+            model = ConcreteModel()
+            model.X = Var(within=Integers)
+            model.C = Constraint(expr= model.X >= -10.5)
+            model.O = Objective(expr= model.X)
+
+            results = opt.solve(model)
+
+            self.assertEqual(results.solver.termination_condition,
+                             TerminationCondition.optimal)
+            self.assertEqual(model.X.value, -10)
+
+
+class GLPKPersistentTests(unittest.TestCase):
+
+    @unittest.skipIf(not glpkpy_available,
+                     "The 'swiglpk' python bindings are not available")
+    def test_incremental_changes(self):
+        model = _lp_model()
+        opt = SolverFactory('glpk_persistent')
+        opt.set_instance(model)
+        opt.solve(model)
+        self.assertAlmostEqual(value(model.O), 13.0/3, delta=diff_tol)
+
+        model.Z = Var(bounds=(0, 1))
+        opt.add_var(model.Z)
+        model.C3 = Constraint(expr= model.X + model.Z >= 5)
+        opt.add_constraint(model.C3)
+        opt.solve(model)
+        self.assertAlmostEqual(model.X.value, 4.0, delta=diff_tol)
+        self.assertAlmostEqual(model.Z.value, 1.0, delta=diff_tol)
+
+        opt.remove_constraint(model.C3)
+        opt.remove_var(model.Z)
+        model.X.fix(3.5)
+        opt.update_var(model.X)
+        opt.solve(model, save_results=False)
+        self.assertAlmostEqual(model.Y.value, 0.5, delta=diff_tol)
+
+        model.dual = Suffix(direction=Suffix.IMPORT)
+        opt.load_duals([model.C1])
+        self.assertIn(model.C1, model.dual)
+        self.assertNotIn(model.C2, model.dual)
+
+    @unittest.skipIf(not glpkpy_available,
+                     "The 'swiglpk' python bindings are not available")
+    def test_add_block(self):
+        model = _lp_model()
+        opt = SolverFactory('glpk_persistent')
+        opt.set_instance(model)
+        model.b = Block()
+        model.b.W = Var(within=NonNegativeReals)
+        model.b.C = Constraint(expr= model.b.W + model.Y >= 2)
+        opt.add_block(model.b)
+        opt.solve(model)
+        self.assertEqual(len(opt._glpk_rows), 3)
+        self.assertAlmostEqual(model.Y.value + model.b.W.value, 2.0,
+                               delta=diff_tol)
+
+    @unittest.skipIf(not glpkpy_available,
+                     "The 'swiglpk' python bindings are not available")
+    def test_remove_batched(self):
+        model = _lp_model()
+        model.I = RangeSet(5)
+        model.W = Var(model.I, bounds=(0, 1))
+        model.D = Constraint(model.I,
+                             rule=lambda m, i: m.W[i] + m.Y >= 0.1*i)
+        opt = SolverFactory('glpk_persistent')
+        opt.set_instance(model)
+        opt.solve(model)
+        lp = opt._solver_model
+        for i in (2, 4):
+            opt.remove_constraint(model.D[i])
+        opt.remove_constraint(model.C2)
+        # the rows are deleted from GLPK on the next flush
+        self.assertEqual(sorted(opt._buffer.del_rows), [2, 4, 6])
+        self.assertEqual(swiglpk.glp_get_num_rows(lp), 7)
+        model.C3 = Constraint(expr= model.X + model.W[5] >= 1)
+        opt.add_constraint(model.C3)
+        for i in (2, 4):
+            opt.remove_var(model.W[i])
+        opt.solve(model)
+        self.assertEqual(swiglpk.glp_get_num_rows(lp), 5)
+        self.assertEqual(swiglpk.glp_get_num_cols(lp), 5)
+        self.assertEqual(opt._glpk_rows,
+                         [model.C1, model.D[1], model.D[3], model.D[5],
+                          model.C3])
+        self.assertEqual(opt._row_number(
+            opt._pyomo_con_to_solver_con_map[model.C3]), 5)
+        obj = value(model.O)
+
+        model.del_component(model.C2)
+        for i in (2, 4):
+            model.D[i].deactivate()
+            model.W[i].fix(0)
+        fresh = SolverFactory('glpk_persistent')
+        fresh.set_instance(model)
+        fresh.solve(model)
+        self.assertAlmostEqual(value(model.O), obj, delta=diff_tol)
+
+
+if __name__ == "__main__":
+    unittest.main()
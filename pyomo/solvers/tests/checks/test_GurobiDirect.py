@@ -0,0 +1,98 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyutilib.th as unittest
+from pyomo.opt import *
+from pyomo.environ import *
+
+try:
+    import gurobipy
+    gurobipy_available = True
+except ImportError:
+    gurobipy_available = False
+
+diff_tol = 1e-6
+
+
+def _bulk_model():
+    model = ConcreteModel()
+    model.X = Var(within=NonNegativeReals)
+    model.Y = Var(within=NonNegativeReals)
+    model.Z = Var(bounds=(0, 10))
+    model.Z.fix(2)
+    model.C1 = Constraint(expr= model.X + 2*model.Y + 1 >= 5)
+    model.C2 = Constraint(expr= (1, model.X - model.Y, 3))
+    model.C4 = Constraint(expr= model.Y + model.Z <= 10)
+    model.O = Objective(expr= model.X + 3*model.Y)
+    return model
+
+
+class GurobiDirectTests(unittest.TestCase):
+
+    @unittest.skipIf(not gurobipy_available,
+                     "The 'gurobipy' python bindings are not available")
+    def test_bulk_add_block(self):
+        model = _bulk_model()
+        model.dual = Suffix(direction=Suffix.IMPORT)
+        model.slack = Suffix(direction=Suffix.IMPORT)
+        with SolverFactory("gurobi_direct") as opt:
+            opt.solve(model, load_solutions=True)
+
+            self.assertEqual(len(opt._buffered_vars), 0)
+            self.assertEqual(len(opt._buffered_cons), 0)
+            self.assertEqual(set(opt._pyomo_con_to_solver_con_map.keys()),
+                             set([model.C1, model.C2, model.C4]))
+            self.assertIn(model.C2, opt._range_constraints)
+            self.assertEqual(opt._referenced_variables[model.Y], 4)
+            self.assertEqual(opt._referenced_variables[model.X], 3)
+            self.assertEqual(opt._pyomo_var_to_solver_var_map[model.Z].lb, 2)
+            self.assertEqual(opt._pyomo_var_to_solver_var_map[model.Z].ub, 2)
+            self.assertAlmostEqual(model.X.value, 10.0/3, delta=diff_tol)
+            self.assertAlmostEqual(model.Y.value, 1.0/3, delta=diff_tol)
+            self.assertAlmostEqual(model.slack[model.C1], 0.0, delta=diff_tol)
+            self.assertAlmostEqual(model.slack[model.C4], 23.0/3, delta=diff_tol)
+
+    @unittest.skipIf(not gurobipy_available,
+                     "The 'gurobipy' python bindings are not available")
+    def test_persistent_add_block(self):
+        model = _bulk_model()
+        opt = SolverFactory('gurobi_persistent')
+        opt.set_instance(model, symbolic_solver_labels=True)
+        self.assertEqual(opt._pyomo_con_to_solver_con_map[model.C4].ConstrName,
+                         'C4')
+        model.b = Block()
+        model.b.W = Var(within=NonNegativeReals)
+        model.b.C = Constraint(expr= model.b.W - model.Y >= 2)
+        opt.add_block(model.b)
+        self.assertEqual(opt._solver_model.NumConstrs, 4)
+        self.assertEqual(opt._pyomo_con_to_solver_con_map[model.b.C].ConstrName,
+                         'b_C')
+        opt.solve(model)
+        self.assertAlmostEqual(model.b.W.value - model.Y.value, 2.0,
+                               delta=diff_tol)
+
+        model.dual = Suffix(direction=Suffix.IMPORT)
+        model.slack = Suffix(direction=Suffix.IMPORT)
+        opt.load_duals([model.C1])
+        opt.load_slacks([model.C2, model.b.C])
+        self.assertEqual(list(model.dual.keys()), [model.C1])
+        self.assertAlmostEqual(model.dual[model.C1], 4.0/3, delta=diff_tol)
+        self.assertEqual(len(model.slack), 2)
+        self.assertAlmostEqual(model.slack[model.C2], -2.0, delta=diff_tol)
+        self.assertAlmostEqual(model.slack[model.b.C], 0.0, delta=diff_tol)
+
+        opt.remove_constraint(model.b.C)
+        opt.remove_var(model.b.W)
+        opt._solver_model.update()
+        self.assertEqual(opt._solver_model.NumConstrs, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import sys
+
+import pyutilib.th as unittest
+from pyutilib.common import ApplicationError
+
+from pyomo.environ import *
+from pyomo.solvers.plugins.solvers.ipopt_persistent import \
+    IPOPTPersistent, _split_nl_segments
+
+ipopt_available = SolverFactory('ipopt').available(exception_flag=False)
+
+
+def _make_model():
+    m = ConcreteModel()
+    m.p = Param(initialize=2.0, mutable=True)
+    m.x = Var(bounds=(0, 10), initialize=1.0)
+    m.y = Var(initialize=1.0)
+    m.z = Var(bounds=(None, 5))
+    m.z.fix(3.0)
+    m.c1 = Constraint(expr=m.x**2 + m.y**2 <= 4*m.p)
+    m.c2 = Constraint(expr=m.x + m.y + m.z >= 1)
+    m.o = Objective(expr=(m.x - 1)**2 + exp(m.y) + m.z**2)
+    return m
+
+
+class IPOPTPersistentTests(unittest.TestCase):
+
+    def _segments(self, opt, warm_start=False):
+        return _split_nl_segments(opt._nl_text(warm_start))
+
+    def test_fixed_vars_substituted(self):
+        m = _make_model()
+        opt = IPOPTPersistent()
+        opt.set_instance(m)
+        self.assertTrue(opt.has_instance())
+        self.assertTrue(m.z.fixed)
+        self.assertEqual(m.z.value, 3.0)
+        self.assertEqual(len(opt._nl_vars), 2)
+        self.assertNotIn(m.z, opt._nl_vars)
+        self.assertFalse(opt._instance_modified())
+
+    def test_update_matches_rewrite(self):
+        m = _make_model()
+        opt = IPOPTPersistent()
+        opt.set_instance(m)
+        m.x.setlb(1)
+        m.x.value = 1.5
+        m.y.setub(2)
+        self.assertFalse(opt._instance_modified())
+        fresh = IPOPTPersistent()
+        fresh.set_instance(m)
+        self.assertEqual(opt._nl_text(False), fresh._nl_text(False))
+
+    def test_fixed_var_change(self):
+        m = _make_model()
+        opt = IPOPTPersistent()
+        opt.set_instance(m)
+        m.z.fix(4.0)
+        self.assertTrue(opt._instance_modified())
+        opt._write_instance()
+        self.assertFalse(opt._instance_modified())
+        m.z.unfix()
+        self.assertTrue(opt._instance_modified())
+        opt._write_instance()
+        self.assertIn(m.z, opt._nl_vars)
+        # a variable that was free when the file was written is
+        # fixed through its bounds
+        m.z.fix(3.0)
+        self.assertFalse(opt._instance_modified())
+        b = dict(self._segments(opt)[1])['b']
+        self.assertIn("4 3.0\n", b)
+
+    def test_update_matches_rewrite_symbolic(self):
+        m = _make_model()
+        opt = IPOPTPersistent()
+        opt.set_instance(m, symbolic_solver_labels=True)
+        m.x.setub(4)
+        m.y.value = None
+        fresh = IPOPTPersistent()
+        fresh.set_instance(m, symbolic_solver_labels=True)
+        self.assertEqual(opt._nl_text(False), fresh._nl_text(False))
+
+    def test_param_change(self):
+        m = _make_model()
+        opt = IPOPTPersistent()
+        opt.set_instance(m)
+        r_orig = dict(self._segments(opt)[1])['r']
+        m.p = 3.0
+        self.assertTrue(opt._instance_modified())
+        opt._write_instance()
+        self.assertFalse(opt._instance_modified())
+        r_new = dict(self._segments(opt)[1])['r']
+        self.assertNotEqual(r_orig, r_new)
+
+    def test_warm_start_segments(self):
+        m = _make_model()
+        opt = IPOPTPersistent()
+        opt.set_instance(m)
+        opt._zL = {0: 0.5}
+        opt._zU = {}
+        opt._duals = {1: -1.25, 0: 2.0}
+        header, segments = self._segments(opt, True)
+        keys = [key for key, _ in segments]
+        self.assertEqual(keys[keys.index('x')-3:keys.index('x')],
+                         ['S', 'S', 'd'])
+        self.assertIn("S4 1 ipopt_zL_in\n0 0.5\n",
+                      [seg for key, seg in segments])
+        self.assertIn("S4 0 ipopt_zU_in\n",
+                      [seg for key, seg in segments])
+        self.assertIn("d2\n0 2.0\n1 -1.25\n",
+                      [seg for key, seg in segments])
+        self.assertEqual(keys.count('d'), 1)
+
+    def test_warm_start_option(self):
+        m = _make_model()
+        opt = IPOPTPersistent()
+        opt.set_executable(sys.executable, validate=False)
+        opt.set_instance(m)
+        opt._zL = {}
+        opt._zU = {}
+        opt._duals = {}
+        options = []
+        create_command_line = opt.create_command_line
+        def _create_command_line(executable, problem_files):
+            options.append(dict(opt.options))
+            return create_command_line(executable, problem_files)
+        opt.create_command_line = _create_command_line
+        # running python on the NL file fails
+        with self.assertRaises(ApplicationError):
+            opt.solve()
+        self.assertEqual(options[-1], {'warm_start_init_point': 'yes'})
+        self.assertNotIn('warm_start_init_point', opt.options)
+        # the option is only set when there is a solution to warm
+        # start from
+        opt._duals = None
+        with self.assertRaises(ApplicationError):
+            opt.solve()
+        self.assertEqual(options[-1], {})
+
+    def test_solve_other_model(self):
+        opt = IPOPTPersistent()
+        with self.assertRaises(RuntimeError):
+            opt.solve()
+        opt.set_instance(_make_model())
+        with self.assertRaises(ValueError):
+            opt.solve(_make_model())
+
+    @unittest.skipIf(not ipopt_available,
+                     "The 'ipopt' executable is not available")
+    def test_solve(self):
+        m = _make_model()
+        m.dual = Suffix(direction=Suffix.IMPORT)
+        opt = SolverFactory('ipopt_persistent')
+        opt.set_instance(m)
+        results = opt.solve()
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.optimal)
+        self.assertIsNotNone(opt._duals)
+        self.assertAlmostEqual(m.x.value, 1.0, places=5)
+        m.z.fix(1.0)
+        results = opt.solve()
+        self.assertEqual(results.solver.termination_condition,
+                         TerminationCondition.optimal)
+        self.assertAlmostEqual(value(m.o), exp(m.y.value) + 1.0, places=5)
+        self.assertIn(m.c2, m.dual)
+
+
+if __name__ == "__main__":
+    unittest.main()
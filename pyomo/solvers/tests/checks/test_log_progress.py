@@ -0,0 +1,126 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright 2017 National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import pyutilib.th as unittest
+
+from pyomo.opt import SolverFactory
+from pyomo.solvers.plugins.solvers.CBCplugin import CBCLogProgressParser
+from pyomo.solvers.plugins.solvers.GLPK import GLPKLogProgressParser
+from pyomo.solvers.plugins.solvers.IPOPT import IPOPTLogProgressParser
+from pyomo.solvers.plugins.solvers.CPLEX import CPLEXLogProgressParser
+
+
+class TestLogProgressParsers(unittest.TestCase):
+
+    def test_cbc(self):
+        parser = CBCLogProgressParser()
+        self.assertIsNone(parser("Cbc0038I Initial state - 0 integers "
+                                 "unsatisfied sum - 0"))
+        p = parser("Cbc0010I After 0 nodes, 1 on tree, 1e+50 best "
+                   "solution, best possible 9.5 (0.01 seconds)")
+        self.assertEqual(p.nodes, 0)
+        self.assertIsNone(p.incumbent)
+        self.assertEqual(p.bound, 9.5)
+        self.assertIsNone(p.gap)
+        p = parser("Cbc0012I Integer solution of 12 found by DiveCoefficient "
+                   "after 37 iterations and 4 nodes (0.02 seconds)")
+        self.assertEqual(p.iteration, 37)
+        self.assertEqual(p.nodes, 4)
+        self.assertEqual(p.incumbent, 12)
+        self.assertEqual(p.bound, 9.5)
+        self.assertAlmostEqual(p.gap, 2.5/12)
+        p = parser("Cbc0010I After 100 nodes, 3 on tree, 11 best "
+                   "solution, best possible 10 (0.10 seconds)")
+        self.assertEqual(p.nodes, 100)
+        self.assertEqual(p.incumbent, 11)
+        self.assertEqual(p.bound, 10)
+
+    def test_glpk(self):
+        parser = GLPKLogProgressParser()
+        self.assertIsNone(parser("GLPK Integer Optimizer, v4.65"))
+        p = parser("*     5: obj =   1.000000000e+01 inf =   "
+                   "0.000e+00 (0)")
+        self.assertEqual(p.iteration, 5)
+        self.assertEqual(p.objective, 10.0)
+        p = parser("      0: obj =   0.000000000e+00 infeas =  "
+                   "1.000e+00 (0)")
+        self.assertEqual(p.iteration, 0)
+        self.assertEqual(p.objective, 0.0)
+        p = parser("+     7: mip =     not found yet >=              "
+                   "-inf        (1; 0)")
+        self.assertEqual(p.iteration, 7)
+        self.assertEqual(p.nodes, 0)
+        self.assertIsNone(p.incumbent)
+        self.assertEqual(p.bound, float('-inf'))
+        self.assertIsNone(p.gap)
+        p = parser("+    25: >>>>>   1.200000000e+01 >=   "
+                   "1.000000000e+01  16.7% (3; 2)")
+        self.assertIsNone(p)
+        p = parser("+    31: mip =   1.200000000e+01 >=   "
+                   "1.000000000e+01  16.7% (3; 2)")
+        self.assertEqual(p.iteration, 31)
+        self.assertEqual(p.nodes, 2)
+        self.assertEqual(p.incumbent, 12)
+        self.assertEqual(p.bound, 10)
+        self.assertAlmostEqual(p.gap, 0.167)
+        p = parser("+    40: mip =   1.100000000e+01 >=     tree is "
+                   "empty   0.0% (0; 9)")
+        self.assertEqual(p.incumbent, 11)
+        self.assertIsNone(p.bound)
+        self.assertEqual(p.gap, 0)
+
+    def test_ipopt(self):
+        parser = IPOPTLogProgressParser()
+        self.assertIsNone(parser("iter    objective    inf_pr   inf_du "
+                                 "lg(mu)  ||d||  lg(rg) alpha_du alpha_pr  ls"))
+        p = parser("   0  1.6109693e+01 1.12e+01 5.28e-01  -1.0 0.00e+00"
+                   "    -  0.00e+00 0.00e+00   0")
+        self.assertEqual(p.iteration, 0)
+        self.assertEqual(p.objective, 16.109693)
+        p = parser("  12r -3.2000000e+00 4.10e-02 9.99e+02  -0.3 0.00e+00"
+                   "    -  0.00e+00 3.24e-07R  2")
+        self.assertEqual(p.iteration, 12)
+        self.assertEqual(p.objective, -3.2)
+        self.assertIsNone(parser("Number of Iterations....: 12"))
+
+    def test_cplex(self):
+        parser = CPLEXLogProgressParser()
+        p = parser("Iteration:     1   Dual objective     =     "
+                   "        4.500000")
+        self.assertEqual(p.iteration, 1)
+        self.assertEqual(p.objective, 4.5)
+        self.assertIsNone(parser("   Node  Left     Objective  IInf  "
+                                 "Best Integer    Best Bound    ItCnt     Gap"))
+        self.assertIsNone(parser("      0     0       13.0000     4     "
+                                 "                13.0000        2"))
+        p = parser("*     0+    0                           13.0000       "
+                   "14.0000             7.69%")
+        self.assertEqual(p.nodes, 0)
+        self.assertEqual(p.incumbent, 13)
+        self.assertEqual(p.bound, 14)
+        self.assertAlmostEqual(p.gap, 0.0769)
+        p = parser("*    15     8      integral     0       11.0000       "
+                   "14.0000       35   27.27%")
+        self.assertEqual(p.nodes, 15)
+        self.assertEqual(p.incumbent, 11)
+        self.assertEqual(p.bound, 14)
+        self.assertAlmostEqual(p.gap, 0.2727)
+
+    def test_solver_parsers(self):
+        for name, cls in (('_glpk_shell', GLPKLogProgressParser),
+                          ('cbc', CBCLogProgressParser),
+                          ('ipopt', IPOPTLogProgressParser),
+                          ('_cplex_shell', CPLEXLogProgressParser)):
+            with SolverFactory(name) as opt:
+                self.assertIs(type(opt._create_progress_parser()), cls)
+
+
+if __name__ == "__main__":
+    unittest.main()
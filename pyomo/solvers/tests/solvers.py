@@ -221,7 +221,17 @@ def test_solver_cases(*args):
             name='glpk',
             io='python',
             capabilities=_glpk_capabilities,
-            import_suffixes=[])
+            import_suffixes=['slack','dual','rc'])
+
+        #
+        # GLPK PERSISTENT
+        #
+
+        _test_solver_cases['glpk_persistent', 'python'] = initialize(
+            name='glpk_persistent',
+            io='python',
+            capabilities=_glpk_capabilities,
+            import_suffixes=['slack','dual','rc'])
 
         #
         # CBC